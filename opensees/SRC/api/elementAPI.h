@@ -214,6 +214,8 @@ class FrictionModel;
 class LimitCurve;
 class Domain;
 class FE_Datastore;
+class Vector;
+class ID;
 
 extern UniaxialMaterial* OPS_GetUniaxialMaterial(int matTag);
 extern NDMaterial* OPS_GetNDMaterial(int matTag);
@@ -222,6 +224,12 @@ extern CrdTransf* OPS_GetCrdTransf(int crdTag);
 extern FrictionModel* OPS_GetFrictionModel(int frnTag);
 extern LimitCurve* OPS_GetLimitCurve(int LimCrvTag);
 extern Domain* OPS_GetDomain(void);
+extern int OPS_GetDoubleListInput(int* size, Vector* data, bool* share = 0, bool writable = false);
+extern int OPS_GetIntListInput(int* size, ID* data);
+// ints read before the rest of the command line,
+// clearing them returns the number of ints not read
+extern int OPS_SetInputPrefix(const ID& prefix);
+extern int OPS_ClearInputPrefix();
 
 extern FE_Datastore* OPS_GetFEDatastore();
 extern "C" const char* OPS_GetInterpPWD();
@@ -1058,6 +1058,8 @@
 #define OPS_STREAM_TAGS_ChannelStream           9
 #define OPS_STREAM_TAGS_DataTurbineStream      10
 #define OPS_STREAM_TAGS_DataFileStreamAdd      11
+#define OPS_STREAM_TAGS_MemoryStream           12
+#define OPS_STREAM_TAGS_ReducerStream          13
 
 
 #define DomDecompALGORITHM_TAGS_DomainDecompAlgo 1
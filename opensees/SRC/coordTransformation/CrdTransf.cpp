@@ -72,6 +72,11 @@ OPS_clearAllCrdTransf(void) {
   theCrdTransfObjects.clearAll();
 }
 
+void 
+OPS_swapAllCrdTransf(MapOfTaggedObjects &theObjects) {
+  theCrdTransfObjects.swap(theObjects);
+}
+
 
 void OPS_printCrdTransf(OPS_Stream &s, int flag) {
   if (flag == OPS_PRINT_PRINTMODEL_JSON) {
@@ -58,6 +58,10 @@ void OPS_clearAllDamageModel(void) {
   theDamageModelObjects.clearAll();
 }
 
+void OPS_swapAllDamageModel(MapOfTaggedObjects &theObjects) {
+  theDamageModelObjects.swap(theObjects);
+}
+
 DamageModel::DamageModel(int tag, int clasTag)
 :TaggedObject(tag), MovableObject(clasTag)
 {
@@ -0,0 +1,328 @@
+/* ****************************************************************** **
+**    OpenSees - Open System for Earthquake Engineering Simulation    **
+**          Pacific Earthquake Engineering Research Center            **
+**                                                                    **
+**                                                                    **
+** (C) Copyright 1999, The Regents of the University of California    **
+** All Rights Reserved.                                               **
+**                                                                    **
+** Commercial use of this program without express permission of the   **
+** University of California, Berkeley, is strictly prohibited.  See   **
+** file 'COPYRIGHT'  in main directory for information on usage and   **
+** redistribution,  and for a DISCLAIMER OF ALL WARRANTIES.           **
+**                                                                    **
+** Developed by:                                                      **
+**   Frank McKenna (fmckenna@ce.berkeley.edu)                         **
+**   Gregory L. Fenves (fenves@ce.berkeley.edu)                       **
+**   Filip C. Filippou (filippou@ce.berkeley.edu)                     **
+**                                                                    **
+** ****************************************************************** */
+
+// Description: This file contains the class implementation for
+// MemoryDatastore. Each ID, Vector, Matrix and Message sent to the
+// datastore is kept as an array of doubles, keyed like the files of a
+// FileDatastore by its dbTag, commitTag and size.
+
+#include "MemoryDatastore.h"
+
+#include <string.h>
+
+#include <FEM_ObjectBroker.h>
+#include <Domain.h>
+#include <ID.h>
+#include <Vector.h>
+#include <Matrix.h>
+#include <Message.h>
+
+// the types of the stored records
+enum {
+    MEMORY_DATASTORE_ID = 1,
+    MEMORY_DATASTORE_VECTOR = 2,
+    MEMORY_DATASTORE_MATRIX = 3,
+    MEMORY_DATASTORE_MESSAGE = 4
+};
+
+bool
+MemoryDatastoreKey::operator<(const MemoryDatastoreKey &other) const
+{
+    if (type != other.type) return type < other.type;
+    if (dbTag != other.dbTag) return dbTag < other.dbTag;
+    if (commitTag != other.commitTag) return commitTag < other.commitTag;
+    return size < other.size;
+}
+
+MemoryDatastore::MemoryDatastore(Domain &theDomain,
+				 FEM_ObjectBroker &theObjBroker)
+  :FE_Datastore(theDomain, theObjBroker), theData()
+{
+}
+
+MemoryDatastore::~MemoryDatastore()
+{
+}
+
+int
+MemoryDatastore::store(int type, int dbTag, int commitTag, int size,
+		       const double *data)
+{
+    MemoryDatastoreKey key = {type, dbTag, commitTag, size};
+
+    // data sent again for the same key replaces the old data
+    std::vector<double> &record = theData[key];
+    record.assign(data, data+size);
+
+    return 0;
+}
+
+const std::vector<double> *
+MemoryDatastore::find(int type, int dbTag, int commitTag, int size)
+{
+    MemoryDatastoreKey key = {type, dbTag, commitTag, size};
+
+    MAP_MEMORY_DATA::const_iterator it = theData.find(key);
+    if (it == theData.end()) {
+	return 0;
+    }
+
+    return &(it->second);
+}
+
+int
+MemoryDatastore::sendMsg(int dbTag, int commitTag,
+			 const Message &theMessage,
+			 ChannelAddress *theAddress)
+{
+    Message &msg = const_cast<Message &>(theMessage);
+    int size = msg.getSize();
+    const char *chars = msg.getData();
+
+    std::vector<double> data(size);
+    for (int i = 0; i < size; i++) {
+	data[i] = (unsigned char)chars[i];
+    }
+
+    return this->store(MEMORY_DATASTORE_MESSAGE, dbTag, commitTag, size,
+		       size > 0 ? &data[0] : 0);
+}
+
+int
+MemoryDatastore::recvMsg(int dbTag, int commitTag,
+			 Message &theMessage,
+			 ChannelAddress *theAddress)
+{
+    int size = theMessage.getSize();
+    const std::vector<double> *data =
+	this->find(MEMORY_DATASTORE_MESSAGE, dbTag, commitTag, size);
+    if (data == 0) {
+	opserr << "MemoryDatastore::recvMsg() - no data for dbTag " << dbTag
+	       << " and commitTag " << commitTag << endln;
+	return -1;
+    }
+
+    char *chars = const_cast<char *>(theMessage.getData());
+    for (int i = 0; i < size; i++) {
+	chars[i] = (char)(unsigned char)(*data)[i];
+    }
+
+    return 0;
+}
+
+int
+MemoryDatastore::recvMsgUnknownSize(int dbTag, int commitTag,
+				    Message &theMessage,
+				    ChannelAddress *theAddress)
+{
+    opserr << "MemoryDatastore::recvMsgUnknownSize() - not yet implemented\n";
+    return -1;
+}
+
+int
+MemoryDatastore::sendMatrix(int dbTag, int commitTag,
+			    const Matrix &theMatrix,
+			    ChannelAddress *theAddress)
+{
+    int numRows = theMatrix.noRows();
+    int numCols = theMatrix.noCols();
+    int size = numRows*numCols;
+
+    std::vector<double> data(size);
+    int loc = 0;
+    for (int j = 0; j < numCols; j++) {
+	for (int i = 0; i < numRows; i++) {
+	    data[loc++] = theMatrix(i,j);
+	}
+    }
+
+    return this->store(MEMORY_DATASTORE_MATRIX, dbTag, commitTag, size,
+		       size > 0 ? &data[0] : 0);
+}
+
+int
+MemoryDatastore::recvMatrix(int dbTag, int commitTag,
+			    Matrix &theMatrix,
+			    ChannelAddress *theAddress)
+{
+    int numRows = theMatrix.noRows();
+    int numCols = theMatrix.noCols();
+    int size = numRows*numCols;
+
+    const std::vector<double> *data =
+	this->find(MEMORY_DATASTORE_MATRIX, dbTag, commitTag, size);
+    if (data == 0) {
+	opserr << "MemoryDatastore::recvMatrix() - no data for dbTag " << dbTag
+	       << " and commitTag " << commitTag << endln;
+	return -1;
+    }
+
+    int loc = 0;
+    for (int j = 0; j < numCols; j++) {
+	for (int i = 0; i < numRows; i++) {
+	    theMatrix(i,j) = (*data)[loc++];
+	}
+    }
+
+    return 0;
+}
+
+int
+MemoryDatastore::sendVector(int dbTag, int commitTag,
+			    const Vector &theVector,
+			    ChannelAddress *theAddress)
+{
+    Vector &vect = const_cast<Vector &>(theVector);
+    int size = vect.Size();
+
+    return this->store(MEMORY_DATASTORE_VECTOR, dbTag, commitTag, size,
+		       size > 0 ? &vect(0) : 0);
+}
+
+int
+MemoryDatastore::recvVector(int dbTag, int commitTag,
+			    Vector &theVector,
+			    ChannelAddress *theAddress)
+{
+    int size = theVector.Size();
+
+    const std::vector<double> *data =
+	this->find(MEMORY_DATASTORE_VECTOR, dbTag, commitTag, size);
+    if (data == 0) {
+	opserr << "MemoryDatastore::recvVector() - no data for dbTag " << dbTag
+	       << " and commitTag " << commitTag << endln;
+	return -1;
+    }
+
+    for (int i = 0; i < size; i++) {
+	theVector(i) = (*data)[i];
+    }
+
+    return 0;
+}
+
+int
+MemoryDatastore::sendID(int dbTag, int commitTag,
+			const ID &theID,
+			ChannelAddress *theAddress)
+{
+    int size = theID.Size();
+
+    std::vector<double> data(size);
+    for (int i = 0; i < size; i++) {
+	data[i] = theID(i);
+    }
+
+    return this->store(MEMORY_DATASTORE_ID, dbTag, commitTag, size,
+		       size > 0 ? &data[0] : 0);
+}
+
+int
+MemoryDatastore::recvID(int dbTag, int commitTag,
+			ID &theID,
+			ChannelAddress *theAddress)
+{
+    int size = theID.Size();
+
+    const std::vector<double> *data =
+	this->find(MEMORY_DATASTORE_ID, dbTag, commitTag, size);
+    if (data == 0) {
+	opserr << "MemoryDatastore::recvID() - no data for dbTag " << dbTag
+	       << " and commitTag " << commitTag << endln;
+	return -1;
+    }
+
+    for (int i = 0; i < size; i++) {
+	theID(i) = (int)(*data)[i];
+    }
+
+    return 0;
+}
+
+int
+MemoryDatastore::getBufferSize(void)
+{
+    int size = 0;
+    for (MAP_MEMORY_DATA::const_iterator it = theData.begin();
+	 it != theData.end(); it++) {
+	size += 4 + it->first.size;
+    }
+
+    return size;
+}
+
+int
+MemoryDatastore::saveBuffer(double *buffer)
+{
+    int loc = 0;
+    for (MAP_MEMORY_DATA::const_iterator it = theData.begin();
+	 it != theData.end(); it++) {
+	const MemoryDatastoreKey &key = it->first;
+	buffer[loc++] = key.type;
+	buffer[loc++] = key.dbTag;
+	buffer[loc++] = key.commitTag;
+	buffer[loc++] = key.size;
+	if (key.size > 0) {
+	    memcpy(&buffer[loc], &(it->second)[0], key.size*sizeof(double));
+	}
+	loc += key.size;
+    }
+
+    return loc;
+}
+
+int
+MemoryDatastore::loadBuffer(const double *buffer, int size)
+{
+    this->clearAll();
+
+    int loc = 0;
+    while (loc < size) {
+	if (loc+4 > size) {
+	    opserr << "MemoryDatastore::loadBuffer() - incomplete record\n";
+	    this->clearAll();
+	    return -1;
+	}
+
+	int type = (int)buffer[loc];
+	int dbTag = (int)buffer[loc+1];
+	int commitTag = (int)buffer[loc+2];
+	int dataSize = (int)buffer[loc+3];
+	loc += 4;
+
+	if (type < MEMORY_DATASTORE_ID || type > MEMORY_DATASTORE_MESSAGE ||
+	    dataSize < 0 || loc+dataSize > size) {
+	    opserr << "MemoryDatastore::loadBuffer() - invalid record\n";
+	    this->clearAll();
+	    return -1;
+	}
+
+	this->store(type, dbTag, commitTag, dataSize, &buffer[loc]);
+	loc += dataSize;
+    }
+
+    return 0;
+}
+
+void
+MemoryDatastore::clearAll(void)
+{
+    theData.clear();
+}
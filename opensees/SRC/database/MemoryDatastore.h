@@ -0,0 +1,101 @@
+/* ****************************************************************** **
+**    OpenSees - Open System for Earthquake Engineering Simulation    **
+**          Pacific Earthquake Engineering Research Center            **
+**                                                                    **
+**                                                                    **
+** (C) Copyright 1999, The Regents of the University of California    **
+** All Rights Reserved.                                               **
+**                                                                    **
+** Commercial use of this program without express permission of the   **
+** University of California, Berkeley, is strictly prohibited.  See   **
+** file 'COPYRIGHT'  in main directory for information on usage and   **
+** redistribution,  and for a DISCLAIMER OF ALL WARRANTIES.           **
+**                                                                    **
+** Developed by:                                                      **
+**   Frank McKenna (fmckenna@ce.berkeley.edu)                         **
+**   Gregory L. Fenves (fenves@ce.berkeley.edu)                       **
+**   Filip C. Filippou (filippou@ce.berkeley.edu)                     **
+**                                                                    **
+** ****************************************************************** */
+
+#ifndef MemoryDatastore_h
+#define MemoryDatastore_h
+
+// Description: This file contains the class definition for MemoryDatastore.
+// MemoryDatastore is a concrete subclass of FE_Datastore. A MemoryDatastore
+// object stores the geometry and state information of a domain in memory,
+// so that a snapshot of the domain can be taken and restored without any
+// file. The stored data can be copied to and from a single array of
+// doubles, e.g. to send the snapshot to another process.
+
+#include <FE_Datastore.h>
+#include <map>
+#include <vector>
+
+class FEM_ObjectBroker;
+
+struct MemoryDatastoreKey {
+    int type;
+    int dbTag;
+    int commitTag;
+    int size;
+    bool operator<(const MemoryDatastoreKey &other) const;
+};
+
+typedef std::map<MemoryDatastoreKey, std::vector<double> > MAP_MEMORY_DATA;
+
+class MemoryDatastore: public FE_Datastore
+{
+  public:
+    MemoryDatastore(Domain &theDomain, FEM_ObjectBroker &theBroker);
+    ~MemoryDatastore();
+
+    // methods for sending and receiving the data
+    int sendMsg(int dbTag, int commitTag,
+		const Message &,
+		ChannelAddress *theAddress =0);
+    int recvMsg(int dbTag, int commitTag,
+		Message &,
+		ChannelAddress *theAddress =0);
+    int recvMsgUnknownSize(int dbTag, int commitTag,
+		Message &,
+		ChannelAddress *theAddress =0);
+
+    int sendMatrix(int dbTag, int commitTag,
+		   const Matrix &theMatrix,
+		   ChannelAddress *theAddress =0);
+    int recvMatrix(int dbTag, int commitTag,
+		   Matrix &theMatrix,
+		   ChannelAddress *theAddress =0);
+
+    int sendVector(int dbTag, int commitTag,
+		   const Vector &theVector,
+		   ChannelAddress *theAddress =0);
+    int recvVector(int dbTag, int commitTag,
+		   Vector &theVector,
+		   ChannelAddress *theAddress =0);
+
+    int sendID(int dbTag, int commitTag,
+	       const ID &theID,
+	       ChannelAddress *theAddress =0);
+    int recvID(int dbTag, int commitTag,
+	       ID &theID,
+	       ChannelAddress *theAddress =0);
+
+    // the stored data as one array of doubles:
+    // [type, dbTag, commitTag, size, data...] for each record
+    int getBufferSize(void);
+    int saveBuffer(double *buffer);
+    int loadBuffer(const double *buffer, int size);
+    void clearAll(void);
+
+  protected:
+
+  private:
+    int store(int type, int dbTag, int commitTag, int size, const double *data);
+    const std::vector<double> *find(int type, int dbTag, int commitTag, int size);
+
+    MAP_MEMORY_DATA theData;
+};
+
+#endif
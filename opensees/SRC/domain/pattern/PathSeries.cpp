@@ -223,7 +223,8 @@ void* OPS_PathSeries()
 
 PathSeries::PathSeries()	
   :TimeSeries(TSERIES_TAG_PathSeries),
-   thePath(0), pathTimeIncr(0.0), cFactor(0.0), otherDbTag(0), lastSendCommitTag(-1)
+   thePath(0), pathTimeIncr(0.0), cFactor(0.0), otherDbTag(0), lastSendCommitTag(-1),
+   sharePath(false)
 {
   // does nothing
 }
@@ -234,13 +235,20 @@ PathSeries::PathSeries(int tag,
 		       double theFactor,
 		       bool last,
                bool prependZero,
-               double tStart)
+               double tStart,
+               bool share)
   :TimeSeries(tag, TSERIES_TAG_PathSeries),
    thePath(0), pathTimeIncr(theTimeIncr), cFactor(theFactor),
-   otherDbTag(0), lastSendCommitTag(-1), useLast(last), startTime(tStart)
+   otherDbTag(0), lastSendCommitTag(-1), useLast(last), startTime(tStart),
+   sharePath(false)
 {
-  // create a copy of the vector containing path points
-  if (prependZero == false) {
+  // refer to the memory of the path points, which must outlive
+  // this series, or create a copy of the vector containing them
+  if (share == true && prependZero == false && theLoadPath.Size() > 0) {
+    Vector &theData = const_cast<Vector &>(theLoadPath);
+    thePath = new Vector(&theData(0), theData.Size());
+    sharePath = true;
+  } else if (prependZero == false) {
     thePath = new Vector(theLoadPath);
   } else {
     // prepend a zero value
@@ -267,7 +275,8 @@ PathSeries::PathSeries(int tag,
                double tStart)
   :TimeSeries(tag, TSERIES_TAG_PathSeries),
    thePath(0), pathTimeIncr(theTimeIncr), cFactor(theFactor),
-   otherDbTag(0), lastSendCommitTag(-1), useLast(last), startTime(tStart)
+   otherDbTag(0), lastSendCommitTag(-1), useLast(last), startTime(tStart),
+   sharePath(false)
 {
   // determine the number of data points .. open file and count num entries
   int numDataPoints = 0;
@@ -339,7 +348,7 @@ PathSeries::~PathSeries()
 TimeSeries *
 PathSeries::getCopy(void) {
   return new PathSeries(this->getTag(), *thePath, pathTimeIncr, cFactor,
-                        useLast, false, startTime);
+                        useLast, false, startTime, sharePath);
 }
 
 double
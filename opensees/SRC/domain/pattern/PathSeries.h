@@ -49,7 +49,8 @@ class PathSeries : public TimeSeries
         double cfactor = 1.0,
         bool useLast = false,
         bool prependZero = false,
-        double startTime = 0.0);
+        double startTime = 0.0,
+        bool sharePath = false);
     PathSeries(int tag,
         const char *fileName, 
         double pathTimeIncr = 1.0,
@@ -87,6 +88,7 @@ class PathSeries : public TimeSeries
     int lastSendCommitTag;
     bool useLast;
     double startTime;
+    bool sharePath;       // thePath refers to memory owned by the caller
 };
 
 #endif
@@ -68,6 +68,10 @@ TimeSeries *OPS_getTimeSeries(int tag) {
 void OPS_clearAllTimeSeries(void) {
   theTimeSeriesObjects.clearAll();
 }
+
+void OPS_swapAllTimeSeries(MapOfTaggedObjects &theObjects) {
+  theTimeSeriesObjects.swap(theObjects);
+}
     
 
 TimeSeries::TimeSeries(int tag, int classTag)
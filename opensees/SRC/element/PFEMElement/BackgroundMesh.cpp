@@ -66,6 +66,11 @@ BackgroundMesh& OPS_getBgMesh()
     return bgmesh;
 }
 
+void OPS_swapBgMesh(BackgroundMesh& theMesh)
+{
+    bgmesh.swap(theMesh);
+}
+
 // OPS_BgMesh
 int OPS_BgMesh()
 {
@@ -829,6 +834,41 @@ BackgroundMesh::clearAll() {
     kernelClose = false;
 }
 
+void
+BackgroundMesh::swap(BackgroundMesh& other) {
+
+    // the cells point to nodes in bnodes, which keep their
+    // addresses when the maps are swapped
+    std::swap(lower, other.lower);
+    std::swap(upper, other.upper);
+    std::swap(bcells, other.bcells);
+    std::swap(bnodes, other.bnodes);
+    std::swap(tol, other.tol);
+    std::swap(meshtol, other.meshtol);
+    std::swap(bsize, other.bsize);
+    std::swap(numave, other.numave);
+    std::swap(numsub, other.numsub);
+    std::swap(recorders, other.recorders);
+    std::swap(locs, other.locs);
+    std::swap(currentTime, other.currentTime);
+    std::swap(theFile, other.theFile);
+    std::swap(structuralNodes, other.structuralNodes);
+    std::swap(freesurface, other.freesurface);
+    std::swap(contactData, other.contactData);
+    std::swap(contactEles, other.contactEles);
+    std::swap(incrVel, other.incrVel);
+    std::swap(fsiTri, other.fsiTri);
+    std::swap(boundReduceFactor, other.boundReduceFactor);
+    std::swap(inletLoc, other.inletLoc);
+    std::swap(inletVel, other.inletVel);
+    std::swap(inletNum, other.inletNum);
+    std::swap(largesize, other.largesize);
+    std::swap(pressureonce, other.pressureonce);
+    std::swap(dispon, other.dispon);
+    std::swap(fastAssembly, other.fastAssembly);
+    std::swap(kernelClose, other.kernelClose);
+}
+
 int
 BackgroundMesh::clearBackground()
 {
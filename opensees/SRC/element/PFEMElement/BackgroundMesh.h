@@ -187,6 +187,7 @@ public:
 
     // clear all
     void clearAll();
+    void swap(BackgroundMesh& other);
     int clearBackground();
     static void clearGridEles();
     void clearGrid();
@@ -246,5 +247,6 @@ private:
 };
 
 BackgroundMesh& OPS_getBgMesh();
+void OPS_swapBgMesh(BackgroundMesh& theMesh);
 
 #endif
@@ -98,6 +98,10 @@ void OPS_clearAllMesh(void) {
     theMeshObjects.clearAll();
 }
 
+void OPS_swapAllMesh(MapOfTaggedObjects &theObjects) {
+    theMeshObjects.swap(theObjects);
+}
+
 TaggedObjectIter &OPS_getAllMesh() {
     return theMeshObjects.getComponents();
 }
@@ -110,10 +110,13 @@ private:
     static int startNodeTag;
 };
 
+class MapOfTaggedObjects;
+
 bool OPS_addMesh(Mesh* msh);
 bool OPS_removeMesh(int tag);
 Mesh *OPS_getMesh(int tag);
 void OPS_clearAllMesh(void);
+void OPS_swapAllMesh(MapOfTaggedObjects &theObjects);
 TaggedObjectIter& OPS_getAllMesh();
 
 #endif
@@ -49,6 +49,10 @@ void OPS_clearAllBeamIntegrationRule(void) {
   theBeamIntegrationRuleObjects.clearAll();
 }
 
+void OPS_swapAllBeamIntegrationRule(MapOfTaggedObjects &theObjects) {
+  theBeamIntegrationRuleObjects.swap(theObjects);
+}
+
 BeamIntegration::BeamIntegration(int classTag):
   MovableObject(classTag)
 {
@@ -61,6 +61,11 @@ void OPS_clearAllFrictionModel()
     theFrictionModelObjects.clearAll();
 }
 
+void OPS_swapAllFrictionModel(MapOfTaggedObjects &theObjects)
+{
+    theFrictionModelObjects.swap(theObjects);
+}
+
 
 FrictionModel::FrictionModel(int tag, int classTag)
     : TaggedObject(tag), MovableObject(classTag),
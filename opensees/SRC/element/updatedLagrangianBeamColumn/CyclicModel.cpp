@@ -32,6 +32,10 @@ void OPS_clearAllCyclicModel(void) {
     theCyclicModelObjects.clearAll();
 }
 
+void OPS_swapAllCyclicModel(MapOfTaggedObjects &theObjects) {
+    theCyclicModelObjects.swap(theObjects);
+}
+
 CyclicModel::CyclicModel(int tag, int clasTag)
 :TaggedObject(tag), MovableObject(clasTag),
  resFactor(1.0),
@@ -0,0 +1,99 @@
+/* ****************************************************************** **
+**    OpenSees - Open System for Earthquake Engineering Simulation    **
+**          Pacific Earthquake Engineering Research Center            **
+**                                                                    **
+**                                                                    **
+** (C) Copyright 1999, The Regents of the University of California    **
+** All Rights Reserved.                                               **
+**                                                                    **
+** Commercial use of this program without express permission of the   **
+** University of California, Berkeley, is strictly prohibited.  See   **
+** file 'COPYRIGHT'  in main directory for information on usage and   **
+** redistribution,  and for a DISCLAIMER OF ALL WARRANTIES.           **
+**                                                                    **
+** Developed by:                                                      **
+**   Frank McKenna (fmckenna@ce.berkeley.edu)                         **
+**   Gregory L. Fenves (fenves@ce.berkeley.edu)                       **
+**   Filip C. Filippou (filippou@ce.berkeley.edu)                     **
+**                                                                    **
+** ****************************************************************** */
+
+// Description: This file contains the class implementation for
+// MemoryStream.
+
+#include <MemoryStream.h>
+#include <Vector.h>
+#include <classTags.h>
+#include <string.h>
+
+MemoryStream::MemoryStream(double *data, int sz, bool rng)
+  :OPS_Stream(OPS_STREAM_TAGS_MemoryStream),
+   theData(data), size(sz), ring(rng), numColumns(0), numRows(0),
+   warned(false)
+{
+
+}
+
+MemoryStream::MemoryStream(int classTag, double *data, int sz)
+  :OPS_Stream(classTag),
+   theData(data), size(sz), ring(false), numColumns(0), numRows(0),
+   warned(false)
+{
+
+}
+
+MemoryStream::~MemoryStream()
+{
+  // the array belongs to its creator
+}
+
+int
+MemoryStream::write(Vector &data)
+{
+  int numData = data.Size();
+  if (numData == 0) {
+    return 0;
+  }
+
+  // the first row sets the number of columns
+  if (numColumns == 0) {
+    numColumns = numData;
+    if (size < numColumns || size % numColumns != 0) {
+      opserr << "WARNING MemoryStream - the size " << size
+	     << " of the array is not a multiple of the " << numColumns
+	     << " columns of a row, nothing is recorded\n";
+      warned = true;
+    }
+  }
+
+  if (numData != numColumns) {
+    opserr << "MemoryStream::write() - a row of " << numData
+	   << " columns instead of " << numColumns << " is ignored\n";
+    return -1;
+  }
+
+  if (size < numColumns || size % numColumns != 0) {
+    numRows++;
+    return -1;
+  }
+
+  int maxRows = size / numColumns;
+  int row = numRows;
+  if (row >= maxRows) {
+    if (!ring) {
+      if (!warned) {
+	opserr << "WARNING MemoryStream - the array of " << maxRows
+	       << " rows is full, the next rows are dropped\n";
+	warned = true;
+      }
+      numRows++;
+      return 0;
+    }
+    row = numRows % maxRows;
+  }
+
+  memcpy(&theData[row*numColumns], &data(0), numColumns*sizeof(double));
+  numRows++;
+
+  return 0;
+}
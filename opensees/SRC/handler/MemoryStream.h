@@ -0,0 +1,89 @@
+/* ****************************************************************** **
+**    OpenSees - Open System for Earthquake Engineering Simulation    **
+**          Pacific Earthquake Engineering Research Center            **
+**                                                                    **
+**                                                                    **
+** (C) Copyright 1999, The Regents of the University of California    **
+** All Rights Reserved.                                               **
+**                                                                    **
+** Commercial use of this program without express permission of the   **
+** University of California, Berkeley, is strictly prohibited.  See   **
+** file 'COPYRIGHT'  in main directory for information on usage and   **
+** redistribution,  and for a DISCLAIMER OF ALL WARRANTIES.           **
+**                                                                    **
+** Developed by:                                                      **
+**   Frank McKenna (fmckenna@ce.berkeley.edu)                         **
+**   Gregory L. Fenves (fenves@ce.berkeley.edu)                       **
+**   Filip C. Filippou (filippou@ce.berkeley.edu)                     **
+**                                                                    **
+** ****************************************************************** */
+
+#ifndef _MemoryStream
+#define _MemoryStream
+
+// Description: This file contains the class definition for MemoryStream.
+// A MemoryStream writes the rows of data of a recorder into an array in
+// memory, which is not owned by the stream, e.g. a numpy array shared by
+// the python interpreter. Once the array is full, the next rows are
+// dropped, or, for a ring, written again from the first row of the array.
+
+#include <OPS_Stream.h>
+
+class MemoryStream : public OPS_Stream
+{
+ public:
+  MemoryStream(double *data, int size, bool ring = false);
+  ~MemoryStream();
+
+  // xml stuff
+  int tag(const char *) {return 0;};
+  int tag(const char *, const char *) {return 0;};
+  int endTag() {return 0;};
+  int attr(const char *name, int value) {return 0;};
+  int attr(const char *name, double value) {return 0;};
+  int attr(const char *name, const char *value) {return 0;};
+  int write(Vector &data);
+
+  OPS_Stream& write(const char *s, int n) {return *this;};
+  OPS_Stream& write(const unsigned char *s, int n) {return *this;};
+  OPS_Stream& write(const signed char *s, int n) {return *this;};
+  OPS_Stream& write(const void *s, int n) {return *this;};
+  OPS_Stream& operator<<(char c) {return *this;};
+  OPS_Stream& operator<<(unsigned char c) {return *this;};
+  OPS_Stream& operator<<(signed char c) {return *this;};
+  OPS_Stream& operator<<(const char *s) {return *this;};
+  OPS_Stream& operator<<(const unsigned char *s) {return *this;};
+  OPS_Stream& operator<<(const signed char *s) {return *this;};
+  OPS_Stream& operator<<(const void *p) {return *this;};
+  OPS_Stream& operator<<(int n) {return *this;};
+  OPS_Stream& operator<<(unsigned int n) {return *this;};
+  OPS_Stream& operator<<(long n) {return *this;};
+  OPS_Stream& operator<<(unsigned long n) {return *this;};
+  OPS_Stream& operator<<(short n) {return *this;};
+  OPS_Stream& operator<<(unsigned short n) {return *this;};
+  OPS_Stream& operator<<(bool b) {return *this;};
+  OPS_Stream& operator<<(double n) {return *this;};
+  OPS_Stream& operator<<(float n) {return *this;};
+
+  int sendSelf(int commitTag, Channel &theChannel) {return -1;};
+  int recvSelf(int commitTag, Channel &theChannel,
+	       FEM_ObjectBroker &theBroker) {return -1;};
+
+  // the number of rows written so far, including the dropped and
+  // overwritten ones, and the number of columns of a row
+  int getNumRows(void) const {return numRows;};
+  int getNumColumns(void) const {return numColumns;};
+
+ protected:
+  // for the streams which write other rows into the array
+  MemoryStream(int classTag, double *data, int size);
+
+  double *theData;
+  int size;
+  bool ring;
+  int numColumns;
+  int numRows;
+  bool warned;
+};
+
+#endif
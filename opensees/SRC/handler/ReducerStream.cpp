@@ -0,0 +1,106 @@
+/* ****************************************************************** **
+**    OpenSees - Open System for Earthquake Engineering Simulation    **
+**          Pacific Earthquake Engineering Research Center            **
+**                                                                    **
+**                                                                    **
+** (C) Copyright 1999, The Regents of the University of California    **
+** All Rights Reserved.                                               **
+**                                                                    **
+** Commercial use of this program without express permission of the   **
+** University of California, Berkeley, is strictly prohibited.  See   **
+** file 'COPYRIGHT'  in main directory for information on usage and   **
+** redistribution,  and for a DISCLAIMER OF ALL WARRANTIES.           **
+**                                                                    **
+** Developed by:                                                      **
+**   Frank McKenna (fmckenna@ce.berkeley.edu)                         **
+**   Gregory L. Fenves (fenves@ce.berkeley.edu)                       **
+**   Filip C. Filippou (filippou@ce.berkeley.edu)                     **
+**                                                                    **
+** ****************************************************************** */
+
+// Description: This file contains the class implementation for
+// ReducerStream.
+
+#include <ReducerStream.h>
+#include <Vector.h>
+#include <classTags.h>
+#include <math.h>
+
+ReducerStream::ReducerStream(double *data, int sz, bool time)
+  :MemoryStream(OPS_STREAM_TAGS_ReducerStream, data, sz),
+   timeColumn(time), sumSquares(0)
+{
+
+}
+
+ReducerStream::~ReducerStream()
+{
+  if (sumSquares != 0)
+    delete [] sumSquares;
+}
+
+int
+ReducerStream::write(Vector &data)
+{
+  int first = timeColumn ? 1 : 0;
+  int numData = data.Size() - first;
+  if (numData <= 0) {
+    return 0;
+  }
+
+  // the first row sets the number of columns
+  if (numColumns == 0) {
+    numColumns = numData;
+    if (size != REDUCER_STREAM_NUM_ROWS*numColumns) {
+      opserr << "WARNING ReducerStream - the array needs " << REDUCER_STREAM_NUM_ROWS
+	     << " rows of " << numColumns << " columns, nothing is recorded\n";
+      warned = true;
+    } else {
+      sumSquares = new double[numColumns];
+    }
+  }
+
+  if (numData != numColumns) {
+    opserr << "ReducerStream::write() - a row of " << numData
+	   << " columns instead of " << numColumns << " is ignored\n";
+    return -1;
+  }
+
+  numRows++;
+  if (sumSquares == 0) {
+    return -1;
+  }
+
+  double time = timeColumn ? data(0) : numRows;
+  double *max = theData;
+  double *min = max + numColumns;
+  double *absMax = min + numColumns;
+  double *rms = absMax + numColumns;
+  double *timeOfAbsMax = rms + numColumns;
+  double *last = timeOfAbsMax + numColumns;
+
+  for (int i = 0; i < numColumns; i++) {
+    double value = data(first+i);
+    if (numRows == 1) {
+      max[i] = value;
+      min[i] = value;
+      absMax[i] = fabs(value);
+      timeOfAbsMax[i] = time;
+      sumSquares[i] = 0.0;
+    } else {
+      if (value > max[i])
+	max[i] = value;
+      if (value < min[i])
+	min[i] = value;
+      if (fabs(value) > absMax[i]) {
+	absMax[i] = fabs(value);
+	timeOfAbsMax[i] = time;
+      }
+    }
+    sumSquares[i] += value*value;
+    rms[i] = sqrt(sumSquares[i]/numRows);
+    last[i] = value;
+  }
+
+  return 0;
+}
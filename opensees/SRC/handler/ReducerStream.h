@@ -0,0 +1,49 @@
+/* ****************************************************************** **
+**    OpenSees - Open System for Earthquake Engineering Simulation    **
+**          Pacific Earthquake Engineering Research Center            **
+**                                                                    **
+**                                                                    **
+** (C) Copyright 1999, The Regents of the University of California    **
+** All Rights Reserved.                                               **
+**                                                                    **
+** Commercial use of this program without express permission of the   **
+** University of California, Berkeley, is strictly prohibited.  See   **
+** file 'COPYRIGHT'  in main directory for information on usage and   **
+** redistribution,  and for a DISCLAIMER OF ALL WARRANTIES.           **
+**                                                                    **
+** Developed by:                                                      **
+**   Frank McKenna (fmckenna@ce.berkeley.edu)                         **
+**   Gregory L. Fenves (fenves@ce.berkeley.edu)                       **
+**   Filip C. Filippou (filippou@ce.berkeley.edu)                     **
+**                                                                    **
+** ****************************************************************** */
+
+#ifndef _ReducerStream
+#define _ReducerStream
+
+// Description: This file contains the class definition for ReducerStream.
+// A ReducerStream keeps the envelope of the rows of data of a recorder in
+// an array in memory, which is not owned by the stream. Each row written
+// updates, for each column, the max, min, absolute max, root mean square,
+// time of the absolute max and last value, in this order, as the rows of
+// the array. The first column of the rows written is the time if the
+// recorder echoes the time, otherwise the number of the row is the time.
+
+#include <MemoryStream.h>
+
+#define REDUCER_STREAM_NUM_ROWS 6
+
+class ReducerStream : public MemoryStream
+{
+ public:
+  ReducerStream(double *data, int size, bool timeColumn = false);
+  ~ReducerStream();
+
+  int write(Vector &data);
+
+ private:
+  bool timeColumn;
+  double *sumSquares;
+};
+
+#endif
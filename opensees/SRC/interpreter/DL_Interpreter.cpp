@@ -96,6 +96,36 @@ DL_Interpreter::resetInput(int cArg)
     // does nothing
 }
 
+int
+DL_Interpreter::getDoubleList(int* size, Vector* data, bool* share, bool writable)
+{
+    return -1;
+}
+
+int
+DL_Interpreter::getIntList(int* size, ID* data)
+{
+    return -1;
+}
+
+void
+DL_Interpreter::releaseSharedInputs()
+{
+    // does nothing
+}
+
+void
+DL_Interpreter::allowThreads()
+{
+    // does nothing
+}
+
+void
+DL_Interpreter::endAllowThreads()
+{
+    // does nothing
+}
+
 int
 DL_Interpreter::setInt(int *, int numArgs, bool scalar)
 {
@@ -45,6 +45,8 @@ UPDATES, ENHANCEMENTS, OR MODIFICATIONS.
 #define DL_Interpreter_h
 
 class Command;
+class Vector;
+class ID;
 
 class DL_Interpreter
 {
@@ -67,6 +69,25 @@ class DL_Interpreter
     virtual int getStringCopy(char **stringPtr);
     virtual void resetInput(int cArg);
 
+    // read all doubles of a single list argument, e.g. a python buffer,
+    // returns -1 without consuming the argument if it is not a list;
+    // if *share is true, data may refer to the memory of the argument,
+    // which is then kept until releaseSharedInputs(), and *share is
+    // left true only if it does; if writable, the shared memory is
+    // written into and a read-only argument is rejected
+    virtual int getDoubleList(int* size, Vector* data, bool* share, bool writable = false);
+
+    // read all ints of a single list argument, e.g. a python buffer,
+    // returns -1 without consuming the argument if it is not a list
+    virtual int getIntList(int* size, ID* data);
+    virtual void releaseSharedInputs();
+
+    // methods to let other threads of the interpreter run during a
+    // computation that does not use the interpreter; commands from
+    // other threads wait until endAllowThreads()
+    virtual void allowThreads();
+    virtual void endAllowThreads();
+
     // methods for interpreters to output results
     virtual int setInt(int *, int numArgs, bool scalar);
     virtual int setDouble(double *, int numArgs, bool scalar);
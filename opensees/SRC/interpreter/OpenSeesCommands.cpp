@@ -65,11 +65,25 @@ UPDATES, ENHANCEMENTS, OR MODIFICATIONS.
 #include <YieldSurface_BC.h>
 #include <CyclicModel.h>
 #include <FileStream.h>
+#include <DummyStream.h>
+#include <Response.h>
+#include <Information.h>
+#include <Element.h>
+#include <Node.h>
 #include <CTestNormUnbalance.h>
 #include <NewtonRaphson.h>
 #include <TransformationConstraintHandler.h>
 #include <Newmark.h>
 #include <GimmeMCK.h>
+#include <FE_Element.h>
+#include <FE_EleIter.h>
+#include <DOF_Group.h>
+#include <DOF_GrpIter.h>
+#include <vector>
+#include <string>
+#include <map>
+#include <algorithm>
+#include <MapOfTaggedObjects.h>
 #include <ProfileSPDLinSolver.h>
 #include <ProfileSPDLinDirectSolver.h>
 #include <ProfileSPDLinSOE.h>
@@ -97,6 +111,7 @@ UPDATES, ENHANCEMENTS, OR MODIFICATIONS.
 #include <RegulaFalsiLineSearch.h>
 #include <NewtonLineSearch.h>
 #include <FileDatastore.h>
+#include <MemoryDatastore.h>
 #include <Mesh.h>
 #ifdef _MUMPS
 #include <MumpsSolver.h>
@@ -139,15 +154,67 @@ bool setMPIDSOEFlag = false;
 // active object
 static OpenSeesCommands* cmds = 0;
 
-OpenSeesCommands::OpenSeesCommands(DL_Interpreter* interp)
-    :interpreter(interp), theDomain(0), ndf(0), ndm(0),
+// all models of the interpreter by tag, model 0 is created with the interpreter
+static std::map<int, OpenSeesCommands*> theModels;
+
+// the model definitions live in global storage, which holds those of
+// the active model; an inactive model keeps its own in theLibraries
+extern void OPS_swapAllUniaxialMaterial(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllNDMaterial(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllSectionForceDeformation(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllSectionRepres(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllTimeSeries(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllCrdTransf(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllBeamIntegrationRule(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllLimitCurve(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllDamageModel(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllFrictionModel(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllHystereticBackbone(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllStiffnessDegradation(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllStrengthDegradation(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllUnloadingRule(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllYieldSurface_BC(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllCyclicModel(MapOfTaggedObjects &theObjects);
+extern void OPS_swapAllMesh(MapOfTaggedObjects &theObjects);
+
+typedef void (*SwapAllFunc)(MapOfTaggedObjects &);
+static SwapAllFunc swapAllFuncs[] = {
+    OPS_swapAllUniaxialMaterial,
+    OPS_swapAllNDMaterial,
+    OPS_swapAllSectionForceDeformation,
+    OPS_swapAllSectionRepres,
+    OPS_swapAllTimeSeries,
+    OPS_swapAllCrdTransf,
+    OPS_swapAllBeamIntegrationRule,
+    OPS_swapAllLimitCurve,
+    OPS_swapAllDamageModel,
+    OPS_swapAllFrictionModel,
+    OPS_swapAllHystereticBackbone,
+    OPS_swapAllStiffnessDegradation,
+    OPS_swapAllStrengthDegradation,
+    OPS_swapAllUnloadingRule,
+    OPS_swapAllYieldSurface_BC,
+    OPS_swapAllCyclicModel,
+    OPS_swapAllMesh
+};
+static const int numLibraries = sizeof(swapAllFuncs)/sizeof(SwapAllFunc);
+
+static int removeModel(int tag);
+
+OpenSeesCommands::OpenSeesCommands(DL_Interpreter* interp, int tag)
+    :interpreter(interp), modelTag(tag), theDomain(0), ndf(0), ndm(0),
      theSOE(0), theEigenSOE(0), theNumberer(0), theHandler(0),
      theStaticIntegrator(0), theTransientIntegrator(0),
      theAlgorithm(0), theStaticAnalysis(0), theTransientAnalysis(0),
      thePFEMAnalysis(0),
-     theAnalysisModel(0), theTest(0), numEigen(0), theDatabase(0),
+     theAnalysisModel(0), theTest(0), fallbackAlgorithms(), fallbackTests(),
+     numEigen(0),
+     eigenCacheModes(0), eigenCacheSolver(0), eigenCacheGeneralized(true),
+     eigenCacheSmallest(true), eigenCacheDomainStamp(0), eigenCacheCommitTag(0),
+     eigenCacheTime(0.0), theDatabase(0),
      theBroker(), theTimer(), theSimulationInfo(), theMachineBroker(0),
-     theChannels(0), numChannels(0), reliability(0)
+     theChannels(0), numChannels(0), reliability(0), theLibraries(0),
+     theBgMesh(0)
 {
 #ifdef _PARALLEL_INTERPRETERS
     theMachineBroker = new MPI_MachineBroker(&theBroker, 0, 0);
@@ -168,19 +235,44 @@ OpenSeesCommands::OpenSeesCommands(DL_Interpreter* interp)
     }
 #endif
 
-    cmds = this;
+    // the first model is the active one
+    if (cmds == 0) cmds = this;
+    theModels[modelTag] = this;
 
     theDomain = new Domain;
 
     reliability = new OpenSeesReliabilityCommands(theDomain);
+
+    theLibraries = new MapOfTaggedObjects[numLibraries];
+    theBgMesh = new BackgroundMesh;
 }
 
 OpenSeesCommands::~OpenSeesCommands()
 {
+    // the other models go with the model of the interpreter
+    if (modelTag == 0) {
+	this->activate();
+	std::map<int, OpenSeesCommands*>::iterator it = theModels.begin();
+	while (it != theModels.end()) {
+	    if (it->second == this) {
+		it++;
+	    } else {
+		removeModel(it->first);
+		it = theModels.begin();
+	    }
+	}
+    }
+    if (theModels.count(modelTag) > 0 && theModels[modelTag] == this) {
+	theModels.erase(modelTag);
+    }
+
+    this->clearFallbacks();
     if (reliability != 0) delete reliability;
     if (theDomain != 0) delete theDomain;
     if (theDatabase != 0) delete theDatabase;
-    cmds = 0;
+    if (theLibraries != 0) delete [] theLibraries;
+    if (theBgMesh != 0) delete theBgMesh;
+    if (cmds == this) cmds = 0;
 
 #ifdef _PARALLEL_INTERPRETERS
     if (theChannels != 0) {
@@ -196,6 +288,28 @@ OpenSeesCommands::~OpenSeesCommands()
 
 }
 
+void
+OpenSeesCommands::activate()
+{
+    if (cmds == this) return;
+
+    // put away the definitions of the active model and bring in ours
+    if (cmds != 0) cmds->swapLibraries();
+    this->swapLibraries();
+
+    cmds = this;
+    if (reliability != 0) reliability->activate();
+}
+
+void
+OpenSeesCommands::swapLibraries()
+{
+    for (int i=0; i<numLibraries; i++) {
+	swapAllFuncs[i](theLibraries[i]);
+    }
+    OPS_swapBgMesh(*theBgMesh);
+}
+
 DL_Interpreter*
 OpenSeesCommands::getInterpreter()
 {
@@ -232,48 +346,98 @@ OpenSeesCommands::setSOE(LinearSOE* soe)
     }
 }
 
+bool
+OpenSeesCommands::setDefaultAnalysis()
+{
+    if (theStaticAnalysis != 0 || theTransientAnalysis != 0) {
+	return false;
+    }
+
+    if (theAnalysisModel == 0)
+	theAnalysisModel = new AnalysisModel();
+    if (theTest == 0)
+	theTest = new CTestNormUnbalance(1.0e-6,25,0);
+    if (theAlgorithm == 0) {
+	theAlgorithm = new NewtonRaphson(*theTest);
+    }
+    if (theHandler == 0) {
+	theHandler = new TransformationConstraintHandler();
+    }
+    if (theNumberer == 0) {
+	RCM *theRCM = new RCM(false);
+	theNumberer = new DOF_Numberer(*theRCM);
+    }
+    if (theTransientIntegrator == 0) {
+	theTransientIntegrator = new Newmark(0.5,0.25);
+    }
+    if (theSOE == 0) {
+	ProfileSPDLinSolver *theSolver;
+	theSolver = new ProfileSPDLinDirectSolver();
+	theSOE = new ProfileSPDLinSOE(*theSolver);
+    }
+
+    theTransientAnalysis = new DirectIntegrationAnalysis(*theDomain,
+							 *theHandler,
+							 *theNumberer,
+							 *theAnalysisModel,
+							 *theAlgorithm,
+							 *theSOE,
+							 *theTransientIntegrator,
+							 theTest);
+    return true;
+}
+
+bool
+OpenSeesCommands::isEigenCached(int typeSolver, bool generalizedAlgo,
+				bool findSmallest, int num)
+{
+    if (eigenCacheModes < num || num <= 0) {
+	return false;
+    }
+    if (eigenCacheSolver != typeSolver ||
+	eigenCacheGeneralized != generalizedAlgo ||
+	eigenCacheSmallest != findSmallest) {
+	return false;
+    }
+
+    // the model must not be changed or analyzed since the last solution
+    if (theDomain->hasDomainChanged() != eigenCacheDomainStamp ||
+	theDomain->getCommitTag() != eigenCacheCommitTag ||
+	theDomain->getCurrentTime() != eigenCacheTime) {
+	return false;
+    }
+
+    return theDomain->getEigenvalues().Size() >= num;
+}
+
 int
 OpenSeesCommands::eigen(int typeSolver, double shift,
-			bool generalizedAlgo, bool findSmallest)
+			bool generalizedAlgo, bool findSmallest, bool useCache)
 {
     //
-    // create a transient analysis if no analysis exists
+    // reuse the last solution if the model has not changed
     //
-    bool newanalysis = false;
-    if (theStaticAnalysis == 0 && theTransientAnalysis == 0) {
-	if (theAnalysisModel == 0)
-	    theAnalysisModel = new AnalysisModel();
-	if (theTest == 0)
-	    theTest = new CTestNormUnbalance(1.0e-6,25,0);
-	if (theAlgorithm == 0) {
-	    theAlgorithm = new NewtonRaphson(*theTest);
-	}
-	if (theHandler == 0) {
-	    theHandler = new TransformationConstraintHandler();
-	}
-	if (theNumberer == 0) {
-	    RCM *theRCM = new RCM(false);
-	    theNumberer = new DOF_Numberer(*theRCM);
-	}
-	if (theTransientIntegrator == 0) {
-	    theTransientIntegrator = new Newmark(0.5,0.25);
-	}
-	if (theSOE == 0) {
-	    ProfileSPDLinSolver *theSolver;
-	    theSolver = new ProfileSPDLinDirectSolver();
-	    theSOE = new ProfileSPDLinSOE(*theSolver);
+    if (useCache && this->isEigenCached(typeSolver,generalizedAlgo,findSmallest,numEigen)) {
+	int num = numEigen;
+	const Vector &eigenvalues = theDomain->getEigenvalues();
+	double* data = new double[num];
+	for (int i=0; i<num; i++) {
+	    data[i] = eigenvalues(i);
 	}
+	OPS_SetDoubleOutput(&num, data, false);
+	delete [] data;
+
+	// all modes of the solution are still available
+	numEigen = eigenCacheModes;
 
-	theTransientAnalysis = new DirectIntegrationAnalysis(*theDomain,
-							     *theHandler,
-							     *theNumberer,
-							     *theAnalysisModel,
-							     *theAlgorithm,
-							     *theSOE,
-							     *theTransientIntegrator,
-							     theTest);
-	newanalysis = true;
+	return 0;
     }
+    eigenCacheModes = 0;
+
+    //
+    // create a transient analysis if no analysis exists
+    //
+    bool newanalysis = this->setDefaultAnalysis();
 
     //
     // create a new eigen system and solver
@@ -317,17 +481,28 @@ OpenSeesCommands::eigen(int typeSolver, double shift,
 
     // run analysis
     int result = 0;
+    interpreter->allowThreads();
     if (theStaticAnalysis != 0) {
 	result = theStaticAnalysis->eigen(numEigen, generalizedAlgo, findSmallest);
     } else if (theTransientAnalysis != 0) {
 	result = theTransientAnalysis->eigen(numEigen, generalizedAlgo, findSmallest);
     }
+    interpreter->endAllowThreads();
     if (newanalysis) {
 	delete theTransientAnalysis;
 	theTransientAnalysis = 0;
     }
 
     if (result == 0) {
+	// save the state of the solution
+	eigenCacheModes = numEigen;
+	eigenCacheSolver = typeSolver;
+	eigenCacheGeneralized = generalizedAlgo;
+	eigenCacheSmallest = findSmallest;
+	eigenCacheDomainStamp = theDomain->hasDomainChanged();
+	eigenCacheCommitTag = theDomain->getCommitTag();
+	eigenCacheTime = theDomain->getCurrentTime();
+
 	const Vector &eigenvalues = theDomain->getEigenvalues();
 	double* data = new double[numEigen];
 	for (int i=0; i<numEigen; i++) {
@@ -340,6 +515,138 @@ OpenSeesCommands::eigen(int typeSolver, double shift,
     return result;
 }
 
+// add the entries of an element or node matrix to the sparse entries,
+// keyed by row*numEqn+col of the equations
+static void
+addSparseEntries(std::vector<std::pair<long long, double> >& entries,
+		 const Matrix& A, const ID& id, int numEqn)
+{
+    int size = id.Size();
+    if (A.noRows() < size || A.noCols() < size) {
+	return;
+    }
+    for (int j=0; j<size; j++) {
+	int col = id(j);
+	if (col < 0) continue;
+	for (int i=0; i<size; i++) {
+	    int row = id(i);
+	    if (row < 0) continue;
+	    double value = A(i,j);
+	    if (value != 0.0) {
+		entries.push_back(std::make_pair((long long)row*numEqn+col, value));
+	    }
+	}
+    }
+}
+
+int
+OpenSeesCommands::sparseMatrix(double m, double c, double k, bool csr)
+{
+    //
+    // create a transient analysis if no analysis exists
+    //
+    bool newanalysis = this->setDefaultAnalysis();
+
+    // number the equations for the current domain
+    int result = 0;
+    if (theStaticAnalysis != 0) {
+	result = theStaticAnalysis->domainChanged();
+    } else if (theTransientAnalysis != 0) {
+	result = theTransientAnalysis->domainChanged();
+    }
+    if (result < 0) {
+	opserr << "WARNING sparseMatrix - failed to number the equations\n";
+	if (newanalysis) {
+	    delete theTransientAnalysis;
+	    theTransientAnalysis = 0;
+	}
+	return -1;
+    }
+
+    //
+    // form the element and nodal matrices as GimmeMCK does and
+    // collect the nonzero entries
+    //
+    int numEqn = theAnalysisModel->getNumEqn();
+    std::vector<std::pair<long long, double> > entries;
+
+    FE_EleIter &theEles = theAnalysisModel->getFEs();
+    FE_Element *theEle;
+    while ((theEle = theEles()) != 0) {
+	theEle->zeroTangent();
+	if (k != 0.0)
+	    theEle->addKtToTang(k);
+	if (c != 0.0)
+	    theEle->addCtoTang(c);
+	if (m != 0.0)
+	    theEle->addMtoTang(m);
+	addSparseEntries(entries, theEle->getTangent(0), theEle->getID(), numEqn);
+    }
+
+    DOF_GrpIter &theDOFs = theAnalysisModel->getDOFs();
+    DOF_Group *theDOF;
+    while ((theDOF = theDOFs()) != 0) {
+	theDOF->zeroTangent();
+	if (c != 0.0)
+	    theDOF->addCtoTang(c);
+	if (m != 0.0)
+	    theDOF->addMtoTang(m);
+	addSparseEntries(entries, theDOF->getTangent(0), theDOF->getID(), numEqn);
+    }
+
+    if (newanalysis) {
+	delete theTransientAnalysis;
+	theTransientAnalysis = 0;
+    }
+
+    // sum the entries at the same location
+    std::sort(entries.begin(), entries.end());
+    int nnz = 0;
+    for (int i=0; i<(int)entries.size(); i++) {
+	if (nnz > 0 && entries[nnz-1].first == entries[i].first) {
+	    entries[nnz-1].second += entries[i].second;
+	} else {
+	    entries[nnz++] = entries[i];
+	}
+    }
+
+    //
+    // set the output as
+    //   coo: numEqn, nnz, rows[nnz], cols[nnz], values[nnz]
+    //   csr: numEqn, nnz, rowPtr[numEqn+1], cols[nnz], values[nnz]
+    //
+    int numRows = csr ? numEqn+1 : nnz;
+    int size = 2 + numRows + 2*nnz;
+    std::vector<double> data(size, 0.0);
+    data[0] = numEqn;
+    data[1] = nnz;
+    double* rows = &data[2];
+    double* cols = rows + numRows;
+    double* values = cols + nnz;
+    for (int i=0; i<nnz; i++) {
+	int row = (int)(entries[i].first / numEqn);
+	if (csr) {
+	    rows[row+1] += 1.0;
+	} else {
+	    rows[i] = row;
+	}
+	cols[i] = (int)(entries[i].first % numEqn);
+	values[i] = entries[i].second;
+    }
+    if (csr) {
+	for (int i=0; i<numEqn; i++) {
+	    rows[i+1] += rows[i];
+	}
+    }
+
+    if (OPS_SetDoubleOutput(&size, &data[0], false) < 0) {
+	opserr << "WARNING sparseMatrix - failed to set output\n";
+	return -1;
+    }
+
+    return 0;
+}
+
 int* OPS_GetNumEigen()                                                          
 {                                                                               
     static int numEigen = 0;                                                    
@@ -354,6 +661,12 @@ int* OPS_GetNumEigen()
     return &numEigen;                                                           
 }
 
+void OPS_clearEigenCache()
+{
+    if (cmds == 0) return;
+    cmds->clearEigenCache();
+}
+
 void
 OpenSeesCommands::setNumberer(DOF_Numberer* numberer)
 {
@@ -515,6 +828,175 @@ OpenSeesCommands::setAlgorithm(EquiSolnAlgo* algorithm)
     }
 }
 
+void
+OpenSeesCommands::addFallbackAlgorithm(EquiSolnAlgo* algorithm)
+{
+    fallbackAlgorithms.push_back(algorithm);
+    fallbackTests.push_back(0);
+}
+
+int
+OpenSeesCommands::setFallbackCTest(ConvergenceTest* test)
+{
+    if (fallbackTests.empty()) {
+	return -1;
+    }
+
+    if (fallbackTests.back() != 0) {
+	delete fallbackTests.back();
+    }
+    fallbackTests.back() = test;
+
+    return 0;
+}
+
+void
+OpenSeesCommands::clearFallbacks()
+{
+    for (int i = 0; i < (int)fallbackAlgorithms.size(); i++) {
+	delete fallbackAlgorithms[i];
+	if (fallbackTests[i] != 0) {
+	    delete fallbackTests[i];
+	}
+    }
+    fallbackAlgorithms.clear();
+    fallbackTests.clear();
+}
+
+int
+OpenSeesCommands::analyzeAdaptive(int numIncr, double dt, int maxBisections,
+				  std::vector<double>& summary)
+{
+    if (theStaticAnalysis == 0 && theTransientAnalysis == 0) {
+	opserr << "WARNING analyzeAdaptive - no static or transient analysis\n";
+	return -1;
+    }
+    if (thePFEMAnalysis != 0) {
+	opserr << "WARNING analyzeAdaptive - not available in a PFEM analysis\n";
+	return -1;
+    }
+
+    // for each step: time, highest rung of the ladder needed (-1 if
+    // the step failed), number of sub-steps and number of iterations
+    summary.clear();
+    summary.reserve(4*numIncr);
+
+    int result = 0;
+    for (int i = 0; i < numIncr; i++) {
+	int rung = 0, numSteps = 0, numIter = 0;
+	result = this->adaptiveStep(dt, 0, maxBisections, rung, numSteps, numIter);
+
+	summary.push_back(theDomain->getCurrentTime());
+	summary.push_back(result < 0 ? -1 : rung);
+	summary.push_back(numSteps);
+	summary.push_back(numIter);
+
+	if (result < 0) {
+	    break;
+	}
+    }
+
+    return result;
+}
+
+int
+OpenSeesCommands::adaptiveStep(double dt, int level, int maxLevel,
+			       int& rung, int& numSteps, int& numIter)
+{
+    // try the analysis algorithm, then the fallbacks in order
+    int numRungs = 1 + (int)fallbackAlgorithms.size();
+    for (int i = 0; i < numRungs; i++) {
+	if (this->ladderStep(i, dt, numIter) >= 0) {
+	    if (i > rung) rung = i;
+	    numSteps++;
+	    return 0;
+	}
+    }
+
+    // all failed, bisect the time step of a transient analysis
+    if (theTransientAnalysis == 0 || level >= maxLevel) {
+	return -1;
+    }
+    for (int j = 0; j < 2; j++) {
+	if (this->adaptiveStep(dt/2, level+1, maxLevel, rung, numSteps, numIter) < 0) {
+	    return -1;
+	}
+    }
+
+    return 0;
+}
+
+int
+OpenSeesCommands::ladderStep(int rung, double dt, int& numIter)
+{
+    // the analysis with its own algorithm, which also
+    // sets up the analysis if the domain has changed
+    if (rung == 0) {
+	int result = 0;
+	if (theStaticAnalysis != 0) {
+	    result = theStaticAnalysis->analyze(1);
+	} else {
+	    result = theTransientAnalysis->analyzeStep(dt);
+	}
+	if (theTest != 0) {
+	    numIter += theTest->getNumTests();
+	}
+	return result;
+    }
+
+    // a fallback algorithm in place of the analysis algorithm,
+    // as StaticAnalysis::analyze and DirectIntegrationAnalysis::analyzeStep
+    EquiSolnAlgo* theAlgo = fallbackAlgorithms[rung-1];
+    ConvergenceTest* test = fallbackTests[rung-1];
+    if (test == 0) {
+	test = theTest;
+    }
+
+    IncrementalIntegrator* theIntegrator = theStaticIntegrator;
+    if (theStaticAnalysis == 0) {
+	theIntegrator = theTransientIntegrator;
+    }
+    theIntegrator->setLinks(*theAnalysisModel, *theSOE, test);
+    theAlgo->setLinks(*theAnalysisModel, *theIntegrator, *theSOE, test);
+    theAlgo->domainChanged();
+
+    int result = 0;
+    if (theStaticAnalysis != 0) {
+	if (theAnalysisModel->analysisStep() < 0) {
+	    result = -2;
+	} else if (theStaticIntegrator->newStep() < 0) {
+	    result = -2;
+	}
+    } else {
+	if (theAnalysisModel->analysisStep(dt) < 0) {
+	    result = -2;
+	} else if (theTransientIntegrator->newStep(dt) < 0) {
+	    result = -2;
+	}
+    }
+    if (result == 0 && theAlgo->solveCurrentStep() < 0) {
+	result = -3;
+    }
+    if (test != 0) {
+	numIter += test->getNumTests();
+    }
+    if (result == 0 && theIntegrator->commit() < 0) {
+	result = -4;
+    }
+    if (result < 0) {
+	theDomain->revertToLastCommit();
+	theIntegrator->revertToLastStep();
+    }
+
+    // back to the analysis algorithm and test
+    theIntegrator->setLinks(*theAnalysisModel, *theSOE, theTest);
+    if (theTest != 0) {
+	theAlgorithm->setConvergenceTest(theTest);
+    }
+
+    return result;
+}
+
 void
 OpenSeesCommands::setStaticAnalysis()
 {
@@ -850,6 +1332,7 @@ OpenSeesCommands::wipeAnalysis()
     thePFEMAnalysis = 0;
     theTest = 0;
 
+    this->clearFallbacks();
 }
 
 void
@@ -857,6 +1340,9 @@ OpenSeesCommands::wipe()
 {
     this->wipeAnalysis();
 
+    // the eigen solution of the old model
+    this->clearEigenCache();
+
     // data base
     if (theDatabase != 0) {
 	delete theDatabase;
@@ -919,6 +1405,9 @@ OpenSeesCommands::wipe()
 	//theReliabilityDomain->clearAll();
       }
     }
+
+    // the time series using shared input data are gone
+    interpreter->releaseSharedInputs();
 }
 
 void
@@ -931,14 +1420,121 @@ OpenSeesCommands::setFileDatabase(const char* filename)
     }
 }
 
+// a snapshot is [version, commitTag, size, data of a MemoryDatastore]
+static const int snapshotVersion = 1;
+static const int snapshotHeader = 3;
+
+int
+OpenSeesCommands::snapshot(Vector& data)
+{
+    // the domain sends its geometry and state to a new datastore,
+    // so that the snapshot holds everything to rebuild the domain
+    MemoryDatastore theStore(*theDomain, theBroker);
+    int commitTag = theDomain->getCommitTag();
+    if (theStore.commitState(commitTag) < 0) {
+	opserr << "WARNING snapshot - failed to send the domain\n";
+	return -1;
+    }
+
+    int size = theStore.getBufferSize();
+    data.resize(snapshotHeader+size);
+    data(0) = snapshotVersion;
+    data(1) = commitTag;
+    data(2) = size;
+    if (size > 0) {
+	theStore.saveBuffer(&data(snapshotHeader));
+    }
+
+    return 0;
+}
+
+int
+OpenSeesCommands::restoreSnapshot(Vector& data)
+{
+    int size = data.Size()-snapshotHeader;
+    if (size < 0 || (int)data(0) != snapshotVersion || (int)data(2) != size) {
+	opserr << "WARNING restoreSnapshot - invalid snapshot\n";
+	return -1;
+    }
+    int commitTag = (int)data(1);
+
+    MemoryDatastore theStore(*theDomain, theBroker);
+    if (size > 0 && theStore.loadBuffer(&data(snapshotHeader), size) < 0) {
+	opserr << "WARNING restoreSnapshot - invalid snapshot\n";
+	return -1;
+    }
+
+    // the domain is rebuilt from the snapshot, the analysis must
+    // not keep the DOF_Groups and FE_Elements of the old one
+    if (theAnalysisModel != 0) {
+	theAnalysisModel->clearAll();
+    }
+    this->clearEigenCache();
+
+    if (theStore.restoreState(commitTag) < 0) {
+	opserr << "WARNING restoreSnapshot - failed to rebuild the domain\n";
+	return -1;
+    }
+    theDomain->domainChange();
+
+    int result = 0;
+    if (theStaticAnalysis != 0) {
+	result = theStaticAnalysis->domainChanged();
+    } else if (theTransientAnalysis != 0) {
+	result = theTransientAnalysis->domainChanged();
+    }
+    if (result < 0) {
+	opserr << "WARNING restoreSnapshot - the analysis failed to set up the restored domain\n";
+	return -1;
+    }
+
+    return 0;
+}
+
 /////////////////////////////
 //// OpenSees APIs  /// /////
 /////////////////////////////
+
+// ints read before the rest of the command line, e.g. the tag and the
+// nodes of each element of the elements command
+static const ID* inputPrefix = 0;
+static int inputPrefixLoc = 0;
+static int inputPrefixArgs = 0;
+static std::vector<std::string> inputPrefixStrings;
+
+int OPS_SetInputPrefix(const ID& prefix)
+{
+    if (cmds == 0) return -1;
+    DL_Interpreter* interp = cmds->getInterpreter();
+    inputPrefix = &prefix;
+    inputPrefixLoc = 0;
+    inputPrefixArgs = interp->getNumRemainingInputArgs();
+    return 0;
+}
+
+int OPS_ClearInputPrefix()
+{
+    // the number of ints of the prefix not read
+    int num = 0;
+    if (inputPrefix != 0) {
+	num = inputPrefix->Size() - inputPrefixLoc;
+    }
+    inputPrefix = 0;
+    inputPrefixLoc = 0;
+    return num;
+}
+
+static int getNumInputPrefix()
+{
+    if (inputPrefix == 0) return 0;
+    return inputPrefix->Size() - inputPrefixLoc;
+}
+
 int OPS_GetNumRemainingInputArgs()
 {
     if (cmds == 0) return 0;
     DL_Interpreter* interp = cmds->getInterpreter();
-    return interp->getNumRemainingInputArgs();
+    return getNumInputPrefix() + interp->getNumRemainingInputArgs();
 }
 
 int OPS_GetIntInput(int *numData, int*data)
@@ -946,7 +1542,21 @@ int OPS_GetIntInput(int *numData, int*data)
     if (cmds == 0) return 0;
     DL_Interpreter* interp = cmds->getInterpreter();
     if (numData == 0 || data == 0) return -1;
-    return interp->getInt(data, *numData);
+    int num = 0;
+    while (num < *numData && getNumInputPrefix() > 0) {
+	data[num++] = (*inputPrefix)(inputPrefixLoc++);
+    }
+    if (num == *numData) return 0;
+    return interp->getInt(data+num, *numData-num);
+}
+
+int OPS_GetIntListInput(int* size, ID* data)
+{
+    if (cmds == 0) return -1;
+    DL_Interpreter* interp = cmds->getInterpreter();
+    if (size == 0 || data == 0) return -1;
+    if (getNumInputPrefix() > 0) return -1;
+    return interp->getIntList(size, data);
 }
 
 int OPS_SetIntOutput(int *numData, int*data, bool scalar)
@@ -961,7 +1571,21 @@ int OPS_GetDoubleInput(int *numData, double *data)
     if (cmds == 0) return 0;
     DL_Interpreter* interp = cmds->getInterpreter();
     if (numData == 0 || data == 0) return -1;
-    return interp->getDouble(data, *numData);
+    int num = 0;
+    while (num < *numData && getNumInputPrefix() > 0) {
+	data[num++] = (*inputPrefix)(inputPrefixLoc++);
+    }
+    if (num == *numData) return 0;
+    return interp->getDouble(data+num, *numData-num);
+}
+
+int OPS_GetDoubleListInput(int* size, Vector* data, bool* share, bool writable)
+{
+    if (cmds == 0) return -1;
+    DL_Interpreter* interp = cmds->getInterpreter();
+    if (size == 0 || data == 0) return -1;
+    if (getNumInputPrefix() > 0) return -1;
+    return interp->getDoubleList(size, data, share, writable);
 }
 
 int OPS_SetDoubleOutput(int *numData, double *data, bool scalar)
@@ -975,6 +1599,16 @@ const char * OPS_GetString(void)
 {
     if (cmds == 0) return "Invalid String Input!";
     DL_Interpreter* interp = cmds->getInterpreter();
+    if (getNumInputPrefix() > 0) {
+	// kept until the prefix is read again
+	if ((int)inputPrefixStrings.size() < inputPrefix->Size()) {
+	    inputPrefixStrings.resize(inputPrefix->Size());
+	}
+	char buffer[20];
+	sprintf(buffer, "%d", (*inputPrefix)(inputPrefixLoc));
+	inputPrefixStrings[inputPrefixLoc] = buffer;
+	return inputPrefixStrings[inputPrefixLoc++].c_str();
+    }
     const char* res = interp->getString();
     if (res == 0) {
 	return "Invalid String Input!";
@@ -1022,6 +1656,20 @@ int OPS_ResetCurrentInputArg(int cArg)
     }
     if (cmds == 0) return 0;
     DL_Interpreter* interp = cmds->getInterpreter();
+    if (inputPrefix != 0 && cArg < 0) {
+	// back over the command line read after the prefix, then
+	// over the prefix
+	int back = -cArg;
+	int numRead = inputPrefixArgs - interp->getNumRemainingInputArgs();
+	if (numRead > 0) {
+	    int num = back < numRead ? back : numRead;
+	    interp->resetInput(-num);
+	    back -= num;
+	}
+	inputPrefixLoc -= back;
+	if (inputPrefixLoc < 0) inputPrefixLoc = 0;
+	return 0;
+    }
     interp->resetInput(cArg);
     return 0;
 }
@@ -1321,17 +1969,10 @@ int OPS_ConstraintHandler()
     return 0;
 }
 
-int OPS_CTest()
+static int newCTest(const char* type, ConvergenceTest*& theTest)
 {
-    if (OPS_GetNumRemainingInputArgs() < 1) {
-    	opserr << "WARNING insufficient args: test type ...\n";
-    	return -1;
-    }
-
-    const char* type = OPS_GetString();
-
     // create ctest
-    ConvergenceTest* theTest = 0;
+    theTest = 0;
     if (strcmp(type,"NormDispAndUnbalance") == 0) {
 	theTest = (ConvergenceTest*)OPS_NormDispAndUnbalance();
 
@@ -1372,6 +2013,24 @@ int OPS_CTest()
     	return -1;
     }
 
+    return 0;
+}
+
+int OPS_CTest()
+{
+    if (OPS_GetNumRemainingInputArgs() < 1) {
+    	opserr << "WARNING insufficient args: test type ...\n";
+    	return -1;
+    }
+
+    const char* type = OPS_GetString();
+
+    // create ctest
+    ConvergenceTest* theTest = 0;
+    if (newCTest(type, theTest) < 0) {
+	return -1;
+    }
+
     // set test
     if (cmds != 0) {
 	cmds->setCTest(theTest);
@@ -1380,6 +2039,97 @@ int OPS_CTest()
     return 0;
 }
 
+namespace {
+
+    struct char_cmp {
+	bool operator () (const char *a,const char *b) const
+	    {
+		return strcmp(a,b)<0;
+	    }
+    };
+
+    typedef std::map<const char *, void *(*)(void), char_cmp> OPS_ParsingFunctionMap;
+
+    // integrators and algorithms by type, looked up instead of
+    // comparing the type to each name in turn
+    static OPS_ParsingFunctionMap staticIntegratorMap;
+    static OPS_ParsingFunctionMap transientIntegratorMap;
+    static OPS_ParsingFunctionMap algorithmMap;
+
+    static int setUpFunctions(void)
+    {
+	staticIntegratorMap.insert(std::make_pair("LoadControl", &OPS_LoadControlIntegrator));
+	staticIntegratorMap.insert(std::make_pair("DisplacementControl", &OPS_DisplacementControlIntegrator));
+	staticIntegratorMap.insert(std::make_pair("ParallelDisplacementControl", &OPS_ParallelDisplacementControl));
+	staticIntegratorMap.insert(std::make_pair("ArcLength", &OPS_ArcLength));
+	staticIntegratorMap.insert(std::make_pair("ArcLength1", &OPS_ArcLength1));
+	staticIntegratorMap.insert(std::make_pair("HSConstraint", &OPS_HSConstraint));
+	staticIntegratorMap.insert(std::make_pair("MinUnbalDispNorm", &OPS_MinUnbalDispNorm));
+
+	transientIntegratorMap.insert(std::make_pair("Newmark", &OPS_Newmark));
+	transientIntegratorMap.insert(std::make_pair("GimmeMCK", &OPS_GimmeMCK));
+	transientIntegratorMap.insert(std::make_pair("ZZTop", &OPS_GimmeMCK));
+	transientIntegratorMap.insert(std::make_pair("TRBDF2", &OPS_TRBDF2));
+	transientIntegratorMap.insert(std::make_pair("Bathe", &OPS_TRBDF2));
+	transientIntegratorMap.insert(std::make_pair("TRBDF3", &OPS_TRBDF3));
+	transientIntegratorMap.insert(std::make_pair("Bathe3", &OPS_TRBDF3));
+	transientIntegratorMap.insert(std::make_pair("Houbolt", &OPS_Houbolt));
+	transientIntegratorMap.insert(std::make_pair("BackwardEuler", &OPS_BackwardEuler));
+	transientIntegratorMap.insert(std::make_pair("PFEM", &OPS_PFEMIntegrator));
+	transientIntegratorMap.insert(std::make_pair("NewmarkExplicit", &OPS_NewmarkExplicit));
+	transientIntegratorMap.insert(std::make_pair("NewmarkHSIncrLimit", &OPS_NewmarkHSIncrLimit));
+	transientIntegratorMap.insert(std::make_pair("NewmarkHSIncrReduct", &OPS_NewmarkHSIncrReduct));
+	transientIntegratorMap.insert(std::make_pair("NewmarkHSFixedNumIter", &OPS_NewmarkHSFixedNumIter));
+	transientIntegratorMap.insert(std::make_pair("HHT", &OPS_HHT));
+	transientIntegratorMap.insert(std::make_pair("HHT_TP", &OPS_HHT_TP));
+	transientIntegratorMap.insert(std::make_pair("HHTGeneralized", &OPS_HHTGeneralized));
+	transientIntegratorMap.insert(std::make_pair("HHTGeneralized_TP", &OPS_HHTGeneralized_TP));
+	transientIntegratorMap.insert(std::make_pair("HHTExplicit", &OPS_HHTExplicit));
+	transientIntegratorMap.insert(std::make_pair("HHTExplicit_TP", &OPS_HHTExplicit_TP));
+	transientIntegratorMap.insert(std::make_pair("HHTGeneralizedExplicit", &OPS_HHTGeneralizedExplicit));
+	transientIntegratorMap.insert(std::make_pair("HHTGeneralizedExplicit_TP", &OPS_HHTGeneralizedExplicit_TP));
+	transientIntegratorMap.insert(std::make_pair("HHTHSIncrLimit", &OPS_HHTHSIncrLimit));
+	transientIntegratorMap.insert(std::make_pair("HHTHSIncrLimit_TP", &OPS_HHTHSIncrLimit_TP));
+	transientIntegratorMap.insert(std::make_pair("HHTHSIncrReduct", &OPS_HHTHSIncrReduct));
+	transientIntegratorMap.insert(std::make_pair("HHTHSIncrReduct_TP", &OPS_HHTHSIncrReduct_TP));
+	transientIntegratorMap.insert(std::make_pair("HHTHSFixedNumIter", &OPS_HHTHSIncrReduct));
+	transientIntegratorMap.insert(std::make_pair("HHTHSFixedNumIter_TP", &OPS_HHTHSIncrReduct_TP));
+	transientIntegratorMap.insert(std::make_pair("GeneralizedAlpha", &OPS_GeneralizedAlpha));
+	transientIntegratorMap.insert(std::make_pair("KRAlphaExplicit", &OPS_KRAlphaExplicit));
+	transientIntegratorMap.insert(std::make_pair("KRAlphaExplicit_TP", &OPS_KRAlphaExplicit_TP));
+	transientIntegratorMap.insert(std::make_pair("AlphaOS", &OPS_AlphaOS));
+	transientIntegratorMap.insert(std::make_pair("AlphaOS_TP", &OPS_AlphaOS_TP));
+	transientIntegratorMap.insert(std::make_pair("AlphaOSGeneralized", &OPS_AlphaOSGeneralized));
+	transientIntegratorMap.insert(std::make_pair("AlphaOSGeneralized_TP", &OPS_AlphaOSGeneralized_TP));
+	transientIntegratorMap.insert(std::make_pair("Collocation", &OPS_Collocation));
+	transientIntegratorMap.insert(std::make_pair("CollocationHSIncrReduct", &OPS_CollocationHSIncrReduct));
+	transientIntegratorMap.insert(std::make_pair("CollocationHSIncrLimit", &OPS_CollocationHSIncrLimit));
+	transientIntegratorMap.insert(std::make_pair("CollocationHSFixedNumIter", &OPS_CollocationHSFixedNumIter));
+	transientIntegratorMap.insert(std::make_pair("Newmark1", &OPS_Newmark1));
+	transientIntegratorMap.insert(std::make_pair("WilsonTheta", &OPS_WilsonTheta));
+	transientIntegratorMap.insert(std::make_pair("CentralDifference", &OPS_CentralDifference));
+	transientIntegratorMap.insert(std::make_pair("CentralDifferenceAlternative", &OPS_CentralDifferenceAlternative));
+	transientIntegratorMap.insert(std::make_pair("CentralDifferenceNoDamping", &OPS_CentralDifferenceNoDamping));
+	transientIntegratorMap.insert(std::make_pair("ExplicitDifference", &OPS_Explicitdifference));
+
+	algorithmMap.insert(std::make_pair("Linear", &OPS_LinearAlgorithm));
+	algorithmMap.insert(std::make_pair("Newton", &OPS_NewtonRaphsonAlgorithm));
+	algorithmMap.insert(std::make_pair("ModifiedNewton", &OPS_ModifiedNewton));
+	algorithmMap.insert(std::make_pair("KrylovNewton", &OPS_KrylovNewton));
+	algorithmMap.insert(std::make_pair("RaphsonNewton", &OPS_RaphsonNewton));
+	algorithmMap.insert(std::make_pair("MillerNewton", &OPS_MillerNewton));
+	algorithmMap.insert(std::make_pair("SecantNewton", &OPS_SecantNewton));
+	algorithmMap.insert(std::make_pair("PeriodicNewton", &OPS_PeriodicNewton));
+	algorithmMap.insert(std::make_pair("Broyden", &OPS_Broyden));
+	algorithmMap.insert(std::make_pair("BFGS", &OPS_BFGS));
+	algorithmMap.insert(std::make_pair("NewtonLineSearch", &OPS_NewtonLineSearch));
+
+	return 0;
+    }
+
+    static int initDone = setUpFunctions();
+}
+
 int OPS_Integrator()
 {
     if (OPS_GetNumRemainingInputArgs() < 1) {
@@ -1392,158 +2142,16 @@ int OPS_Integrator()
     // create integrator
     StaticIntegrator* si = 0;
     TransientIntegrator* ti = 0;
-    if (strcmp(type,"LoadControl") == 0) {
-
-	si = (StaticIntegrator*)OPS_LoadControlIntegrator();
-
-    } else if (strcmp(type,"DisplacementControl") == 0) {
-
-	si = (StaticIntegrator*)OPS_DisplacementControlIntegrator();
-
-    } else if (strcmp(type,"ParallelDisplacementControl") == 0) {
-
-        si = (StaticIntegrator*)OPS_ParallelDisplacementControl();
-
-    } else if (strcmp(type,"ArcLength") == 0) {
-	si = (StaticIntegrator*)OPS_ArcLength();
-
-    } else if (strcmp(type,"ArcLength1") == 0) {
-	si = (StaticIntegrator*)OPS_ArcLength1();
-
-    } else if (strcmp(type,"HSConstraint") == 0) {
-	si = (StaticIntegrator*)OPS_HSConstraint();
-
-    } else if (strcmp(type,"MinUnbalDispNorm") == 0) {
-	si = (StaticIntegrator*)OPS_MinUnbalDispNorm();
-
-    } else if (strcmp(type,"Newmark") == 0) {
-	ti = (TransientIntegrator*)OPS_Newmark();
-
-    } else if (strcmp(type,"GimmeMCK") == 0 || strcmp(type,"ZZTop") == 0) {
-	ti = (TransientIntegrator*)OPS_GimmeMCK();
-
-    } else if (strcmp(type,"TRBDF2") == 0 || strcmp(type,"Bathe") == 0) {
-	ti = (TransientIntegrator*)OPS_TRBDF2();
-
-    } else if (strcmp(type,"TRBDF3") == 0 || strcmp(type,"Bathe3") == 0) {
-	ti = (TransientIntegrator*)OPS_TRBDF3();
-
-    } else if (strcmp(type,"Houbolt") == 0) {
-	ti = (TransientIntegrator*)OPS_Houbolt();
-
-    } else if (strcmp(type,"BackwardEuler") == 0) {
-	ti = (TransientIntegrator*)OPS_BackwardEuler();
-
-    } else if (strcmp(type,"PFEM") == 0) {
-	ti = (TransientIntegrator*)OPS_PFEMIntegrator();
-
-    } else if (strcmp(type,"NewmarkExplicit") == 0) {
-	ti = (TransientIntegrator*)OPS_NewmarkExplicit();
-
-    } else if (strcmp(type,"NewmarkHSIncrLimit") == 0) {
-	ti = (TransientIntegrator*)OPS_NewmarkHSIncrLimit();
-
-    } else if (strcmp(type,"NewmarkHSIncrReduct") == 0) {
-	ti = (TransientIntegrator*)OPS_NewmarkHSIncrReduct();
-
-    } else if (strcmp(type,"NewmarkHSFixedNumIter") == 0) {
-	ti = (TransientIntegrator*)OPS_NewmarkHSFixedNumIter();
-
-    } else if (strcmp(type,"HHT") == 0) {
-	ti = (TransientIntegrator*)OPS_HHT();
-
-    } else if (strcmp(type,"HHT_TP") == 0) {
-	ti = (TransientIntegrator*)OPS_HHT_TP();
-
-    } else if (strcmp(type,"HHTGeneralized") == 0) {
-	ti = (TransientIntegrator*)OPS_HHTGeneralized();
-
-    } else if (strcmp(type,"HHTGeneralized_TP") == 0) {
-	ti = (TransientIntegrator*)OPS_HHTGeneralized_TP();
-
-    } else if (strcmp(type,"HHTExplicit") == 0) {
-	ti = (TransientIntegrator*)OPS_HHTExplicit();
-
-    } else if (strcmp(type,"HHTExplicit_TP") == 0) {
-	ti = (TransientIntegrator*)OPS_HHTExplicit_TP();
-
-    } else if (strcmp(type,"HHTGeneralizedExplicit") == 0) {
-	ti = (TransientIntegrator*)OPS_HHTGeneralizedExplicit();
-
-    } else if (strcmp(type,"HHTGeneralizedExplicit_TP") == 0) {
-	ti = (TransientIntegrator*)OPS_HHTGeneralizedExplicit_TP();
-
-    } else if (strcmp(type,"HHTHSIncrLimit") == 0) {
-	ti = (TransientIntegrator*)OPS_HHTHSIncrLimit();
-
-    } else if (strcmp(type,"HHTHSIncrLimit_TP") == 0) {
-	ti = (TransientIntegrator*)OPS_HHTHSIncrLimit_TP();
-
-    } else if (strcmp(type,"HHTHSIncrReduct") == 0) {
-	ti = (TransientIntegrator*)OPS_HHTHSIncrReduct();
-
-    } else if (strcmp(type,"HHTHSIncrReduct_TP") == 0) {
-	ti = (TransientIntegrator*)OPS_HHTHSIncrReduct_TP();
-
-    } else if (strcmp(type,"HHTHSFixedNumIter") == 0) {
-	ti = (TransientIntegrator*)OPS_HHTHSIncrReduct();
-
-    } else if (strcmp(type,"HHTHSFixedNumIter_TP") == 0) {
-	ti = (TransientIntegrator*)OPS_HHTHSIncrReduct_TP();
-
-    } else if (strcmp(type,"GeneralizedAlpha") == 0) {
-	ti = (TransientIntegrator*)OPS_GeneralizedAlpha();
-
-    } else if (strcmp(type,"KRAlphaExplicit") == 0) {
-	ti = (TransientIntegrator*)OPS_KRAlphaExplicit();
-
-    } else if (strcmp(type,"KRAlphaExplicit_TP") == 0) {
-	ti = (TransientIntegrator*)OPS_KRAlphaExplicit_TP();
-
-    } else if (strcmp(type,"AlphaOS") == 0) {
-	ti = (TransientIntegrator*)OPS_AlphaOS();
-
-    } else if (strcmp(type,"AlphaOS_TP") == 0) {
-	ti = (TransientIntegrator*)OPS_AlphaOS_TP();
-
-    } else if (strcmp(type,"AlphaOSGeneralized") == 0) {
-	ti = (TransientIntegrator*)OPS_AlphaOSGeneralized();
-
-    } else if (strcmp(type,"AlphaOSGeneralized_TP") == 0) {
-	ti = (TransientIntegrator*)OPS_AlphaOSGeneralized_TP();
-
-    } else if (strcmp(type,"Collocation") == 0) {
-	ti = (TransientIntegrator*)OPS_Collocation();
-
-    } else if (strcmp(type,"CollocationHSIncrReduct") == 0) {
-	ti = (TransientIntegrator*)OPS_CollocationHSIncrReduct();
-
-    } else if (strcmp(type,"CollocationHSIncrLimit") == 0) {
-	ti = (TransientIntegrator*)OPS_CollocationHSIncrLimit();
-
-    } else if (strcmp(type,"CollocationHSFixedNumIter") == 0) {
-	ti = (TransientIntegrator*)OPS_CollocationHSFixedNumIter();
-
-    } else if (strcmp(type,"Newmark1") == 0) {
-	ti = (TransientIntegrator*)OPS_Newmark1();
-
-    } else if (strcmp(type,"WilsonTheta") == 0) {
-	ti = (TransientIntegrator*)OPS_WilsonTheta();
-
-    } else if (strcmp(type,"CentralDifference") == 0) {
-	ti = (TransientIntegrator*)OPS_CentralDifference();
-
-    } else if (strcmp(type,"CentralDifferenceAlternative") == 0) {
-	ti = (TransientIntegrator*)OPS_CentralDifferenceAlternative();
-
-    } else if (strcmp(type,"CentralDifferenceNoDamping") == 0) {
-	ti = (TransientIntegrator*)OPS_CentralDifferenceNoDamping();
-
-	} else if (strcmp(type, "ExplicitDifference") == 0) {
-    ti = (TransientIntegrator*)OPS_Explicitdifference();
-
+    OPS_ParsingFunctionMap::const_iterator iter = staticIntegratorMap.find(type);
+    if (iter != staticIntegratorMap.end()) {
+	si = (StaticIntegrator*)(*iter->second)();
     } else {
-	opserr<<"WARNING unknown integrator type "<<type<<"\n";
+	iter = transientIntegratorMap.find(type);
+	if (iter != transientIntegratorMap.end()) {
+	    ti = (TransientIntegrator*)(*iter->second)();
+	} else {
+	    opserr<<"WARNING unknown integrator type "<<type<<"\n";
+	}
     }
 
     // set integrator
@@ -1560,6 +2168,20 @@ int OPS_Integrator()
     return 0;
 }
 
+static int newAlgorithm(const char* type, EquiSolnAlgo*& theAlgo)
+{
+    // create algorithm
+    theAlgo = 0;
+    OPS_ParsingFunctionMap::const_iterator iter = algorithmMap.find(type);
+    if (iter == algorithmMap.end()) {
+	opserr<<"WARNING unknown algorithm type "<<type<<"\n";
+	return -1;
+    }
+    theAlgo = (EquiSolnAlgo*)(*iter->second)();
+
+    return 0;
+}
+
 int OPS_Algorithm()
 {
     if (OPS_GetNumRemainingInputArgs() < 1) {
@@ -1571,87 +2193,330 @@ int OPS_Algorithm()
 
     // create algorithm
     EquiSolnAlgo* theAlgo = 0;
-    if (strcmp(type, "Linear") == 0) {
-	theAlgo = (EquiSolnAlgo*) OPS_LinearAlgorithm();
+    newAlgorithm(type, theAlgo);
+
+    // set algorithm
+    if (theAlgo != 0) {
+	if (cmds != 0) {
+	    cmds->setAlgorithm(theAlgo);
+	}
+    }
+
+    return 0;
+}
+
+int OPS_Analysis()
+{
+    if (OPS_GetNumRemainingInputArgs() < 1) {
+    	opserr << "WARNING insufficient args: analysis type ...\n";
+    	return -1;
+    }
+
+    const char* type = OPS_GetString();
+
+    // create analysis
+    if (strcmp(type, "Static") == 0) {
+	if (cmds != 0) {
+	    cmds->setStaticAnalysis();
+	}
+    } else if (strcmp(type, "Transient") == 0) {
+	if (cmds != 0) {
+	    cmds->setTransientAnalysis();
+	}
+    } else if (strcmp(type, "PFEM") == 0) {
+	if (cmds != 0) {
+	    if (cmds->setPFEMAnalysis() < 0) {
+		return -1;
+	    }
+	}
+    } else if (strcmp(type, "VariableTimeStepTransient") == 0 ||
+	       (strcmp(type,"TransientWithVariableTimeStep") == 0) ||
+	       (strcmp(type,"VariableTransient") == 0)) {
+	if (cmds != 0) {
+	    cmds->setVariableAnalysis();
+	}
+
+    } else {
+	opserr<<"WARNING unknown analysis type "<<type<<"\n";
+    }
 
-    } else if (strcmp(type, "Newton") == 0) {
-	theAlgo = (EquiSolnAlgo*) OPS_NewtonRaphsonAlgorithm();
+    return 0;
+}
 
-    } else if (strcmp(type, "ModifiedNewton") == 0) {
-	theAlgo = (EquiSolnAlgo*) OPS_ModifiedNewton();
+// a response which stops the analyze command when it reaches a limit
+enum {
+    ANALYZE_LIMIT_NODE = 1,
+    ANALYZE_LIMIT_DRIFT = 2,
+    ANALYZE_LIMIT_ELE = 3
+};
+
+struct AnalyzeLimit {
+    int type;
+    Node* iNode;
+    Node* jNode;
+    int dof;
+    int respType;
+    double length;
+    Response* theResponse;
+    double limit;
+};
+
+static void clearAnalyzeLimits(std::vector<AnalyzeLimit>& limits)
+{
+    for (int i=0; i<(int)limits.size(); i++) {
+	if (limits[i].theResponse != 0) {
+	    delete limits[i].theResponse;
+	}
+    }
+    limits.clear();
+}
+
+static Node* getAnalyzeLimitNode(Domain* theDomain, int ndtag, int dof)
+{
+    Node* theNode = theDomain->getNode(ndtag);
+    if (theNode == 0) {
+	opserr << "WARNING node " << ndtag << " does not exist\n";
+	return 0;
+    }
+    if (dof < 0 || dof >= theNode->getNumberDOF()) {
+	opserr << "WARNING invalid dof " << dof+1 << " of node " << ndtag << "\n";
+	return 0;
+    }
+    return theNode;
+}
 
-    } else if (strcmp(type, "KrylovNewton") == 0) {
-	theAlgo = (EquiSolnAlgo*) OPS_KrylovNewton();
+// read the options of analyze after numIncr and dt:
+// <-time tFinal>
+// <-nodeLimit nodeTag dof limit <'disp'|'vel'|'accel'>>
+// <-driftLimit iNode jNode dof perpDirn limit>
+// <-eleLimit eleTag limit eleArgs...>
+static int readAnalyzeLimits(std::vector<AnalyzeLimit>& limits, bool& toTime, double& tFinal)
+{
+    Domain* theDomain = cmds->getDomain();
+    int numdata = 1;
 
-    } else if (strcmp(type, "RaphsonNewton") == 0) {
-	theAlgo = (EquiSolnAlgo*) OPS_RaphsonNewton();
+    while (OPS_GetNumRemainingInputArgs() > 0) {
 
-    } else if (strcmp(type, "MillerNewton") == 0) {
-	theAlgo = (EquiSolnAlgo*) OPS_MillerNewton();
+	// numbers, e.g. dtMin, dtMax and Jd of a variable transient
+	// analysis, are not options
+	double value;
+	if (OPS_GetDoubleInput(&numdata, &value) == 0) {
+	    continue;
+	}
+	OPS_ResetCurrentInputArg(-1);
 
-    } else if (strcmp(type, "SecantNewton") == 0) {
-	theAlgo = (EquiSolnAlgo*) OPS_SecantNewton();
+	const char* opt = OPS_GetString();
+	if (opt == 0) {
+	    opserr << "WARNING invalid option of analyze\n";
+	    return -1;
+	}
 
-    } else if (strcmp(type, "PeriodicNewton") == 0) {
-	theAlgo = (EquiSolnAlgo*) OPS_PeriodicNewton();
+	if (strcmp(opt, "-time") == 0) {
+	    if (OPS_GetNumRemainingInputArgs() < 1) {
+		opserr << "WARNING need tFinal after -time\n";
+		return -1;
+	    }
+	    if (OPS_GetDoubleInput(&numdata, &tFinal) < 0) {
+		opserr << "WARNING invalid tFinal\n";
+		return -1;
+	    }
+	    toTime = true;
 
+	} else if (strcmp(opt, "-nodeLimit") == 0) {
+	    if (OPS_GetNumRemainingInputArgs() < 3) {
+		opserr << "WARNING need -nodeLimit nodeTag dof limit <'disp'|'vel'|'accel'>\n";
+		return -1;
+	    }
+	    int idata[2];
+	    numdata = 2;
+	    if (OPS_GetIntInput(&numdata, idata) < 0) {
+		opserr << "WARNING invalid nodeTag or dof of -nodeLimit\n";
+		return -1;
+	    }
+	    numdata = 1;
+	    AnalyzeLimit theLimit = {ANALYZE_LIMIT_NODE, 0, 0, idata[1]-1, 1, 0.0, 0, 0.0};
+	    if (OPS_GetDoubleInput(&numdata, &theLimit.limit) < 0) {
+		opserr << "WARNING invalid limit of -nodeLimit\n";
+		return -1;
+	    }
+	    theLimit.iNode = getAnalyzeLimitNode(theDomain, idata[0], theLimit.dof);
+	    if (theLimit.iNode == 0) return -1;
 
-    } else if (strcmp(type, "Broyden") == 0) {
-	theAlgo = (EquiSolnAlgo*)OPS_Broyden();
+	    if (OPS_GetNumRemainingInputArgs() > 0) {
+		const char* type = OPS_GetString();
+		if (type == 0) {
+		    // not a response type
+		    OPS_ResetCurrentInputArg(-1);
+		} else if (strcmp(type, "disp") == 0) {
+		    theLimit.respType = 1;
+		} else if (strcmp(type, "vel") == 0) {
+		    theLimit.respType = 2;
+		} else if (strcmp(type, "accel") == 0) {
+		    theLimit.respType = 3;
+		} else {
+		    OPS_ResetCurrentInputArg(-1);
+		}
+	    }
+	    limits.push_back(theLimit);
 
-    } else if (strcmp(type, "BFGS") == 0) {
-	theAlgo = (EquiSolnAlgo*)OPS_BFGS();
+	} else if (strcmp(opt, "-driftLimit") == 0) {
+	    if (OPS_GetNumRemainingInputArgs() < 5) {
+		opserr << "WARNING need -driftLimit iNode jNode dof perpDirn limit\n";
+		return -1;
+	    }
+	    int idata[4];
+	    numdata = 4;
+	    if (OPS_GetIntInput(&numdata, idata) < 0) {
+		opserr << "WARNING invalid iNode, jNode, dof or perpDirn of -driftLimit\n";
+		return -1;
+	    }
+	    numdata = 1;
+	    AnalyzeLimit theLimit = {ANALYZE_LIMIT_DRIFT, 0, 0, idata[2]-1, 1, 0.0, 0, 0.0};
+	    if (OPS_GetDoubleInput(&numdata, &theLimit.limit) < 0) {
+		opserr << "WARNING invalid limit of -driftLimit\n";
+		return -1;
+	    }
+	    theLimit.iNode = getAnalyzeLimitNode(theDomain, idata[0], theLimit.dof);
+	    if (theLimit.iNode == 0) return -1;
+	    theLimit.jNode = getAnalyzeLimitNode(theDomain, idata[1], theLimit.dof);
+	    if (theLimit.jNode == 0) return -1;
+
+	    // the same drift as the drift recorder
+	    const Vector& crdI = theLimit.iNode->getCrds();
+	    const Vector& crdJ = theLimit.jNode->getCrds();
+	    int perpDirn = idata[3]-1;
+	    if (perpDirn < 0 || perpDirn >= crdI.Size() || perpDirn >= crdJ.Size()) {
+		opserr << "WARNING invalid perpDirn " << idata[3] << " of -driftLimit\n";
+		return -1;
+	    }
+	    theLimit.length = crdJ(perpDirn) - crdI(perpDirn);
+	    if (theLimit.length == 0.0) {
+		opserr << "WARNING nodes " << idata[0] << " and " << idata[1]
+		       << " have the same coordinate in perpDirn\n";
+		return -1;
+	    }
+	    limits.push_back(theLimit);
 
-    } else if (strcmp(type, "NewtonLineSearch") == 0) {
-	theAlgo = (EquiSolnAlgo*)OPS_NewtonLineSearch();
+	} else if (strcmp(opt, "-eleLimit") == 0) {
+	    if (OPS_GetNumRemainingInputArgs() < 3) {
+		opserr << "WARNING need -eleLimit eleTag limit eleArgs...\n";
+		return -1;
+	    }
+	    int eleTag;
+	    if (OPS_GetIntInput(&numdata, &eleTag) < 0) {
+		opserr << "WARNING invalid eleTag of -eleLimit\n";
+		return -1;
+	    }
+	    AnalyzeLimit theLimit = {ANALYZE_LIMIT_ELE, 0, 0, 0, 0, 0.0, 0, 0.0};
+	    if (OPS_GetDoubleInput(&numdata, &theLimit.limit) < 0) {
+		opserr << "WARNING invalid limit of -eleLimit\n";
+		return -1;
+	    }
+	    Element* theEle = theDomain->getElement(eleTag);
+	    if (theEle == 0) {
+		opserr << "WARNING element " << eleTag << " does not exist\n";
+		return -1;
+	    }
 
-    } else {
-	opserr<<"WARNING unknown algorithm type "<<type<<"\n";
-    }
+	    // the rest of the arguments are the response of the element,
+	    // the response is set up once for all steps
+	    int argc = OPS_GetNumRemainingInputArgs();
+	    const char** argv = new const char*[argc];
+	    for (int i=0; i<argc; i++) {
+		argv[i] = OPS_GetString();
+		if (argv[i] == 0) {
+		    opserr << "WARNING invalid response of element " << eleTag << "\n";
+		    delete [] argv;
+		    return -1;
+		}
+	    }
+	    DummyStream dummy;
+	    theLimit.theResponse = theEle->setResponse(argv, argc, dummy);
+	    delete [] argv;
+	    if (theLimit.theResponse == 0) {
+		opserr << "WARNING invalid response of element " << eleTag << "\n";
+		return -1;
+	    }
+	    limits.push_back(theLimit);
 
-    // set algorithm
-    if (theAlgo != 0) {
-	if (cmds != 0) {
-	    cmds->setAlgorithm(theAlgo);
+	} else {
+	    opserr << "WARNING unknown option " << opt << " of analyze\n";
+	    return -1;
 	}
     }
 
     return 0;
 }
 
-int OPS_Analysis()
+static bool reachedAnalyzeLimit(AnalyzeLimit& theLimit)
 {
-    if (OPS_GetNumRemainingInputArgs() < 1) {
-    	opserr << "WARNING insufficient args: analysis type ...\n";
-    	return -1;
-    }
+    double value = 0.0;
 
-    const char* type = OPS_GetString();
+    if (theLimit.type == ANALYZE_LIMIT_NODE) {
+	if (theLimit.respType == 2) {
+	    value = theLimit.iNode->getVel()(theLimit.dof);
+	} else if (theLimit.respType == 3) {
+	    value = theLimit.iNode->getAccel()(theLimit.dof);
+	} else {
+	    value = theLimit.iNode->getDisp()(theLimit.dof);
+	}
 
-    // create analysis
-    if (strcmp(type, "Static") == 0) {
-	if (cmds != 0) {
-	    cmds->setStaticAnalysis();
+    } else if (theLimit.type == ANALYZE_LIMIT_DRIFT) {
+	value = (theLimit.jNode->getDisp()(theLimit.dof) -
+		 theLimit.iNode->getDisp()(theLimit.dof)) / theLimit.length;
+
+    } else if (theLimit.type == ANALYZE_LIMIT_ELE) {
+	if (theLimit.theResponse->getResponse() < 0) {
+	    return false;
 	}
-    } else if (strcmp(type, "Transient") == 0) {
-	if (cmds != 0) {
-	    cmds->setTransientAnalysis();
+	const Vector& data = theLimit.theResponse->getInformation().getData();
+	for (int i=0; i<data.Size(); i++) {
+	    if (fabs(data(i)) > value) {
+		value = fabs(data(i));
+	    }
 	}
-    } else if (strcmp(type, "PFEM") == 0) {
-	if (cmds != 0) {
-	    if (cmds->setPFEMAnalysis() < 0) {
-		return -1;
+    }
+
+    return fabs(value) >= theLimit.limit;
+}
+
+// run the steps one by one until the end time or a limit is reached,
+// returns the 1-based index of the limit reached or the result of the
+// analysis
+static int analyzeToLimits(int numIncr, double dt, bool toTime, double tFinal,
+			   std::vector<AnalyzeLimit>& limits)
+{
+    StaticAnalysis* theStaticAnalysis = cmds->getStaticAnalysis();
+    TransientAnalysis* theTransientAnalysis = cmds->getTransientAnalysis();
+    Domain* theDomain = cmds->getDomain();
+
+    for (int i=0; i<numIncr; i++) {
+	int result = 0;
+	if (theTransientAnalysis != 0) {
+	    double stepDt = dt;
+	    if (toTime) {
+		double remaining = tFinal - theDomain->getCurrentTime();
+		if (remaining < 1e-8*dt) {
+		    break;
+		}
+		// land on tFinal without a tiny last step
+		if (remaining < stepDt + 1e-8*dt) {
+		    stepDt = remaining;
+		}
 	    }
+	    result = theTransientAnalysis->analyze(1, stepDt);
+	} else {
+	    result = theStaticAnalysis->analyze(1);
 	}
-    } else if (strcmp(type, "VariableTimeStepTransient") == 0 ||
-	       (strcmp(type,"TransientWithVariableTimeStep") == 0) ||
-	       (strcmp(type,"VariableTransient") == 0)) {
-	if (cmds != 0) {
-	    cmds->setVariableAnalysis();
+	if (result < 0) {
+	    return result;
 	}
 
-    } else {
-	opserr<<"WARNING unknown analysis type "<<type<<"\n";
+	for (int j=0; j<(int)limits.size(); j++) {
+	    if (reachedAnalyzeLimit(limits[j])) {
+		return j+1;
+	    }
+	}
     }
 
     return 0;
@@ -1666,6 +2531,9 @@ int OPS_analyze()
     TransientAnalysis* theTransientAnalysis = cmds->getTransientAnalysis();
     PFEMAnalysis* thePFEMAnalysis = cmds->getPFEMAnalysis();
 
+    // the analysis runs without the interpreter
+    DL_Interpreter* interp = cmds->getInterpreter();
+
     if (theStaticAnalysis != 0) {
 	if (OPS_GetNumRemainingInputArgs() < 1) {
 	    opserr << "WARNING insufficient args: analyze numIncr ...\n";
@@ -1674,11 +2542,34 @@ int OPS_analyze()
 	int numIncr;
 	int numdata = 1;
 	if (OPS_GetIntInput(&numdata, &numIncr) < 0) return -1;
-	result = theStaticAnalysis->analyze(numIncr);
+
+	std::vector<AnalyzeLimit> limits;
+	bool toTime = false;
+	double tFinal = 0.0;
+	if (readAnalyzeLimits(limits, toTime, tFinal) < 0) {
+	    clearAnalyzeLimits(limits);
+	    return -1;
+	}
+	if (toTime) {
+	    opserr << "WARNING -time is only for a transient analysis\n";
+	    clearAnalyzeLimits(limits);
+	    return -1;
+	}
+
+	interp->allowThreads();
+	if (limits.empty()) {
+	    result = theStaticAnalysis->analyze(numIncr);
+	} else {
+	    result = analyzeToLimits(numIncr, 0.0, false, 0.0, limits);
+	}
+	interp->endAllowThreads();
+	clearAnalyzeLimits(limits);
 
     } else if (thePFEMAnalysis != 0) {
 
+	interp->allowThreads();
 	result = thePFEMAnalysis->analyze();
+	interp->endAllowThreads();
 
     } else if (theTransientAnalysis != 0) {
 	if (OPS_GetNumRemainingInputArgs() < 2) {
@@ -1693,7 +2584,22 @@ int OPS_analyze()
 	if (OPS_GetDoubleInput(&numdata, &dt) < 0) return -1;
 	ops_Dt = dt;
 
-	result = theTransientAnalysis->analyze(numIncr, dt);
+	std::vector<AnalyzeLimit> limits;
+	bool toTime = false;
+	double tFinal = 0.0;
+	if (readAnalyzeLimits(limits, toTime, tFinal) < 0) {
+	    clearAnalyzeLimits(limits);
+	    return -1;
+	}
+
+	interp->allowThreads();
+	if (limits.empty() && !toTime) {
+	    result = theTransientAnalysis->analyze(numIncr, dt);
+	} else {
+	    result = analyzeToLimits(numIncr, dt, toTime, tFinal, limits);
+	}
+	interp->endAllowThreads();
+	clearAnalyzeLimits(limits);
     } else {
 	opserr << "WARNING No Analysis type has been specified \n";
 	return -1;
@@ -1712,6 +2618,121 @@ int OPS_analyze()
     return 0;
 }
 
+int OPS_analyzeAdaptive()
+{
+    if (cmds == 0) return 0;
+
+    // analyzeAdaptive numIncr <dt> <-maxBisections n>
+    if (OPS_GetNumRemainingInputArgs() < 1) {
+	opserr << "WARNING insufficient args: analyzeAdaptive numIncr <dt> <-maxBisections n>\n";
+	return -1;
+    }
+
+    int numIncr;
+    int numdata = 1;
+    if (OPS_GetIntInput(&numdata, &numIncr) < 0) {
+	opserr << "WARNING analyzeAdaptive - failed to read numIncr\n";
+	return -1;
+    }
+
+    double dt = 0.0;
+    if (cmds->getTransientAnalysis() != 0) {
+	if (OPS_GetDoubleInput(&numdata, &dt) < 0) {
+	    opserr << "WARNING analyzeAdaptive - failed to read dt\n";
+	    return -1;
+	}
+	ops_Dt = dt;
+    }
+
+    int maxBisections = 4;
+    while (OPS_GetNumRemainingInputArgs() > 0) {
+	const char* opt = OPS_GetString();
+	if (strcmp(opt, "-maxBisections") == 0) {
+	    if (OPS_GetIntInput(&numdata, &maxBisections) < 0) {
+		opserr << "WARNING analyzeAdaptive - failed to read maxBisections\n";
+		return -1;
+	    }
+	} else {
+	    opserr << "WARNING analyzeAdaptive - unknown option " << opt << "\n";
+	    return -1;
+	}
+    }
+
+    // the analysis runs without the interpreter
+    DL_Interpreter* interp = cmds->getInterpreter();
+
+    std::vector<double> summary;
+    interp->allowThreads();
+    int result = cmds->analyzeAdaptive(numIncr, dt, maxBisections, summary);
+    interp->endAllowThreads();
+
+    if (result < 0) {
+	opserr << "OpenSees > analyzeAdaptive failed at time " << OPS_GetDomain()->getCurrentTime() << "\n";
+	if (summary.empty()) {
+	    return -1;
+	}
+    }
+
+    int size = (int)summary.size();
+    double* data = size > 0 ? &summary[0] : 0;
+    if (OPS_SetDoubleOutput(&size, data, false) < 0) {
+	opserr << "WARNING analyzeAdaptive - failed to set output\n";
+	return -1;
+    }
+
+    return 0;
+}
+
+int OPS_fallback()
+{
+    if (cmds == 0) return 0;
+
+    // fallback 'algorithm' type args..., fallback 'test' type args..., fallback 'clear'
+    if (OPS_GetNumRemainingInputArgs() < 1) {
+	opserr << "WARNING insufficient args: fallback 'algorithm' type ... or 'test' type ... or 'clear'\n";
+	return -1;
+    }
+
+    const char* kind = OPS_GetString();
+    if (strcmp(kind, "clear") == 0) {
+	cmds->clearFallbacks();
+	return 0;
+    }
+
+    if (OPS_GetNumRemainingInputArgs() < 1) {
+	opserr << "WARNING insufficient args: fallback " << kind << " type ...\n";
+	return -1;
+    }
+    const char* type = OPS_GetString();
+
+    if (strcmp(kind, "algorithm") == 0) {
+	EquiSolnAlgo* theAlgo = 0;
+	if (newAlgorithm(type, theAlgo) < 0 || theAlgo == 0) {
+	    opserr << "WARNING fallback - failed to create algorithm " << type << "\n";
+	    return -1;
+	}
+	cmds->addFallbackAlgorithm(theAlgo);
+
+    } else if (strcmp(kind, "test") == 0) {
+	ConvergenceTest* theTest = 0;
+	if (newCTest(type, theTest) < 0 || theTest == 0) {
+	    opserr << "WARNING fallback - failed to create test " << type << "\n";
+	    return -1;
+	}
+	if (cmds->setFallbackCTest(theTest) < 0) {
+	    opserr << "WARNING fallback - no fallback algorithm for the test\n";
+	    delete theTest;
+	    return -1;
+	}
+
+    } else {
+	opserr << "WARNING fallback - unknown " << kind << ", want 'algorithm', 'test' or 'clear'\n";
+	return -1;
+    }
+
+    return 0;
+}
+
 int OPS_eigenAnalysis()
 {
     // make sure at least one other argument to contain type of system
@@ -1727,6 +2748,8 @@ int OPS_eigenAnalysis()
     int typeSolver = EigenSOE_TAGS_ArpackSOE;
     double shift = 0.0;
     bool findSmallest = true;
+    bool useCache = false;
+    bool solverSet = false;
 
     // Check type of eigenvalue analysis
     while (OPS_GetNumRemainingInputArgs() > 1) {
@@ -1746,23 +2769,32 @@ int OPS_eigenAnalysis()
 	else if ((strcmp(type,"-findLargest") == 0))
 	    findSmallest = false;
 
+	else if ((strcmp(type,"-cache") == 0))
+	    useCache = true;
+
 	else if ((strcmp(type,"genBandArpack") == 0) ||
 		 (strcmp(type,"-genBandArpack") == 0) ||
 		 (strcmp(type,"genBandArpackEigen") == 0) ||
-		 (strcmp(type,"-genBandArpackEigen") == 0))
+		 (strcmp(type,"-genBandArpackEigen") == 0)) {
 	    typeSolver = EigenSOE_TAGS_ArpackSOE;
+	    solverSet = true;
+	}
 
 	else if ((strcmp(type,"symmBandLapack") == 0) ||
 		 (strcmp(type,"-symmBandLapack") == 0) ||
 		 (strcmp(type,"symmBandLapackEigen") == 0) ||
-		 (strcmp(type,"-symmBandLapackEigen") == 0))
+		 (strcmp(type,"-symmBandLapackEigen") == 0)) {
 	    typeSolver = EigenSOE_TAGS_SymBandEigenSOE;
+	    solverSet = true;
+	}
 
 	else if ((strcmp(type,"fullGenLapack") == 0) ||
 		 (strcmp(type,"-fullGenLapack") == 0) ||
 		 (strcmp(type,"fullGenLapackEigen") == 0) ||
-		 (strcmp(type,"-fullGenLapackEigen") == 0))
+		 (strcmp(type,"-fullGenLapackEigen") == 0)) {
 	    typeSolver = EigenSOE_TAGS_FullGenEigenSOE;
+	    solverSet = true;
+	}
 
 	else {
 	    opserr << "eigen - unknown option specified " << type << endln;
@@ -1784,8 +2816,14 @@ int OPS_eigenAnalysis()
     }
     cmds->setNumEigen(numEigen);
 
+    // without a solver specified, reuse the solution of any solver
+    if (useCache && !solverSet &&
+	cmds->isEigenCached(cmds->getEigenCacheSolver(),generalizedAlgo,findSmallest,numEigen)) {
+	typeSolver = cmds->getEigenCacheSolver();
+    }
+
     // set eigen soe
-    if (cmds->eigen(typeSolver,shift,generalizedAlgo,findSmallest) < 0) {
+    if (cmds->eigen(typeSolver,shift,generalizedAlgo,findSmallest,useCache) < 0) {
 	opserr<<"WANRING failed to do eigen analysis\n";
 	return -1;
     }
@@ -1805,6 +2843,7 @@ int OPS_resetModel()
     if (theTransientIntegrator != 0) {
 	theTransientIntegrator->revertToStart();
     }
+    cmds->clearEigenCache();
 
     return 0;
 }
@@ -1860,11 +2899,14 @@ int OPS_printA()
     TransientIntegrator* theTransientIntegrator = cmds->getTransientIntegrator();
 
     if (theSOE != 0) {
+	DL_Interpreter* interp = cmds->getInterpreter();
+	interp->allowThreads();
 	if (theStaticIntegrator != 0) {
 	    theStaticIntegrator->formTangent();
 	} else if (theTransientIntegrator != 0) {
 	    theTransientIntegrator->formTangent(0);
 	}
+	interp->endAllowThreads();
 
     PFEMLinSOE* pfemsoe = dynamic_cast<PFEMLinSOE*>(theSOE);
     if (pfemsoe != 0) {
@@ -1885,7 +2927,9 @@ int OPS_printA()
 		    }
 		}
 	    } else {
+		interp->allowThreads();
 		*output << *A;
+		interp->endAllowThreads();
 	    }
 	} else {
         int size = 0;
@@ -1978,6 +3022,62 @@ int OPS_printB()
     return 0;
 }
 
+int OPS_sparseMatrix()
+{
+    if (cmds == 0) return 0;
+
+    // sparseMatrix 'K'|'M'|'C' <'-csr'>
+    // sparseMatrix '-m' m? '-c' c? '-k' k? <'-csr'>
+    if (OPS_GetNumRemainingInputArgs() < 1) {
+	opserr << "WARNING want - sparseMatrix type? <-csr>\n";
+	return -1;
+    }
+
+    double m = 0.0, c = 0.0, k = 0.0;
+    bool csr = false;
+    int numdata = 1;
+    while (OPS_GetNumRemainingInputArgs() > 0) {
+	const char* type = OPS_GetString();
+
+	if (strcmp(type,"K") == 0 || strcmp(type,"-K") == 0) {
+	    k = 1.0;
+	} else if (strcmp(type,"M") == 0 || strcmp(type,"-M") == 0) {
+	    m = 1.0;
+	} else if (strcmp(type,"C") == 0 || strcmp(type,"-C") == 0) {
+	    c = 1.0;
+	} else if (strcmp(type,"-k") == 0) {
+	    if (OPS_GetDoubleInput(&numdata, &k) < 0) {
+		opserr << "WARNING sparseMatrix - failed to read k factor\n";
+		return -1;
+	    }
+	} else if (strcmp(type,"-m") == 0) {
+	    if (OPS_GetDoubleInput(&numdata, &m) < 0) {
+		opserr << "WARNING sparseMatrix - failed to read m factor\n";
+		return -1;
+	    }
+	} else if (strcmp(type,"-c") == 0) {
+	    if (OPS_GetDoubleInput(&numdata, &c) < 0) {
+		opserr << "WARNING sparseMatrix - failed to read c factor\n";
+		return -1;
+	    }
+	} else if (strcmp(type,"-csr") == 0) {
+	    csr = true;
+	} else if (strcmp(type,"-coo") == 0) {
+	    csr = false;
+	} else {
+	    opserr << "WARNING sparseMatrix - unknown option " << type << endln;
+	    return -1;
+	}
+    }
+
+    if (cmds->sparseMatrix(m, c, k, csr) < 0) {
+	opserr << "WARNING failed to form the sparse matrix\n";
+	return -1;
+    }
+
+    return 0;
+}
+
 int printNode(OPS_Stream& output);
 int printElement(OPS_Stream& output);
 int printAlgorithm(OPS_Stream& output);
@@ -2570,6 +3670,46 @@ int OPS_restore()
     return 0;
 }
 
+int OPS_snapshot()
+{
+    if (cmds == 0) return 0;
+
+    Vector data;
+    if (cmds->snapshot(data) < 0) {
+	return -1;
+    }
+
+    int size = data.Size();
+    if (OPS_SetDoubleOutput(&size, &data(0), false) < 0) {
+	opserr << "WARNING snapshot - failed to set the output\n";
+	return -1;
+    }
+
+    return 0;
+}
+
+int OPS_restoreSnapshot()
+{
+    if (cmds == 0) return 0;
+    if (OPS_GetNumRemainingInputArgs() < 1) {
+	opserr << "WARNING restoreSnapshot data\n";
+	return -1;
+    }
+
+    Vector data;
+    int size = 0;
+    if (OPS_GetDoubleListInput(&size, &data) < 0) {
+	opserr << "WARNING restoreSnapshot - invalid snapshot data\n";
+	return -1;
+    }
+
+    if (cmds->restoreSnapshot(data) < 0) {
+	return -1;
+    }
+
+    return 0;
+}
+
 int OPS_startTimer()
 {
     if (cmds == 0) return 0;
@@ -3059,6 +4199,112 @@ int OPS_systemSize()
     return 0;
 }
 
+static int removeModel(int tag)
+{
+    OpenSeesCommands* theModel = theModels[tag];
+    OpenSeesCommands* current = cmds;
+
+    // wipe while its definitions are in the global storage
+    theModel->activate();
+    theModel->wipe();
+    current->activate();
+
+    delete theModel;
+
+    return 0;
+}
+
+int OPS_switchModel()
+{
+    if (cmds == 0) return 0;
+    if (OPS_GetNumRemainingInputArgs() < 1) {
+	opserr << "WARNING insufficient args: switchModel tag\n";
+	return -1;
+    }
+
+    int tag;
+    int numdata = 1;
+    if (OPS_GetIntInput(&numdata, &tag) < 0) {
+	opserr << "WARNING switchModel - failed to read model tag\n";
+	return -1;
+    }
+
+    // a new empty model
+    if (theModels.count(tag) == 0) {
+#ifdef _PARALLEL_INTERPRETERS
+	opserr << "WARNING switchModel - only one model in parallel interpreters\n";
+	return -1;
+#endif
+	new OpenSeesCommands(cmds->getInterpreter(), tag);
+    }
+
+    theModels[tag]->activate();
+
+    return 0;
+}
+
+int OPS_getActiveModel()
+{
+    if (cmds == 0) return 0;
+
+    int tag = cmds->getModelTag();
+    int numdata = 1;
+    if (OPS_SetIntOutput(&numdata, &tag, true) < 0) {
+	opserr << "WARNING getActiveModel - failed to set output\n";
+	return -1;
+    }
+
+    return 0;
+}
+
+int OPS_getModelTags()
+{
+    std::vector<int> tags;
+    std::map<int, OpenSeesCommands*>::iterator it;
+    for (it = theModels.begin(); it != theModels.end(); it++) {
+	tags.push_back(it->first);
+    }
+
+    int size = (int)tags.size();
+    if (OPS_SetIntOutput(&size, &tags[0], false) < 0) {
+	opserr << "WARNING getModelTags - failed to set output\n";
+	return -1;
+    }
+
+    return 0;
+}
+
+int OPS_removeModel()
+{
+    if (cmds == 0) return 0;
+    if (OPS_GetNumRemainingInputArgs() < 1) {
+	opserr << "WARNING insufficient args: removeModel tag\n";
+	return -1;
+    }
+
+    int tag;
+    int numdata = 1;
+    if (OPS_GetIntInput(&numdata, &tag) < 0) {
+	opserr << "WARNING removeModel - failed to read model tag\n";
+	return -1;
+    }
+
+    if (theModels.count(tag) == 0) {
+	opserr << "WARNING removeModel - model " << tag << " does not exist\n";
+	return -1;
+    }
+    if (tag == 0) {
+	opserr << "WARNING removeModel - model 0 can only be wiped\n";
+	return -1;
+    }
+    if (theModels[tag] == cmds) {
+	opserr << "WARNING removeModel - can't remove the active model " << tag << "\n";
+	return -1;
+    }
+
+    return removeModel(tag);
+}
+
 void* OPS_ParallelRCM() {
 
 #ifdef _PARALLEL_INTERPRETERS
@@ -63,14 +63,22 @@ UPDATES, ENHANCEMENTS, OR MODIFICATIONS.
 #include <elementAPI.h>
 #include <MachineBroker.h>
 #include "OpenSeesReliabilityCommands.h"
+#include <vector>
+
+class MapOfTaggedObjects;
+class BackgroundMesh;
 
 class OpenSeesCommands
 {
 public:
 
-    explicit OpenSeesCommands(DL_Interpreter* interpreter);
+    explicit OpenSeesCommands(DL_Interpreter* interpreter, int modelTag = 0);
     ~OpenSeesCommands();
 
+    // several models in one interpreter, the commands act on the active one
+    void activate();
+    int getModelTag() const {return modelTag;}
+
     DL_Interpreter* getInterpreter();
     Domain* getDomain();
 
@@ -101,6 +109,15 @@ public:
     void setCTest(ConvergenceTest* test);
     ConvergenceTest* getCTest() {return theTest;}
 
+    // the algorithms tried, in order, when the analysis algorithm
+    // fails in analyzeAdaptive, each with its own test or the
+    // analysis test
+    void addFallbackAlgorithm(EquiSolnAlgo* algorithm);
+    int setFallbackCTest(ConvergenceTest* test);
+    void clearFallbacks();
+    int analyzeAdaptive(int numIncr, double dt, int maxBisections,
+			std::vector<double>& summary);
+
     void setStaticAnalysis();
     StaticAnalysis* getStaticAnalysis() {return theStaticAnalysis;}
 
@@ -121,6 +138,10 @@ public:
     void setFileDatabase(const char* filename);
     FE_Datastore* getDatabase() {return theDatabase;}
 
+    // the domain state in memory
+    int snapshot(Vector& data);
+    int restoreSnapshot(Vector& data);
+
     Timer* getTimer() {return &theTimer;}
     SimulationInformation* getSimulationInformation() {return &theSimulationInfo;}
 
@@ -131,11 +152,23 @@ public:
     void wipeAnalysis();
     void wipe();
     int eigen(int typeSolver, double shift,
-	      bool generalizedAlgo, bool findSmallest);
+	      bool generalizedAlgo, bool findSmallest, bool useCache=false);
+    void clearEigenCache() {eigenCacheModes = 0;}
+    int getEigenCacheSolver() {return eigenCacheModes>0? eigenCacheSolver:-1;}
+    bool isEigenCached(int typeSolver, bool generalizedAlgo,
+		       bool findSmallest, int num);
+    int sparseMatrix(double m, double c, double k, bool csr);
 
 private:
 
+    bool setDefaultAnalysis();
+    void swapLibraries();
+    int adaptiveStep(double dt, int level, int maxLevel,
+		     int& rung, int& numSteps, int& numIter);
+    int ladderStep(int rung, double dt, int& numIter);
+
     DL_Interpreter* interpreter;
+    int modelTag;
     Domain* theDomain;
     int ndf, ndm;
 
@@ -152,8 +185,17 @@ private:
     VariableTimeStepDirectIntegrationAnalysis* theVariableTimeStepTransientAnalysis;
     AnalysisModel* theAnalysisModel;
     ConvergenceTest *theTest;
+    std::vector<EquiSolnAlgo*> fallbackAlgorithms;
+    std::vector<ConvergenceTest*> fallbackTests;
 
     int numEigen;
+
+    // the last eigen solution and the state of the model it was solved for
+    int eigenCacheModes, eigenCacheSolver;
+    bool eigenCacheGeneralized, eigenCacheSmallest;
+    int eigenCacheDomainStamp, eigenCacheCommitTag;
+    double eigenCacheTime;
+
     FE_Datastore* theDatabase;
     FEM_ObjectBrokerAllClasses theBroker;
     Timer theTimer;
@@ -165,6 +207,9 @@ private:
 
     OpenSeesReliabilityCommands* reliability;
 
+    // the model definitions (materials, sections, ...) while not active
+    MapOfTaggedObjects* theLibraries;
+    BackgroundMesh* theBgMesh;
 };
 
 ///////////////////////////////////////////////////////////////////////////
@@ -179,6 +224,7 @@ int OPS_getStrain();
 int OPS_getStress();
 int OPS_getTangent();
 int OPS_getDampTangent();
+int OPS_setStrainHistory();
 int OPS_LimitCurve();
 
 int OPS_hystereticBackbone();
@@ -203,6 +249,7 @@ int OPS_setParameter();
 
 /* OpenSeesElementCommands.cpp */
 int OPS_Element();
+int OPS_elements();
 int OPS_doBlock2D();
 int OPS_doBlock3D();
 
@@ -240,6 +287,7 @@ int OPS_printModelGID();
 int OPS_getCTestNorms();
 int OPS_getCTestIter();
 int OPS_Recorder();
+int OPS_recorderRows();
 int OPS_eleForce();
 int OPS_eleDynamicalForce();
 int OPS_nodeUnbalance();
@@ -290,6 +338,9 @@ int OPS_setTime();
 int OPS_setCreep();
 int OPS_removeObject();
 int OPS_addNodalMass();
+int OPS_nodes();
+int OPS_fixes();
+int OPS_masses();
 int OPS_buildModel();
 int OPS_setNodeDisp();
 int OPS_setNodeVel();
@@ -315,6 +366,7 @@ int OPS_send();
 int OPS_recv();
 int OPS_Bcast();
 int OPS_sdfResponse();
+int OPS_responseSpectrum();
 int OPS_getNumThreads();
 int OPS_setNumThreads();
 int OPS_setStartNodeTag();
@@ -345,15 +397,20 @@ int OPS_Integrator();
 int OPS_Algorithm();
 int OPS_Analysis();
 int OPS_analyze();
+int OPS_analyzeAdaptive();
+int OPS_fallback();
 int OPS_eigenAnalysis();
 int OPS_resetModel();
 int OPS_initializeAnalysis();
 int OPS_printA();
 int OPS_printB();
+int OPS_sparseMatrix();
 int OPS_printModel();
 int OPS_Database();
 int OPS_save();
 int OPS_restore();
+int OPS_snapshot();
+int OPS_restoreSnapshot();
 int OPS_startTimer();
 int OPS_stopTimer();
 int OPS_modalDamping();
@@ -366,7 +423,12 @@ int OPS_accelCPU();
 int OPS_numFact();
 int OPS_numIter();
 int* OPS_GetNumEigen();
+void OPS_clearEigenCache();
 int OPS_systemSize();
+int OPS_switchModel();
+int OPS_getActiveModel();
+int OPS_getModelTags();
+int OPS_removeModel();
 
 void* OPS_KrylovNewton();
 void* OPS_RaphsonNewton();
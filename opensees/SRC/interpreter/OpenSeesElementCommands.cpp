@@ -673,6 +673,100 @@ OPS_Element()
 
 }
 
+// back to the first element arg of the elements command,
+// returns the number of ints of the tag and nodes not read
+static int resetElementArgs(int numArgs)
+{
+    int numLeft = OPS_ClearInputPrefix();
+    int numRead = numArgs - OPS_GetNumRemainingInputArgs();
+    if (numRead > 0) {
+	OPS_ResetCurrentInputArg(-numRead);
+    }
+    return numLeft;
+}
+
+int OPS_elements()
+{
+    static bool initDone = false;
+    if (initDone == false) {
+	setUpFunctions();
+	initDone = true;
+    }
+
+    // elements type tags connectivity eleArgs...
+    if (OPS_GetNumRemainingInputArgs() < 3) {
+	opserr<<"WARNING too few arguments: elements type? tags? connectivity? eleArgs...\n";
+	return -1;
+    }
+
+    const char* type = OPS_GetString();
+
+    OPS_ParsingFunctionMap::const_iterator iter = functionMap.find(type);
+    if (iter == functionMap.end()) {
+	opserr<<"WARNING element type " << type << " is unknown\n";
+	return -1;
+    }
+
+    ID tags;
+    int numEle = 0;
+    if (OPS_GetIntListInput(&numEle, &tags) < 0 || numEle < 1) {
+	opserr<<"WARNING elements - invalid list of element tags\n";
+	return -1;
+    }
+
+    // a row of nodes for each element
+    ID nodes;
+    int size = 0;
+    if (OPS_GetIntListInput(&size, &nodes) < 0 || size < numEle || size % numEle != 0) {
+	opserr<<"WARNING elements - want a row of nodes for each of the "
+	      << numEle << " elements\n";
+	return -1;
+    }
+    int numEleNodes = size / numEle;
+
+    Domain* theDomain = OPS_GetDomain();
+    if (theDomain == 0) return -1;
+
+    // each element reads its tag and nodes followed by the
+    // element args, which are the same for all elements
+    int numArgs = OPS_GetNumRemainingInputArgs();
+    ID prefix(1+numEleNodes);
+    for (int i=0; i<numEle; i++) {
+	prefix(0) = tags(i);
+	for (int j=0; j<numEleNodes; j++) {
+	    prefix(1+j) = nodes(i*numEleNodes+j);
+	}
+
+	OPS_SetInputPrefix(prefix);
+	Element* theEle = (Element*) (*iter->second)();
+	if (theEle == 0 && (strcmp(type, "truss")==0 || strcmp(type, "Truss")==0)) {
+	    resetElementArgs(numArgs);
+	    OPS_SetInputPrefix(prefix);
+	    theEle = (Element*) OPS_TrussSectionElement();
+	}
+	int numLeft = resetElementArgs(numArgs);
+
+	if (theEle == 0) {
+	    opserr<<"WARNING elements - failed to create element " << tags(i) << "\n";
+	    return -1;
+	}
+	if (numLeft > 0) {
+	    opserr<<"WARNING elements - element " << tags(i) << " has less than "
+		  << numEleNodes << " nodes\n";
+	    delete theEle;
+	    return -1;
+	}
+
+	if (theDomain->addElement(theEle) == false) {
+	    opserr<<"ERROR could not add element to domain.\n";
+	    delete theEle;
+	    return -1;
+	}
+    }
+
+    return 0;
+}
+
 int OPS_doBlock2D()
 {
     int ndm = OPS_GetNDM();
@@ -52,6 +52,7 @@
 #include <RigidBeam.h>
 #include <RigidDiaphragm.h>
 #include <vector>
+#include <algorithm>
 #include <TriMesh.h>
 #include <TetMesh.h>
 #include <BackgroundMesh.h>
@@ -65,6 +66,10 @@
 #include <omp.h>
 #endif
 
+// a command changing the mass or stiffness of the model drops the
+// last eigen solution
+void OPS_clearEigenCache();
+
 int OPS_loadConst()
 {
     Domain* theDomain = OPS_GetDomain();
@@ -434,11 +439,207 @@ int OPS_addNodalMass()
 	opserr << "WARNING failed to set mass at node " << nodeTag << "\n";
 	return -1;
     }
+    OPS_clearEigenCache();
 
     return 0;
 
 }
 
+int OPS_nodes()
+{
+    // nodes tags crds <-mass masses> <-ndf ndf>
+    Domain* theDomain = OPS_GetDomain();
+    if (theDomain == 0) return -1;
+
+    int ndm = OPS_GetNDM();
+    int ndf = OPS_GetNDF();
+    if (ndm <= 0 || ndf <= 0) {
+	opserr << "WARNING: system ndm and ndf are zero\n";
+	return -1;
+    }
+
+    if (OPS_GetNumRemainingInputArgs() < 2) {
+	opserr << "WARNING want - nodes tags? crds? <-mass masses?> <-ndf ndf?>\n";
+	return -1;
+    }
+
+    // all nodes are read in one go
+    ID tags;
+    int numNodes = 0;
+    if (OPS_GetIntListInput(&numNodes, &tags) < 0 || numNodes < 1) {
+	opserr << "WARNING nodes - invalid list of node tags\n";
+	return -1;
+    }
+
+    Vector crds;
+    int size = 0;
+    if (OPS_GetDoubleListInput(&size, &crds) < 0 || size != numNodes*ndm) {
+	opserr << "WARNING nodes - want " << numNodes*ndm << " coordinates\n";
+	return -1;
+    }
+
+    Vector masses;
+    while (OPS_GetNumRemainingInputArgs() > 0) {
+	const char* opt = OPS_GetString();
+	if (strcmp(opt, "-mass") == 0) {
+	    if (OPS_GetDoubleListInput(&size, &masses) < 0) {
+		opserr << "WARNING nodes - invalid list of masses\n";
+		return -1;
+	    }
+	} else if (strcmp(opt, "-ndf") == 0) {
+	    int numdata = 1;
+	    if (OPS_GetIntInput(&numdata, &ndf) < 0 || ndf <= 0) {
+		opserr << "WARNING nodes - invalid ndf\n";
+		return -1;
+	    }
+	} else {
+	    opserr << "WARNING nodes - unknown option " << opt << "\n";
+	    return -1;
+	}
+    }
+    if (masses.Size() > 0 && masses.Size() != numNodes*ndf) {
+	opserr << "WARNING nodes - want " << numNodes*ndf << " masses\n";
+	return -1;
+    }
+
+    Matrix mass(ndf, ndf);
+    for (int i = 0; i < numNodes; i++) {
+	Node* theNode = 0;
+	const double* crd = &crds(i*ndm);
+	if (ndm == 1) {
+	    theNode = new Node(tags(i), ndf, crd[0]);
+	} else if (ndm == 2) {
+	    theNode = new Node(tags(i), ndf, crd[0], crd[1]);
+	} else {
+	    theNode = new Node(tags(i), ndf, crd[0], crd[1], crd[2]);
+	}
+
+	if (masses.Size() > 0) {
+	    for (int j = 0; j < ndf; j++) {
+		mass(j,j) = masses(i*ndf+j);
+	    }
+	    theNode->setMass(mass);
+	}
+	theNode->commitState();
+
+	if (theDomain->addNode(theNode) == false) {
+	    opserr << "WARNING nodes - failed to add node " << tags(i) << " to domain\n";
+	    delete theNode;
+	    return -1;
+	}
+    }
+
+    return 0;
+}
+
+int OPS_fixes()
+{
+    // fixes tags fixities
+    Domain* theDomain = OPS_GetDomain();
+    if (theDomain == 0) return -1;
+
+    if (OPS_GetNumRemainingInputArgs() < 2) {
+	opserr << "WARNING want - fixes tags? fixities?\n";
+	return -1;
+    }
+
+    ID tags;
+    int numNodes = 0;
+    if (OPS_GetIntListInput(&numNodes, &tags) < 0 || numNodes < 1) {
+	opserr << "WARNING fixes - invalid list of node tags\n";
+	return -1;
+    }
+
+    // a row of fixities for each node
+    ID fixities;
+    int size = 0;
+    if (OPS_GetIntListInput(&size, &fixities) < 0 || size % numNodes != 0) {
+	opserr << "WARNING fixes - want a row of fixities for each of the "
+	       << numNodes << " nodes\n";
+	return -1;
+    }
+    int numFix = size / numNodes;
+
+    for (int i = 0; i < numNodes; i++) {
+	Node* theNode = theDomain->getNode(tags(i));
+	if (theNode == 0) {
+	    opserr << "WARNING fixes - node " << tags(i) << " is not defined\n";
+	    return -1;
+	}
+	int ndf = theNode->getNumberDOF();
+	if (numFix < ndf) {
+	    opserr << "WARNING fixes - want " << ndf << " fixities for node "
+		   << tags(i) << "\n";
+	    return -1;
+	}
+	for (int j = 0; j < ndf; j++) {
+	    if (fixities(i*numFix+j) == 0) continue;
+	    SP_Constraint* theSP = new SP_Constraint(tags(i), j, 0.0, true);
+	    if (theDomain->addSP_Constraint(theSP) == false) {
+		opserr << "WARNING fixes - failed to add SP to domain\n";
+		delete theSP;
+		return -1;
+	    }
+	}
+    }
+
+    return 0;
+}
+
+int OPS_masses()
+{
+    // masses tags masses
+    Domain* theDomain = OPS_GetDomain();
+    if (theDomain == 0) return -1;
+
+    if (OPS_GetNumRemainingInputArgs() < 2) {
+	opserr << "WARNING want - masses tags? masses?\n";
+	return -1;
+    }
+
+    ID tags;
+    int numNodes = 0;
+    if (OPS_GetIntListInput(&numNodes, &tags) < 0 || numNodes < 1) {
+	opserr << "WARNING masses - invalid list of node tags\n";
+	return -1;
+    }
+
+    // a row of masses for each node
+    Vector masses;
+    int size = 0;
+    if (OPS_GetDoubleListInput(&size, &masses) < 0 || size % numNodes != 0) {
+	opserr << "WARNING masses - want a row of masses for each of the "
+	       << numNodes << " nodes\n";
+	return -1;
+    }
+    int numMass = size / numNodes;
+
+    for (int i = 0; i < numNodes; i++) {
+	Node* theNode = theDomain->getNode(tags(i));
+	if (theNode == 0) {
+	    opserr << "WARNING masses - node " << tags(i) << " is not defined\n";
+	    return -1;
+	}
+	int ndf = theNode->getNumberDOF();
+	if (numMass > ndf) {
+	    opserr << "WARNING masses - want at most " << ndf << " masses for node "
+		   << tags(i) << "\n";
+	    return -1;
+	}
+	Matrix mass(ndf, ndf);
+	for (int j = 0; j < numMass; j++) {
+	    mass(j,j) = masses(i*numMass+j);
+	}
+	if (theNode->setMass(mass) != 0) {
+	    opserr << "WARNING masses - failed to set mass at node " << tags(i) << "\n";
+	    return -1;
+	}
+    }
+    OPS_clearEigenCache();
+
+    return 0;
+}
+
 int OPS_buildModel()
 {
     return 0;
@@ -497,6 +698,7 @@ int OPS_setNodeDisp()
         disp = theNode->getDisp();
         disp(dof) = value;
         theNode->setTrialDisp(disp);
+        OPS_clearEigenCache();
     }
     if (commit)
         theNode->commitState();
@@ -1994,6 +2196,251 @@ int OPS_sdfResponse()
     return 0;
 }
 
+// Displacement history of a linear elastic SDOF (unit mass, frequency
+// omega, damping ratio zeta < 1) under the ground accelerations ag,
+// which are linear within each step dt. The exact recurrence of
+// Nigam and Jennings is used, so it is accurate for any dt.
+static void
+sdfElasticHistory(const std::vector<double>& ag, double dt,
+		  double omega, double zeta, std::vector<double>& u)
+{
+    double k = omega*omega;
+    double sz = sqrt(1.0-zeta*zeta);
+    double wd = omega*sz;
+    double e = exp(-zeta*omega*dt);
+    double s = sin(wd*dt);
+    double c = cos(wd*dt);
+    double r = zeta/sz;
+    double zwdt = 2.0*zeta/(omega*dt);
+
+    double A = e*(r*s+c);
+    double B = e*s/wd;
+    double C = (zwdt + e*(((1.0-2.0*zeta*zeta)/(wd*dt)-r)*s - (1.0+zwdt)*c))/k;
+    double D = (1.0 - zwdt + e*((2.0*zeta*zeta-1.0)/(wd*dt)*s + zwdt*c))/k;
+    double Av = -e*omega/sz*s;
+    double Bv = e*(c-r*s);
+    double Cv = (-1.0/dt + e*((omega/sz+zeta/(dt*sz))*s + c/dt))/k;
+    double Dv = (1.0-e*(r*s+c))/(k*dt);
+
+    int npts = (int)ag.size();
+    u.resize(npts);
+    if (npts == 0) return;
+
+    double ui = 0.0, vi = 0.0;
+    u[0] = 0.0;
+    for (int i = 1; i < npts; i++) {
+	double p0 = -ag[i-1];
+	double p1 = -ag[i];
+	double un = A*ui + B*vi + C*p0 + D*p1;
+	vi = Av*ui + Bv*vi + Cv*p0 + Dv*p1;
+	ui = un;
+	u[i] = ui;
+    }
+}
+
+int OPS_responseSpectrum()
+{
+    // responseSpectrum -dt dt -accel a1 a2 ... -periods T1 T2 ...
+    //     <-damping z1 z2 ...> <-accel2 b1 b2 ...> <-angles th1 th2 ...>
+    //     <-factor f>
+    // each list may also be given as one list or array
+    if (OPS_GetNumRemainingInputArgs() < 6) {
+	opserr << "WARNING insufficient arguments\n";
+	opserr << "Want: responseSpectrum -dt dt -accel a1 a2 ... -periods T1 T2 ... <-damping z1 z2 ...> <-accel2 b1 b2 ...> <-angles th1 th2 ...> <-factor f>\n";
+	return -1;
+    }
+
+    double dt = 0.0, factor = 1.0;
+    std::vector<double> accel, accel2, periods, damping, angles;
+    bool rotD = false, anglesSet = false;
+
+    int numdata = 1;
+    while (OPS_GetNumRemainingInputArgs() > 0) {
+	const char* opt = OPS_GetString();
+	if (opt == 0) {
+	    opserr << "WARNING responseSpectrum -- expected an option\n";
+	    return -1;
+	}
+
+	std::vector<double>* list = 0;
+	if (strcmp(opt, "-dt") == 0) {
+	    if (OPS_GetDoubleInput(&numdata, &dt) < 0) {
+		opserr << "WARNING responseSpectrum -- invalid dt\n";
+		return -1;
+	    }
+	} else if (strcmp(opt, "-factor") == 0) {
+	    if (OPS_GetDoubleInput(&numdata, &factor) < 0) {
+		opserr << "WARNING responseSpectrum -- invalid factor\n";
+		return -1;
+	    }
+	} else if (strcmp(opt, "-accel") == 0) {
+	    list = &accel;
+	} else if (strcmp(opt, "-accel2") == 0) {
+	    list = &accel2;
+	    rotD = true;
+	} else if (strcmp(opt, "-periods") == 0) {
+	    list = &periods;
+	} else if (strcmp(opt, "-damping") == 0) {
+	    list = &damping;
+	} else if (strcmp(opt, "-angles") == 0) {
+	    list = &angles;
+	    anglesSet = true;
+	} else {
+	    opserr << "WARNING responseSpectrum -- unknown option " << opt << "\n";
+	    return -1;
+	}
+
+	// a list or array is read in one go, or numbers are read up
+	// to the next option
+	if (list != 0) {
+	    int size = 0;
+	    Vector values;
+	    if (OPS_GetDoubleListInput(&size, &values) == 0) {
+		for (int i = 0; i < size; i++) {
+		    list->push_back(values(i));
+		}
+		continue;
+	    }
+	    while (OPS_GetNumRemainingInputArgs() > 0) {
+		double val;
+		if (OPS_GetDoubleInput(&numdata, &val) < 0) {
+		    OPS_ResetCurrentInputArg(-1);
+		    break;
+		}
+		list->push_back(val);
+	    }
+	}
+    }
+
+    if (dt <= 0.0) {
+	opserr << "WARNING responseSpectrum -- dt must be positive\n";
+	return -1;
+    }
+    if (accel.empty() || periods.empty()) {
+	opserr << "WARNING responseSpectrum -- no accelerations or periods are given\n";
+	return -1;
+    }
+    if (rotD && accel2.size() != accel.size()) {
+	opserr << "WARNING responseSpectrum -- -accel and -accel2 must have the same number of points\n";
+	return -1;
+    }
+    if (damping.empty()) {
+	damping.push_back(0.05);
+    }
+    for (int j = 0; j < (int)damping.size(); j++) {
+	if (damping[j] < 0.0 || damping[j] >= 1.0) {
+	    opserr << "WARNING responseSpectrum -- damping ratios must be in [0,1)\n";
+	    return -1;
+	}
+    }
+    if (rotD && !anglesSet) {
+	// 0, 1, ..., 179 degrees
+	for (int i = 0; i < 180; i++) {
+	    angles.push_back(i);
+	}
+    }
+    if (rotD && angles.empty()) {
+	opserr << "WARNING responseSpectrum -- no rotation angles are given\n";
+	return -1;
+    }
+
+    int npts = (int)accel.size();
+    for (int i = 0; i < npts; i++) {
+	accel[i] *= factor;
+    }
+    if (rotD) {
+	for (int i = 0; i < npts; i++) {
+	    accel2[i] *= factor;
+	}
+    }
+
+    int nangles = (int)angles.size();
+    std::vector<double> cosa(nangles), sina(nangles);
+    for (int m = 0; m < nangles; m++) {
+	double theta = angles[m]*3.14159265358979323846/180.0;
+	cosa[m] = cos(theta);
+	sina[m] = sin(theta);
+    }
+
+    // for each damping ratio and period: Sd, PSv, PSa, and with -accel2
+    // the RotD50 values followed by the RotD100 values
+    int nout = rotD ? 6 : 3;
+    int nperiods = (int)periods.size();
+    std::vector<double> output(damping.size()*nperiods*nout);
+
+    std::vector<double> u1, u2, peaks(nangles);
+    int loc = 0;
+    for (int j = 0; j < (int)damping.size(); j++) {
+	for (int i = 0; i < nperiods; i++) {
+	    double T = periods[i];
+
+	    // a rigid oscillator follows the ground, so only PSa = PGA is
+	    // nonzero
+	    double omega = 0.0;
+	    if (T > 0.0) {
+		omega = 2*3.14159265358979323846/T;
+		sdfElasticHistory(accel, dt, omega, damping[j], u1);
+		if (rotD) {
+		    sdfElasticHistory(accel2, dt, omega, damping[j], u2);
+		}
+	    } else {
+		u1 = accel;
+		if (rotD) {
+		    u2 = accel2;
+		}
+	    }
+
+	    // the response to a rotated record is the rotated response,
+	    // since the oscillators are linear
+	    double peak50 = 0.0, peak100 = 0.0;
+	    if (rotD) {
+		for (int m = 0; m < nangles; m++) {
+		    double peak = 0.0;
+		    for (int n = 0; n < npts; n++) {
+			double val = fabs(cosa[m]*u1[n] + sina[m]*u2[n]);
+			if (val > peak) peak = val;
+		    }
+		    peaks[m] = peak;
+		}
+		std::sort(peaks.begin(), peaks.end());
+		if (nangles%2 == 1) {
+		    peak50 = peaks[nangles/2];
+		} else {
+		    peak50 = 0.5*(peaks[nangles/2-1] + peaks[nangles/2]);
+		}
+		peak100 = peaks[nangles-1];
+	    } else {
+		for (int n = 0; n < npts; n++) {
+		    double val = fabs(u1[n]);
+		    if (val > peak50) peak50 = val;
+		}
+	    }
+
+	    int ncomp = rotD ? 2 : 1;
+	    double peak[2] = {peak50, peak100};
+	    for (int n = 0; n < ncomp; n++) {
+		if (T > 0.0) {
+		    output[loc++] = peak[n];
+		    output[loc++] = omega*peak[n];
+		    output[loc++] = omega*omega*peak[n];
+		} else {
+		    output[loc++] = 0.0;
+		    output[loc++] = 0.0;
+		    output[loc++] = peak[n];
+		}
+	    }
+	}
+    }
+
+    numdata = (int)output.size();
+    if (OPS_SetDoubleOutput(&numdata, &output[0], false) < 0) {
+	opserr << "WARNING: failed to set output -- responseSpectrum\n";
+	return -1;
+    }
+
+    return 0;
+}
+
 int OPS_getNumThreads()
 {
 #ifdef _OPENMP
@@ -8,6 +8,10 @@
 #include <string.h>
 #include <Domain.h>
 
+// a command changing the mass or stiffness of the model drops the
+// last eigen solution
+void OPS_clearEigenCache();
+
 
 void* OPS_ElasticIsotropicMaterial();
 void* OPS_ElasticIsotropic3D();
@@ -265,6 +269,7 @@ OPS_updateMaterialStage()
     if (res == 0) {
 	res = theDomain->updateParameter(parTag, value);
 	theDomain->removeParameter(parTag);
+	OPS_clearEigenCache();
     }
 
     return res;
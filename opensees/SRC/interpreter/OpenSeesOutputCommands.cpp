@@ -57,21 +57,33 @@ UPDATES, ENHANCEMENTS, OR MODIFICATIONS.
 #include <Parameter.h>
 #include <ParameterIter.h>
 #include <DummyStream.h>
+#include <MemoryStream.h>
 #include <Response.h>
 #include <Mesh.h>
 #include <BackgroundMesh.h>
 #include <Parameter.h>
 #include <ParameterIter.h>
 
+// a command changing the mass or stiffness of the model drops the
+// last eigen solution
+void OPS_clearEigenCache();
+
 void* OPS_NodeRecorder();
 void* OPS_EnvelopeNodeRecorder();
 void* OPS_ElementRecorder();
 void* OPS_EnvelopeElementRecorder();
 void* OPS_PVDRecorder();
 void* OPS_AlgorithmRecorder();
+void* OPS_DriftRecorder();
+void* OPS_EnvelopeDriftRecorder();
+void* OPS_NodeRecorderRMS();
+void* OPS_ElementRecorderRMS();
+void* OPS_NormEnvelopeElementRecorder();
+void* OPS_MPCORecorder();
+void* OPS_VTK_Recorder();
+void* OPS_GmshRecorder();
 BackgroundMesh& OPS_getBgMesh();
 
-//void* OPS_DriftRecorder();
 //void* OPS_PatternRecorder();
 
 namespace {
@@ -94,7 +106,17 @@ namespace {
         recordersMap.insert(std::make_pair("EnvelopeElement", &OPS_EnvelopeElementRecorder));
 	recordersMap.insert(std::make_pair("PVD", &OPS_PVDRecorder));
 	recordersMap.insert(std::make_pair("BgPVD", &OPS_PVDRecorder));
-        //recordersMap.insert(std::make_pair("Drift", &OPS_DriftRecorder));
+        recordersMap.insert(std::make_pair("Drift", &OPS_DriftRecorder));
+        recordersMap.insert(std::make_pair("EnvelopeDrift", &OPS_EnvelopeDriftRecorder));
+        recordersMap.insert(std::make_pair("NodeRMS", &OPS_NodeRecorderRMS));
+        recordersMap.insert(std::make_pair("ElementRMS", &OPS_ElementRecorderRMS));
+        recordersMap.insert(std::make_pair("NormEnvelopeElement", &OPS_NormEnvelopeElementRecorder));
+        recordersMap.insert(std::make_pair("mpco", &OPS_MPCORecorder));
+        recordersMap.insert(std::make_pair("MPCO", &OPS_MPCORecorder));
+        recordersMap.insert(std::make_pair("vtk", &OPS_VTK_Recorder));
+        recordersMap.insert(std::make_pair("VTK", &OPS_VTK_Recorder));
+        recordersMap.insert(std::make_pair("gmsh", &OPS_GmshRecorder));
+        recordersMap.insert(std::make_pair("GMSH", &OPS_GmshRecorder));
         //recordersMap.insert(std::make_pair("Pattern", &OPS_PatternRecorder));
 
         return 0;
@@ -143,11 +165,256 @@ int OPS_Recorder()
 	}
     }
 
+    int tag = theRecorder->getTag();
+    int numdata = 1;
+    if (OPS_SetIntOutput(&numdata, &tag, true) < 0) {
+	opserr << "WARNING failed to set output\n";
+	return -1;
+    }
+
+    return 0;
+}
+
+int OPS_recorderRows()
+{
+    // recorderRows tag
+    if (OPS_GetNumRemainingInputArgs() < 1) {
+	opserr << "WARNING want - recorderRows tag\n";
+	return -1;
+    }
+
+    int tag;
+    int numdata = 1;
+    if (OPS_GetIntInput(&numdata, &tag) < 0) {
+	opserr << "WARNING recorderRows - could not read tag\n";
+	return -1;
+    }
+
+    Domain* theDomain = OPS_GetDomain();
+    if (theDomain == 0) return -1;
+
+    Recorder* theRecorder = theDomain->getRecorder(tag);
+    if (theRecorder == 0) {
+	opserr << "WARNING recorderRows - recorder " << tag << " does not exist\n";
+	return -1;
+    }
+
+    OPS_Stream* theStream = theRecorder->getOutputHandler();
+    if (theStream == 0 || (theStream->getClassTag() != OPS_STREAM_TAGS_MemoryStream &&
+			   theStream->getClassTag() != OPS_STREAM_TAGS_ReducerStream)) {
+	opserr << "WARNING recorderRows - recorder " << tag << " does not record into an array\n";
+	return -1;
+    }
+    MemoryStream* theMemoryStream = (MemoryStream*)theStream;
+
+    // the rows written so far and the columns of a row
+    int data[2];
+    data[0] = theMemoryStream->getNumRows();
+    data[1] = theMemoryStream->getNumColumns();
+    numdata = 2;
+    if (OPS_SetIntOutput(&numdata, data, false) < 0) {
+	opserr << "WARNING failed to set output\n";
+	return -1;
+    }
+
+    return 0;
+}
+
+// queries of the bulk node commands in addition to NodeResponseType
+enum BulkNodeQuery {BulkNodeCoord = -1, BulkNodeEigenvector = -2};
+
+// check if a query command is called for many nodes or elements
+//   cmd '-all' ...
+//   cmd flag tag1 tag2 ...
+// the input is not consumed
+static bool OPS_isBulkQuery(const char* flag)
+{
+    if (OPS_GetNumRemainingInputArgs() < 1) {
+	return false;
+    }
+
+    const char* type = OPS_GetString();
+    OPS_ResetCurrentInputArg(-1);
+    if (type == 0) {
+	return false;
+    }
+
+    return strcmp(type, "-all") == 0 || strcmp(type, flag) == 0;
+}
+
+// read the tags following '-node' or '-ele' until the end of the
+// command or the next flag
+static int OPS_getBulkQueryTags(std::vector<int>& tags)
+{
+    int numdata = 1;
+    while (OPS_GetNumRemainingInputArgs() > 0) {
+	int tag;
+	if (OPS_GetIntInput(&numdata, &tag) < 0) {
+	    // back one arg
+	    OPS_ResetCurrentInputArg(-1);
+	    break;
+	}
+	tags.push_back(tag);
+    }
+
+    return 0;
+}
+
+// bulk version of the node query commands
+//   cmd '-all' <'-dof' dof1 dof2 ...> <'-mode' mode1 mode2 ...> <'-sizes'>
+//   cmd '-node' tag1 tag2 ... <'-dof' dof1 dof2 ...> <'-mode' mode1 mode2 ...> <'-sizes'>
+// the values of all nodes are returned in one flat list, node by node,
+// in the order of getNodeTags for '-all', and mode by mode for each node
+// with '-sizes', the values of each node are preceded by their number, as
+// in eleNodes, so that nodes may have different numbers of values
+static int OPS_bulkNodeQuery(const char* cmd, int query)
+{
+    Domain* theDomain = OPS_GetDomain();
+    if (theDomain == 0) return -1;
+
+    // nodes
+    std::vector<Node*> nodes;
+    const char* type = OPS_GetString();
+    if (strcmp(type, "-all") == 0) {
+	Node *theNode;
+	NodeIter &nodeIter = theDomain->getNodes();
+	while ((theNode = nodeIter()) != 0) {
+	    nodes.push_back(theNode);
+	}
+    } else {
+	std::vector<int> tags;
+	OPS_getBulkQueryTags(tags);
+	for (int i = 0; i < (int)tags.size(); ++i) {
+	    Node* theNode = theDomain->getNode(tags[i]);
+	    if (theNode == 0) {
+		opserr << "WARNING " << cmd << " - node " << tags[i] << " does not exist\n";
+		return -1;
+	    }
+	    nodes.push_back(theNode);
+	}
+    }
+
+    // options
+    std::vector<int> dofs;
+    std::vector<int> modes;
+    bool withSizes = false;
+    while (OPS_GetNumRemainingInputArgs() > 0) {
+	const char* opt = OPS_GetString();
+	if (opt == 0) {
+	    opserr << "WARNING " << cmd << " - invalid input, want '-dof' or '-mode'\n";
+	    return -1;
+	}
+	if (strcmp(opt, "-dof") == 0) {
+	    OPS_getBulkQueryTags(dofs);
+	} else if (strcmp(opt, "-mode") == 0 && query == BulkNodeEigenvector) {
+	    OPS_getBulkQueryTags(modes);
+	} else if (strcmp(opt, "-sizes") == 0) {
+	    withSizes = true;
+	} else {
+	    opserr << "WARNING " << cmd << " - unknown option " << opt << "\n";
+	    return -1;
+	}
+    }
+
+    if (query == BulkNodeEigenvector) {
+	if (modes.empty()) {
+	    opserr << "WARNING " << cmd << " - '-mode' is needed\n";
+	    return -1;
+	}
+	for (int k = 0; k < (int)modes.size(); ++k) {
+	    if (modes[k] < 1) {
+		opserr << "WARNING " << cmd << " - invalid mode " << modes[k] << "\n";
+		return -1;
+	    }
+	}
+    } else {
+	// one set of values for each node
+	modes.push_back(0);
+    }
+
+    // values
+    std::vector<double> values;
+    int numValues = -1;
+    for (int i = 0; i < (int)nodes.size(); ++i) {
+	Node* theNode = nodes[i];
+	for (int k = 0; k < (int)modes.size(); ++k) {
+	    const Vector* nodalValues = 0;
+	    Vector eigenvector;
+	    if (query == BulkNodeCoord) {
+		nodalValues = &(theNode->getCrds());
+	    } else if (query == BulkNodeEigenvector) {
+		const Matrix &theEigenvectors = theNode->getEigenvectors();
+		int mode = modes[k];
+		if (mode > theEigenvectors.noCols()) {
+		    opserr << "WARNING " << cmd << " - mode " << mode << " is not found for node " << theNode->getTag() << "\n";
+		    return -1;
+		}
+		eigenvector.resize(theEigenvectors.noRows());
+		for (int j = 0; j < eigenvector.Size(); ++j) {
+		    eigenvector(j) = theEigenvectors(j, mode-1);
+		}
+		nodalValues = &eigenvector;
+	    } else {
+		nodalValues = theNode->getResponse((NodeResponseType)query);
+	    }
+	    if (nodalValues == 0) {
+		opserr << "WARNING " << cmd << " - no response is found for node " << theNode->getTag() << "\n";
+		return -1;
+	    }
+
+	    int size = nodalValues->Size();
+	    if (dofs.empty() && withSizes) {
+		values.push_back(size);
+		for (int j = 0; j < size; ++j) {
+		    values.push_back((*nodalValues)(j));
+		}
+	    } else if (dofs.empty()) {
+		// all nodes must have the same number of values
+		if (numValues < 0) {
+		    numValues = size;
+		    values.reserve(nodes.size()*modes.size()*size);
+		} else if (numValues != size) {
+		    opserr << "WARNING " << cmd << " - nodes have different number of values, use '-dof' to select them or '-sizes'\n";
+		    return -1;
+		}
+		for (int j = 0; j < size; ++j) {
+		    values.push_back((*nodalValues)(j));
+		}
+	    } else {
+		if (withSizes) {
+		    values.push_back((int)dofs.size());
+		}
+		for (int j = 0; j < (int)dofs.size(); ++j) {
+		    int dof = dofs[j] - 1;
+		    if (dof < 0 || dof >= size) {
+			opserr << "WARNING " << cmd << " - dof " << dofs[j] << " is out of range for node " << theNode->getTag() << "\n";
+			return -1;
+		    }
+		    values.push_back((*nodalValues)(dof));
+		}
+	    }
+	}
+    }
+
+    int size = (int)values.size();
+    double* data = 0;
+    if (size > 0) {
+	data = &values[0];
+    }
+    if (OPS_SetDoubleOutput(&size, data, false) < 0) {
+	opserr << "WARNING " << cmd << " - failed to set outputs\n";
+	return -1;
+    }
+
     return 0;
 }
 
 int OPS_nodeDisp()
 {
+    if (OPS_isBulkQuery("-node")) {
+	return OPS_bulkNodeQuery("nodeDisp", Disp);
+    }
+
     if (OPS_GetNumRemainingInputArgs() < 1) {
 	opserr << "WARNING insufficient args: nodeDisp nodeTag <dof ...>\n";
 	return -1;
@@ -210,6 +477,10 @@ int OPS_nodeDisp()
 
 int OPS_nodeReaction()
 {
+    if (OPS_isBulkQuery("-node")) {
+	return OPS_bulkNodeQuery("nodeReaction", Reaction);
+    }
+
     // make sure at least one other argument to contain type of system
     if (OPS_GetNumRemainingInputArgs() < 1) {
 	opserr << "WARNING want - nodeReaction nodeTag? <dof?>\n";
@@ -271,6 +542,10 @@ int OPS_nodeReaction()
 
 int OPS_nodeEigenvector()
 {
+    if (OPS_isBulkQuery("-node")) {
+	return OPS_bulkNodeQuery("nodeEigenvector", BulkNodeEigenvector);
+    }
+
     Domain* theDomain = OPS_GetDomain();
     if (theDomain == 0) return -1;
 
@@ -1232,6 +1507,10 @@ int OPS_nodeUnbalance()
 
 int OPS_nodeVel()
 {
+    if (OPS_isBulkQuery("-node")) {
+	return OPS_bulkNodeQuery("nodeVel", Vel);
+    }
+
     // make sure at least one other argument to contain type of system
     if (OPS_GetNumRemainingInputArgs() < 1) {
 	opserr << "WARNING want - nodeVel nodeTag? <dof?>\n";
@@ -1303,6 +1582,10 @@ int OPS_nodeVel()
 
 int OPS_nodeAccel()
 {
+    if (OPS_isBulkQuery("-node")) {
+	return OPS_bulkNodeQuery("nodeAccel", Accel);
+    }
+
     // make sure at least one other argument to contain type of system
     if (OPS_GetNumRemainingInputArgs() < 1) {
 	opserr << "WARNING want - nodeAccel nodeTag? <dof?>\n";
@@ -1414,6 +1697,10 @@ int OPS_nodeResponse()
 
 int OPS_nodeCoord()
 {
+    if (OPS_isBulkQuery("-node")) {
+	return OPS_bulkNodeQuery("nodeCoord", BulkNodeCoord);
+    }
+
     // make sure at least one other argument to contain type of system
     if (OPS_GetNumRemainingInputArgs() < 1) {
 	opserr << "WARNING want - nodeCoord nodeTag? <dim?>\n";
@@ -1528,6 +1815,7 @@ int OPS_setNodeCoord()
     Vector coords(theNode->getCrds());
     coords(dim-1) = value;
     theNode->setCrds(coords);
+    OPS_clearEigenCache();
 
     return 0;
 }
@@ -1543,12 +1831,71 @@ int OPS_updateElementDomain()
     while ((theElement = theElements()) != 0) {
 	theElement->setDomain(theDomain);
     }
+    OPS_clearEigenCache();
+
+    return 0;
+}
+
+// bulk version of eleNodes
+//   eleNodes '-all'
+//   eleNodes '-ele' tag1 tag2 ...
+// the nodes of all elements are returned in one flat list, each element
+// as the number of its nodes followed by the node tags, in the order of
+// getEleTags for '-all'
+static int OPS_bulkEleNodes()
+{
+    Domain* theDomain = OPS_GetDomain();
+    if (theDomain == 0) return -1;
+
+    std::vector<Element*> elements;
+    const char* type = OPS_GetString();
+    if (strcmp(type, "-all") == 0) {
+	Element *theEle;
+	ElementIter &eleIter = theDomain->getElements();
+	while ((theEle = eleIter()) != 0) {
+	    elements.push_back(theEle);
+	}
+    } else {
+	std::vector<int> tags;
+	OPS_getBulkQueryTags(tags);
+	for (int i = 0; i < (int)tags.size(); ++i) {
+	    Element* theEle = theDomain->getElement(tags[i]);
+	    if (theEle == 0) {
+		opserr << "WARNING eleNodes - element " << tags[i] << " does not exist\n";
+		return -1;
+	    }
+	    elements.push_back(theEle);
+	}
+    }
+
+    std::vector<int> data;
+    for (int i = 0; i < (int)elements.size(); ++i) {
+	const ID& theNodes = elements[i]->getExternalNodes();
+	data.push_back(theNodes.Size());
+	for (int j = 0; j < theNodes.Size(); ++j) {
+	    data.push_back(theNodes(j));
+	}
+    }
+
+    int size = (int)data.size();
+    int* ptr = 0;
+    if (size > 0) {
+	ptr = &data[0];
+    }
+    if (OPS_SetIntOutput(&size, ptr, false) < 0) {
+	opserr << "WARNING eleNodes - failed to set outputs\n";
+	return -1;
+    }
 
     return 0;
 }
 
 int OPS_eleNodes()
 {
+    if (OPS_isBulkQuery("-ele")) {
+	return OPS_bulkEleNodes();
+    }
+
     if (OPS_GetNumRemainingInputArgs() < 1) {
 	opserr << "WARNING want - eleNodes eleTag?\n";
 	return -1;
@@ -39,6 +39,10 @@
 
 #include <vector>
 
+// a command changing the mass or stiffness of the model drops the
+// last eigen solution
+void OPS_clearEigenCache();
+
 #ifdef _RELIABILITY
 
 // #include <ReliabilityDomain.h>
@@ -541,6 +545,7 @@ OPS_updateParameter()
     }
 
     theDomain->updateParameter(paramTag, newValue);
+    OPS_clearEigenCache();
 
     if (OPS_SetIntOutput(&num, &paramTag, true) < 0) {
 	opserr << "WARING: parameter - failed to set parameter tag\n";
@@ -711,6 +716,7 @@ int OPS_setParameter()
     Domain* theDomain = OPS_GetDomain();
     if (theDomain == 0) return 0;
     theDomain->addParameter(&theParameter);
+    OPS_clearEigenCache();
 
     return 0;
 }
@@ -84,13 +84,19 @@ OpenSeesReliabilityCommands::OpenSeesReliabilityCommands(Domain* structuralDomai
 	theDomain = new ReliabilityDomain(structuralDomain);	
     }
 
-    cmds = this;
+    if (cmds == 0) cmds = this;
 }
 
 OpenSeesReliabilityCommands::~OpenSeesReliabilityCommands()
 {
     if (theDomain != 0) delete theDomain;
-    cmds = 0;
+    if (cmds == this) cmds = 0;
+}
+
+void
+OpenSeesReliabilityCommands::activate()
+{
+    cmds = this;
 }
 
 ReliabilityDomain*
@@ -54,6 +54,8 @@ public:
     explicit OpenSeesReliabilityCommands(Domain* structuralDomain);
     ~OpenSeesReliabilityCommands();
 
+    void activate();
+
     ReliabilityDomain* getDomain();
 
     void setProbabilityTransformation(ProbabilityTransformation *transform);
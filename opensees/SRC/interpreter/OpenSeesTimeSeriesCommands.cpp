@@ -85,10 +85,22 @@ namespace {
 	double factor = -1.0, dt = -1.0;
 	std::vector<double> values, times;
 	const char* fileTime = 0, *filePath = 0;
-	bool useLast = false, prependZero = false;
+	bool useLast = false, prependZero = false, share = false;
 	double startTime = 0.0;
 
+	// values or times given as a single list or buffer argument
+	Vector valueList, timeList;
+
+	// -share has to be known before the values are read
 	int loc = 2;
+	while(OPS_GetNumRemainingInputArgs() > 0) {
+	    const char* arg = OPS_GetString();
+	    if (arg != 0 && strcmp(arg, "-share") == 0) {
+		share = true;
+	    }
+	}
+	OPS_ResetCurrentInputArg(loc+1);
+
 	while(OPS_GetNumRemainingInputArgs() > 0) {
 
 	    // next arg
@@ -108,6 +120,15 @@ namespace {
 		loc++;
 		
 	    } else if (strcmp(arg, "-values") == 0) {
+		// a list or buffer is read in one go, and shared with
+		// the series if possible when -share is given
+		int size = 0;
+		bool shared = share;
+		if (OPS_GetDoubleListInput(&size, &valueList, &shared) == 0) {
+		    share = shared;
+		    loc++;
+		    continue;
+		}
 		while(OPS_GetNumRemainingInputArgs() > 0) {
 		    double val;
 		    if (OPS_GetDoubleInput(&numdata, &val) < 0) {
@@ -132,6 +153,9 @@ namespace {
 	    } else if (strcmp(arg, "-useLast") == 0) {
 		useLast = true;
 
+	    } else if (strcmp(arg, "-share") == 0) {
+		// already known
+
 	    } else if (strcmp(arg, "-prependZero") == 0) {
 		prependZero = true;
 
@@ -163,6 +187,11 @@ namespace {
 		loc++;
 
 	    } else if (strcmp(arg, "-time") == 0) {
+		int size = 0;
+		if (OPS_GetDoubleListInput(&size, &timeList) == 0) {
+		    loc++;
+		    continue;
+		}
 		while(OPS_GetNumRemainingInputArgs() > 0) {
 		    double val;
 		    if (OPS_GetDoubleInput(&numdata, &val) < 0) {
@@ -178,23 +207,29 @@ namespace {
 
 	if (factor < 0) factor = 1.0;
 
+	// values given one by one
+	if (valueList.Size() == 0 && values.empty() == false) {
+	    valueList.setData(&values[0], (int)values.size());
+	    share = false;
+	}
+	if (timeList.Size() == 0 && times.empty() == false) {
+	    timeList.setData(&times[0], (int)times.size());
+	}
+
 	// create path series
-	if (dt > 0 && values.empty()==false) {
+	if (dt > 0 && valueList.Size() > 0) {
 	    
-	    Vector thePath(&values[0], (int)values.size());
-	    return new PathSeries(tag, thePath, dt, factor, useLast, prependZero,
-				  startTime);
+	    return new PathSeries(tag, valueList, dt, factor, useLast, prependZero,
+				  startTime, share);
 	    
 	} else if (dt > 0 && filePath != 0) {
 	    
 	    return new PathSeries(tag, filePath, dt, factor, useLast, prependZero,
 				  startTime);
 	    
-	} else if (times.empty()==false && values.empty()==false) {
+	} else if (timeList.Size() > 0 && valueList.Size() > 0) {
 	    
-	    Vector thePath(&values[0], (int)values.size());
-	    Vector theTime(&times[0], (int)times.size());
-	    return new PathTimeSeries(tag, thePath, theTime, factor);
+	    return new PathTimeSeries(tag, valueList, timeList, factor);
 	    
 	} else if (fileTime != 0 && filePath != 0) {
 
@@ -40,6 +40,8 @@ UPDATES, ENHANCEMENTS, OR MODIFICATIONS.
 #include <UniaxialMaterial.h>
 #include <elementAPI.h>
 #include <map>
+#include <vector>
+#include <string.h>
 #include <LimitCurve.h>
 #include <HystereticBackbone.h>
 #include <StiffnessDegradation.h>
@@ -563,6 +565,91 @@ int OPS_getDampTangent()
     return 0;
 }
 
+int OPS_setStrainHistory()
+{
+    // setStrainHistory strains <matTags...> <-clone>
+    if (OPS_GetNumRemainingInputArgs() < 1) {
+	opserr<<"WARNING want - setStrainHistory strains <matTags...> <-clone>\n";
+	return -1;
+    }
+
+    Vector strains;
+    int numStrains = 0;
+    if (OPS_GetDoubleListInput(&numStrains, &strains) < 0) {
+	opserr<<"WARNING setStrainHistory - strains must be a list of doubles\n";
+	return -1;
+    }
+
+    std::vector<UniaxialMaterial*> materials;
+    bool clone = false;
+    while (OPS_GetNumRemainingInputArgs() > 0) {
+	int tag;
+	int numData = 1;
+	if (OPS_GetIntInput(&numData, &tag) < 0) {
+	    OPS_ResetCurrentInputArg(-1);
+	    const char* opt = OPS_GetString();
+	    if (opt != 0 && strcmp(opt, "-clone") == 0) {
+		clone = true;
+		continue;
+	    }
+	    opserr<<"WARNING setStrainHistory - invalid material tag or option\n";
+	    return -1;
+	}
+	UniaxialMaterial* mat = OPS_getUniaxialMaterial(tag);
+	if (mat == 0) {
+	    opserr<<"WARNING setStrainHistory - material "<<tag<<" not found\n";
+	    return -1;
+	}
+	materials.push_back(mat);
+    }
+
+    // without tags, the material of testUniaxialMaterial
+    if (materials.empty()) {
+	if (theTestingUniaxialMaterial == 0) {
+	    opserr<<"setStrainHistory WARNING no active UniaxialMaterial - use testUniaxialMaterial command.\n";
+	    return -1;
+	}
+	materials.push_back(theTestingUniaxialMaterial);
+    }
+
+    // the stresses and then the tangents of each material in turn
+    int numMats = (int)materials.size();
+    std::vector<double> data(2*numMats*numStrains);
+    for (int i = 0; i < numMats; i++) {
+
+	// a copy leaves the committed state of the material as it is
+	UniaxialMaterial* material = materials[i];
+	if (clone) {
+	    material = material->getCopy();
+	    if (material == 0) {
+		opserr<<"WARNING setStrainHistory - failed to copy material "<<materials[i]->getTag()<<"\n";
+		return -1;
+	    }
+	}
+
+	double* stresses = &data[2*i*numStrains];
+	double* tangents = stresses + numStrains;
+	for (int j = 0; j < numStrains; j++) {
+	    material->setTrialStrain(strains(j));
+	    material->commitState();
+	    stresses[j] = material->getStress();
+	    tangents[j] = material->getTangent();
+	}
+
+	if (clone) {
+	    delete material;
+	}
+    }
+
+    int size = (int)data.size();
+    if (OPS_SetDoubleOutput(&size, size > 0 ? &data[0] : 0, false) < 0) {
+	opserr<<"failed to set stresses and tangents\n";
+	return -1;
+    }
+
+    return 0;
+}
+
 void* OPS_RotationShearCurve();
 void* OPS_ThreePointCurve();
 void* OPS_ShearCurve();
@@ -43,6 +43,9 @@ UPDATES, ENHANCEMENTS, OR MODIFICATIONS.
 
 #include "PythonModule.h"
 #include "PythonStream.h"
+#include <Vector.h>
+#include <ID.h>
+#include <string.h>
 
 // define opserr
 static PythonStream sserr;
@@ -137,16 +140,27 @@ PythonModule::getString() {
         return 0;
     }
 
-    PyObject* space = PyUnicode_FromString(" ");
-    PyObject* empty = PyUnicode_FromString("");
-    PyObject* newo = PyUnicode_Replace(o, space, empty, -1);
-    const char* res = PyUnicode_AsUTF8(newo);
+    // most strings have no spaces, and the utf8 buffer of a
+    // string is cached with it for as long as it lives
+    Py_ssize_t loc = PyUnicode_FindChar(o, ' ', 0, PyUnicode_GetLength(o), 1);
+    if (loc == -1) {
+        return PyUnicode_AsUTF8(o);
+    }
+    if (loc < -1) {
+        return 0;
+    }
 
-    Py_DECREF(newo);
-    Py_DECREF(space);
-    Py_DECREF(empty);
+    // the copy without spaces is kept by the wrapper as long
+    // as the arguments, until the next command
+    static PyObject* space = PyUnicode_InternFromString(" ");
+    static PyObject* empty = PyUnicode_InternFromString("");
+    PyObject* newo = PyUnicode_Replace(o, space, empty, -1);
+    if (newo == 0) {
+        return 0;
+    }
+    wrapper.keepString(newo);
 
-    return res;
+    return PyUnicode_AsUTF8(newo);
 #else
     if (!PyString_Check(o)) {
         return 0;
@@ -166,6 +180,226 @@ PythonModule::resetInput(int cArg) {
     wrapper.resetCommandLine(cArg);
 }
 
+// true if the buffer holds native doubles
+static bool isDoubleBuffer(const Py_buffer& view) {
+    if (view.itemsize != sizeof(double) || view.format == 0) {
+        return false;
+    }
+    const char* format = view.format;
+#if PY_LITTLE_ENDIAN
+    if (format[0] == '@' || format[0] == '=' || format[0] == '<') format++;
+#else
+    if (format[0] == '@' || format[0] == '=' || format[0] == '>') format++;
+#endif
+    return strcmp(format, "d") == 0;
+}
+
+int
+PythonModule::getDoubleList(int* size, Vector* data, bool* share, bool writable) {
+    if (wrapper.getCurrentArg() >= wrapper.getNumberArgs()) {
+        return -1;
+    }
+
+    bool wantShare = share != 0 && *share;
+    bool wantWritable = wantShare && writable;
+    if (share != 0) {
+        *share = false;
+    }
+
+    PyObject *o = PyTuple_GetItem(wrapper.getCurrentArgv(), wrapper.getCurrentArg());
+
+    // numbers (including numpy float64 scalars, which also have a
+    // buffer), strings and bytes are not lists of doubles
+    if (PyFloat_Check(o) || PyLong_Check(o) || PyBool_Check(o) ||
+        PyUnicode_Check(o) || PyBytes_Check(o) || PyByteArray_Check(o)) {
+        return -1;
+    }
+
+    // a contiguous buffer of doubles (numpy array, array.array('d'),
+    // memoryview) is copied in one go, or shared
+    if (PyObject_CheckBuffer(o)) {
+        Py_buffer view;
+        int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT;
+        if (wantWritable) {
+            flags |= PyBUF_WRITABLE;
+        }
+        if (PyObject_GetBuffer(o, &view, flags) == 0) {
+            if (isDoubleBuffer(view)) {
+                int n = (int)(view.len / sizeof(double));
+                if (wantShare && n > 0) {
+                    data->setData((double*)view.buf, n);
+                    wrapper.addSharedBuffer(view, OPS_GetDomain());
+                    *share = true;
+                } else {
+                    data->resize(n);
+                    if (n > 0) {
+                        memcpy(&(*data)(0), view.buf, n*sizeof(double));
+                    }
+                    PyBuffer_Release(&view);
+                }
+                wrapper.incrCurrentArg();
+                *size = n;
+                return 0;
+            }
+            PyBuffer_Release(&view);
+        } else if (wantWritable) {
+            // a read-only array of doubles can not be written into
+            PyErr_Clear();
+            if (PyObject_GetBuffer(o, &view, flags & ~PyBUF_WRITABLE) == 0) {
+                bool doubles = isDoubleBuffer(view);
+                PyBuffer_Release(&view);
+                if (doubles) {
+                    opserr << "WARNING the array is read-only and can not be written into\n";
+                    return -1;
+                }
+            }
+        }
+        PyErr_Clear();
+    }
+
+    // any other sequence of numbers is converted item by item
+    if (!PySequence_Check(o)) {
+        return -1;
+    }
+    PyObject* seq = PySequence_Fast(o, "");
+    if (seq == 0) {
+        PyErr_Clear();
+        return -1;
+    }
+    int n = (int)PySequence_Fast_GET_SIZE(seq);
+    PyObject** items = PySequence_Fast_ITEMS(seq);
+    data->resize(n);
+    for (int i = 0; i < n; i++) {
+        double val = PyFloat_AsDouble(items[i]);
+        if (val == -1.0 && PyErr_Occurred()) {
+            PyErr_Clear();
+            Py_DECREF(seq);
+            return -1;
+        }
+        (*data)(i) = val;
+    }
+    Py_DECREF(seq);
+
+    wrapper.incrCurrentArg();
+    *size = n;
+    return 0;
+}
+
+// the size of the native ints of the buffer, 0 if it holds no ints
+static int intBufferSize(const Py_buffer& view) {
+    if (view.format == 0) {
+        return 0;
+    }
+    const char* format = view.format;
+#if PY_LITTLE_ENDIAN
+    if (format[0] == '@' || format[0] == '=' || format[0] == '<') format++;
+#else
+    if (format[0] == '@' || format[0] == '=' || format[0] == '>') format++;
+#endif
+    if (strcmp(format, "i") != 0 && strcmp(format, "l") != 0 &&
+        strcmp(format, "q") != 0) {
+        return 0;
+    }
+    if (view.itemsize != 4 && view.itemsize != 8) {
+        return 0;
+    }
+    return (int)view.itemsize;
+}
+
+int
+PythonModule::getIntList(int* size, ID* data) {
+    if (wrapper.getCurrentArg() >= wrapper.getNumberArgs()) {
+        return -1;
+    }
+
+    PyObject *o = PyTuple_GetItem(wrapper.getCurrentArgv(), wrapper.getCurrentArg());
+
+    // numbers, strings and bytes are not lists of ints
+    if (PyFloat_Check(o) || PyLong_Check(o) || PyBool_Check(o) ||
+        PyUnicode_Check(o) || PyBytes_Check(o) || PyByteArray_Check(o)) {
+        return -1;
+    }
+
+    // a contiguous buffer of ints (numpy int32 or int64 array,
+    // array.array('i')) is converted in one go
+    if (PyObject_CheckBuffer(o)) {
+        Py_buffer view;
+        if (PyObject_GetBuffer(o, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == 0) {
+            int itemsize = intBufferSize(view);
+            if (itemsize > 0) {
+                int n = (int)(view.len / itemsize);
+                if (n > 0) {
+                    data->resize(n);
+                }
+                for (int i = 0; i < n; i++) {
+                    long long val;
+                    if (itemsize == 4) {
+                        val = ((const int*)view.buf)[i];
+                    } else {
+                        val = ((const long long*)view.buf)[i];
+                    }
+                    if (val != (int)val) {
+                        PyBuffer_Release(&view);
+                        return -1;
+                    }
+                    (*data)(i) = (int)val;
+                }
+                PyBuffer_Release(&view);
+                wrapper.incrCurrentArg();
+                *size = n;
+                return 0;
+            }
+            PyBuffer_Release(&view);
+        }
+        PyErr_Clear();
+    }
+
+    // any other sequence of ints is converted item by item
+    if (!PySequence_Check(o)) {
+        return -1;
+    }
+    PyObject* seq = PySequence_Fast(o, "");
+    if (seq == 0) {
+        PyErr_Clear();
+        return -1;
+    }
+    int n = (int)PySequence_Fast_GET_SIZE(seq);
+    PyObject** items = PySequence_Fast_ITEMS(seq);
+    if (n > 0) {
+        data->resize(n);
+    }
+    for (int i = 0; i < n; i++) {
+        long val = PyLong_AsLong(items[i]);
+        if (PyErr_Occurred() || val != (int)val) {
+            PyErr_Clear();
+            Py_DECREF(seq);
+            return -1;
+        }
+        (*data)(i) = (int)val;
+    }
+    Py_DECREF(seq);
+
+    wrapper.incrCurrentArg();
+    *size = n;
+    return 0;
+}
+
+void
+PythonModule::releaseSharedInputs() {
+    // only those of the active model
+    wrapper.releaseSharedBuffers(OPS_GetDomain());
+}
+
+void
+PythonModule::allowThreads() {
+    wrapper.allowThreads();
+}
+
+void
+PythonModule::endAllowThreads() {
+    wrapper.endAllowThreads();
+}
+
 int
 PythonModule::setInt(int *data, int numArgs, bool scalar) {
     wrapper.setOutputs(data, numArgs, scalar);
@@ -203,8 +437,9 @@ PyMethodDef *getmethodsFunc() {
 }
 
 void cleanupFunc() {
-    module->getCmds().wipe();
     if (module != 0) {
+        module->getCmds().activate();
+        module->getCmds().wipe();
         delete module;
     }
 }
@@ -76,6 +76,11 @@ class PythonModule: public DL_Interpreter
     virtual const char* getString();
     virtual int getStringCopy(char **stringPtr);
     virtual void resetInput(int cArg);
+    virtual int getDoubleList(int* size, Vector* data, bool* share, bool writable = false);
+    virtual int getIntList(int* size, ID* data);
+    virtual void releaseSharedInputs();
+    virtual void allowThreads();
+    virtual void endAllowThreads();
 
     // methods for interpreters to output results
     virtual int setInt(int *, int numArgs, bool scalar);
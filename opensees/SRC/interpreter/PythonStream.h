@@ -141,7 +141,10 @@ private:
         std::stringstream ss;
         ss << err;
         msg = ss.str();
+        // also called by computations that released the GIL
+        PyGILState_STATE state = PyGILState_Ensure();
         PySys_FormatStderr(msg.c_str());
+        PyGILState_Release(state);
     }
 
     PyObject *error;
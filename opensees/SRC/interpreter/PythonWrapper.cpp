@@ -46,20 +46,102 @@ UPDATES, ENHANCEMENTS, OR MODIFICATIONS.
 static PythonWrapper* wrapper = 0;
 
 PythonWrapper::PythonWrapper()
-    :currentArgv(0), currentArg(0), numberArgs(0),
-     methodsOpenSees(), opensees_docstring(""), currentResult(0)
+    :currentArgv(0), currentArg(0), numberArgs(0), keptStrings(),
+     methodsOpenSees(), opensees_docstring(""), currentResult(0),
+     bufferOutputs(false), sharedBuffers(), sharedOwners(),
+     computing(false), computeDepth(0), computeThread(0), computeState(0),
+     computeLock(0)
 {
     wrapper = this;
 }
 
 PythonWrapper::~PythonWrapper()
 {
+    if (Py_IsInitialized()) {
+	for (int i = 0; i < (int)keptStrings.size(); i++) {
+	    Py_DECREF(keptStrings[i]);
+	}
+    }
     wrapper = 0;
 }
 
+void
+PythonWrapper::addSharedBuffer(const Py_buffer& view, void* owner)
+{
+    sharedBuffers.push_back(view);
+    sharedOwners.push_back(owner);
+}
+
+void
+PythonWrapper::releaseSharedBuffers(void* owner)
+{
+    // nothing to release to once python is finalized
+    bool finalized = !Py_IsInitialized();
+
+    int num = 0;
+    for (int i = 0; i < (int)sharedBuffers.size(); i++) {
+	if (sharedOwners[i] != owner) {
+	    sharedBuffers[num] = sharedBuffers[i];
+	    sharedOwners[num] = sharedOwners[i];
+	    num++;
+	} else if (!finalized) {
+	    PyBuffer_Release(&sharedBuffers[i]);
+	}
+    }
+    sharedBuffers.resize(num);
+    sharedOwners.resize(num);
+}
+
+void
+PythonWrapper::allowThreads()
+{
+    if (computeDepth++ > 0) return;
+
+    if (computeLock == 0) {
+	computeLock = PyThread_allocate_lock();
+    }
+
+    // the flag is set while this thread still holds the GIL
+    PyThread_acquire_lock(computeLock, WAIT_LOCK);
+    computing = true;
+    computeThread = PyThread_get_thread_ident();
+    computeState = PyEval_SaveThread();
+}
+
+void
+PythonWrapper::endAllowThreads()
+{
+    if (computeDepth <= 0 || --computeDepth > 0) return;
+
+    PyEval_RestoreThread(computeState);
+    computeState = 0;
+    computing = false;
+    PyThread_release_lock(computeLock);
+}
+
+void
+PythonWrapper::waitForComputation()
+{
+    // a command of another thread while the GIL is released
+    while (computing && computeThread != PyThread_get_thread_ident()) {
+	Py_BEGIN_ALLOW_THREADS
+	PyThread_acquire_lock(computeLock, WAIT_LOCK);
+	PyThread_release_lock(computeLock);
+	Py_END_ALLOW_THREADS
+    }
+}
+
 void
 PythonWrapper::resetCommandLine(int nArgs, int cArg, PyObject* argv)
 {
+    this->waitForComputation();
+
+    // the strings of the last command are no longer used
+    for (int i = 0; i < (int)keptStrings.size(); i++) {
+	Py_DECREF(keptStrings[i]);
+    }
+    keptStrings.clear();
+
     numberArgs = nArgs;
     currentArg = cArg-1;
     if (currentArg < 0) currentArg = 0;
@@ -94,6 +176,27 @@ PythonWrapper::getMethods()
     return &methodsOpenSees[0];
 }
 
+// a memoryview of the given format over a single copy of the data,
+// which numpy can use without another copy
+static PyObject* newBufferOutput(const void* data, Py_ssize_t size, const char* format)
+{
+    PyObject* bytes = PyByteArray_FromStringAndSize((const char*)data, size);
+    if (bytes == 0) {
+	return 0;
+    }
+
+    PyObject* view = PyMemoryView_FromObject(bytes);
+    Py_DECREF(bytes);
+    if (view == 0) {
+	return 0;
+    }
+
+    PyObject* result = PyObject_CallMethod(view, "cast", "s", format);
+    Py_DECREF(view);
+
+    return result;
+}
+
 void
 PythonWrapper::setOutputs(int* data, int numArgs, bool scalar)
 {
@@ -103,6 +206,10 @@ PythonWrapper::setOutputs(int* data, int numArgs, bool scalar)
         if (numArgs > 0) {
             currentResult = Py_BuildValue("i", data[0]);
         }
+#if PY_MAJOR_VERSION >= 3
+    } else if (bufferOutputs) {
+        currentResult = newBufferOutput(data, numArgs*sizeof(int), "i");
+#endif
     } else {
         currentResult = PyList_New(numArgs);
         for (int i = 0; i < numArgs; i++) {
@@ -120,6 +227,10 @@ PythonWrapper::setOutputs(double* data, int numArgs, bool scalar)
         if (numArgs > 0) {
             currentResult = Py_BuildValue("d", data[0]);
         }
+#if PY_MAJOR_VERSION >= 3
+    } else if (bufferOutputs) {
+        currentResult = newBufferOutput(data, numArgs*sizeof(double), "d");
+#endif
     } else {
         currentResult = PyList_New(numArgs);
         for (int i = 0; i < numArgs; i++) {
@@ -235,6 +346,18 @@ static PyObject *Py_ops_getDampTangent(PyObject *self, PyObject *args)
     return wrapper->getResults();
 }
 
+static PyObject *Py_ops_setStrainHistory(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_setStrainHistory() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
 static PyObject *Py_ops_wipe(PyObject *self, PyObject *args)
 {
     wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
@@ -295,6 +418,54 @@ static PyObject *Py_ops_fix(PyObject *self, PyObject *args)
     return wrapper->getResults();
 }
 
+static PyObject *Py_ops_nodes(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_nodes() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
+static PyObject *Py_ops_fixes(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_fixes() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
+static PyObject *Py_ops_elements(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_elements() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
+static PyObject *Py_ops_masses(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_masses() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
 static PyObject *Py_ops_element(PyObject *self, PyObject *args)
 {
     wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
@@ -427,6 +598,30 @@ static PyObject *Py_ops_analyze(PyObject *self, PyObject *args)
     return wrapper->getResults();
 }
 
+static PyObject *Py_ops_analyzeAdaptive(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_analyzeAdaptive() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
+static PyObject *Py_ops_fallback(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_fallback() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
 static PyObject *Py_ops_test(PyObject *self, PyObject *args)
 {
     wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
@@ -859,6 +1054,18 @@ static PyObject *Py_ops_printB(PyObject *self, PyObject *args)
     return wrapper->getResults();
 }
 
+static PyObject *Py_ops_sparseMatrix(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_sparseMatrix() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
 static PyObject *Py_ops_printGID(PyObject *self, PyObject *args)
 {
     wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
@@ -907,6 +1114,18 @@ static PyObject *Py_ops_recorder(PyObject *self, PyObject *args)
     return wrapper->getResults();
 }
 
+static PyObject *Py_ops_recorderRows(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_recorderRows() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
 static PyObject *Py_ops_database(PyObject *self, PyObject *args)
 {
     wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
@@ -943,6 +1162,72 @@ static PyObject *Py_ops_restore(PyObject *self, PyObject *args)
     return wrapper->getResults();
 }
 
+static PyObject *Py_ops_snapshot(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    // get the snapshot as a buffer of doubles in one copy
+    bool bufferOutputs = wrapper->getBufferOutputs();
+    wrapper->setBufferOutputs(true);
+    int res = OPS_snapshot();
+    wrapper->setBufferOutputs(bufferOutputs);
+
+    if (res < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    PyObject* result = wrapper->getResults();
+
+    // return bytes, which can be pickled, e.g. to send the
+    // snapshot to other processes
+    if (PyMemoryView_Check(result)) {
+	PyObject* bytes = PyBytes_FromObject(result);
+	Py_DECREF(result);
+	return bytes;
+    }
+
+    return result;
+}
+
+static PyObject *Py_ops_restoreSnapshot(PyObject *self, PyObject *args)
+{
+    // the bytes of snapshot() are read as a buffer of doubles
+    PyObject* snapshot = 0;
+    if (PyTuple_Size(args) == 1) {
+	PyObject* o = PyTuple_GetItem(args, 0);
+	if (PyBytes_Check(o) || PyByteArray_Check(o)) {
+	    PyObject* view = PyMemoryView_FromObject(o);
+	    if (view == 0) {
+		return NULL;
+	    }
+	    snapshot = PyObject_CallMethod(view, "cast", "s", "d");
+	    Py_DECREF(view);
+	    if (snapshot == 0) {
+		return NULL;
+	    }
+	    args = PyTuple_Pack(1, snapshot);
+	    Py_DECREF(snapshot);
+	    if (args == 0) {
+		return NULL;
+	    }
+	    snapshot = args;
+	}
+    }
+
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    int res = OPS_restoreSnapshot();
+    Py_XDECREF(snapshot);
+
+    if (res < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
 static PyObject *Py_ops_eleForce(PyObject *self, PyObject *args)
 {
     wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
@@ -1243,6 +1528,26 @@ static PyObject *Py_ops_setPrecision(PyObject *self, PyObject *args)
     return wrapper->getResults();
 }
 
+static PyObject *Py_ops_setOutputBuffer(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    // setOutputBuffer <flag>
+    int flag = 1;
+    int numdata = 1;
+    if (OPS_GetNumRemainingInputArgs() > 0) {
+	if (OPS_GetIntInput(&numdata, &flag) < 0) {
+	    opserr << "WARNING setOutputBuffer <flag> - failed to read flag\n";
+	    opserr<<(void*)0;
+	    return NULL;
+	}
+    }
+
+    wrapper->setBufferOutputs(flag != 0);
+
+    return wrapper->getResults();
+}
+
 static PyObject *Py_ops_searchPeerNGA(PyObject *self, PyObject *args)
 {
     wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
@@ -1271,7 +1576,12 @@ static PyObject *Py_ops_record(PyObject *self, PyObject *args)
 {
     wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
 
-    if (OPS_record() < 0) {
+    // the recorders don't use python objects
+    wrapper->allowThreads();
+    int res = OPS_record();
+    wrapper->endAllowThreads();
+
+    if (res < 0) {
 	opserr<<(void*)0;
 	return NULL;
     }
@@ -1604,6 +1914,54 @@ static PyObject *Py_ops_systemSize(PyObject *self, PyObject *args)
     return wrapper->getResults();
 }
 
+static PyObject *Py_ops_switchModel(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_switchModel() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
+static PyObject *Py_ops_getActiveModel(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_getActiveModel() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
+static PyObject *Py_ops_getModelTags(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_getModelTags() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
+static PyObject *Py_ops_removeModel(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_removeModel() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
 static PyObject *Py_ops_version(PyObject *self, PyObject *args)
 {
     wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
@@ -2096,6 +2454,18 @@ static PyObject *Py_ops_sdfResponse(PyObject *self, PyObject *args)
     return wrapper->getResults();
 }
 
+static PyObject *Py_ops_responseSpectrum(PyObject *self, PyObject *args)
+{
+    wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
+
+    if (OPS_responseSpectrum() < 0) {
+	opserr<<(void*)0;
+	return NULL;
+    }
+
+    return wrapper->getResults();
+}
+
 static PyObject *Py_ops_getNumThreads(PyObject *self, PyObject *args)
 {
     wrapper->resetCommandLine(PyTuple_Size(args), 1, args);
@@ -2218,11 +2588,16 @@ PythonWrapper::addOpenSeesCommands()
     addCommand("getStress", &Py_ops_getStress);
     addCommand("getTangent", &Py_ops_getTangent);
     addCommand("getDampTangent", &Py_ops_getDampTangent);
+    addCommand("setStrainHistory", &Py_ops_setStrainHistory);
     addCommand("wipe", &Py_ops_wipe);
     addCommand("model", &Py_ops_model);
     addCommand("node", &Py_ops_node);
     addCommand("fix", &Py_ops_fix);
     addCommand("element", &Py_ops_element);
+    addCommand("nodes", &Py_ops_nodes);
+    addCommand("fixes", &Py_ops_fixes);
+    addCommand("elements", &Py_ops_elements);
+    addCommand("masses", &Py_ops_masses);
     addCommand("timeSeries", &Py_ops_timeSeries);
     addCommand("pattern", &Py_ops_pattern);
     addCommand("load", &Py_ops_nodalLoad);
@@ -2233,6 +2608,8 @@ PythonWrapper::addOpenSeesCommands()
     addCommand("algorithm", &Py_ops_algorithm);
     addCommand("analysis", &Py_ops_analysis);
     addCommand("analyze", &Py_ops_analyze);
+    addCommand("analyzeAdaptive", &Py_ops_analyzeAdaptive);
+    addCommand("fallback", &Py_ops_fallback);
     addCommand("test", &Py_ops_test);
     addCommand("section", &Py_ops_section);
     addCommand("fiber", &Py_ops_fiber);
@@ -2269,13 +2646,17 @@ PythonWrapper::addOpenSeesCommands()
     addCommand("printModel", &Py_ops_print);
     addCommand("printA", &Py_ops_printA);
     addCommand("printB", &Py_ops_printB);
+    addCommand("sparseMatrix", &Py_ops_sparseMatrix);
     addCommand("printGID", &Py_ops_printGID);
     addCommand("testNorm", &Py_ops_getCTestNorms);
     addCommand("testIter", &Py_ops_getCTestIter);
     addCommand("recorder", &Py_ops_recorder);
+    addCommand("recorderRows", &Py_ops_recorderRows);
     addCommand("database", &Py_ops_database);
     addCommand("save", &Py_ops_save);
     addCommand("restore", &Py_ops_restore);
+    addCommand("snapshot", &Py_ops_snapshot);
+    addCommand("restoreSnapshot", &Py_ops_restoreSnapshot);
     addCommand("eleForce", &Py_ops_eleForce);
     addCommand("eleDynamicalForce", &Py_ops_eleDynamicalForce);
     addCommand("nodeUnbalance", &Py_ops_nodeUnbalance);
@@ -2301,6 +2682,7 @@ PythonWrapper::addOpenSeesCommands()
     addCommand("setElementRayleighDampingFactors", &Py_ops_setElementRayleighDampingFactors);
     addCommand("region", &Py_ops_region);
     addCommand("setPrecision", &Py_ops_setPrecision);
+    addCommand("setOutputBuffer", &Py_ops_setOutputBuffer);
     addCommand("searchPeerNGA", &Py_ops_searchPeerNGA);
     addCommand("domainChange", &Py_ops_domainChange);
     addCommand("record", &Py_ops_record);
@@ -2331,6 +2713,10 @@ PythonWrapper::addOpenSeesCommands()
     addCommand("numFact", &Py_ops_numFact);
     addCommand("numIter", &Py_ops_numIter);
     addCommand("systemSize", &Py_ops_systemSize);
+    addCommand("switchModel", &Py_ops_switchModel);
+    addCommand("getActiveModel", &Py_ops_getActiveModel);
+    addCommand("getModelTags", &Py_ops_getModelTags);
+    addCommand("removeModel", &Py_ops_removeModel);
     addCommand("version", &Py_ops_version);
     addCommand("setMaxOpenFiles", &Py_ops_setMaxOpenFiles);
     addCommand("limitCurve", &Py_ops_limitCurve);
@@ -2375,6 +2761,7 @@ PythonWrapper::addOpenSeesCommands()
     addCommand("wipeReliability", &Py_ops_wipeReliability);
     addCommand("updateMaterialStage", &Py_ops_updateMaterialStage);
     addCommand("sdfResponse", &Py_ops_sdfResponse);
+    addCommand("responseSpectrum", &Py_ops_responseSpectrum);
     addCommand("probabilityTransformation", &Py_ops_probabilityTransformation);
     addCommand("getNumThreads", &Py_ops_getNumThreads);
     addCommand("setNumThreads", &Py_ops_setNumThreads);
@@ -73,21 +73,47 @@ public:
     int getNumberArgs() const {return numberArgs;}
     void incrCurrentArg() {currentArg++;}
 
+    // keep a string made from an argument until the next command
+    void keepString(PyObject* str) {keptStrings.push_back(str);}
+
     // set outputs
     void setOutputs(int* data, int numArgs, bool scalar);
     void setOutputs(double* data, int numArgs, bool scalar);
     void setOutputs(const char* str);
     PyObject* getResults();
 
+    // return list outputs as buffers instead of python lists
+    void setBufferOutputs(bool flag) {bufferOutputs = flag;}
+    bool getBufferOutputs() const {return bufferOutputs;}
+
+    // keep the buffers of inputs that are shared with a domain
+    void addSharedBuffer(const Py_buffer& view, void* owner);
+    void releaseSharedBuffers(void* owner);
+
+    // run a computation without the GIL, the commands
+    // of other threads wait until it is done
+    void allowThreads();
+    void endAllowThreads();
+    void waitForComputation();
+
 private:
     // command line arguments
     PyObject* currentArgv;
     int currentArg;
     int numberArgs;
+    std::vector<PyObject*> keptStrings;
 
     // methods table
     std::vector<PyMethodDef> methodsOpenSees;
     const char* opensees_docstring;
     PyObject* currentResult;
+    bool bufferOutputs;
+    std::vector<Py_buffer> sharedBuffers;
+    std::vector<void*> sharedOwners;
+    bool computing;
+    int computeDepth;
+    unsigned long computeThread;
+    PyThreadState* computeState;
+    PyThread_type_lock computeLock;
 };
 #endif
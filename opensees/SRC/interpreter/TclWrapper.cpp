@@ -277,6 +277,22 @@ static int Tcl_ops_analyze(ClientData clientData, Tcl_Interp *interp, int argc,
     return TCL_OK;
 }
 
+static int Tcl_ops_analyzeAdaptive(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv) {
+    wrapper->resetCommandLine(argc, 1, argv);
+
+    if (OPS_analyzeAdaptive() < 0) return TCL_ERROR;
+
+    return TCL_OK;
+}
+
+static int Tcl_ops_fallback(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv) {
+    wrapper->resetCommandLine(argc, 1, argv);
+
+    if (OPS_fallback() < 0) return TCL_ERROR;
+
+    return TCL_OK;
+}
+
 static int Tcl_ops_nodeDisp(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv) {
     wrapper->resetCommandLine(argc, 1, argv);
 
@@ -573,6 +589,14 @@ static int Tcl_ops_printB(ClientData clientData, Tcl_Interp *interp, int argc,
     return TCL_OK;
 }
 
+static int Tcl_ops_sparseMatrix(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv) {
+    wrapper->resetCommandLine(argc, 1, argv);
+
+    if (OPS_sparseMatrix() < 0) return TCL_ERROR;
+
+    return TCL_OK;
+}
+
 static int Tcl_ops_printGID(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv) {
     wrapper->resetCommandLine(argc, 1, argv);
 
@@ -605,6 +629,14 @@ static int Tcl_ops_recorder(ClientData clientData, Tcl_Interp *interp, int argc,
     return TCL_OK;
 }
 
+static int Tcl_ops_recorderRows(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv) {
+    wrapper->resetCommandLine(argc, 1, argv);
+
+    if (OPS_recorderRows() < 0) return TCL_ERROR;
+
+    return TCL_OK;
+}
+
 static int Tcl_ops_database(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv) {
     wrapper->resetCommandLine(argc, 1, argv);
 
@@ -1045,6 +1077,38 @@ static int Tcl_ops_systemSize(ClientData clientData, Tcl_Interp *interp, int arg
     return TCL_OK;
 }
 
+static int Tcl_ops_switchModel(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv) {
+    wrapper->resetCommandLine(argc, 1, argv);
+
+    if (OPS_switchModel() < 0) return TCL_ERROR;
+
+    return TCL_OK;
+}
+
+static int Tcl_ops_getActiveModel(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv) {
+    wrapper->resetCommandLine(argc, 1, argv);
+
+    if (OPS_getActiveModel() < 0) return TCL_ERROR;
+
+    return TCL_OK;
+}
+
+static int Tcl_ops_getModelTags(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv) {
+    wrapper->resetCommandLine(argc, 1, argv);
+
+    if (OPS_getModelTags() < 0) return TCL_ERROR;
+
+    return TCL_OK;
+}
+
+static int Tcl_ops_removeModel(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv) {
+    wrapper->resetCommandLine(argc, 1, argv);
+
+    if (OPS_removeModel() < 0) return TCL_ERROR;
+
+    return TCL_OK;
+}
+
 static int Tcl_ops_version(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv) {
     wrapper->resetCommandLine(argc, 1, argv);
 
@@ -1416,6 +1480,15 @@ static int Tcl_ops_sdfResponse(ClientData clientData, Tcl_Interp *interp, int ar
     return TCL_OK;
 }
 
+static int Tcl_ops_responseSpectrum(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv)
+{
+    wrapper->resetCommandLine(argc, 1, argv);
+
+    if (OPS_responseSpectrum() < 0) return TCL_ERROR;
+
+    return TCL_OK;
+}
+
 static int Tcl_ops_getNumThreads(ClientData clientData, Tcl_Interp *interp, int argc,   TCL_Char **argv)
 {
     wrapper->resetCommandLine(argc, 1, argv);
@@ -1525,6 +1598,8 @@ TclWrapper::addOpenSeesCommands(Tcl_Interp* interp)
     addCommand(interp,"algorithm", &Tcl_ops_algorithm);
     addCommand(interp,"analysis", &Tcl_ops_analysis);
     addCommand(interp,"analyze", &Tcl_ops_analyze);
+    addCommand(interp,"analyzeAdaptive", &Tcl_ops_analyzeAdaptive);
+    addCommand(interp,"fallback", &Tcl_ops_fallback);
     addCommand(interp,"test", &Tcl_ops_test);
     addCommand(interp,"section", &Tcl_ops_section);
     addCommand(interp,"fiber", &Tcl_ops_fiber);
@@ -1561,10 +1636,12 @@ TclWrapper::addOpenSeesCommands(Tcl_Interp* interp)
     addCommand(interp,"printModel", &Tcl_ops_print);
     addCommand(interp,"printA", &Tcl_ops_printA);
     addCommand(interp,"printB", &Tcl_ops_printB);
+    addCommand(interp,"sparseMatrix", &Tcl_ops_sparseMatrix);
     addCommand(interp,"printGID", &Tcl_ops_printGID);
     addCommand(interp,"getCTestNorms", &Tcl_ops_getCTestNorms);
     addCommand(interp,"getCTestIter", &Tcl_ops_getCTestIter);
     addCommand(interp,"recorder", &Tcl_ops_recorder);
+    addCommand(interp,"recorderRows", &Tcl_ops_recorderRows);
     addCommand(interp,"database", &Tcl_ops_database);
     addCommand(interp,"save", &Tcl_ops_save);
     addCommand(interp,"restore", &Tcl_ops_restore);
@@ -1621,6 +1698,10 @@ TclWrapper::addOpenSeesCommands(Tcl_Interp* interp)
     addCommand(interp,"numFact", &Tcl_ops_numFact);
     addCommand(interp,"numIter", &Tcl_ops_numIter);
     addCommand(interp,"systemSize", &Tcl_ops_systemSize);
+    addCommand(interp,"switchModel", &Tcl_ops_switchModel);
+    addCommand(interp,"getActiveModel", &Tcl_ops_getActiveModel);
+    addCommand(interp,"getModelTags", &Tcl_ops_getModelTags);
+    addCommand(interp,"removeModel", &Tcl_ops_removeModel);
     addCommand(interp,"version", &Tcl_ops_version);
     addCommand(interp,"setMaxOpenFiles", &Tcl_ops_setMaxOpenFiles);
     addCommand(interp,"limitCurve", &Tcl_ops_limitCurve);
@@ -1664,6 +1745,7 @@ TclWrapper::addOpenSeesCommands(Tcl_Interp* interp)
     addCommand(interp,"transformUtoX", &Tcl_ops_transformUtoX);
     addCommand(interp,"updateMaterialStage", &Tcl_ops_updateMaterialStage);
     addCommand(interp,"sdfResponse", &Tcl_ops_sdfResponse);
+    addCommand(interp,"responseSpectrum", &Tcl_ops_responseSpectrum);
     addCommand(interp,"probabilityTransformation", &Tcl_ops_probabilityTransformation);
     addCommand(interp,"getNumThreads", &Tcl_ops_getNumThreads);
     addCommand(interp,"setNumThreads", &Tcl_ops_setNumThreads);
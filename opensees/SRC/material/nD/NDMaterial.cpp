@@ -86,6 +86,11 @@ void OPS_clearAllNDMaterial(void)
     theNDMaterialObjects.clearAll();
 }
 
+void OPS_swapAllNDMaterial(MapOfTaggedObjects &theObjects)
+{
+    theNDMaterialObjects.swap(theObjects);
+}
+
 void OPS_printNDMaterial(OPS_Stream &s, int flag) {
     if (flag == OPS_PRINT_PRINTMODEL_JSON) {
         s << "\t\t\"ndMaterials\": [\n";
@@ -75,6 +75,10 @@ void OPS_clearAllSectionForceDeformation(void) {
   theSectionForceDeformationObjects.clearAll();
 }
 
+void OPS_swapAllSectionForceDeformation(MapOfTaggedObjects &theObjects) {
+  theSectionForceDeformationObjects.swap(theObjects);
+}
+
 void OPS_printSectionForceDeformation(OPS_Stream &s, int flag) {
 
   if (flag == OPS_PRINT_PRINTMODEL_JSON) {
@@ -55,6 +55,11 @@ void OPS_clearAllSectionRepres(void)
     theSectionRepresObjects.clearAll();
 }
 
+void OPS_swapAllSectionRepres(MapOfTaggedObjects &theObjects)
+{
+    theSectionRepresObjects.swap(theObjects);
+}
+
 SectionRepres::SectionRepres(int tag):
                  TaggedObject(tag)
 {
@@ -75,6 +75,10 @@ void OPS_clearAllUniaxialMaterial(void) {
   theUniaxialMaterialObjects.clearAll();
 }
 
+void OPS_swapAllUniaxialMaterial(MapOfTaggedObjects &theObjects) {
+  theUniaxialMaterialObjects.swap(theObjects);
+}
+
 void OPS_printUniaxialMaterial(OPS_Stream &s, int flag) {
   if (flag == OPS_PRINT_PRINTMODEL_JSON) {
     s << "\t\t\"uniaxialMaterials\": [\n";        
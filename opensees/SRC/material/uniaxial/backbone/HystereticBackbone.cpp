@@ -55,6 +55,10 @@ void OPS_clearAllHystereticBackbone(void) {
   theHystereticBackboneObjects.clearAll();
 }
 
+void OPS_swapAllHystereticBackbone(MapOfTaggedObjects &theObjects) {
+  theHystereticBackboneObjects.swap(theObjects);
+}
+
 
 HystereticBackbone::HystereticBackbone (int tag, int classTag):
   TaggedObject(tag), MovableObject(classTag)
@@ -63,6 +63,10 @@ void OPS_clearAllLimitCurve(void) {
   theLimitCurveObjects.clearAll();
 }
 
+void OPS_swapAllLimitCurve(MapOfTaggedObjects &theObjects) {
+  theLimitCurveObjects.swap(theObjects);
+}
+
 
 
 
@@ -57,6 +57,11 @@ void OPS_clearAllStiffnessDegradation(void)
   theStiffnessDegradationObjects.clearAll();
 }
 
+void OPS_swapAllStiffnessDegradation(MapOfTaggedObjects &theObjects)
+{
+  theStiffnessDegradationObjects.swap(theObjects);
+}
+
 StiffnessDegradation::StiffnessDegradation(int tag, int classTag)
   :MaterialState(tag,classTag)
 {
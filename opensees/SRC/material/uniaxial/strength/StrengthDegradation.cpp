@@ -57,6 +57,11 @@ void OPS_clearAllStrengthDegradation(void)
   theStrengthDegradationObjects.clearAll();
 }
 
+void OPS_swapAllStrengthDegradation(MapOfTaggedObjects &theObjects)
+{
+  theStrengthDegradationObjects.swap(theObjects);
+}
+
 StrengthDegradation::StrengthDegradation(int tag, int classTag)
   :MaterialState(tag,classTag)
 {
@@ -57,6 +57,11 @@ void OPS_clearAllUnloadingRule(void)
   theUnloadingRuleObjects.clearAll();
 }
 
+void OPS_swapAllUnloadingRule(MapOfTaggedObjects &theObjects)
+{
+  theUnloadingRuleObjects.swap(theObjects);
+}
+
 UnloadingRule::UnloadingRule(int tag, int classTag)
 :MaterialState(tag,classTag)
 {
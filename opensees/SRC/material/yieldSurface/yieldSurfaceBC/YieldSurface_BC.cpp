@@ -38,6 +38,10 @@ void OPS_clearAllYieldSurface_BC(void) {
     theYieldSurface_BCObjects.clearAll();
 }
 
+void OPS_swapAllYieldSurface_BC(MapOfTaggedObjects &theObjects) {
+    theYieldSurface_BCObjects.swap(theObjects);
+}
+
 //////////////////////////////////////////////////////////////////////
 // Construction/Destruction
 //////////////////////////////////////////////////////////////////////
@@ -38,6 +38,249 @@
 #include <string.h>
 #include <Channel.h>
 #include <FEM_ObjectBroker.h>
+#include <EnvelopeDriftRecorder.h>
+
+#include <StandardStream.h>
+#include <DataFileStream.h>
+#include <XmlFileStream.h>
+#include <BinaryFileStream.h>
+#include <TCP_Stream.h>
+#include <MemoryStream.h>
+#include <ReducerStream.h>
+
+#include <elementAPI.h>
+
+static void*
+OPS_DriftRecorder(bool envelope)
+{
+    const char* type = envelope ? "EnvelopeDrift" : "Drift";
+    if (OPS_GetNumRemainingInputArgs() < 4) {
+        opserr << "WARING: recorder " << type << " ";
+        opserr << "-iNode <list nodes> -jNode <list nodes> -dof dof -perpDirn dirn\n";
+        return 0;
+    }
+
+    OPS_Stream *theOutputStream = 0;
+    const char* filename = 0;
+
+    const int STANDARD_STREAM = 0;
+    const int DATA_STREAM = 1;
+    const int XML_STREAM = 2;
+    const int BINARY_STREAM = 4;
+    const int DATA_STREAM_CSV = 5;
+    const int TCP_STREAM = 6;
+    const int MEMORY_STREAM = 8;
+    const int REDUCER_STREAM = 9;
+
+    int eMode = STANDARD_STREAM;
+
+    bool echoTimeFlag = false;
+    double dT = 0.0;
+    bool doScientific = false;
+
+    int precision = 6;
+
+    bool closeOnWrite = false;
+
+    const char *inetAddr = 0;
+    int inetPort;
+
+    Vector theArray;
+    bool ring = false;
+
+    ID iNodes(0, 16);
+    ID jNodes(0, 16);
+    int dof = 1;
+    int perpDirn = 2;
+
+    while (OPS_GetNumRemainingInputArgs() > 0) {
+
+        const char* option = OPS_GetString();
+
+        if (strcmp(option, "-time") == 0) {
+            echoTimeFlag = true;
+        }
+        else if (strcmp(option, "-scientific") == 0) {
+            doScientific = true;
+        }
+        else if (strcmp(option, "-file") == 0) {
+            if (OPS_GetNumRemainingInputArgs() > 0) {
+                filename = OPS_GetString();
+            }
+            eMode = DATA_STREAM;
+        }
+        else if (strcmp(option, "-closeOnWrite") == 0) {
+            closeOnWrite = true;
+        }
+        else if (strcmp(option, "-csv") == 0 || strcmp(option, "-fileCSV") == 0) {
+            if (OPS_GetNumRemainingInputArgs() > 0) {
+                filename = OPS_GetString();
+            }
+            eMode = DATA_STREAM_CSV;
+        }
+        else if (strcmp(option, "-tcp") == 0) {
+            if (OPS_GetNumRemainingInputArgs() > 0) {
+                inetAddr = OPS_GetString();
+            }
+            if (OPS_GetNumRemainingInputArgs() > 0) {
+                int num = 1;
+                if (OPS_GetIntInput(&num, &inetPort) < 0) {
+                    opserr << "WARNING: failed to read inetPort\n";
+                    return 0;
+                }
+            }
+            eMode = TCP_STREAM;
+        }
+        else if (strcmp(option, "-xml") == 0) {
+            if (OPS_GetNumRemainingInputArgs() > 0) {
+                filename = OPS_GetString();
+            }
+            eMode = XML_STREAM;
+        }
+        else if (strcmp(option, "-binary") == 0) {
+            if (OPS_GetNumRemainingInputArgs() > 0) {
+                filename = OPS_GetString();
+            }
+            eMode = BINARY_STREAM;
+        }
+        else if (strcmp(option, "-array") == 0) {
+            // the envelope is only written when the recorder is
+            // removed, after the array may be released
+            if (envelope) {
+                opserr << "WARNING: -array is not supported by recorder EnvelopeDrift\n";
+                return 0;
+            }
+            int size = 0;
+            bool shared = true;
+            if (OPS_GetDoubleListInput(&size, &theArray, &shared, true) < 0 || !shared) {
+                opserr << "WARNING: -array needs a writable array of doubles shared by the interpreter\n";
+                return 0;
+            }
+            eMode = MEMORY_STREAM;
+        }
+        else if (strcmp(option, "-ring") == 0) {
+            ring = true;
+        }
+        else if (strcmp(option, "-reduce") == 0) {
+            // the envelope of the rows is kept in an array of the interpreter
+            if (envelope) {
+                opserr << "WARNING: -reduce is not supported by recorder EnvelopeDrift\n";
+                return 0;
+            }
+            int size = 0;
+            bool shared = true;
+            if (OPS_GetDoubleListInput(&size, &theArray, &shared, true) < 0 || !shared) {
+                opserr << "WARNING: -reduce needs a writable array of doubles shared by the interpreter\n";
+                return 0;
+            }
+            eMode = REDUCER_STREAM;
+        }
+        else if (strcmp(option, "-dT") == 0) {
+            if (OPS_GetNumRemainingInputArgs() > 0) {
+                int num = 1;
+                if (OPS_GetDoubleInput(&num, &dT) < 0) {
+                    opserr << "WARNING: failed to read dT\n";
+                    return 0;
+                }
+            }
+        }
+        else if (strcmp(option, "-precision") == 0) {
+            if (OPS_GetNumRemainingInputArgs() > 0) {
+                int num = 1;
+                if (OPS_GetIntInput(&num, &precision) < 0) {
+                    opserr << "WARNING: failed to read precision\n";
+                    return 0;
+                }
+            }
+        }
+        else if (strcmp(option, "-iNode") == 0 || strcmp(option, "-iNodes") == 0 ||
+                 strcmp(option, "-jNode") == 0 || strcmp(option, "-jNodes") == 0) {
+            ID& nodes = option[1] == 'i' ? iNodes : jNodes;
+            int numNodes = 0;
+            while (OPS_GetNumRemainingInputArgs() > 0) {
+                int num = 1;
+                int nd;
+                if (OPS_GetIntInput(&num, &nd) < 0) {
+                    OPS_ResetCurrentInputArg(-1);
+                    break;
+                }
+                nodes[numNodes++] = nd;
+            }
+        }
+        else if (strcmp(option, "-dof") == 0) {
+            if (OPS_GetNumRemainingInputArgs() > 0) {
+                int num = 1;
+                if (OPS_GetIntInput(&num, &dof) < 0) {
+                    opserr << "WARNING: failed to read dof\n";
+                    return 0;
+                }
+            }
+        }
+        else if (strcmp(option, "-perpDirn") == 0) {
+            if (OPS_GetNumRemainingInputArgs() > 0) {
+                int num = 1;
+                if (OPS_GetIntInput(&num, &perpDirn) < 0) {
+                    opserr << "WARNING: failed to read perpDirn\n";
+                    return 0;
+                }
+            }
+        }
+        else {
+            // a misspelt -dof or -perpDirn would record the wrong drift
+            opserr << "WARNING recorder " << type << " - unknown option " << option << "\n";
+            return 0;
+        }
+    }
+
+    if (iNodes.Size() == 0 || iNodes.Size() != jNodes.Size()) {
+        opserr << "WARNING recorder " << type << " - the number of iNodes and jNodes must be the same and not zero\n";
+        return 0;
+    }
+
+    // data handler
+    if (eMode == DATA_STREAM && filename != 0)
+        theOutputStream = new DataFileStream(filename, OVERWRITE, 2, 0, closeOnWrite, precision, doScientific);
+    else if (eMode == DATA_STREAM_CSV && filename != 0)
+        theOutputStream = new DataFileStream(filename, OVERWRITE, 2, 1, closeOnWrite, precision, doScientific);
+    else if (eMode == XML_STREAM && filename != 0)
+        theOutputStream = new XmlFileStream(filename);
+    else if (eMode == BINARY_STREAM && filename != 0)
+        theOutputStream = new BinaryFileStream(filename);
+    else if (eMode == TCP_STREAM && inetAddr != 0)
+        theOutputStream = new TCP_Stream(inetPort, inetAddr);
+    else if (eMode == MEMORY_STREAM)
+        theOutputStream = new MemoryStream(&theArray(0), theArray.Size(), ring);
+    else if (eMode == REDUCER_STREAM)
+        theOutputStream = new ReducerStream(&theArray(0), theArray.Size(), echoTimeFlag);
+    else
+        theOutputStream = new StandardStream();
+
+    theOutputStream->setPrecision(precision);
+
+    Domain* domain = OPS_GetDomain();
+    if (domain == 0)
+        return 0;
+
+    // Subtract one from dof and perpDirn for C indexing
+    if (envelope)
+        return new EnvelopeDriftRecorder(iNodes, jNodes, dof-1, perpDirn-1,
+                                         *domain, *theOutputStream, echoTimeFlag);
+
+    return new DriftRecorder(iNodes, jNodes, dof-1, perpDirn-1,
+                             *domain, *theOutputStream, echoTimeFlag, dT);
+}
+
+void*
+OPS_DriftRecorder()
+{
+    return OPS_DriftRecorder(false);
+}
+
+void*
+OPS_EnvelopeDriftRecorder()
+{
+    return OPS_DriftRecorder(true);
+}
 
 DriftRecorder::DriftRecorder()
   :Recorder(RECORDER_TAGS_DriftRecorder),
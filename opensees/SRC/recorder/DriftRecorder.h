@@ -65,6 +65,7 @@ class DriftRecorder: public Recorder
 	       FEM_ObjectBroker &theBroker);
   
   virtual double getRecordedValue(int clmnId, int rowOffset, bool reset); //added by SAJalali
+  OPS_Stream *getOutputHandler(void) {return theOutputHandler;}
 
  protected:
   
@@ -51,6 +51,8 @@
 #include <BinaryFileStream.h>
 #include <DatabaseStream.h>
 #include <TCP_Stream.h>
+#include <MemoryStream.h>
+#include <ReducerStream.h>
 
 #include <elementAPI.h>
 
@@ -78,6 +80,8 @@ OPS_ElementRecorder()
     const int DATA_STREAM_CSV = 5;
     const int TCP_STREAM = 6;
     const int DATA_STREAM_ADD = 7;
+    const int MEMORY_STREAM = 8;
+    const int REDUCER_STREAM = 9;
 
     int eMode = STANDARD_STREAM;
 
@@ -92,6 +96,9 @@ OPS_ElementRecorder()
     const char *inetAddr = 0;
     int inetPort;
 
+    Vector theArray;
+    bool ring = false;
+
     ID elements(0, 6);
     ID dofs(0, 6);
 
@@ -154,6 +161,29 @@ OPS_ElementRecorder()
             }
             eMode = BINARY_STREAM;
         }
+        else if (strcmp(option, "-array") == 0) {
+            // the rows are written into an array of the interpreter
+            int size = 0;
+            bool shared = true;
+            if (OPS_GetDoubleListInput(&size, &theArray, &shared, true) < 0 || !shared) {
+                opserr << "WARNING: -array needs a writable array of doubles shared by the interpreter\n";
+                return 0;
+            }
+            eMode = MEMORY_STREAM;
+        }
+        else if (strcmp(option, "-ring") == 0) {
+            ring = true;
+        }
+        else if (strcmp(option, "-reduce") == 0) {
+            // the envelope of the rows is kept in an array of the interpreter
+            int size = 0;
+            bool shared = true;
+            if (OPS_GetDoubleListInput(&size, &theArray, &shared, true) < 0 || !shared) {
+                opserr << "WARNING: -reduce needs a writable array of doubles shared by the interpreter\n";
+                return 0;
+            }
+            eMode = REDUCER_STREAM;
+        }
         else if (strcmp(option, "-dT") == 0) {
             if (OPS_GetNumRemainingInputArgs() > 0) {
                 int num = 1;
@@ -267,6 +297,10 @@ OPS_ElementRecorder()
         theOutputStream = new BinaryFileStream(filename);
     else if (eMode == TCP_STREAM && inetAddr != 0)
         theOutputStream = new TCP_Stream(inetPort, inetAddr);
+    else if (eMode == MEMORY_STREAM)
+        theOutputStream = new MemoryStream(&theArray(0), theArray.Size(), ring);
+    else if (eMode == REDUCER_STREAM)
+        theOutputStream = new ReducerStream(&theArray(0), theArray.Size(), echoTimeFlag);
     else
         theOutputStream = new StandardStream();
 
@@ -71,6 +71,7 @@ class ElementRecorder: public Recorder
     int recvSelf(int commitTag, Channel &theChannel, 
 		 FEM_ObjectBroker &theBroker);
 	virtual double getRecordedValue(int clmnId, int rowOffset, bool reset); //added by SAJalali
+	OPS_Stream *getOutputHandler(void) {return theOutputHandler;}
 
   protected:
 
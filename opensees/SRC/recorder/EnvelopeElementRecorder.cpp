@@ -53,18 +53,23 @@
 #include <stdlib.h>
 #include <math.h>
 
-void*
-OPS_EnvelopeElementRecorder()
+// the options of the EnvelopeElement and NormEnvelopeElement recorders:
+// the elements, the response request, the output stream, dT and the dofs
+int
+OPS_EnvelopeElementRecorderArgs(const char* type, ID& elements,
+                                const char**& data, int& nargrem,
+                                OPS_Stream*& theOutputStream, double& dT,
+                                bool& echoTimeFlag, ID& dofs)
 {
     if (OPS_GetNumRemainingInputArgs() < 5) {
-        opserr << "WARING: recorder EnvelopeElement ";
+        opserr << "WARING: recorder " << type << " ";
         opserr << "-ele <list elements> -file <fileName> -dT <dT> reponse";
-        return 0;
+        return -1;
     }
 
-    const char** data = 0;
-    int nargrem = 0;
-    OPS_Stream *theOutputStream = 0;
+    data = 0;
+    nargrem = 0;
+    theOutputStream = 0;
     const char* filename = 0;
 
     const int STANDARD_STREAM = 0;
@@ -78,8 +83,8 @@ OPS_EnvelopeElementRecorder()
 
     int eMode = STANDARD_STREAM;
 
-    bool echoTimeFlag = false;
-    double dT = 0.0;
+    echoTimeFlag = false;
+    dT = 0.0;
     bool doScientific = false;
 
     int precision = 6;
@@ -89,9 +94,6 @@ OPS_EnvelopeElementRecorder()
     const char *inetAddr = 0;
     int inetPort;
 
-    ID elements(0, 6);
-    ID dofs(0, 6);
-
     while (OPS_GetNumRemainingInputArgs() > 0) {
 
         const char* option = OPS_GetString();
@@ -134,7 +136,7 @@ OPS_EnvelopeElementRecorder()
                 int num = 1;
                 if (OPS_GetIntInput(&num, &inetPort) < 0) {
                     opserr << "WARNING: failed to read inetPort\n";
-                    return 0;
+                    return -1;
                 }
             }
             eMode = TCP_STREAM;
@@ -156,7 +158,7 @@ OPS_EnvelopeElementRecorder()
                 int num = 1;
                 if (OPS_GetDoubleInput(&num, &dT) < 0) {
                     opserr << "WARNING: failed to read dT\n";
-                    return 0;
+                    return -1;
                 }
             }
         }
@@ -165,7 +167,7 @@ OPS_EnvelopeElementRecorder()
                 int num = 1;
                 if (OPS_GetIntInput(&num, &precision) < 0) {
                     opserr << "WARNING: failed to read precision\n";
-                    return 0;
+                    return -1;
                 }
             }
         }
@@ -187,14 +189,14 @@ OPS_EnvelopeElementRecorder()
                 int num = 1;
                 if (OPS_GetIntInput(&num, &start) < 0) {
                     opserr << "WARNING: failed to read start element\n";
-                    return 0;
+                    return -1;
                 }
             }
             if (OPS_GetNumRemainingInputArgs() > 0) {
                 int num = 1;
                 if (OPS_GetIntInput(&num, &end) < 0) {
                     opserr << "WARNING: failed to read end element\n";
-                    return 0;
+                    return -1;
                 }
             }
             if (start > end) {
@@ -212,14 +214,14 @@ OPS_EnvelopeElementRecorder()
                 int num = 1;
                 if (OPS_GetIntInput(&num, &tag) < 0) {
                     opserr << "WARNING: failed to read region tag\n";
-                    return 0;
+                    return -1;
                 }
             }
             Domain *domain = OPS_GetDomain();
             MeshRegion *theRegion = domain->getRegion(tag);
             if (theRegion == 0) {
                 opserr << "WARNING: region does not exist\n";
-                return 0;
+                return -1;
             }
             const ID &eleRegion = theRegion->getElements();
             int numEle = 0;
@@ -270,6 +272,23 @@ OPS_EnvelopeElementRecorder()
 
     theOutputStream->setPrecision(precision);
 
+    return 0;
+}
+
+void*
+OPS_EnvelopeElementRecorder()
+{
+    ID elements(0, 6);
+    ID dofs(0, 6);
+    const char** data = 0;
+    int nargrem = 0;
+    OPS_Stream *theOutputStream = 0;
+    double dT = 0.0;
+    bool echoTimeFlag = false;
+    if (OPS_EnvelopeElementRecorderArgs("EnvelopeElement", elements, data, nargrem,
+                                        theOutputStream, dT, echoTimeFlag, dofs) < 0)
+        return 0;
+
     Domain* domain = OPS_GetDomain();
     if (domain == 0)
         return 0;
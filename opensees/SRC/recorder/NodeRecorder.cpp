@@ -48,6 +48,8 @@
 #include <BinaryFileStream.h>
 #include <DatabaseStream.h>
 #include <TCP_Stream.h>
+#include <MemoryStream.h>
+#include <ReducerStream.h>
 
 #include <elementAPI.h>
 
@@ -76,6 +78,8 @@ OPS_NodeRecorder()
     const int DATA_STREAM_CSV = 5;
     const int TCP_STREAM = 6;
     const int DATA_STREAM_ADD = 7;
+    const int MEMORY_STREAM = 8;
+    const int REDUCER_STREAM = 9;
     
     int eMode = STANDARD_STREAM;
     
@@ -89,6 +93,9 @@ OPS_NodeRecorder()
     
     const char *inetAddr = 0;
     int inetPort;
+
+    Vector theArray;
+    bool ring = false;
     
     int gradIndex = -1;
     
@@ -158,6 +165,29 @@ OPS_NodeRecorder()
             }
             eMode = BINARY_STREAM;
         }
+        else if (strcmp(option, "-array") == 0) {
+            // the rows are written into an array of the interpreter
+            int size = 0;
+            bool shared = true;
+            if (OPS_GetDoubleListInput(&size, &theArray, &shared, true) < 0 || !shared) {
+                opserr << "WARNING: -array needs a writable array of doubles shared by the interpreter\n";
+                return 0;
+            }
+            eMode = MEMORY_STREAM;
+        }
+        else if (strcmp(option, "-ring") == 0) {
+            ring = true;
+        }
+        else if (strcmp(option, "-reduce") == 0) {
+            // the envelope of the rows is kept in an array of the interpreter
+            int size = 0;
+            bool shared = true;
+            if (OPS_GetDoubleListInput(&size, &theArray, &shared, true) < 0 || !shared) {
+                opserr << "WARNING: -reduce needs a writable array of doubles shared by the interpreter\n";
+                return 0;
+            }
+            eMode = REDUCER_STREAM;
+        }
         else if (strcmp(option, "-dT") == 0) {
             if (OPS_GetNumRemainingInputArgs() > 0) {
                 int num = 1;
@@ -281,6 +311,10 @@ OPS_NodeRecorder()
         theOutputStream = new BinaryFileStream(filename);
     else if (eMode == TCP_STREAM && inetAddr != 0)
         theOutputStream = new TCP_Stream(inetPort, inetAddr);
+    else if (eMode == MEMORY_STREAM)
+        theOutputStream = new MemoryStream(&theArray(0), theArray.Size(), ring);
+    else if (eMode == REDUCER_STREAM)
+        theOutputStream = new ReducerStream(&theArray(0), theArray.Size(), echoTimeFlag);
     else
         theOutputStream = new StandardStream();
     
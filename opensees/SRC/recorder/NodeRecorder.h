@@ -69,6 +69,7 @@ class NodeRecorder: public Recorder
     int recvSelf(int commitTag, Channel &theChannel, 
 		 FEM_ObjectBroker &theBroker);
 	virtual double getRecordedValue(int clmnId, int rowOffset, bool reset); //added by SAJalali
+	OPS_Stream *getOutputHandler(void) {return theOutputHandler;}
 
   protected:
 
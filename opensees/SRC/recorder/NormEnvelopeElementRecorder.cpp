@@ -46,6 +46,38 @@
 #include <math.h>
 #include <stdlib.h>
 
+#include <elementAPI.h>
+
+int OPS_EnvelopeElementRecorderArgs(const char* type, ID& elements,
+                                    const char**& data, int& nargrem,
+                                    OPS_Stream*& theOutputStream, double& dT,
+                                    bool& echoTimeFlag, ID& dofs);
+
+void*
+OPS_NormEnvelopeElementRecorder()
+{
+    // the options are those of the EnvelopeElement recorder
+    ID elements(0, 6);
+    ID dofs(0, 6);
+    const char** data = 0;
+    int nargrem = 0;
+    OPS_Stream *theOutputStream = 0;
+    double dT = 0.0;
+    bool echoTimeFlag = false;
+    if (OPS_EnvelopeElementRecorderArgs("NormEnvelopeElement", elements, data, nargrem,
+                                        theOutputStream, dT, echoTimeFlag, dofs) < 0)
+        return 0;
+
+    Domain* domain = OPS_GetDomain();
+    if (domain == 0)
+        return 0;
+    NormEnvelopeElementRecorder* recorder = new NormEnvelopeElementRecorder(&elements,
+        data, nargrem, *domain, *theOutputStream, dT, echoTimeFlag, &dofs);
+
+    return recorder;
+}
+
+
 NormEnvelopeElementRecorder::NormEnvelopeElementRecorder()
 :Recorder(RECORDER_TAGS_NormEnvelopeElementRecorder),
  numEle(0), numDOF(0), eleID(0), dof(0), theResponses(0), theDomain(0),
@@ -58,6 +58,7 @@ class Recorder: public MovableObject, public TaggedObject
 
     virtual void Print(OPS_Stream &s, int flag); 
 	virtual double getRecordedValue(int clmnId, int rowOffset, bool reset) { return 0; } //added by SAJalali
+	virtual OPS_Stream *getOutputHandler(void) {return 0;}
 
   protected:
     
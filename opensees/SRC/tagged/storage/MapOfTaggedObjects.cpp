@@ -200,6 +200,13 @@ MapOfTaggedObjects::clearAll(bool invokeDestructor)
     theMap.clear();
 }
 
+void
+MapOfTaggedObjects::swap(MapOfTaggedObjects &other)
+{
+    // exchange the stored objects, the iters still refer to their own map
+    theMap.swap(other.theMap);
+}
+
 void
 MapOfTaggedObjects::Print(OPS_Stream &s, int flag)
 {
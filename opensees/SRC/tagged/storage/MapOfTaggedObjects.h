@@ -64,6 +64,7 @@ class MapOfTaggedObjects : public TaggedObjectStorage
     
     TaggedObjectStorage *getEmptyCopy(void);
     void clearAll(bool invokeDestructor = true);
+    void swap(MapOfTaggedObjects &other);
     
     void Print(OPS_Stream &s, int flag =0);
     friend class MapOfTaggedObjectsIter;
@@ -101,171 +101,42 @@ No_of_GMs = int(len(fnmatch.filter(os.listdir(GMdir),'*.AT2'))/2)
 print('\nGenerating Spectra for {} provided GMs \n\n'.format(np.round(No_of_GMs,0)))
 
 # Initializations
-DISPLACEMENTS = pd.DataFrame(columns=['uX','uY'])
 GM_SPECTRA = pd.DataFrame(columns=['Period(s)','RotD50Sa(g)', 'RotD100Sa(g)'])
-SDOF_RESPONSE = [[]]
 GM_RESPONSE = [[]]
+xDamp = 0.05                # 5% damping ratio
 
 # Spectra Generation
 for iEQ in range(1,No_of_GMs+1):
     print('Generating Spectra for GM: {} ...\n'.format(np.round(iEQ,0)))   
     Periods = np.concatenate((list(np.arange(Int_T_Reg_1,End_T_Reg_1+Int_T_Reg_1,Int_T_Reg_1)),list(np.arange(End_T_Reg_1+Int_T_Reg_2,End_T_Reg_2+Int_T_Reg_2,Int_T_Reg_2)),list(np.arange(End_T_Reg_2+Int_T_Reg_3,End_T_Reg_3+Int_T_Reg_3,Int_T_Reg_3))),axis=0)
-    ii = 0
     
-    for T in Periods:
-        ii = ii+1
-        GMinter = 0
-               
-        # Storing Periods
-        GM_SPECTRA.loc[ii-1,'Period(s)'] = T
-                
-        # Setting modelbuilder
-        model('basic', '-ndm', 3, '-ndf', 6)
-        
-        # Setting SODF Variables        
-        g = 386.1                   # value of g
-        L = 1.0                     # Length 
-        d = 2                       # Diameter
-        r = d/2                     # Radius
-        A = np.pi*(r**2)            # Area
-        E = 1.0                     # Elastic Modulus
-        G = 1.0                     # Shear Modulus
-        I3 = np.pi*(r**4)/4         # Moment of Inertia (zz)                
-        J = np.pi*(r**4)/2          # Polar Moment of Inertia
-        I2 = np.pi*(r**4)/4         # Moment of Inertia (yy)
-        K = 3*E*I3/(L**3)           # Stiffness 
-        M = K*(T**2)/4/(np.pi**2)   # Mass
-        omega = np.sqrt(K/M)        # Natural Frequency
-        Tn = 2*np.pi/omega          # Natural Period
-                
-        # Creating nodes
-        node(1, 0.0, 0.0, 0.0)
-        node(2, 0.0, 0.0, L)
-        
-        # Transformation
-        transfTag = 1
-        geomTransf('Linear',transfTag,0.0,1.0,0.0)
-        
-        # Setting boundary condition
-        fix(1, 1, 1, 1, 1, 1, 1)
-        
-        # Defining materials
-        uniaxialMaterial("Elastic", 11, E)
-        
-        # Defining elements
-        element("elasticBeamColumn",12,1,2,A,E,G,J,I2,I3,1)
-        
-        # Defining mass
-        mass(2,M,M,0.0,0.0,0.0,0.0)
-        
-        # Eigen Value Analysis (Verifying Period)
-        numEigen = 1
-        eigenValues = eigen(numEigen)
-        omega = np.sqrt(eigenValues)
-        T = 2*np.pi/omega
-        print('   Calculating Spectral Ordinate for Period = {} secs'.format(np.round(T,3)))
+    ## Reading GM Files (once per ground motion)
+    exec(open("ReadGMFile.py").read())	            # read in procedure Multinition 
+    iGMinput = 'GM1'+str(iEQ)+' GM2'+str(iEQ) ;
+    GMinput  = iGMinput.split(' ');
+    gmXY     = {}        
+    for i in range(0,2):
+        inFile   = os.path.join(GMdir, GMinput[i]+'.AT2');
+        dt, NumPts , gmXY = ReadGMFile()
     
-        ## Reading GM Files 
-        exec(open("ReadGMFile.py").read())	            # read in procedure Multinition 
-        iGMinput = 'GM1'+str(iEQ)+' GM2'+str(iEQ) ;
-        GMinput  = iGMinput.split(' ');
-        gmXY     = {}        
-        for i in range(0,2):
-            inFile   = GMdir + '\\'+ GMinput[i]+'.AT2';
-            dt, NumPts , gmXY = ReadGMFile()
-        
-        # Storing GM Histories
-        gmX = gmXY[1]
-        gmY = gmXY[2]       
-        gmXY_mat = np.column_stack((gmX,gmX,gmY,gmY))
-        
-        # Bidirectional Uniform Earthquake ground motion (uniform acceleration input at all support nodes)
-        iGMfile      = 'GM1'+str(iEQ)+' GM2'+str(iEQ) ;			
-        GMfile       = iGMfile.split(' ')
-        GMdirection  = [1,1,2,2];					
-        GMfact	     = [np.cos(GMinter*np.pi/180),np.sin(-GMinter*np.pi/180), np.sin(GMinter*np.pi/180), np.cos(GMinter*np.pi/180)];
-        IDTag        = 2
-        loop         = [1,2,3,4]
-        
-        for i in loop:
-            # Setting time series to be passed to uniform excitation
-            timeSeries('Path',IDTag +i, '-dt', dt, '-values', *list(gmXY_mat[:,i-1]), '-factor', GMfact[i-1]*g)
-            # Creating UniformExcitation load pattern
-            pattern('UniformExcitation',  IDTag+i,   GMdirection[i-1],  '-accel', IDTag+i)
-        
-        # Defining Damping
-        # Applying Rayleigh Damping from $xDamp
-        # D=$alphaM*M + $betaKcurr*Kcurrent + $betaKcomm*KlastCommit + $beatKinit*$Kinitial
-        xDamp 		= 0.05;								# 5% damping ratio
-        alphaM 		= 0.;								# M-prop. damping; D = alphaM*M
-        betaKcurr 	= 0.;         						# K-proportional damping;      +beatKcurr*KCurrent
-        betaKcomm 	= 2.*xDamp/omega;   				# K-prop. damping parameter;   +betaKcomm*KlastCommitt
-        betaKinit 	= 0.;         						# initial-stiffness proportional damping      +beatKinit*Kini
-        rayleigh(alphaM,betaKcurr,betaKinit,betaKcomm); # RAYLEIGH damping
-                
-        # Creating the analysis
-        wipeAnalysis()			            # clear previously-define analysis parameters
-        constraints("Penalty",1e18, 1e18)   # how to handle boundary conditions
-        numberer("RCM")                     # renumber dof's to minimize band-width (optimization), if you want to
-        system('SparseGeneral')             # how to store and solve the system of equations in the analysis
-        algorithm('Linear')	                # use Linear algorithm for linear analysis
-        integrator("TRBDF2")                # determine the next time step for an analysis
-        algorithm("NewtonLineSearch")       # define type of analysis: time-dependent
-        test('EnergyIncr',1.0e-6, 100, 0)
-        analysis("Transient")
-        
-        # Variables (Can alter the speed of analysis)
-        dtAnalysis    = dt
-        TmaxAnanlysis = dt*NumPts
-        tFinal        = int(TmaxAnanlysis/dtAnalysis)
-        tCurrent      = getTime()
-        ok            = 0
-        time          = [tCurrent]
-        
-        # Initializations of response
-        u1            = [0.0]
-        u2            = [0.0]
-                
-        # Performing the transient analysis (Performance is slow in this loop, can be altered by changing the parameters)
-        while ok == 0 and tCurrent < tFinal:
-            ok = analyze(1, dtAnalysis)
-            # if the analysis fails try initial tangent iteration
-            if ok != 0:
-                print("Iteration failed .. lets try an initial stiffness for this step")
-                test('NormDispIncr', 1.0e-12,  100, 0)
-                algorithm('ModifiedNewton', '-initial')
-                ok =analyze( 1, .001)
-                
-                if ok == 0:
-                    print("that worked .. back to regular newton")
-                    test('NormDispIncr', 1.0e-12,  10 )
-                    algorithm('Newton')
-                    
-            tCurrent = getTime()
-            time.append(tCurrent)
-            u1.append(nodeDisp(2,1))
-            u2.append(nodeDisp(2,2))  
-            
-        # Storing responses
-        DISPLACEMENTS.loc[ii-1,'uX'] = np.array(u1)
-        DISPLACEMENTS.loc[ii-1,'uY'] = np.array(u2)
-        DISP_X_Y = np.column_stack((np.array(u1),np.array(u2)))
-        
-        # Rotating the Spectra (Projections)
-        Rot_Matrix = np.zeros((2,2))
-        Rot_Disp = np.zeros((180,1))
-        for theta in range (0,180,1):
-            Rot_Matrix [0,0] = np.cos(np.deg2rad(theta))
-            Rot_Matrix [0,1] = np.sin(np.deg2rad(-theta))
-            Rot_Matrix [1,0] = np.sin(np.deg2rad(theta))
-            Rot_Matrix [1,1] = np.cos(np.deg2rad(theta))
-            Rot_Disp[theta,0] = np.max(np.matmul(DISP_X_Y,Rot_Matrix)[:,0])
-        
-        # Storing Spectra
-        Rot_Acc = np.dot(Rot_Disp,(omega**2)/g)
-        GM_SPECTRA.loc[ii-1,'RotD50Sa(g)'] = np.median(Rot_Acc)
-        GM_SPECTRA.loc[ii-1,'RotD100Sa(g)']= np.max(Rot_Acc)
-        wipe()
+    # Storing GM Histories
+    gmX = gmXY[1]
+    gmY = gmXY[2]       
+    
+    # The SDOF oscillators of all periods are integrated in C++ in one call, and the 
+    # RotD50 and RotD100 spectra are obtained by rotating the responses to the 
+    # two components by 0 to 179 degrees. The ground motions are in g, and so are 
+    # the spectral accelerations.
+    spectra = responseSpectrum('-dt', dt, '-accel', gmX, '-accel2', gmY, 
+                               '-periods', Periods, '-damping', xDamp)
+    spectra = np.reshape(spectra, (len(Periods), 6))
+    
+    # Storing Spectra
+    for ii, T in enumerate(Periods):
+        print('   Calculated Spectral Ordinate for Period = {} secs'.format(np.round(T,3)))
+        GM_SPECTRA.loc[ii,'Period(s)'] = T
+        GM_SPECTRA.loc[ii,'RotD50Sa(g)'] = spectra[ii,2]
+        GM_SPECTRA.loc[ii,'RotD100Sa(g)']= spectra[ii,5]
 
     # Writing Spectra to Files                
     if not os.path.exists('Spectra'):
@@ -296,7 +167,6 @@ for iEQ in range(1,No_of_GMs+1):
         fig = plt.figure(2,figsize=(18,12))
         plot_spectra('RotD100 Spectra','RotD100Sa(g)',iEQ)
 
-    SDOF_RESPONSE.insert(iEQ-1,DISPLACEMENTS)
     GM_RESPONSE.insert(iEQ-1,GM_SPECTRA)
     
     print('\nGenerated Spectra for GM: {}\n\n'.format(np.round(iEQ,0)))
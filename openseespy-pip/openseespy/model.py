@@ -0,0 +1,58 @@
+import openseespy.opensees as ops
+
+
+class Model:
+    """A model of its own in the interpreter (see switchModel).
+
+    The model is made active with activate() or in a with block.
+    Any OpenSees command called on the object, e.g. model.analyze(1),
+    activates the model first.
+
+    Args:
+        tag: model tag, default is a new model with the next free tag
+    """
+
+    def __init__(self, tag=None):
+
+        if tag is None:
+            tag = max(ops.getModelTags()) + 1
+        self.tag = tag
+        self._previous = []
+
+        # create the model without changing the active one
+        current = ops.getActiveModel()
+        ops.switchModel(tag)
+        ops.switchModel(current)
+
+    def activate(self):
+        """Make the model the active one."""
+        ops.switchModel(self.tag)
+        return self
+
+    def isActive(self):
+        return ops.getActiveModel() == self.tag
+
+    def remove(self):
+        """Wipe and remove the model, it must not be active."""
+        ops.removeModel(self.tag)
+
+    def __enter__(self):
+        self._previous.append(ops.getActiveModel())
+        ops.switchModel(self.tag)
+        return self
+
+    def __exit__(self, *args):
+        ops.switchModel(self._previous.pop())
+
+    def __getattr__(self, name):
+
+        command = getattr(ops, name)
+
+        def call(*args):
+            ops.switchModel(self.tag)
+            return command(*args)
+
+        return call
+
+    def __repr__(self):
+        return 'Model({})'.format(self.tag)
@@ -0,0 +1,131 @@
+import itertools
+import functools
+import multiprocessing
+
+import numpy as np
+import openseespy.opensees as ops
+
+# Run many independent analyses (e.g. materials x ground motions) in a pool
+# of local processes. Every worker imports OpenSees once and reuses it for
+# all of its cases: the model is wiped and rebuilt for each case.
+#
+# build(case) builds the model of a case, analyze(case, attempt) runs the
+# analysis and returns its result, a number or an array of numbers of the
+# same shape for all cases. A case is a dict of parameters. A case fails if
+# analyze returns None (e.g. ops.analyze did not converge) or an OpenSees
+# command raises an error; it is then wiped, rebuilt and run again with
+# attempt = 1, 2, ... up to retries, so analyze can try a smaller time
+# step or another algorithm. Cases still failing are skipped.
+
+
+def gridCases(grid):
+    """All combinations of the parameter values of a grid.
+
+    Args:
+        grid: dict of parameter name: list of values
+
+    Returns:
+        list of cases (dicts), the last parameter changing fastest
+    """
+
+    names = list(grid.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def _runCase(build, analyze, retries, case):
+
+    for attempt in range(retries + 1):
+        try:
+            ops.wipe()
+            build(case)
+            result = analyze(case, attempt)
+        except ops.OpenSeesError:
+            result = None
+
+        if result is not None:
+            return True, result
+
+    ops.wipe()
+    return False, None
+
+
+def _collect(outcomes):
+
+    converged = np.array([ok for ok, result in outcomes], dtype=bool)
+
+    shape = ()
+    for ok, result in outcomes:
+        if ok:
+            shape = np.shape(result)
+            break
+
+    results = np.full((len(outcomes),) + shape, np.nan)
+    for i, (ok, result) in enumerate(outcomes):
+        if ok:
+            results[i] = result
+
+    return results, converged
+
+
+def runCases(build, analyze, cases, processes=None, retries=0, chunksize=1):
+    """Run the analyses of a list of cases in a pool of processes.
+
+    Args:
+        build: function build(case) building the model of a case
+        analyze: function analyze(case, attempt) returning the result or None
+        cases: list of cases, each a dict of parameters
+        processes: number of processes, default is the number of CPUs;
+            with 1 the cases run in this process, wiping its model
+        retries: number of times a failed case is run again
+        chunksize: number of cases sent to a worker at once
+
+    Returns:
+        results: array of the results (number of cases, result shape),
+            nan for the failed cases
+        converged: bool array, False for the failed cases
+    """
+
+    runCase = functools.partial(_runCase, build, analyze, retries)
+
+    if processes == 1:
+        outcomes = [runCase(case) for case in cases]
+    else:
+        pool = multiprocessing.Pool(processes)
+        try:
+            outcomes = list(pool.imap(runCase, cases, chunksize))
+        except BaseException:
+            # an error of build or analyze stops all workers
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+
+    return _collect(outcomes)
+
+
+def runGrid(build, analyze, grid, processes=None, retries=0, chunksize=1):
+    """Run the analyses of all combinations of the parameters of a grid.
+
+    Args:
+        build: see runCases
+        analyze: see runCases
+        grid: dict of parameter name: list of values
+        processes: see runCases
+        retries: see runCases
+        chunksize: see runCases
+
+    Returns:
+        results: array of the results (grid shape, result shape),
+            e.g. results[i, j] for the i-th value of the first parameter
+            and the j-th value of the second one
+        converged: bool array of the grid shape
+    """
+
+    cases = gridCases(grid)
+    results, converged = runCases(build, analyze, cases, processes, retries, chunksize)
+
+    gridShape = tuple(len(values) for values in grid.values())
+    return (results.reshape(gridShape + results.shape[1:]),
+            converged.reshape(gridShape))
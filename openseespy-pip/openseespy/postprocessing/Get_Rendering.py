@@ -43,12 +43,12 @@ import openseespy.opensees as ops
 ####
 #####################################################################
 
-def createODB(*argv, Nmodes=0, deltaT=0.0, recorders=[]):
+def createODB(*argv, Nmodes=0, deltaT=0.0, recorders=[], fileFormat="binary"):
 	
 	"""
 	This function creates a directory to save all the output data.
 
-	Command: createODB("ModelName",<"LoadCase Name">, <Nmodes=Nmodes(int)>, <recorders=*recorder(list)>)
+	Command: createODB("ModelName",<"LoadCase Name">, <Nmodes=Nmodes(int)>, <recorders=*recorder(list)>, <fileFormat="binary">)
 	
 	ModelName    : (string) Name of the model. The main output folder will be named "ModelName_ODB" in the current directory.
 	LoadCase Name: (string), Optional. Name of the load case forder to be created inside the ModelName_ODB folder. If not provided,
@@ -63,6 +63,10 @@ def createODB(*argv, Nmodes=0, deltaT=0.0, recorders=[]):
 					'localForce','basicDeformation', 'plasticDeformation','stresses','strains'
 					The recorders for node displacement and reactions are saved by default to help plot the deformed shape.
 	
+	fileFormat	 : (string) Optional format of the load case output files. "binary" (default) saves the recorder output 
+					with the OpenSees '-binary' option in ".bin" files, which are much faster to write and read for large models.
+					"text" saves the legacy space delimited ".out" files.
+	
 	Example: createODB(TwoSpanBridge, Pushover, Nmodes=3, recorders=['stresses', 'strains'])
 	
 	Future: The integrationPoints output works only for nonlinear beam column elements. If a model has a combination 
@@ -75,6 +79,15 @@ def createODB(*argv, Nmodes=0, deltaT=0.0, recorders=[]):
 	if not os.path.exists(ODBdir):
 			os.makedirs(ODBdir)
 
+	if fileFormat == "binary":
+		fileOption = '-binary'
+		ftype = '.bin'
+	elif fileFormat == "text":
+		fileOption = '-file'
+		ftype = '.out'
+	else:
+		raise Exception('fileFormat should be "binary" or "text".')
+
 	nodeList = ops.getNodeTags()
 	eleList = ops.getEleTags()
 	
@@ -95,9 +108,10 @@ def createODB(*argv, Nmodes=0, deltaT=0.0, recorders=[]):
 			os.makedirs(ModeShapeDir)
 			
 		## Run eigen analysis internally and get information to print
+		## The last eigen solution is reused if the model has not changed since
 		Tarray = np.zeros([1,Nmodes])  # To save all the periods of vibration
 		ops.wipeAnalysis()
-		eigenVal = ops.eigen(Nmodes+1)
+		eigenVal = ops.eigen('-cache', Nmodes+1)
 	
 		for m in range(1,Nmodes+1):
 			Tarray[0,m-1]=4*asin(1.0)/(eigenVal[m-1])**0.5
@@ -105,9 +119,8 @@ def createODB(*argv, Nmodes=0, deltaT=0.0, recorders=[]):
 		modeTFile = os.path.join(ModeShapeDir, "ModalPeriods.out")
 		np.savetxt(modeTFile, Tarray, delimiter = ' ', fmt = '%.5e')   
 		
-		### Save mode shape data
-		for i in range(1,Nmodes+1):
-			idbf._saveModeShapeData(ModelName,i)
+		### Save mode shape data of all modes in one file
+		idbf._saveAllModeShapeData(ModelName,Nmodes)
 		
 		ops.wipeAnalysis()
 		
@@ -119,33 +132,39 @@ def createODB(*argv, Nmodes=0, deltaT=0.0, recorders=[]):
 		if not os.path.exists(LoadCaseDir):
 			os.makedirs(LoadCaseDir)
 			
-		NodeDispFile = os.path.join(LoadCaseDir,"NodeDisp_All.out")
-		EleForceFile = os.path.join(LoadCaseDir,"EleForce_All.out")
-		ReactionFile = os.path.join(LoadCaseDir,"Reaction_All.out")
-		EleStressFile = os.path.join(LoadCaseDir,"EleStress_All.out")
-		EleStrainFile = os.path.join(LoadCaseDir,"EleStrain_All.out")
-		EleBasicDefFile = os.path.join(LoadCaseDir,"EleBasicDef_All.out")
-		ElePlasticDefFile = os.path.join(LoadCaseDir,"ElePlasticDef_All.out")
+		NodeDispFile = os.path.join(LoadCaseDir,"NodeDisp_All"+ftype)
+		EleForceFile = os.path.join(LoadCaseDir,"EleForce_All"+ftype)
+		ReactionFile = os.path.join(LoadCaseDir,"Reaction_All"+ftype)
+		EleStressFile = os.path.join(LoadCaseDir,"EleStress_All"+ftype)
+		EleStrainFile = os.path.join(LoadCaseDir,"EleStrain_All"+ftype)
+		EleBasicDefFile = os.path.join(LoadCaseDir,"EleBasicDef_All"+ftype)
+		ElePlasticDefFile = os.path.join(LoadCaseDir,"ElePlasticDef_All"+ftype)
 # 		EleIntPointsFile = os.path.join(LoadCaseDir,"EleIntPoints_All.out")
 		
+		# Remove output of the other format from an earlier run, the readers use the binary files first
+		for FileName in [NodeDispFile, EleForceFile, ReactionFile, EleStressFile, EleStrainFile, EleBasicDefFile, ElePlasticDefFile]:
+			oldFile = FileName[:-len(ftype)] + {'.bin':'.out', '.out':'.bin'}[ftype]
+			if os.path.isfile(oldFile):
+				os.remove(oldFile)
+		
 		# Save recorders in the ODB folder
-		ops.recorder('Node', '-file', NodeDispFile,  '-time', '-dT', deltaT, '-node', *nodeList, '-dof',*dofList, 'disp')
-		ops.recorder('Node', '-file', ReactionFile,  '-time', '-dT', deltaT, '-node', *nodeList, '-dof',*dofList, 'reaction')
+		ops.recorder('Node', fileOption, NodeDispFile,  '-time', '-dT', deltaT, '-node', *nodeList, '-dof',*dofList, 'disp')
+		ops.recorder('Node', fileOption, ReactionFile,  '-time', '-dT', deltaT, '-node', *nodeList, '-dof',*dofList, 'reaction')
 		
 		if 'localForce' in recorders:
-			ops.recorder('Element', '-file', EleForceFile,  '-time', '-dT', deltaT, '-ele', *eleList, '-dof',*dofList, 'localForce')   
+			ops.recorder('Element', fileOption, EleForceFile,  '-time', '-dT', deltaT, '-ele', *eleList, '-dof',*dofList, 'localForce')   
 		
 		if 'basicDeformation' in recorders:
-			ops.recorder('Element', '-file', EleBasicDefFile,  '-time', '-dT', deltaT, '-ele', *eleList, '-dof',*dofList, 'basicDeformation')
+			ops.recorder('Element', fileOption, EleBasicDefFile,  '-time', '-dT', deltaT, '-ele', *eleList, '-dof',*dofList, 'basicDeformation')
 
 		if 'plasticDeformation' in recorders:
-			ops.recorder('Element', '-file', ElePlasticDefFile,  '-time', '-dT', deltaT, '-ele', *eleList, '-dof',*dofList, 'plasticDeformation')  
+			ops.recorder('Element', fileOption, ElePlasticDefFile,  '-time', '-dT', deltaT, '-ele', *eleList, '-dof',*dofList, 'plasticDeformation')  
 
 		if 'stresses' in recorders:
-			ops.recorder('Element','-file', EleStressFile,  '-time', '-dT', deltaT, '-ele', *eleList,'stresses')
+			ops.recorder('Element',fileOption, EleStressFile,  '-time', '-dT', deltaT, '-ele', *eleList,'stresses')
 		
 		if 'strains' in recorders:
-			ops.recorder('Element','-file', EleStrainFile,  '-time', '-dT', deltaT, '-ele', *eleList,'strains')
+			ops.recorder('Element',fileOption, EleStrainFile,  '-time', '-dT', deltaT, '-ele', *eleList,'strains')
 		
 		# ops.recorder('Element', '-file', EleIntPointsFile, '-time', '-dT', deltaT, '-ele', *eleList, 'integrationPoints')   		# Records IP locations only in NL elements
 		
@@ -164,6 +183,8 @@ def readODB(*argv):
 	ModelName    : (string) Name of the model. The main output folder will be named "ModelName_ODB" in the current directory.
 	LoadCase Name: (string), Optional. Name of the load case forder to be created inside the ModelName_ODB folder. If not provided,
 					no load case data will be read.
+	
+	Both the binary (".bin") and the legacy text (".out") load case files are read, the binary files are used if both exist.
     
 	"""
     
@@ -180,10 +201,11 @@ def readODB(*argv):
 		if not os.path.exists(LoadCaseDir):
 			print("No database found")
 		
+		# Number of nodal values in each row of the node recorders
+		Nnodes = len(nodes)
+		ndm = len(nodes[0,1:])
+		
 		# Define standard outout filenames
-		NodeDispFile = os.path.join(LoadCaseDir,"NodeDisp_All.out")
-		EleForceFile = os.path.join(LoadCaseDir,"EleForce_All.out")
-		ReactionFile = os.path.join(LoadCaseDir,"Reaction_All.out")
 		# EleStressFile = os.path.join(LoadCaseDir,"EleStress_All.out")
 		# EleStrainFile = os.path.join(LoadCaseDir,"EleStrain_All.out")
 		# EleBasicDefFile = os.path.join(LoadCaseDir,"EleBasicDef_All.out")
@@ -192,9 +214,9 @@ def readODB(*argv):
 		
 		# Read recorders in the ODB folder
 		# FUTURE: Gives warning if the files are empty. Create a procedure to check if files are empty.
-		NodeDisp = np.loadtxt(NodeDispFile,delimiter=' ')
-		EleForce = np.loadtxt(EleForceFile,delimiter=' ')   
-		Reaction = np.loadtxt(ReactionFile,delimiter=' ')
+		NodeDisp = idbf._readRecorderData(LoadCaseDir, "NodeDisp_All", 1 + Nnodes*ndm)
+		EleForce = idbf._readRecorderData(LoadCaseDir, "EleForce_All")
+		Reaction = idbf._readRecorderData(LoadCaseDir, "Reaction_All", 1 + Nnodes*ndm)
 		# EleStress = np.loadtxt(EleStressFile,delimiter=' ')
 		# EleStrain = np.loadtxt(EleStrainFile,delimiter=' ')   
 		# EleBasicDef = np.loadtxt(EleBasicDefFile,delimiter=' ')
@@ -205,6 +227,30 @@ def readODB(*argv):
 		return nodes, elements
 
 
+def readNodeResponse(ModelName, LoadCaseName, response="NodeDisp"):
+	
+	"""
+	This function opens the node response of a load case without reading it into memory.
+	
+	Command: readNodeResponse("ModelName","LoadCase Name", <response="NodeDisp">)
+	
+	ModelName    : (string) Name of the model used in createODB().
+	LoadCase Name: (string) Name of the load case used in createODB().
+	response     : (string) Optional. "NodeDisp" (default) or "Reaction".
+	
+	Returns an object that is sliced like an array of shape [Ntime, Nnodes, ndm]. The binary output is memory-mapped,
+	so only the sliced time steps, nodes and dofs are read from the disk. The object also has the attributes
+	timeSteps, nodeTags, Ntime, Nnodes and ndm, and the methods getTimeIndex(time) and getNodeIndex(nodeTags).
+	
+	Example: NodeDisp = readNodeResponse("TwoSpanBridge", "Dynamic_GM1")
+			 finalDisp = NodeDisp[-1]
+			 topHistory = NodeDisp[:, NodeDisp.getNodeIndex(topNode), 0]
+	
+	"""
+	
+	return idbf.NodeResponseODB(ModelName, LoadCaseName, response)
+
+
 def saveFiberData2D(ModelName, LoadCaseName, eleNumber, sectionNumber = 1, deltaT = 0.0, ZLE = False):
     """
     Model : string
@@ -291,49 +337,27 @@ def plot_model(*argv,Model="none"):
 			raise Exception("No Model_ODB found. No active model found.")
 		
 	nodetags = nodeArray[:,0]
+	nodeIndex = idbf._getNodeIndex(nodetags)		# row of each node tag
 	
 	
 	def nodecoords(nodetag):
 		"""
 		Returns an array of node coordinates: works like nodeCoord() in opensees.
 		"""
-		i, = np.where(nodeArray[:,0] == float(nodetag))
-		return nodeArray[int(i),1:]
+		return nodeArray[nodeIndex[int(nodetag)],1:]
 
+	# Group the elements by their number of nodes, each group is drawn as one collection
+	eleConn = ipltf._getEleConnectivity(nodetags, elementArray)
+	
 	# Check if the model is 2D or 3D
 	if len(nodecoords(nodetags[0])) == 2:
 		print('2D model')
 		fig = plt.figure()
 		ax = fig.add_subplot(1,1,1)
 		
-		for ele in elementArray:
-			eleTag = int(ele[0])
-			Nodes =ele[1:]
-			
-			if len(Nodes) == 2:
-				# 2D beam-column elements
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				
-				ipltf._plotBeam2D(iNode, jNode, ax, show_element_tags, eleTag, "solid")
-				
-			if len(Nodes) == 3:
-				# 2D Planer three-node shell elements
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				kNode = nodecoords(Nodes[2])
-				
-				ipltf._plotTri2D(iNode, jNode, kNode, ax, show_element_tags, eleTag, ele_style, fillSurface='yes')
-						
-			if len(Nodes) == 4:
-				# 2D Planer four-node shell elements
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				kNode = nodecoords(Nodes[2])
-				lNode = nodecoords(Nodes[3])
-				
-				ipltf._plotQuad2D(iNode, jNode, kNode, lNode, ax, show_element_tags, eleTag, ele_style, fillSurface='yes')
-
+		ipltf._plotEleCollections(nodeArray[:,1:], eleConn, ax, "solid", fillSurface='yes')
+		if show_element_tags == 'yes':
+			ipltf._plotEleTags(nodeArray[:,1:], eleConn, ax)
 			
 		if show_node_tags == 'yes':
 			for node in nodetags:
@@ -350,39 +374,9 @@ def plot_model(*argv,Model="none"):
 		fig = plt.figure()
 		ax = fig.add_subplot(1,1,1, projection='3d')
 		
-		for ele in elementArray:
-			eleTag = int(ele[0])
-			Nodes =ele[1:]
-			
-			if len(Nodes) == 2:
-				# 3D beam-column elements
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				
-				ipltf._plotBeam3D(iNode, jNode, ax, show_element_tags, eleTag, "solid")
-				
-			if len(Nodes) == 4:
-				# 3D four-node Quad/shell element
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				kNode = nodecoords(Nodes[2])
-				lNode = nodecoords(Nodes[3])
-				
-				ipltf._plotQuad3D(iNode, jNode, kNode, lNode, ax, show_element_tags, eleTag, ele_style, fillSurface='yes')
-				
-			if len(Nodes) == 8:
-				# 3D eight-node Brick element
-				# Nodes in CCW on bottom (0-3) and top (4-7) faces resp
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				kNode = nodecoords(Nodes[2])
-				lNode = nodecoords(Nodes[3])
-				iiNode = nodecoords(Nodes[4])
-				jjNode = nodecoords(Nodes[5])
-				kkNode = nodecoords(Nodes[6])
-				llNode = nodecoords(Nodes[7])
-				
-				ipltf._plotCubeVol(iNode, jNode, kNode, lNode, iiNode, jjNode, kkNode, llNode, ax, show_element_tags, eleTag, 'solid', fillSurface='yes')
+		ipltf._plotEleCollections(nodeArray[:,1:], eleConn, ax, "solid", fillSurface='yes')
+		if show_element_tags == 'yes':
+			ipltf._plotEleTags(nodeArray[:,1:], eleConn, ax)
 				
 		if show_node_tags == 'yes':
 			for node in nodetags:
@@ -421,7 +415,7 @@ def plot_modeshape(*argv,overlap="yes",Model="none"):
 	if Model == "none":
 		print("No Model_ODB specified to plot modeshapes")
 		ops.wipeAnalysis()
-		eigenVal = ops.eigen(modeNumber+1)
+		eigenVal = ops.eigen('-cache', modeNumber+1)
 		Tn=4*asin(1.0)/(eigenVal[modeNumber-1])**0.5
 		nodeArray, elementArray = idbf._getNodesandElements()
 		Mode_nodeArray = idbf._getModeShapeData(modeNumber)		# DOES NOT GIVE MODAL PERIOD
@@ -432,24 +426,21 @@ def plot_modeshape(*argv,overlap="yes",Model="none"):
 		Mode_nodeArray, Periods = idbf._readModeShapeData(Model,modeNumber)
 		Tn = Periods[modeNumber-1]
 				
-	DeflectedNodeCoordArray = nodeArray[:,1:]+ scale*Mode_nodeArray[:,1:]
 	nodetags = nodeArray[:,0]
-	show_element_tags = 'no'	# No node or element tags are to be displayed on modeshape plots.
+	nodeIndex = idbf._getNodeIndex(nodetags)					# row of each node tag
+	modeNodeIndex = idbf._getNodeIndex(Mode_nodeArray[:,0])		# row of each node tag in the mode shape
+	modeRows = np.array([modeNodeIndex[int(tag)] for tag in nodetags], dtype=int)
+	DeflectedNodeCoordArray = nodeArray[:,1:]+ scale*Mode_nodeArray[modeRows,1:]
 
 	def nodecoords(nodetag):
 		"""
 		Returns an array of node coordinates: works like nodeCoord() in opensees.
 		"""
-		i, = np.where(nodeArray[:,0] == float(nodetag))
-		return nodeArray[int(i),1:]
-		
-	def nodecoordsEigen(nodetag):
-		"""
-		Returns an array of final deformed node coordinates
-		"""
-		i, = np.where(nodeArray[:,0] == float(nodetag))				# index for Original coordinates
-		ii, = np.where(Mode_nodeArray[:,0] == float(nodetag))		# index for Mode shape coordinates
-		return nodeArray[int(i),1:] + scale*Mode_nodeArray[int(ii),1:]
+		return nodeArray[nodeIndex[int(nodetag)],1:]
+
+	# Group the elements by their number of nodes, each group is drawn as one collection
+	# No node or element tags are to be displayed on modeshape plots.
+	eleConn = ipltf._getEleConnectivity(nodetags, elementArray)
 
 	# Check if the model is 2D or 3D
 	if len(nodecoords(nodetags[0])) == 2:
@@ -457,54 +448,9 @@ def plot_modeshape(*argv,overlap="yes",Model="none"):
 		fig = plt.figure()
 		ax = fig.add_subplot(1,1,1)
 		
-		for ele in elementArray:
-			eleTag = int(ele[0])
-			Nodes =ele[1:]
-			
-			if len(Nodes) == 2:
-				# 3D beam-column elements
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				
-				iNode_final = nodecoordsEigen(Nodes[0])
-				jNode_final = nodecoordsEigen(Nodes[1])
-				
-				if overlap == "yes":
-					ipltf._plotBeam2D(iNode, jNode, ax, show_element_tags, eleTag, "wire")
-				
-				ipltf._plotBeam2D(iNode_final, jNode_final, ax, show_element_tags, eleTag, "solid")
-				
-			if len(Nodes) == 3:
-				## 2D Planer three-node shell elements
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				kNode = nodecoords(Nodes[2])
-				
-				iNode_final = nodecoordsEigen(Nodes[0])
-				jNode_final = nodecoordsEigen(Nodes[1])
-				kNode_final = nodecoordsEigen(Nodes[2])
-
-				if overlap == "yes":
-					ipltf._plotTri2D(iNode, jNode, kNode, iNode, ax, show_element_tags, eleTag, "wire", fillSurface='no')
-				
-				ipltf._plotTri2D(iNode_final, jNode_final, kNode_final, iNode_final, ax, show_element_tags, eleTag, "solid", fillSurface='yes')
-				
-			if len(Nodes) == 4:
-				## 2D four-node Quad/shell element
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				kNode = nodecoords(Nodes[2])
-				lNode = nodecoords(Nodes[3])
-				
-				iNode_final = nodecoordsEigen(Nodes[0])
-				jNode_final = nodecoordsEigen(Nodes[1])
-				kNode_final = nodecoordsEigen(Nodes[2])
-				lNode_final = nodecoordsEigen(Nodes[3])
-				
-				if overlap == "yes":
-					ipltf._plotQuad2D(iNode, jNode, kNode, lNode, ax, show_element_tags, eleTag, "wire", fillSurface='no')
-					
-				ipltf._plotQuad2D(iNode_final, jNode_final, kNode_final, lNode_final, ax, show_element_tags, eleTag, "solid", fillSurface='yes')
+		if overlap == "yes":
+			ipltf._plotEleCollections(nodeArray[:,1:], eleConn, ax, "wire", fillSurface='no')
+		ipltf._plotEleCollections(DeflectedNodeCoordArray, eleConn, ax, "solid", fillSurface='yes')
 				        
 		ax.text(0.05, 0.95, "Mode "+str(modeNumber), transform=ax.transAxes)
 		ax.text(0.05, 0.90, "T = "+str("%.3f" % Tn)+" s", transform=ax.transAxes)
@@ -515,65 +461,9 @@ def plot_modeshape(*argv,overlap="yes",Model="none"):
 		fig = plt.figure()
 		ax = fig.add_subplot(1,1,1, projection='3d')
 		
-		for ele in elementArray:
-			eleTag = int(ele[0])
-			Nodes =ele[1:]
-			if len(Nodes) == 2:
-				## 3D beam-column elements
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				
-				iNode_final = nodecoordsEigen(Nodes[0])
-				jNode_final = nodecoordsEigen(Nodes[1])
-				
-				if overlap == "yes":
-					ipltf._plotBeam3D(iNode, jNode, ax, show_element_tags, eleTag, "wire")
-				
-				ipltf._plotBeam3D(iNode_final, jNode_final, ax, show_element_tags, eleTag, "solid")
-				
-			if len(Nodes) == 4:
-				## 3D four-node Quad/shell element
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				kNode = nodecoords(Nodes[2])
-				lNode = nodecoords(Nodes[3])
-				
-				iNode_final = nodecoordsEigen(Nodes[0])
-				jNode_final = nodecoordsEigen(Nodes[1])
-				kNode_final = nodecoordsEigen(Nodes[2])
-				lNode_final = nodecoordsEigen(Nodes[3])
-				
-				if overlap == "yes":
-					ipltf._plotQuad3D(iNode, jNode, kNode, lNode, ax, show_element_tags, eleTag, "wire", fillSurface='no')
-					
-				ipltf._plotQuad3D(iNode_final, jNode_final, kNode_final, lNode_final, ax, show_element_tags, eleTag, "solid", fillSurface='yes')
-
-			if len(Nodes) == 8:
-				## 3D eight-node Brick element
-				## Nodes in CCW on bottom (0-3) and top (4-7) faces resp
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				kNode = nodecoords(Nodes[2])
-				lNode = nodecoords(Nodes[3])
-				iiNode = nodecoords(Nodes[4])
-				jjNode = nodecoords(Nodes[5])
-				kkNode = nodecoords(Nodes[6])
-				llNode = nodecoords(Nodes[7])
-				
-				iNode_final = nodecoordsEigen(Nodes[0])
-				jNode_final = nodecoordsEigen(Nodes[1])
-				kNode_final = nodecoordsEigen(Nodes[2])
-				lNode_final = nodecoordsEigen(Nodes[3])
-				iiNode_final = nodecoordsEigen(Nodes[4])
-				jjNode_final = nodecoordsEigen(Nodes[5])
-				kkNode_final = nodecoordsEigen(Nodes[6])
-				llNode_final = nodecoordsEigen(Nodes[7])
-				
-				if overlap == "yes":
-					ipltf._plotCubeVol(iNode, jNode, kNode, lNode, iiNode, jjNode, kkNode, llNode, ax, show_element_tags, eleTag, "wire", fillSurface='no') # plot undeformed shape
-
-				ipltf._plotCubeVol(iNode_final, jNode_final, kNode_final, lNode_final, iiNode_final, jjNode_final, kkNode_final, llNode_final, 
-								ax, show_element_tags, eleTag, "solid", fillSurface='yes')
+		if overlap == "yes":
+			ipltf._plotEleCollections(nodeArray[:,1:], eleConn, ax, "wire", fillSurface='no')
+		ipltf._plotEleCollections(DeflectedNodeCoordArray, eleConn, ax, "solid", fillSurface='yes')
 								
 		ax.text2D(0.10, 0.95, "Mode "+str(modeNumber), transform=ax.transAxes)
 		ax.text2D(0.10, 0.90, "T = "+str("%.3f" % Tn)+" s", transform=ax.transAxes)
@@ -611,21 +501,24 @@ def plot_deformedshape(Model="none", LoadCase="none", tstep = -1, scale = 10, ov
 	
 	print("Reading displacement data from "+str(Model)+"_ODB/"+LoadCase)
 	nodeArray, elementArray = idbf._readNodesandElements(Model)
-	timeSteps, Disp_nodeArray = idbf._readNodeDispData(Model,LoadCase)
+	NodeDispODB = idbf.NodeResponseODB(Model,LoadCase)
 		
 	if tstep == -1:
-		jj = len(timeSteps)-1
+		jj = NodeDispODB.Ntime-1
 		printLine = "Final deformed shape"
 	else:
-		jj = (np.abs(timeSteps - tstep)).argmin()			# index closest to the time step requested.
+		timeSteps = NodeDispODB.timeSteps
+		jj = NodeDispODB.getTimeIndex(tstep)			# index closest to the time step requested.
 		if timeSteps[-1] < tstep:
 			print("XX Warining: Time-Step has exceeded maximum analysis time step XX")
 		printLine = "Deformation at time: " + str(round(timeSteps[jj], 2))
+	
+	# Only the displacement at the requested step is read from the database
+	Disp_nodeFrame = NodeDispODB[int(jj)]
 		
 		
 	#############  Get data for the specified region to tag ##############
 	adjustViewport = "no"
-	adjNodeNum = 0			# Start the counter to curtail the array later
 		
 	if monitorEleTags != []:
 		adjustViewport = "yes"
@@ -643,100 +536,32 @@ def plot_deformedshape(Model="none", LoadCase="none", tstep = -1, scale = 10, ov
 			
 	#######################################################################
 
-	DeflectedNodeCoordArray = nodeArray[:,1:]+ scale*Disp_nodeArray[int(jj),:,:]
+	DeflectedNodeCoordArray = nodeArray[:,1:]+ scale*Disp_nodeFrame
 	nodetags = nodeArray[:,0]
 		
-	show_element_tags = 'no'			# Set show tags to "no" to plot deformed shapes.
-
 	#### Read the monitoring element deformation data
 	# MonitorEleFile = os.path.join(LoadCaseDir,monitorOutFile)
 	# MonitorEleDef = np.transpose(np.loadtxt(MonitorEleFile, dtype=float, delimiter=None, converters=None, unpack=True))
 		
+	nodeIndex = idbf._getNodeIndex(nodetags)		# row of each node tag
+		
 	def nodecoords(nodetag):
 		# Returns an array of node coordinates: works like nodeCoord() in opensees.
-		i, = np.where(nodeArray[:,0] == float(nodetag))
-		return nodeArray[int(i),1:]
-    
-    # TODO C: Can we just return DeflectedNodeCoordArray here instead of summing?
-	def nodecoordsFinal(nodetag):
-		# Returns an array of final deformed node coordinates
-		i, = np.where(nodeArray[:,0] == float(nodetag))				# Original coordinates
-		return nodeArray[int(i),1:] + scale*Disp_nodeArray[int(jj),int(i),:]
+		return nodeArray[nodeIndex[int(nodetag)],1:]
 
+	# Group the elements by their number of nodes, each group is drawn as one collection
+	# Element tags are not shown on deformed shapes.
+	eleConn = ipltf._getEleConnectivity(nodetags, elementArray)
+	
 	# Check if the model is 2D or 3D
 	if len(nodecoords(nodetags[0])) == 2:
 		print('2D model')
 		fig = plt.figure()
 		ax = fig.add_subplot(1,1,1)
-			
-		if adjustViewport == "yes":
-			adjusted_NodeArray = np.zeros([len(nodeArray),2])   # 2D array
-	
-		for ele in elementArray:
-			eleTag = int(ele[0])
-			Nodes =ele[1:]
 		
-			if len(Nodes) == 2:
-				# 3D beam-column elements
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-					
-				iNode_final = nodecoordsFinal(Nodes[0])
-				jNode_final = nodecoordsFinal(Nodes[1])
-					
-				if adjustViewport == "yes":
-					for node in Nodes:
-						if node not in adjusted_NodeArray[:,0]:
-							adjusted_NodeArray[adjNodeNum,0:1] = nodecoordsFinal(node)
-						
-				if overlap == "yes":
-					ipltf._plotBeam2D(iNode, jNode, ax, show_element_tags, eleTag, "wire")
-			
-				ipltf._plotBeam2D(iNode_final, jNode_final, ax, show_element_tags, eleTag, "solid")
-					
-			if len(Nodes) == 3:
-				## 2D Planer three-node shell elements
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				kNode = nodecoords(Nodes[2])
-					
-				iNode_final = nodecoordsFinal(Nodes[0])
-				jNode_final = nodecoordsFinal(Nodes[1])
-				kNode_final = nodecoordsFinal(Nodes[2])
-
-				if adjustViewport == "yes":
-					for node in Nodes:
-						if node not in adjusted_NodeArray[:,0]:
-							adjusted_NodeArray[adjNodeNum,0:1] = nodecoordsFinal(node)
-								
-				if overlap == "yes":
-					ipltf._plotTri2D(iNode, jNode, kNode, iNode, ax, show_element_tags, eleTag, "wire", fillSurface='no')
-					
-				ipltf._plotTri2D(iNode_final, jNode_final, kNode_final, iNode_final, ax, show_element_tags, eleTag, "solid", fillSurface='yes')
-					
-			if len(Nodes) == 4:
-				## 2D four-node Quad/shell element
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				kNode = nodecoords(Nodes[2])
-				lNode = nodecoords(Nodes[3])
-					
-				iNode_final = nodecoordsFinal(Nodes[0])
-				jNode_final = nodecoordsFinal(Nodes[1])
-				kNode_final = nodecoordsFinal(Nodes[2])
-				lNode_final = nodecoordsFinal(Nodes[3])
-					
-				if adjustViewport == "yes":
-					for node in Nodes:
-						if node not in adjusted_NodeArray[:,0]:
-							adjusted_NodeArray[adjNodeNum,0:1] = nodecoordsFinal(node)
-								
-				if overlap == "yes":
-					ipltf._plotQuad2D(iNode, jNode, kNode, lNode, ax, show_element_tags, eleTag, "wire", fillSurface='no')
-						
-				ipltf._plotQuad2D(iNode_final, jNode_final, kNode_final, lNode_final, ax, show_element_tags, eleTag, "solid", fillSurface='yes')
-				
-			adjNodeNum+=1
+		if overlap == "yes":
+			ipltf._plotEleCollections(nodeArray[:,1:], eleConn, ax, "wire", fillSurface='no')
+		ipltf._plotEleCollections(DeflectedNodeCoordArray, eleConn, ax, "solid", fillSurface='yes')
 	            
 		ax.text(0.1, 0.90, printLine, transform=ax.transAxes)
 		
@@ -744,94 +569,17 @@ def plot_deformedshape(Model="none", LoadCase="none", tstep = -1, scale = 10, ov
 		print('3D model')
 		fig = plt.figure()
 		ax = fig.add_subplot(1,1,1, projection='3d')
-	
-		if adjustViewport == "yes":
-			adjusted_NodeArray = np.zeros([len(nodeArray),3])   #  array
-			print(np.shape(adjusted_NodeArray))
-			
-		for ele in elementArray:
-			eleTag = int(ele[0])
-			Nodes =ele[1:]
-				
-			if len(Nodes) == 2:
-				## 3D beam-column elements
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-			
-				iNode_final = nodecoordsFinal(Nodes[0])
-				jNode_final = nodecoordsFinal(Nodes[1])
-			
-				if adjustViewport == "yes":
-					for node in Nodes:
-						if node not in adjusted_NodeArray[:,0]:
-							adjusted_NodeArray[adjNodeNum,:] = nodecoordsFinal(node)
-							# print(nodecoordsFinal(node))
-								
-				if overlap == "yes":
-					ipltf._plotBeam3D(iNode, jNode, ax, show_element_tags, eleTag, "wire")
-			
-				ipltf._plotBeam3D(iNode_final, jNode_final, ax, show_element_tags, eleTag, "solid")
-					
-			if len(Nodes) == 4:
-				## 3D four-node Quad/shell element
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				kNode = nodecoords(Nodes[2])
-				lNode = nodecoords(Nodes[3])
-			
-				iNode_final = nodecoordsFinal(Nodes[0])
-				jNode_final = nodecoordsFinal(Nodes[1])
-				kNode_final = nodecoordsFinal(Nodes[2])
-				lNode_final = nodecoordsFinal(Nodes[3])
-					
-				if adjustViewport == "yes":
-					for node in Nodes:
-						if node not in adjusted_NodeArray[:,0]:
-							adjusted_NodeArray[adjNodeNum,0:2] = nodecoordsFinal(node)
-								
-				if overlap == "yes":
-					ipltf._plotQuad3D(iNode, jNode, kNode, lNode, ax, show_element_tags, eleTag, "wire", fillSurface='no')
-				
-				ipltf._plotQuad3D(iNode_final, jNode_final, kNode_final, lNode_final, ax, show_element_tags, eleTag, "solid", fillSurface='yes')
-
-			if len(Nodes) == 8:
-				## 3D eight-node Brick element
-				## Nodes in CCW on bottom (0-3) and top (4-7) faces resp
-				iNode = nodecoords(Nodes[0])
-				jNode = nodecoords(Nodes[1])
-				kNode = nodecoords(Nodes[2])
-				lNode = nodecoords(Nodes[3])
-				iiNode = nodecoords(Nodes[4])
-				jjNode = nodecoords(Nodes[5])
-				kkNode = nodecoords(Nodes[6])
-				llNode = nodecoords(Nodes[7])
-					
-				iNode_final = nodecoordsFinal(Nodes[0])
-				jNode_final = nodecoordsFinal(Nodes[1])
-				kNode_final = nodecoordsFinal(Nodes[2])
-				lNode_final = nodecoordsFinal(Nodes[3])
-				iiNode_final = nodecoordsFinal(Nodes[4])
-				jjNode_final = nodecoordsFinal(Nodes[5])
-				kkNode_final = nodecoordsFinal(Nodes[6])
-				llNode_final = nodecoordsFinal(Nodes[7])
-					
-				if adjustViewport == "yes":
-					for node in Nodes:
-						if node not in adjusted_NodeArray[:,0]:
-							adjusted_NodeArray[adjNodeNum,0:2] = nodecoordsFinal(node)
-								
-				if overlap == "yes":
-					ipltf._plotCubeVol(iNode, jNode, kNode, lNode, iiNode, jjNode, kkNode, llNode, ax, show_element_tags, eleTag, "wire", fillSurface='no') # plot undeformed shape
-
-				ipltf._plotCubeVol(iNode_final, jNode_final, kNode_final, lNode_final, iiNode_final, jjNode_final, kkNode_final, llNode_final, 
-									ax, show_element_tags, eleTag, "solid", fillSurface='yes')
-					
-			adjNodeNum+=1
+		
+		if overlap == "yes":
+			ipltf._plotEleCollections(nodeArray[:,1:], eleConn, ax, "wire", fillSurface='no')
+		ipltf._plotEleCollections(DeflectedNodeCoordArray, eleConn, ax, "solid", fillSurface='yes')
 				
 		ax.text2D(0.1, 0.90, printLine, transform=ax.transAxes)
 		
+	# Fit the viewport to the deformed nodes of the monitored elements
 	if adjustViewport == "yes":
-		DeflectedNodeCoordArray = adjusted_NodeArray[0:adjNodeNum-1,:]
+		monitorNodes = np.unique(np.concatenate([conn.ravel() for eleTags, conn in eleConn.values()]))
+		DeflectedNodeCoordArray = DeflectedNodeCoordArray[monitorNodes,:]
 		
 	ipltf._setStandardViewport(fig, ax, DeflectedNodeCoordArray, len(nodecoords(nodetags[0])))					
 	plt.axis('on')
@@ -845,9 +593,10 @@ def animate_deformedshape( Model = 'none', LoadCase = 'none', dt = 0, tStart = 0
     """
     This defines the animation of an opensees model, given input data.
     
-    For big models it's unlikely that the animation will actually run at the 
-    desired fps in "real time". Matplotlib just isn't built for high fps 
-    animation.
+    The elements are drawn as one collection per element type that is moved 
+    to each frame, and 2D animations are blitted. For big models the 
+    interactive animation may still not run at the desired fps in "real 
+    time"; a saved movie always plays at the desired fps.
     Parameters
     ----------
     Model : string
@@ -878,7 +627,10 @@ def animate_deformedshape( Model = 'none', LoadCase = 'none', dt = 0, tStart = 0
     timeScale : TYPE, optional
         DESCRIPTION. The default is 1.
     Movie : str, optional 
-        Name of the movie file if the user wants to save the animation as .mp4 file.
+        Name of the movie file if the user wants to save the animation. The 
+        movie is saved as .gif if the name ends with ".gif", and as .mp4 
+        (using ffmpeg) otherwise. The frames are rendered without the GUI, so 
+        it also works on a headless backend such as "Agg".
     Returns
     -------
     TYPE
@@ -896,47 +648,39 @@ def animate_deformedshape( Model = 'none', LoadCase = 'none', dt = 0, tStart = 0
     nodes, elements = idbf._readNodesandElements(Model)
     Disp = Disp*scale
     
-    # Reshape array
-    Ntime = len(Disp[:,0])
-    ndm = len(nodes[0,1:])
-    Nnodes = int((len(Disp[0,:]))/ndm)
-    
     # Get nodes and elements
     ndm = len(nodes[0,1:])
-    Nnodes = len(nodes[:,0])
-    Nele = len(elements)
-    
-    nodeLabels = nodes[:, 0]       
+    nodeCords = nodes[:,1:]
+    eleConn = ipltf._getEleConnectivity(nodes[:,0], elements)
 
     # initialize figure
-    fig, ax = ipltf._initializeFig(nodes[:,1:], ndm, Disp)    
+    fig, ax = ipltf._initializeFig(nodeCords, ndm, Disp)    
     plt.subplots_adjust(bottom=.15) # Add extra space bellow graph
     
 	# Adjust plot area.   
-    ipltf._setStandardViewport(fig, ax, nodes[:,1:], ndm, Disp)
+    ipltf._setStandardViewport(fig, ax, nodeCords, ndm, Disp)
          
        
     # ========================================================================
     # Initialize Plots
     # ========================================================================
     
-    initialDisp = nodes[:, 1:] + Disp[0,:,:]
+    initialDisp = nodeCords + Disp[0,:,:]
     
     # Add Text
     if ndm == 2:
         time_text = ax.text(0.95, 0.01, '', verticalalignment='bottom', 
                             horizontalalignment='right', transform=ax.transAxes, color='blue')
-        
-        EQObjects = ipltf._plotEle_2D(nodes, elements, initialDisp, fig, ax, show_element_tags = 'no')
-        [EqfigLines, EqfigSurfaces, EqfigText] = EQObjects 
-        EqfigNodes, = ax.plot(Disp[0,:,0],Disp[0,:,1], **node_style_animation)  
+        EqfigNodes, = ax.plot(initialDisp[:,0], initialDisp[:,1], **node_style_animation)  
                     
     if ndm == 3:
         time_text = ax.text2D(0.95, 0.01, '', verticalalignment='bottom', 
                             horizontalalignment='right', transform=ax.transAxes, color='blue')
-        EQObjects = ipltf._plotEle_3D(nodes, elements, initialDisp, fig, ax, show_element_tags = 'no')
-        [EqfigLines, EqfigSurfaces, EqfigText] = EQObjects 
-        EqfigNodes, = ax.plot(Disp[0,:,0], Disp[0,:,1], Disp[0,:,2], **node_style_animation)  
+        EqfigNodes, = ax.plot(initialDisp[:,0], initialDisp[:,1], initialDisp[:,2], **node_style_animation)  
+    
+    # One collection per element group, moved to each frame by update_frame
+    EqfigCollections = ipltf._plotEleCollections(initialDisp, eleConn, ax, "solid", fillSurface='yes')
+    update_frame = ipltf._getAnimationUpdate(nodeCords, Disp, eleConn, EqfigCollections, EqfigNodes)
 
     # ========================================================================
     # Animation
@@ -973,13 +717,32 @@ def animate_deformedshape( Model = 'none', LoadCase = 'none', dt = 0, tStart = 0
             kk = (np.abs(time - tEnd)).argmin()
             FrameEnd = Frames[kk]
 
-    aniFrames = FrameEnd-FrameStart  # Number of frames to be animated
+    aniFrames = int(FrameEnd-FrameStart)  # Number of frames to be animated
+	
+    # Save the movie first, it renders every frame at a fixed rate without the GUI
+    if Movie != "none":
+        if os.path.splitext(Movie)[1].lower() in ['.mp4', '.gif']:
+            MovefileName = Movie
+        else:
+            MovefileName = Movie + '.mp4'
+        ODBdir = Model+"_ODB"		# ODB Dir name
+        Movfile = os.path.join(ODBdir, LoadCase, MovefileName)
+        print("Saving the animation movie as "+MovefileName+" in "+ODBdir+"->"+LoadCase+" folder")
+        ipltf._saveAnimation(fig, update_frame, range(FrameStart, FrameEnd), Movfile, fps*timeScale)
+        update_frame(FrameStart)
 	
     # Slider Location and size relative to plot
     # [x, y, xsize, ysize]
     axSlider = plt.axes([0.25, .03, 0.50, 0.02])
     plotSlider = Slider(axSlider, 'Time', framesTime[FrameStart], framesTime[FrameEnd], valinit=framesTime[FrameStart])
     
+    # The animation moves the slider itself, so the slider must not redraw the 
+    # whole figure. The moving slider parts are blitted with the elements, the 
+    # lines of the slider axis are the initial value line and, in newer 
+    # matplotlib versions, the handle.
+    plotSlider.drawon = False
+    sliderArtists = [plotSlider.poly] + list(axSlider.lines) + [plotSlider.valtext]
+    
     # Animation controls
     global is_paused
     is_paused = False # True if user has taken control of the animation   
@@ -998,120 +761,27 @@ def animate_deformedshape( Model = 'none', LoadCase = 'none', dt = 0, tStart = 0
             elif is_paused == False:
                 is_paused=True
                 
-    def animate2D_slider(Time):
+    def animate_slider(Time):
         """
-        The slider value is liked with the plot - we update the plot by updating
-        the slider.
+        The slider value is liked with the plot - when the user moves the 
+        slider, the animation is paused at the matching frame.
         """
         global is_paused
         is_paused=True
         # Convert time to frame
         TimeStep = (np.abs(framesTime - Time)).argmin()
-               
-        # The current node coordinants in (x,y) or (x,y,z)
-        CurrentNodeCoords =  nodes[:,1:] + Disp[TimeStep,:,:]
-        # Update Plots
-        
-        # update node locations
-        EqfigNodes.set_xdata(CurrentNodeCoords[:,0]) 
-        EqfigNodes.set_ydata(CurrentNodeCoords[:,1])
-           
-        # Get new node mapping
-        # I don't like doing this loop every time - there has to be a faster way
-        xy_labels = {}
-        for jj in range(Nnodes):
-            xy_labels[nodeLabels[jj]] = CurrentNodeCoords[jj,:]
-        
-        # Define the surface
-        SurfCounter = 0
-        
-        # update element locations
-        for jj in range(Nele):
-            # Get the node number for the first and second node connected by the element
-            TempNodes = elements[jj][1:]
-            # This is the xy coordinates of each node in the group
-            TempNodeCoords = [xy_labels[node] for node in TempNodes] 
-            coords_x = [xy[0] for xy in TempNodeCoords]
-            coords_y = [xy[1] for xy in TempNodeCoords]
-            
-            # Update element lines    
-            EqfigLines[jj].set_xdata(coords_x)
-            EqfigLines[jj].set_ydata(coords_y)
-            # print('loop start')
-            # Update the surface if necessary
-            if 2 < len(TempNodes):
-                tempxy = np.column_stack([coords_x, coords_y])
-                EqfigSurfaces[SurfCounter].xy = tempxy
-                SurfCounter += 1
-       
-        # update time Text
-        # time_text.set_text("Time= "+'%.2f' % time[TimeStep]+ " s")
-        
-        # redraw canvas while idle
-        fig.canvas.draw_idle()    
-            
-        return EqfigNodes, EqfigLines, EqfigSurfaces, EqfigText
-
-    def animate3D_slider(Time):
-        
-        
-        global is_paused
-        is_paused=True
-        TimeStep = (np.abs(framesTime - Time)).argmin()
-        
-        # this is the most performance critical area of code
-        
-        # The current node coordinants in (x,y) or (x,y,z)
-        CurrentNodeCoords =  nodes[:,1:] + Disp[TimeStep,:,:]
-        # Update Plots
-        
-        # update node locations
-        EqfigNodes.set_data_3d(CurrentNodeCoords[:,0], CurrentNodeCoords[:,1], CurrentNodeCoords[:,2])
-               
-        # Get new node mapping
-        # I don't like doing this loop every time - there has to be a faster way
-        xyz_labels = {}
-        for jj in range(Nnodes):
-            xyz_labels[nodeLabels[jj]] = CurrentNodeCoords[jj,:]        
-    
-        SurfCounter = 0
-            
-        # update element locations
-        for jj in range(Nele):
-            # Get the node number for the first and second node connected by the element
-            TempNodes = elements[jj][1:]
-            # This is the xy coordinates of each node in the group
-            TempNodeCoords = [xyz_labels[node] for node in TempNodes] 
-            coords_x = [xyz[0] for xyz in TempNodeCoords]
-            coords_y = [xyz[1] for xyz in TempNodeCoords]
-            coords_z = [xyz[2] for xyz in TempNodeCoords]
-            
-            # Update element Plot    
-            EqfigLines[jj].set_data_3d(coords_x, coords_y, coords_z)
-            
-            if len(TempNodes) > 2:
-                # Update 3D surfaces
-                tempVec = np.zeros([4,4])
-                tempVec[0,:] = coords_x
-                tempVec[1,:] = coords_y
-                tempVec[2,:] = coords_z
-                tempVec[3,:] = EqfigSurfaces[SurfCounter]._vec[3,:]
-                EqfigSurfaces[SurfCounter]._vec = tempVec
-                SurfCounter += 1
-                
-        # update time Text
-        # time_text.set_text("Time= "+'%.3f' % time[TimeStep]+ " s")
+        update_frame(TimeStep)
         
         # redraw canvas while idle
-        fig.canvas.draw_idle()   
+        fig.canvas.draw_idle()
 
-        return EqfigNodes, EqfigLines, EqfigSurfaces, EqfigText
+    def init_plot():
+        return update_frame(FrameStart) + sliderArtists
 
     def update_plot(ii):
         # If the control is manual, we don't change the plot    
-        global is_paused
         if is_paused:
-            return EqfigNodes, EqfigLines, EqfigSurfaces, EqfigText
+            return EqfigArtists
        
         # Find the close timeStep and plot that
         CurrentTime = plotSlider.val
@@ -1121,28 +791,23 @@ def animate_deformedshape( Model = 'none', LoadCase = 'none', dt = 0, tStart = 0
         if CurrentFrame >= FrameEnd:
             CurrentFrame = FrameStart
         
-        # Update the slider
+        # Update the slider without calling animate_slider
+        plotSlider.eventson = False
         plotSlider.set_val(framesTime[CurrentFrame])
+        plotSlider.eventson = True
         
-        is_paused = False # the above line called update_slider, so we need to reset this
-        return EqfigNodes, EqfigLines, EqfigSurfaces, EqfigText
+        return update_frame(CurrentFrame) + sliderArtists
 
-    if ndm == 2:
-        plotSlider.on_changed(animate2D_slider)
-    elif ndm == 3:
-        plotSlider.on_changed(animate3D_slider)
+    # The artists are redrawn as they are while paused
+    EqfigArtists = list(EqfigCollections.values()) + [EqfigNodes] + sliderArtists
+    plotSlider.on_changed(animate_slider)
     
     # assign click control
     fig.canvas.mpl_connect('button_press_event', on_click)
 
-    ani = animation.FuncAnimation(fig, update_plot, aniFrames, interval = FrameInterval)
-	
-    if Movie != "none":
-        MovefileName = Movie + '.mp4'
-        ODBdir = Model+"_ODB"		# ODB Dir name
-        Movfile = os.path.join(ODBdir, LoadCase, MovefileName)
-        print("Saving the animation movie as "+MovefileName+" in "+ODBdir+"->"+LoadCase+" folder")
-        ani.save(Movfile, writer='ffmpeg')
+    # The 3D collections are projected when the whole axis is drawn, so they can't be blitted.
+    ani = animation.FuncAnimation(fig, update_plot, aniFrames, init_func = init_plot, 
+                                  interval = FrameInterval, blit = (ndm == 2))
 
     plt.show()
     return ani
@@ -123,16 +123,17 @@ class plot_deformedshape_Events:
         show_element_tags = 'no'			# Set show tags to "no" to plot deformed shapes.
   
   		
+        nodeIndex = opp._getNodeIndex(nodetags)		# row of each node tag
+  		
         def nodecoords(nodetag):
             # Returns an array of node coordinates: works like nodeCoord() in opensees.
-            i, = np.where(nodeArray[:,0] == float(nodetag))
-            return nodeArray[int(i),1:]
+            return nodeArray[nodeIndex[int(nodetag)],1:]
   
           # TODO C: Can we just return DeflectedNodeCoordArray here instead of summing?
         def nodecoordsFinal(nodetag):
             # Returns an array of final deformed node coordinates
-            i, = np.where(nodeArray[:,0] == float(nodetag))				# Original coordinates
-            return nodeArray[int(i),1:] + self.scale*Disp_nodeArray[int(jj),int(i),:]
+            i = nodeIndex[int(nodetag)]				# Original coordinates
+            return nodeArray[i,1:] + self.scale*Disp_nodeArray[int(jj),i,:]
         
         fig = plt.figure()
   		# Check if the model is 2D or 3D
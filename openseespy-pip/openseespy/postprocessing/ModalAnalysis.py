@@ -51,70 +51,62 @@ def ModalAnalysis(numEigen, pflag=1, outname=None):
     import sys
 
     op.wipeAnalysis()
-    op.numberer("Plain")
-    op.system('FullGeneral')
-    op.analysis('Transient')
 
-    # Extract the Mass Matrix
+    # Extract the Mass Matrix in sparse (coordinate) format
     # Note that this is not the global mass matrix, but unrestrained part (Muu)
-    op.integrator('GimmeMCK',1.0,0.0,0.0)
-    op.analyze(1,0.0) 
-    # Number of equations in the model
-    N = op.systemSize()         # Has to be done after analyze
-    Mmatrix = op.printA('-ret') # Or use op.printA('-file','M.out')
-    Mmatrix = np.array(Mmatrix) # Convert the list to an array
-    Mmatrix.shape = (N,N)       # Make the array an NxN matrix
-    print( '\n************************************************************', \
-          '\nExtracting the mass matrix, ignore the warnings...')
-        
+    Mdata = np.asarray(op.sparseMatrix('M'))
+    N = int(Mdata[0])                           # Number of equations in the model
+    nnz = int(Mdata[1])                         # Number of nonzero entries
+    Mrows = Mdata[2:2+nnz].astype(int)          # Row (equation) ids of the entries
+    Mcols = Mdata[2+nnz:2+2*nnz].astype(int)    # Column (equation) ids of the entries
+    Mvals = Mdata[2+2*nnz:2+3*nnz]              # Values of the entries
+
+    def Mdot(v):
+        # Product of the mass matrix with vector v, using the nonzero entries only
+        Mv = np.zeros(N)
+        np.add.at(Mv, Mrows, Mvals*v[Mcols])
+        return Mv
+
     # Determine maximum number of DOFs/node used in the system
-    NDF = 0
+    nodeDOFs = {}   # Dictionary with nodes and equation ids of their DOFs
     for node in op.getNodeTags():
-        temp = len(op.nodeDOFs(node))
-        if temp > NDF: NDF = temp
+        nodeDOFs[node] = op.nodeDOFs(node)
+    NDF = max([len(dofs) for dofs in nodeDOFs.values()])
 
-    DOFs = []       # List containing indices of unrestrained DOFs
-    used = {}       # Dictionary with nodes and associated unrestrained DOFs
+    DOFs = set()    # Set containing equation ids of unrestrained DOFs
+    used = {}       # Dictionary with nodes and associated unrestrained DOFs, (local id, equation id)
     ldict = {}      # Dictionary containing influence vectors
     Mratios = {}    # Dictionary containing effective modal masses ratios
     Mfactors = {}   # Dictionary containing modal participation factors
     for i in range(1,NDF+1):
-        ldict[i] = np.zeros([N,1])
+        ldict[i] = np.zeros(N)
         Mratios[i] = np.zeros(numEigen)
         Mfactors[i] = np.zeros(numEigen)
         
     # Create the influence vectors, and get the unrestrained DOFs assigned to the nodes
     # TODO -1: The influence vectors are not correct in case of rotational excitations
     # One typical approach is to use center of mass on plane
-    idx = 0                                     # Counter for unrestrained DOFs
-    for node in op.getNodeTags():               # Start iterating over each node
+    for node in nodeDOFs:                       # Start iterating over each node
         used[node] = []                         # Unrestrain local DOF ids
-        ndof = len(op.nodeDOFs(node))           # Total number of DOFs assigned
-        for j in range(ndof):                   # Iterate over each DOF
-            temp = op.nodeDOFs(node)[j]         # Get the global DOF id (-1 if restrained)
+        for j, temp in enumerate(nodeDOFs[node]):   # Iterate over each DOF, global DOF id is -1 if restrained
             if temp not in DOFs and temp >= 0:  # Check if this DOF is unrestrained and is not known before
-                DOFs.append(temp)               # Save the global id of DOF 
-                used[node].append(j+1)          # Save the local id of DOF 
-                ldict[j+1][idx,0] = 1           # Influence vectors for horizontal and vertical excitations
-                idx += 1                        # Increase the counter
-
-    # This does not seem necessary when numberer is "Plain"
-    # But lets reorganize the mass matrix anyway
-    Mmatrix = Mmatrix[DOFs,:][:,DOFs]  
+                DOFs.add(temp)                  # Save the global id of DOF 
+                used[node].append((j+1, temp))  # Save the local and global id of DOF 
+                ldict[j+1][temp] = 1            # Influence vectors for horizontal and vertical excitations
 
     # Calculate the total masses assigned to the unrestrained DOFs
     Mtots = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0}
     for i in range(1,NDF+1):
-        Mtots[i] = (ldict[i].T@Mmatrix@ldict[i])[0,0]
+        Mtots[i] = ldict[i]@Mdot(ldict[i])
 
-    # Perform eigenvalue analysis
+    # Perform eigenvalue analysis, the last solution is reused if the model has not changed
     op.wipeAnalysis()
     listSolvers = ['-genBandArpack','-fullGenLapack','-symmBandLapack']
     ok = 1  
     for s in listSolvers:
         print("Using %s as solver..." % s[1:])
         try:
-            eigenValues = op.eigen(s,numEigen)
+            eigenValues = op.eigen('-cache',s,numEigen)
             catchOK = 0
             ok = 0
         except: 
@@ -139,20 +131,22 @@ def ModalAnalysis(numEigen, pflag=1, outname=None):
     # Note: influence factors for rotational excitation is wrong! 
     # Obtain modal properties
     for mode in range(1,numEigen+1):
-        idx = 0
-        phi = np.zeros([N,1]) # Eigen vector
+        phi = np.zeros(N) # Eigen vector
         for node in used:
-            for dof in used[node]:
-                phi[idx,0]=op.nodeEigenvector(node,mode,dof)
-                idx += 1
+            if len(used[node]) == 0: continue
+            vec = op.nodeEigenvector(node,mode)
+            for dof, eqn in used[node]:
+                phi[eqn] = vec[dof-1]
                 
-        phi = phi/(phi.T@Mmatrix@phi)**0.5  # Normalize the eigen vector by modal mass
-        Mn = phi.T@Mmatrix@phi              # Modal mass (should always be equal to 1)
+        Mphi = Mdot(phi)
+        phi = phi/(phi@Mphi)**0.5           # Normalize the eigen vector by modal mass
+        Mphi = Mdot(phi)
+        Mn = phi@Mphi                       # Modal mass (should always be equal to 1)
 
         for j in range(1,NDF+1):
             if Mtots[j] != 0:                              # Check if any mass is assigned
-                Ln = phi.T@Mmatrix@ldict[j]                # Modal excitation factor
-                Mnstar = (Ln**2/Mn)[0,0]                   # Effective modal mass
+                Ln = Mphi@ldict[j]                         # Modal excitation factor
+                Mnstar = Ln**2/Mn                          # Effective modal mass
                 Mfactors[j][mode-1] = Ln/Mn                # Modal participation factor
                 Mratios[j][mode-1] = (Mnstar/Mtots[j]*100) # Effective modal mass participation ratio [%]
     
@@ -33,25 +33,26 @@ def _getNodesandElements():
     Nnodes = len(nodeList)
     nodes = np.zeros([Nnodes, ndm + 1])
     
-    # Get Node list
-    for ii, node in enumerate(nodeList):
-        nodes[ii,0] = node
-        nodes[ii,1:] = ops.nodeCoord(nodeList[ii])           
+    # Get Node list, the coordinates of all nodes are read in one call
+    nodes[:,0] = nodeList
+    nodes[:,1:] = np.reshape(ops.nodeCoord('-all'), [Nnodes, ndm])
     
     Nele = len(eleList)
     elements = [None]*Nele
     
-    # Generate the element list by looping through all emenemts
+    # Generate the element list from the nodes of all elements, read in one 
+    # call as [NnodesEle1, node1, node2, ..., NnodesEle2, node1, ...]
+    eleNodes = ops.eleNodes('-all')
+    jj = 0
     for ii, ele in enumerate(eleList):
-        tempNodes = ops.eleNodes(ele)
-        
-        tempNnodes = len(tempNodes)
+        tempNnodes = eleNodes[jj]
         tempEle = np.zeros(tempNnodes + 1)
         
         tempEle[0] = int(ele)
-        tempEle[1:] = tempNodes
+        tempEle[1:] = eleNodes[jj+1:jj+1+tempNnodes]
         
-        elements[ii] = tempEle       
+        elements[ii] = tempEle
+        jj += tempNnodes + 1
     
     return nodes, elements
 
@@ -194,6 +195,16 @@ def _readNodesandElements(ModelName):
     return nodes, elements
 	
 	
+def _getNodeIndex(nodeTags):
+    """
+    This function returns a dictionary with the row index of each node tag
+    in nodeTags, e.g. the first column of a node array, so that the row of a 
+    node is found in constant time instead of searching the array.
+    """
+    
+    return {int(tag): ii for ii, tag in enumerate(nodeTags)}
+	
+	
 ################ ModeShapes #############################
 
 def _getModeShapeData(modeNumber):
@@ -206,12 +217,53 @@ def _getModeShapeData(modeNumber):
     Nnodes = len(nodeList)
     nodes_modeshape = np.zeros([Nnodes, ndm + 1])
     
-    for ii, node in enumerate(nodeList):
-        nodes_modeshape[ii,0] = node
-        tempData = ops.nodeEigenvector(nodeList[ii], modeNumber)
-        nodes_modeshape[ii,1:] = tempData[0:ndm]
+    # Translational dofs of all nodes in one call
+    dofList = list(range(1, ndm + 1))
+    nodes_modeshape[:,0] = nodeList
+    nodes_modeshape[:,1:] = np.reshape(ops.nodeEigenvector('-all', '-mode', modeNumber, '-dof', *dofList), [Nnodes, ndm])
 
     return nodes_modeshape
+
+
+def _getAllModeShapeData(Nmodes):
+    """
+    This function returns the translational mode shapes of the first Nmodes
+    modes of all nodes, read from the active model in a single traversal.
+
+    Returns
+    -------
+    nodeList : 1dArray
+        The node tags, in the order of the mode shape rows.
+    modeshapes : 3dArray
+        The mode shapes in the shape [Nmodes, Nnodes, ndm].
+    """
+    
+    nodeList = np.array(ops.getNodeTags())
+    ndm = len(ops.nodeCoord(int(nodeList[0])))
+    Nnodes = len(nodeList)
+    
+    # All modes of all nodes in one call, node by node and mode by mode
+    dofList = list(range(1, ndm + 1))
+    modeList = list(range(1, Nmodes + 1))
+    modeshapes = np.reshape(ops.nodeEigenvector('-all', '-mode', *modeList, '-dof', *dofList), [Nnodes, Nmodes, ndm])
+    
+    return nodeList, np.ascontiguousarray(modeshapes.transpose(1, 0, 2))
+
+
+def _saveAllModeShapeData(ModelName, Nmodes):
+    """
+    This function saves the first Nmodes mode shapes in one array file, 
+    ModeShapes.npy with the shape [Nmodes, Nnodes, ndm], and the node tags 
+    in ModeShapeNodes.out.
+    """
+    
+    nodeList, modeshapes = _getAllModeShapeData(Nmodes)
+    
+    ODBdir = ModelName+"_ODB"		# ODB Dir name
+    ModeShapeDir = os.path.join(ODBdir,"ModeShapes")
+    
+    np.save(os.path.join(ModeShapeDir, "ModeShapes.npy"), modeshapes)
+    np.savetxt(os.path.join(ModeShapeDir, "ModeShapeNodes.out"), nodeList, fmt = '%d')
 	
 	
 def _saveModeShapeData(ModelName,modeNumber):
@@ -250,9 +302,22 @@ def _readModeShapeData(ModelName,modeNumber):
 
     modeFile = os.path.join(ModeShapeDir, modeName+str(modeNumber)+ftype)
     modeTFile = os.path.join(ModeShapeDir, "ModalPeriods.out")
+    allModeFile = os.path.join(ModeShapeDir, "ModeShapes.npy")
+    allModeNodeFile = os.path.join(ModeShapeDir, "ModeShapeNodes.out")
     
     ## Read modal period data to display
     periods = np.loadtxt(modeTFile, dtype, delimiter = delim, unpack=False)
+    
+    ## Read only the requested mode from the file of all modes, if it exists
+    if os.path.isfile(allModeFile):
+        modeshapes = np.load(allModeFile, mmap_mode='r')
+        if modeNumber < 1 or modeNumber > modeshapes.shape[0]:
+            raise Exception("Mode "+str(modeNumber)+" is not saved in the ODB, only "+str(modeshapes.shape[0])+" modes are saved.")
+        nodeList = np.loadtxt(allModeNodeFile, dtype=int, ndmin=1)
+        nodes_modeshape = np.zeros([len(nodeList), modeshapes.shape[2] + 1], dtype)
+        nodes_modeshape[:,0] = nodeList
+        nodes_modeshape[:,1:] = modeshapes[modeNumber-1]
+        return nodes_modeshape, periods
 	
 	## Load Node information
     try:
@@ -264,6 +329,198 @@ def _readModeShapeData(ModelName,modeNumber):
     return nodes_modeshape, periods
 
 
+############## Recorder Data ###############################################
+
+def _getBinaryNcols(FileName):
+    """
+    Finds the number of columns in a file written by a recorder with the
+    '-binary' option. Each row in these files is stored as ncols 8 byte 
+    doubles followed by a single newline byte, so the row length is the 
+    first newline position that divides the file evenly and lines up with
+    the newline at the end of every row.
+    
+    Returns
+    -------
+    ncols : int
+        The number of columns, 0 if the file is empty.
+    """
+    
+    raw = np.fromfile(FileName, dtype=np.uint8)
+    Nbytes = len(raw)
+    if Nbytes == 0:
+        return 0
+    
+    # Candidate row ends are newline bytes after a whole number of doubles
+    for ii in np.flatnonzero(raw[8::8] == 10):
+        ncols = int(ii) + 1
+        rowLength = 8*ncols + 1
+        if Nbytes % rowLength == 0 and np.all(raw[rowLength-1::rowLength] == 10):
+            return ncols
+    
+    raise Exception('The file ' + FileName + ' is not a binary recorder file.')
+
+
+def _readBinaryData(FileName, ncols=0):
+    """
+    Reads a file written by a recorder with the '-binary' option.
+
+    Parameters
+    ----------
+    FileName : str
+        The binary file to read.
+    ncols : int, optional
+        The number of columns in the file. If not provided, it is found 
+        from the file itself.
+
+    Returns
+    -------
+    data : [Nrows, ncols]
+    """
+    
+    if ncols == 0:
+        ncols = _getBinaryNcols(FileName)
+    if ncols == 0:
+        return np.zeros([0, 0])
+    
+    rowType = np.dtype([('data', '<f8', (ncols,)), ('eol', 'S1')])
+    data = np.fromfile(FileName, dtype=rowType)
+    
+    return data['data']
+
+
+def _getRecorderFile(LoadCaseDir, baseName):
+    """
+    Returns the file name for recorder output in a load case directory. 
+    The binary file (.bin) is used if it exists, otherwise the text 
+    file (.out) is used.
+    """
+    
+    binFile = os.path.join(LoadCaseDir, baseName + ".bin")
+    if os.path.isfile(binFile):
+        return binFile
+    
+    return os.path.join(LoadCaseDir, baseName + ".out")
+
+
+def _readRecorderData(LoadCaseDir, baseName, ncols=0):
+    """
+    Reads recorder output from a load case directory in either the binary
+    or the text format.
+
+    Returns
+    -------
+    data : [Nrows, ncols]
+    """
+    
+    FileName = _getRecorderFile(LoadCaseDir, baseName)
+    
+    if FileName.endswith(".bin"):
+        return _readBinaryData(FileName, ncols)
+
+    return np.transpose(np.loadtxt(FileName, dtype=float, delimiter=None, converters=None, ndmin=2, unpack=True))
+
+
+class NodeResponseODB:
+    """
+    Memory-mapped access to the node response saved by createODB() for a 
+    load case. The data is not read until it is sliced, so only the 
+    requested time steps, nodes and dofs are loaded into memory. 
+    
+    Text (".out") output can not be memory-mapped and is read in full.
+
+    Slicing follows the shape [Ntime, Nnodes, ndm] of _readNodeDispData(), 
+    with node indices in the order of the nodes in the ODB:
+        
+        ODBData = NodeResponseODB("Model", "LoadCase")
+        frame = ODBData[-1]                  # [Nnodes, ndm], last step
+        history = ODBData[:, ODBData.getNodeIndex(5), 0]   # x disp of node 5
+
+    Parameters
+    ----------
+    ModelName : str
+        Name of the model used in createODB().
+    LoadCaseName : str
+        Name of the load case used in createODB().
+    response : str, optional
+        The recorded response, "NodeDisp" or "Reaction". The default is 
+        "NodeDisp".
+    """
+
+    def __init__(self, ModelName, LoadCaseName, response="NodeDisp"):
+        
+        ODBdir = ModelName+"_ODB"		# ODB Dir name
+        LoadCaseDir = os.path.join(ODBdir, LoadCaseName)
+        
+        nodes, elements = _readNodesandElements(ModelName)
+        self.nodeTags = nodes[:,0].astype(int)
+        self.Nnodes = len(nodes)
+        self.ndm = len(nodes[0,1:])
+        ncols = 1 + self.Nnodes*self.ndm
+        
+        FileName = _getRecorderFile(LoadCaseDir, response + "_All")
+        if not os.path.isfile(FileName):
+            raise Exception('No ' + response + ' data found in ' + LoadCaseDir)
+        
+        if FileName.endswith(".bin") and os.path.getsize(FileName) > 0:
+            rowType = np.dtype([('data', '<f8', (ncols,)), ('eol', 'S1')])
+            self._data = np.memmap(FileName, dtype=rowType, mode='r')['data']
+        else:
+            self._data = _readRecorderData(LoadCaseDir, response + "_All", ncols)
+        
+        self._timeSteps = None
+        self._nodeIndex = None
+
+    @property
+    def Ntime(self):
+        return len(self._data)
+
+    @property
+    def timeSteps(self):
+        # The time column is only read the first time it is needed
+        if self._timeSteps is None:
+            self._timeSteps = np.array(self._data[:,0])
+        return self._timeSteps
+
+    def getNodeIndex(self, nodeTags):
+        """
+        Returns the index of a node tag, or an array of indices for a 
+        list of node tags, in the node order of the ODB.
+        """
+        if self._nodeIndex is None:
+            self._nodeIndex = _getNodeIndex(self.nodeTags)
+        
+        if np.ndim(nodeTags) == 0:
+            return self._nodeIndex[int(nodeTags)]
+        return np.array([self._nodeIndex[int(tag)] for tag in nodeTags], dtype=int)
+
+    def getTimeIndex(self, time):
+        """
+        Returns the index of the time step closest to time.
+        """
+        return int((np.abs(self.timeSteps - time)).argmin())
+
+    def __len__(self):
+        return self.Ntime
+
+    def __getitem__(self, key):
+        
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > 3:
+            raise IndexError('Too many indices, the data has the shape [Ntime, Nnodes, ndm]')
+        timeKey, nodeKey, dofKey = key + (slice(None),)*(3 - len(key))
+        
+        # Column of each requested node and dof, the first column is time
+        nodeIndex = np.arange(self.Nnodes)[nodeKey]
+        dofIndex = np.arange(self.ndm)[dofKey]
+        columns = 1 + np.add.outer(np.asarray(nodeIndex)*self.ndm, dofIndex)
+        
+        # Slicing the rows first keeps the memory map from being read in full
+        rows = self._data[timeKey]
+        
+        return np.array(rows[..., columns])
+
+
 ############## Node Displacement Data ######################################
 
 def _readNodeDispData(ModelName,LoadCaseName):
@@ -283,8 +540,7 @@ def _readNodeDispData(ModelName,LoadCaseName):
     Nnodes = len(nodes)
     ndm = len(nodes[0,1:])
 	
-    NodeDispFile = os.path.join(LoadCaseDir,"NodeDisp_All.out")
-    Disp = np.transpose(np.loadtxt(NodeDispFile, dtype=float, delimiter=None, converters=None, unpack=True))
+    Disp = _readRecorderData(LoadCaseDir, "NodeDisp_All", 1 + Nnodes*ndm)
 	
     timeSteps = Disp[:,0]
     Ntime = len(Disp[:,0])
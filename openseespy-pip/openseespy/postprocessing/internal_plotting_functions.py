@@ -9,7 +9,11 @@
 
 import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
 import matplotlib.pyplot as plt
+import matplotlib.animation as animation
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
 
 
 ele_style = {'color':'black', 'linewidth':1, 'linestyle':'-'} # elements
@@ -332,6 +336,242 @@ def _plotEle_3D(nodes, elements, DispNodeCoordArray, fig, ax, show_element_tags)
     return figLines, figSurfaces, figTags
 
 
+# =============================================================================
+# Collection based rendering, one matplotlib artist per element class
+# =============================================================================
+
+# Node order of the six faces of an eight-node brick, as in _plotCubeVol()
+brickFaces = np.array([[0, 1, 2, 3], [0, 1, 5, 4], [4, 5, 6, 7],
+                       [3, 2, 6, 7], [1, 2, 6, 5], [0, 3, 7, 4]])
+
+
+def _getEleConnectivity(nodeTags, elements):
+    """
+    This function groups the elements by their number of nodes and converts
+    the node tags of each group to rows of the node array.
+
+    Parameters
+    ----------
+    nodeTags : 1dArray
+        The node tags, in the order of the rows of the node coordinates.
+    elements : list
+        The elements as returned by _getNodesandElements(), 
+        [element1, element2,...],   element1 = [element#, node1, node2,...]
+
+    Returns
+    -------
+    eleConn : dictionary
+        For each number of element nodes (2, 3, 4 or 8), a tuple of the 
+        element tags [Nele] and the node rows [Nele, Nen] of the elements.
+        An exception is raised if an element node is not in nodeTags.
+    """
+    
+    groups = {}
+    for element in elements:
+        groups.setdefault(len(element) - 1, []).append(element)
+    
+    # Find the rows of all node tags at once
+    nodeTags = np.asarray(nodeTags)
+    order = np.argsort(nodeTags, kind='stable')
+    sortedTags = nodeTags[order]
+    
+    eleConn = {}
+    for Nen in [2, 3, 4, 8]:
+        if Nen not in groups:
+            continue
+        eleArray = np.array(groups[Nen])
+        eleTags = eleArray[:, 0].astype(int)
+        eleNodes = eleArray[:, 1:]
+        
+        # A node tag that isn't in nodeTags would take the row of the next one
+        rows = np.minimum(np.searchsorted(sortedTags, eleNodes), len(sortedTags) - 1)
+        missing = sortedTags[rows] != eleNodes
+        if missing.any():
+            ele, node = np.argwhere(missing)[0]
+            raise Exception('Node ' + str(int(eleNodes[ele, node])) + ' of element ' + str(eleTags[ele]) + ' is not in the nodes of the model.')
+        
+        conn = order[rows]
+        eleConn[Nen] = (eleTags, conn)
+    
+    return eleConn
+
+
+def _getEleVerts(Nen, conn, nodeCords):
+    """
+    This function returns the vertices of an element group, [Nele, 2, ndm]
+    segments for two-node elements, [Nele, Nen, ndm] polygons for three and
+    four-node elements and [6*Nele, 4, 3] faces for eight-node bricks.
+    """
+    
+    if Nen == 8:
+        return nodeCords[conn[:, brickFaces]].reshape(-1, 4, nodeCords.shape[1])
+    
+    return nodeCords[conn]
+
+
+def _plotEleCollections(nodeCords, eleConn, ax, eleStyle, fillSurface):
+    """
+    This function renders all elements with a single collection per element 
+    group, instead of one artist per element as in _plotBeam2D() etc. The 
+    collections are moved to the frames of an animation by the update from 
+    _getAnimationUpdate().
+    
+    Parameters
+    ----------
+    nodeCords : 2dArray
+        The node coordinates [Nnodes, ndm], in the order of the node rows 
+        in eleConn.
+    eleConn : dictionary
+        The element connectivity from _getEleConnectivity().
+    ax : matplotlib ax object
+        The axis to add the collections to.
+    eleStyle : str
+        "wire" for a wire frame, and "solid" for solid element lines.
+    fillSurface : str
+        "yes" for color fill in the elements, "no" for wireframe.
+
+    Returns
+    -------
+    eleCollections : dictionary
+        The collection of each element group in eleConn.
+    """
+    
+    ndm = nodeCords.shape[1]
+    
+    if eleStyle == "wire":
+        lineStyle = WireEle_style
+    else:
+        lineStyle = ele_style
+    lineKwargs = {'colors': lineStyle['color'], 'linewidths': lineStyle['linewidth'], 
+                  'linestyles': lineStyle['linestyle']}
+    
+    eleCollections = {}
+    for Nen, (eleTags, conn) in eleConn.items():
+        verts = _getEleVerts(Nen, conn, nodeCords)
+        
+        if Nen == 2:
+            if ndm == 2:
+                collection = LineCollection(verts, **lineKwargs)
+            else:
+                collection = Line3DCollection(verts, **lineKwargs)
+        else:
+            # Bricks are filled as in _plotCubeSurf(), shells as in _plotQuad2D()
+            if fillSurface == 'yes':
+                faceColor = to_rgba('g', .5 if Nen == 8 else .6)
+            else:
+                faceColor = 'none'
+            polyKwargs = {'facecolors': faceColor, 'edgecolors': lineKwargs['colors'], 
+                          'linewidths': lineKwargs['linewidths'], 'linestyles': lineKwargs['linestyles']}
+            if ndm == 2:
+                collection = PolyCollection(verts, **polyKwargs)
+            else:
+                collection = Poly3DCollection(verts, **polyKwargs)
+        
+        if ndm == 2:
+            ax.add_collection(collection)
+        else:
+            ax.add_collection3d(collection)
+        eleCollections[Nen] = collection
+    
+    return eleCollections
+
+
+def _plotEleTags(nodeCords, eleConn, ax):
+    """
+    This function labels the elements at their centroids.
+    """
+    
+    ndm = nodeCords.shape[1]
+    
+    figTags = []
+    for Nen, (eleTags, conn) in eleConn.items():
+        centroids = np.mean(nodeCords[conn], axis=1)
+        for eleTag, centroid in zip(eleTags, centroids):
+            if ndm == 2:
+                figTags.append(ax.text(centroid[0], centroid[1], str(eleTag), **ele_text_style))
+            else:
+                figTags.append(ax.text(centroid[0], centroid[1], centroid[2], str(eleTag), **ele_text_style))
+    
+    return figTags
+
+
+def _getAnimationUpdate(nodeCords, Disp, eleConn, eleCollections, figNodes):
+    """
+    This function returns the frame update of the animation engine. The node 
+    rows of every element vertex are found once, so that moving the element 
+    collections to a frame is a single gather from the displacement block, 
+    with no loop over the elements.
+    
+    Parameters
+    ----------
+    nodeCords : 2dArray
+        The undeformed node coordinates [Nnodes, ndm].
+    Disp : 3dArray
+        The (scaled) node displacements [Nframes, Nnodes, ndm], with the 
+        nodes in the order of nodeCords.
+    eleConn : dictionary
+        The element connectivity from _getEleConnectivity().
+    eleCollections : dictionary
+        The element collections from _plotEleCollections().
+    figNodes : Line2D
+        The node markers.
+
+    Returns
+    -------
+    update : function
+        update(frame) moves the collections and node markers to the frame, 
+        and returns the updated artists for blitting.
+    """
+    
+    ndm = nodeCords.shape[1]
+    
+    # The node rows of the segments, polygons and brick faces of each group
+    vertRows = {}
+    for Nen, (eleTags, conn) in eleConn.items():
+        if Nen == 8:
+            vertRows[Nen] = conn[:, brickFaces].reshape(-1, 4)
+        else:
+            vertRows[Nen] = conn
+    
+    artists = list(eleCollections.values()) + [figNodes]
+    
+    def update(frame):
+        frameCords = nodeCords + Disp[frame]
+        for Nen, collection in eleCollections.items():
+            if Nen == 2:
+                collection.set_segments(frameCords[vertRows[Nen]])
+            else:
+                collection.set_verts(frameCords[vertRows[Nen]])
+        
+        if ndm == 2:
+            figNodes.set_data(frameCords[:, 0], frameCords[:, 1])
+        else:
+            figNodes.set_data_3d(frameCords[:, 0], frameCords[:, 1], frameCords[:, 2])
+        
+        return artists
+    
+    return update
+
+
+def _saveAnimation(fig, update, frames, fileName, fps):
+    """
+    This function renders the frames of an animation straight to a movie 
+    file, without a GUI event loop, so it also works on a headless backend. 
+    The writer is chosen from the file extension: Pillow for ".gif" and 
+    ffmpeg for anything else.
+    """
+    
+    if fileName.lower().endswith('.gif'):
+        writer = animation.PillowWriter(fps=fps)
+    else:
+        writer = animation.FFMpegWriter(fps=fps)
+    
+    with writer.saving(fig, fileName, fig.dpi):
+        for frame in frames:
+            update(frame)
+            writer.grab_frame()
+
+
 def _initializeFig(nodeCords,ndm, Disp = np.array([])):
     
     # set the maximum figure size
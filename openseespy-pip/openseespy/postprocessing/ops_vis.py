@@ -21,6 +21,7 @@ from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 from matplotlib.patches import Circle, Polygon
 from matplotlib.animation import FuncAnimation
 import matplotlib.tri as tri
+from openseespy.postprocessing.internal_database_functions import _getNodeIndex
 
 # default settings
 
@@ -49,21 +50,93 @@ az_el = (-60., 30.)
 fig_wi_he = (16., 10.)
 
 
+def _get_node_crds():
+    """Return a dict of node coordinates from a single bulk query."""
+    node_tags = ops.getNodeTags()
+    node_crds = np.reshape(ops.nodeCoord('-all'), (len(node_tags), -1))
+
+    return dict(zip(node_tags, node_crds))
+
+
+def _get_node_values(node_query, *args):
+    """Return a dict of node values from a single bulk query.
+
+    The values of each node are preceded by their number, so that models
+    mixing node sizes (e.g. truss and beam nodes) are queried at once too.
+    """
+    node_tags = ops.getNodeTags()
+    node_values_all = np.asarray(node_query('-all', *args, '-sizes'))
+
+    node_values = {}
+    i = 0
+    for node_tag in node_tags:
+        ndf = int(node_values_all[i])
+        node_values[node_tag] = node_values_all[i+1:i+1+ndf]
+        i += ndf + 1
+
+    return node_values
+
+
+def _get_node_disps():
+    """Return a dict of node displacements."""
+    return _get_node_values(ops.nodeDisp)
+
+
+def _get_node_eigenvectors(modeNo):
+    """Return a dict of node eigenvectors of mode modeNo."""
+    return _get_node_values(ops.nodeEigenvector, '-mode', modeNo)
+
+
+def _get_ele_nodes():
+    """Return a dict of element nodes from a single bulk query.
+
+    The bulk eleNodes query returns for each element the number of its
+    nodes followed by the node tags.
+    """
+    ele_tags = ops.getEleTags()
+    ele_nodes_all = ops.eleNodes('-all')
+
+    ele_nodes = {}
+    i = 0
+    for ele_tag in ele_tags:
+        nen = ele_nodes_all[i]
+        ele_nodes[ele_tag] = ele_nodes_all[i+1:i+1+nen]
+        i += nen + 1
+
+    return ele_nodes
+
+
+def _save_anim(anim, movie, fps):
+    """Render all frames of anim to the movie file at a fixed fps.
+
+    A .gif is written with Pillow and anything else with ffmpeg. No GUI is
+    needed, so this also works with a headless backend such as Agg.
+    """
+    if movie.lower().endswith('.gif'):
+        writer = 'pillow'
+    else:
+        writer = 'ffmpeg'
+
+    anim.save(movie, writer=writer, fps=fps)
+
+
 def _plot_model_2d(node_labels, element_labels, offset_nd_label, axis_off):
 
     max_x_crd, max_y_crd, max_crd = -np.inf, -np.inf, -np.inf
 
     node_tags = ops.getNodeTags()
+    node_crd = _get_node_crds()
+    ele_nodes = _get_ele_nodes()
     ele_tags = ops.getEleTags()
 
-    nen = np.shape(ops.eleNodes(ele_tags[0]))[0]
+    nen = np.shape(ele_nodes[ele_tags[0]])[0]
 
     # truss and beam/frame elements
     if nen == 2:
 
         for node_tag in node_tags:
-            x_crd = ops.nodeCoord(node_tag)[0]
-            y_crd = ops.nodeCoord(node_tag)[1]
+            x_crd = node_crd[node_tag][0]
+            y_crd = node_crd[node_tag][1]
             if x_crd > max_x_crd:
                 max_x_crd = x_crd
             if y_crd > max_y_crd:
@@ -73,11 +146,11 @@ def _plot_model_2d(node_labels, element_labels, offset_nd_label, axis_off):
         _offset = 0.005 * max_crd
 
         for i, ele_tag in enumerate(ele_tags):
-            nd1, nd2 = ops.eleNodes(ele_tag)
+            nd1, nd2 = ele_nodes[ele_tag]
 
             # element node1-node2, x,  y coordinates
-            ex = np.array([ops.nodeCoord(nd1)[0], ops.nodeCoord(nd2)[0]])
-            ey = np.array([ops.nodeCoord(nd1)[1], ops.nodeCoord(nd2)[1]])
+            ex = np.array([node_crd[nd1][0], node_crd[nd2][0]])
+            ey = np.array([node_crd[nd1][1], node_crd[nd2][1]])
 
             # location of label
             xt = sum(ex)/nen
@@ -113,8 +186,8 @@ def _plot_model_2d(node_labels, element_labels, offset_nd_label, axis_off):
                     va = 'bottom'
                     ha = 'center'
 
-                plt.text(ops.nodeCoord(node_tag)[0]+offset_nd_label_x,
-                         ops.nodeCoord(node_tag)[1]+offset_nd_label_y,
+                plt.text(node_crd[node_tag][0]+offset_nd_label_x,
+                         node_crd[node_tag][1]+offset_nd_label_y,
                          f'{node_tag}', va=va, ha=ha, color='blue')
 
         # plt.axis('equal')
@@ -123,8 +196,8 @@ def _plot_model_2d(node_labels, element_labels, offset_nd_label, axis_off):
     elif nen == 3:
 
         for node_tag in node_tags:
-            x_crd = ops.nodeCoord(node_tag)[0]
-            y_crd = ops.nodeCoord(node_tag)[1]
+            x_crd = node_crd[node_tag][0]
+            y_crd = node_crd[node_tag][1]
             if x_crd > max_x_crd:
                 max_x_crd = x_crd
             if y_crd > max_y_crd:
@@ -135,15 +208,15 @@ def _plot_model_2d(node_labels, element_labels, offset_nd_label, axis_off):
         _offnl = 0.003 * max_crd
 
         for i, ele_tag in enumerate(ele_tags):
-            nd1, nd2, nd3 = ops.eleNodes(ele_tag)
+            nd1, nd2, nd3 = ele_nodes[ele_tag]
 
             # element x, y coordinates
-            ex = np.array([ops.nodeCoord(nd1)[0],
-                           ops.nodeCoord(nd2)[0],
-                           ops.nodeCoord(nd3)[0]])
-            ey = np.array([ops.nodeCoord(nd1)[1],
-                           ops.nodeCoord(nd2)[1],
-                           ops.nodeCoord(nd3)[1]])
+            ex = np.array([node_crd[nd1][0],
+                           node_crd[nd2][0],
+                           node_crd[nd3][0]])
+            ey = np.array([node_crd[nd1][1],
+                           node_crd[nd2][1],
+                           node_crd[nd3][1]])
 
             # location of label
             xt = sum(ex)/nen
@@ -168,16 +241,16 @@ def _plot_model_2d(node_labels, element_labels, offset_nd_label, axis_off):
                     va = 'bottom'
                     ha = 'center'
 
-                plt.text(ops.nodeCoord(node_tag)[0]+offset_nd_label_x,
-                         ops.nodeCoord(node_tag)[1]+offset_nd_label_y,
+                plt.text(node_crd[node_tag][0]+offset_nd_label_x,
+                         node_crd[node_tag][1]+offset_nd_label_y,
                          f'{node_tag}', va=va, ha=ha, color='blue')
 
     # 2d quadrilateral (quad) elements
     elif nen == 4:
 
         for node_tag in node_tags:
-            x_crd = ops.nodeCoord(node_tag)[0]
-            y_crd = ops.nodeCoord(node_tag)[1]
+            x_crd = node_crd[node_tag][0]
+            y_crd = node_crd[node_tag][1]
             if x_crd > max_x_crd:
                 max_x_crd = x_crd
             if y_crd > max_y_crd:
@@ -188,17 +261,17 @@ def _plot_model_2d(node_labels, element_labels, offset_nd_label, axis_off):
         _offnl = 0.003 * max_crd
 
         for i, ele_tag in enumerate(ele_tags):
-            nd1, nd2, nd3, nd4 = ops.eleNodes(ele_tag)
+            nd1, nd2, nd3, nd4 = ele_nodes[ele_tag]
 
             # element x, y coordinates
-            ex = np.array([ops.nodeCoord(nd1)[0],
-                           ops.nodeCoord(nd2)[0],
-                           ops.nodeCoord(nd3)[0],
-                           ops.nodeCoord(nd4)[0]])
-            ey = np.array([ops.nodeCoord(nd1)[1],
-                           ops.nodeCoord(nd2)[1],
-                           ops.nodeCoord(nd3)[1],
-                           ops.nodeCoord(nd4)[1]])
+            ex = np.array([node_crd[nd1][0],
+                           node_crd[nd2][0],
+                           node_crd[nd3][0],
+                           node_crd[nd4][0]])
+            ey = np.array([node_crd[nd1][1],
+                           node_crd[nd2][1],
+                           node_crd[nd3][1],
+                           node_crd[nd4][1]])
 
             # location of label
             xt = sum(ex)/nen
@@ -224,8 +297,8 @@ def _plot_model_2d(node_labels, element_labels, offset_nd_label, axis_off):
                     va = 'bottom'
                     ha = 'center'
 
-                plt.text(ops.nodeCoord(node_tag)[0]+offset_nd_label_x,
-                         ops.nodeCoord(node_tag)[1]+offset_nd_label_y,
+                plt.text(node_crd[node_tag][0]+offset_nd_label_x,
+                         node_crd[node_tag][1]+offset_nd_label_y,
                          f'{node_tag}', va=va, ha=ha, color='blue')
 
         plt.axis('equal')
@@ -235,6 +308,8 @@ def _plot_model_3d(node_labels, element_labels, offset_nd_label, axis_off,
                    az_el, fig_wi_he, fig_lbrt):
 
     node_tags = ops.getNodeTags()
+    node_crd = _get_node_crds()
+    ele_nodes = _get_ele_nodes()
     ele_tags = ops.getEleTags()
 
     azim, elev = az_el
@@ -256,14 +331,14 @@ def _plot_model_3d(node_labels, element_labels, offset_nd_label, axis_off,
     max_x_crd, max_y_crd, max_z_crd, max_crd = -np.inf, -np.inf, \
         -np.inf, -np.inf
 
-    nen = np.shape(ops.eleNodes(ele_tags[0]))[0]
+    nen = np.shape(ele_nodes[ele_tags[0]])[0]
 
     # truss and beam/frame elements
     if nen == 2:
         for node_tag in node_tags:
-            x_crd = ops.nodeCoord(node_tag)[0]
-            y_crd = ops.nodeCoord(node_tag)[1]
-            z_crd = ops.nodeCoord(node_tag)[2]
+            x_crd = node_crd[node_tag][0]
+            y_crd = node_crd[node_tag][1]
+            z_crd = node_crd[node_tag][2]
             if x_crd > max_x_crd:
                 max_x_crd = x_crd
             if y_crd > max_y_crd:
@@ -285,12 +360,12 @@ def _plot_model_3d(node_labels, element_labels, offset_nd_label, axis_off,
         # ax.set_zlim(_min_overall, _max_overall)
 
         for i, ele_tag in enumerate(ele_tags):
-            nd1, nd2 = ops.eleNodes(ele_tag)
+            nd1, nd2 = ele_nodes[ele_tag]
 
             # element node1-node2, x,  y coordinates
-            ex = np.array([ops.nodeCoord(nd1)[0], ops.nodeCoord(nd2)[0]])
-            ey = np.array([ops.nodeCoord(nd1)[1], ops.nodeCoord(nd2)[1]])
-            ez = np.array([ops.nodeCoord(nd1)[2], ops.nodeCoord(nd2)[2]])
+            ex = np.array([node_crd[nd1][0], node_crd[nd2][0]])
+            ey = np.array([node_crd[nd1][1], node_crd[nd2][1]])
+            ez = np.array([node_crd[nd1][2], node_crd[nd2][2]])
 
             # location of label
             xt = sum(ex)/nen
@@ -323,17 +398,17 @@ def _plot_model_3d(node_labels, element_labels, offset_nd_label, axis_off,
 
         if node_labels:
             for node_tag in node_tags:
-                ax.text(ops.nodeCoord(node_tag)[0]+_offset,
-                        ops.nodeCoord(node_tag)[1]+_offset,
-                        ops.nodeCoord(node_tag)[2]+_offset,
+                ax.text(node_crd[node_tag][0]+_offset,
+                        node_crd[node_tag][1]+_offset,
+                        node_crd[node_tag][2]+_offset,
                         f'{node_tag}', va='bottom', ha='left', color='blue')
 
     # quad in 3d
     elif nen == 4:
         for node_tag in node_tags:
-            x_crd = ops.nodeCoord(node_tag)[0]
-            y_crd = ops.nodeCoord(node_tag)[1]
-            z_crd = ops.nodeCoord(node_tag)[2]
+            x_crd = node_crd[node_tag][0]
+            y_crd = node_crd[node_tag][1]
+            z_crd = node_crd[node_tag][2]
             if x_crd > max_x_crd:
                 max_x_crd = x_crd
             if y_crd > max_y_crd:
@@ -349,21 +424,21 @@ def _plot_model_3d(node_labels, element_labels, offset_nd_label, axis_off,
         _offset = 0.002 * max_crd
 
         for i, ele_tag in enumerate(ele_tags):
-            nd1, nd2, nd3, nd4 = ops.eleNodes(ele_tag)
+            nd1, nd2, nd3, nd4 = ele_nodes[ele_tag]
 
             # element node1-node2, x,  y coordinates
-            ex = np.array([ops.nodeCoord(nd1)[0],
-                           ops.nodeCoord(nd2)[0],
-                           ops.nodeCoord(nd3)[0],
-                           ops.nodeCoord(nd4)[0]])
-            ey = np.array([ops.nodeCoord(nd1)[1],
-                           ops.nodeCoord(nd2)[1],
-                           ops.nodeCoord(nd3)[1],
-                           ops.nodeCoord(nd4)[1]])
-            ez = np.array([ops.nodeCoord(nd1)[2],
-                           ops.nodeCoord(nd2)[2],
-                           ops.nodeCoord(nd3)[2],
-                           ops.nodeCoord(nd4)[2]])
+            ex = np.array([node_crd[nd1][0],
+                           node_crd[nd2][0],
+                           node_crd[nd3][0],
+                           node_crd[nd4][0]])
+            ey = np.array([node_crd[nd1][1],
+                           node_crd[nd2][1],
+                           node_crd[nd3][1],
+                           node_crd[nd4][1]])
+            ez = np.array([node_crd[nd1][2],
+                           node_crd[nd2][2],
+                           node_crd[nd3][2],
+                           node_crd[nd4][2]])
 
             # location of label
             xt = sum(ex)/nen
@@ -398,17 +473,17 @@ def _plot_model_3d(node_labels, element_labels, offset_nd_label, axis_off,
 
         if node_labels:
             for node_tag in node_tags:
-                ax.text(ops.nodeCoord(node_tag)[0]+_offset,
-                        ops.nodeCoord(node_tag)[1]+_offset,
-                        ops.nodeCoord(node_tag)[2]+_offset,
+                ax.text(node_crd[node_tag][0]+_offset,
+                        node_crd[node_tag][1]+_offset,
+                        node_crd[node_tag][2]+_offset,
                         f'{node_tag}', va='bottom', ha='left', color='blue')
 
     # 8-node brick, 3d model
     elif nen == 8:
         for node_tag in node_tags:
-            x_crd = ops.nodeCoord(node_tag)[0]
-            y_crd = ops.nodeCoord(node_tag)[1]
-            z_crd = ops.nodeCoord(node_tag)[2]
+            x_crd = node_crd[node_tag][0]
+            y_crd = node_crd[node_tag][1]
+            z_crd = node_crd[node_tag][2]
             if x_crd > max_x_crd:
                 max_x_crd = x_crd
             if y_crd > max_y_crd:
@@ -431,33 +506,33 @@ def _plot_model_3d(node_labels, element_labels, offset_nd_label, axis_off,
         ax.set_zlim(_min_overall, _max_overall)
 
         for i, ele_tag in enumerate(ele_tags):
-            nd1, nd2, nd3, nd4, nd5, nd6, nd7, nd8 = ops.eleNodes(ele_tag)
+            nd1, nd2, nd3, nd4, nd5, nd6, nd7, nd8 = ele_nodes[ele_tag]
 
             # element node1-node2, x,  y coordinates
-            ex = np.array([ops.nodeCoord(nd1)[0],
-                           ops.nodeCoord(nd2)[0],
-                           ops.nodeCoord(nd3)[0],
-                           ops.nodeCoord(nd4)[0],
-                           ops.nodeCoord(nd5)[0],
-                           ops.nodeCoord(nd6)[0],
-                           ops.nodeCoord(nd7)[0],
-                           ops.nodeCoord(nd8)[0]])
-            ey = np.array([ops.nodeCoord(nd1)[1],
-                           ops.nodeCoord(nd2)[1],
-                           ops.nodeCoord(nd3)[1],
-                           ops.nodeCoord(nd4)[1],
-                           ops.nodeCoord(nd5)[1],
-                           ops.nodeCoord(nd6)[1],
-                           ops.nodeCoord(nd7)[1],
-                           ops.nodeCoord(nd8)[1]])
-            ez = np.array([ops.nodeCoord(nd1)[2],
-                           ops.nodeCoord(nd2)[2],
-                           ops.nodeCoord(nd3)[2],
-                           ops.nodeCoord(nd4)[2],
-                           ops.nodeCoord(nd5)[2],
-                           ops.nodeCoord(nd6)[2],
-                           ops.nodeCoord(nd7)[2],
-                           ops.nodeCoord(nd8)[2]])
+            ex = np.array([node_crd[nd1][0],
+                           node_crd[nd2][0],
+                           node_crd[nd3][0],
+                           node_crd[nd4][0],
+                           node_crd[nd5][0],
+                           node_crd[nd6][0],
+                           node_crd[nd7][0],
+                           node_crd[nd8][0]])
+            ey = np.array([node_crd[nd1][1],
+                           node_crd[nd2][1],
+                           node_crd[nd3][1],
+                           node_crd[nd4][1],
+                           node_crd[nd5][1],
+                           node_crd[nd6][1],
+                           node_crd[nd7][1],
+                           node_crd[nd8][1]])
+            ez = np.array([node_crd[nd1][2],
+                           node_crd[nd2][2],
+                           node_crd[nd3][2],
+                           node_crd[nd4][2],
+                           node_crd[nd5][2],
+                           node_crd[nd6][2],
+                           node_crd[nd7][2],
+                           node_crd[nd8][2]])
 
             # location of label
             xt = sum(ex)/nen
@@ -507,9 +582,9 @@ def _plot_model_3d(node_labels, element_labels, offset_nd_label, axis_off,
 
         if node_labels:
             for node_tag in node_tags:
-                ax.text(ops.nodeCoord(node_tag)[0]+_offset,
-                        ops.nodeCoord(node_tag)[1]+_offset,
-                        ops.nodeCoord(node_tag)[2]+_offset,
+                ax.text(node_crd[node_tag][0]+_offset,
+                        node_crd[node_tag][1]+_offset,
+                        node_crd[node_tag][2]+_offset,
                         f'{node_tag}', va='bottom', ha='left', color='blue')
 
 
@@ -577,36 +652,42 @@ def _plot_defo_mode_2d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
                        endDispFlag, fmt_interp, fmt_nodes):
 
     ele_tags = ops.getEleTags()
+    node_crd = _get_node_crds()
+    ele_nodes = _get_ele_nodes()
+    if modeNo:
+        node_eig = _get_node_eigenvectors(modeNo)
+    else:
+        node_dsp = _get_node_disps()
 
-    nen = np.shape(ops.eleNodes(ele_tags[0]))[0]
+    nen = np.shape(ele_nodes[ele_tags[0]])[0]
 
     # truss and beam/frame elements
     if nen == 2:
 
-        ndf = np.shape(ops.nodeDOFs(ops.eleNodes(ele_tags[0])[0]))[0]
+        ndf = np.shape(ops.nodeDOFs(ele_nodes[ele_tags[0]][0]))[0]
 
         # truss element
         if ndf == 2:
 
             for ele_tag in ele_tags:
-                nd1, nd2 = ops.eleNodes(ele_tag)
+                nd1, nd2 = ele_nodes[ele_tag]
 
                 # element x, y coordinates
-                ex = np.array([ops.nodeCoord(nd1)[0],
-                               ops.nodeCoord(nd2)[0]])
-                ey = np.array([ops.nodeCoord(nd1)[1],
-                               ops.nodeCoord(nd2)[1]])
+                ex = np.array([node_crd[nd1][0],
+                               node_crd[nd2][0]])
+                ey = np.array([node_crd[nd1][1],
+                               node_crd[nd2][1]])
 
                 if modeNo:
-                    eux = np.array([ops.nodeEigenvector(nd1, modeNo)[0],
-                                    ops.nodeEigenvector(nd2, modeNo)[0]])
-                    euy = np.array([ops.nodeEigenvector(nd1, modeNo)[1],
-                                    ops.nodeEigenvector(nd2, modeNo)[1]])
+                    eux = np.array([node_eig[nd1][0],
+                                    node_eig[nd2][0]])
+                    euy = np.array([node_eig[nd1][1],
+                                    node_eig[nd2][1]])
                 else:
-                    eux = np.array([ops.nodeDisp(nd1)[0],
-                                    ops.nodeDisp(nd2)[0]])
-                    euy = np.array([ops.nodeDisp(nd1)[1],
-                                    ops.nodeDisp(nd2)[1]])
+                    eux = np.array([node_dsp[nd1][0],
+                                    node_dsp[nd2][0]])
+                    euy = np.array([node_dsp[nd1][1],
+                                    node_dsp[nd2][1]])
 
                 # displaced element coordinates (scaled by sfac factor)
                 edx = np.array([ex[0] + sfac*eux[0], ex[1] + sfac*eux[1]])
@@ -621,28 +702,28 @@ def _plot_defo_mode_2d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
         elif ndf == 3:
 
             for ele_tag in ele_tags:
-                nd1, nd2 = ops.eleNodes(ele_tag)
+                nd1, nd2 = ele_nodes[ele_tag]
 
                 # element x, y coordinates
-                ex = np.array([ops.nodeCoord(nd1)[0],
-                               ops.nodeCoord(nd2)[0]])
-                ey = np.array([ops.nodeCoord(nd1)[1],
-                               ops.nodeCoord(nd2)[1]])
+                ex = np.array([node_crd[nd1][0],
+                               node_crd[nd2][0]])
+                ey = np.array([node_crd[nd1][1],
+                               node_crd[nd2][1]])
 
                 if modeNo:
-                    ed = np.array([ops.nodeEigenvector(nd1, modeNo)[0],
-                                   ops.nodeEigenvector(nd1, modeNo)[1],
-                                   ops.nodeEigenvector(nd1, modeNo)[2],
-                                   ops.nodeEigenvector(nd2, modeNo)[0],
-                                   ops.nodeEigenvector(nd2, modeNo)[1],
-                                   ops.nodeEigenvector(nd2, modeNo)[2]])
+                    ed = np.array([node_eig[nd1][0],
+                                   node_eig[nd1][1],
+                                   node_eig[nd1][2],
+                                   node_eig[nd2][0],
+                                   node_eig[nd2][1],
+                                   node_eig[nd2][2]])
                 else:
-                    ed = np.array([ops.nodeDisp(nd1)[0],
-                                   ops.nodeDisp(nd1)[1],
-                                   ops.nodeDisp(nd1)[2],
-                                   ops.nodeDisp(nd2)[0],
-                                   ops.nodeDisp(nd2)[1],
-                                   ops.nodeDisp(nd2)[2]])
+                    ed = np.array([node_dsp[nd1][0],
+                                   node_dsp[nd1][1],
+                                   node_dsp[nd1][2],
+                                   node_dsp[nd2][0],
+                                   node_dsp[nd2][1],
+                                   node_dsp[nd2][2]])
 
                 if unDefoFlag:
                     plt.plot(ex, ey, fmt_undefo)
@@ -663,30 +744,30 @@ def _plot_defo_mode_2d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
     # 2d triangular (tri31) elements
     elif nen == 3:
         for ele_tag in ele_tags:
-            nd1, nd2, nd3 = ops.eleNodes(ele_tag)
+            nd1, nd2, nd3 = ele_nodes[ele_tag]
 
             # element x, y coordinates
-            ex = np.array([ops.nodeCoord(nd1)[0],
-                           ops.nodeCoord(nd2)[0],
-                           ops.nodeCoord(nd3)[0]])
-            ey = np.array([ops.nodeCoord(nd1)[1],
-                           ops.nodeCoord(nd2)[1],
-                           ops.nodeCoord(nd3)[1]])
+            ex = np.array([node_crd[nd1][0],
+                           node_crd[nd2][0],
+                           node_crd[nd3][0]])
+            ey = np.array([node_crd[nd1][1],
+                           node_crd[nd2][1],
+                           node_crd[nd3][1]])
 
             if modeNo:
-                ed = np.array([ops.nodeEigenvector(nd1, modeNo)[0],
-                               ops.nodeEigenvector(nd1, modeNo)[1],
-                               ops.nodeEigenvector(nd2, modeNo)[0],
-                               ops.nodeEigenvector(nd2, modeNo)[1],
-                               ops.nodeEigenvector(nd3, modeNo)[0],
-                               ops.nodeEigenvector(nd3, modeNo)[1]])
+                ed = np.array([node_eig[nd1][0],
+                               node_eig[nd1][1],
+                               node_eig[nd2][0],
+                               node_eig[nd2][1],
+                               node_eig[nd3][0],
+                               node_eig[nd3][1]])
             else:
-                ed = np.array([ops.nodeDisp(nd1)[0],
-                               ops.nodeDisp(nd1)[1],
-                               ops.nodeDisp(nd2)[0],
-                               ops.nodeDisp(nd2)[1],
-                               ops.nodeDisp(nd3)[0],
-                               ops.nodeDisp(nd3)[1]])
+                ed = np.array([node_dsp[nd1][0],
+                               node_dsp[nd1][1],
+                               node_dsp[nd2][0],
+                               node_dsp[nd2][1],
+                               node_dsp[nd3][0],
+                               node_dsp[nd3][1]])
 
             if unDefoFlag:
                 plt.plot(np.append(ex, ex[0]), np.append(ey, ey[0]),
@@ -713,36 +794,36 @@ def _plot_defo_mode_2d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
     # 2d quadrilateral (quad) elements
     elif nen == 4:
         for ele_tag in ele_tags:
-            nd1, nd2, nd3, nd4 = ops.eleNodes(ele_tag)
+            nd1, nd2, nd3, nd4 = ele_nodes[ele_tag]
 
             # element x, y coordinates
-            ex = np.array([ops.nodeCoord(nd1)[0],
-                           ops.nodeCoord(nd2)[0],
-                           ops.nodeCoord(nd3)[0],
-                           ops.nodeCoord(nd4)[0]])
-            ey = np.array([ops.nodeCoord(nd1)[1],
-                           ops.nodeCoord(nd2)[1],
-                           ops.nodeCoord(nd3)[1],
-                           ops.nodeCoord(nd4)[1]])
+            ex = np.array([node_crd[nd1][0],
+                           node_crd[nd2][0],
+                           node_crd[nd3][0],
+                           node_crd[nd4][0]])
+            ey = np.array([node_crd[nd1][1],
+                           node_crd[nd2][1],
+                           node_crd[nd3][1],
+                           node_crd[nd4][1]])
 
             if modeNo:
-                ed = np.array([ops.nodeEigenvector(nd1, modeNo)[0],
-                               ops.nodeEigenvector(nd1, modeNo)[1],
-                               ops.nodeEigenvector(nd2, modeNo)[0],
-                               ops.nodeEigenvector(nd2, modeNo)[1],
-                               ops.nodeEigenvector(nd3, modeNo)[0],
-                               ops.nodeEigenvector(nd3, modeNo)[1],
-                               ops.nodeEigenvector(nd4, modeNo)[0],
-                               ops.nodeEigenvector(nd4, modeNo)[1]])
+                ed = np.array([node_eig[nd1][0],
+                               node_eig[nd1][1],
+                               node_eig[nd2][0],
+                               node_eig[nd2][1],
+                               node_eig[nd3][0],
+                               node_eig[nd3][1],
+                               node_eig[nd4][0],
+                               node_eig[nd4][1]])
             else:
-                ed = np.array([ops.nodeDisp(nd1)[0],
-                               ops.nodeDisp(nd1)[1],
-                               ops.nodeDisp(nd2)[0],
-                               ops.nodeDisp(nd2)[1],
-                               ops.nodeDisp(nd3)[0],
-                               ops.nodeDisp(nd3)[1],
-                               ops.nodeDisp(nd4)[0],
-                               ops.nodeDisp(nd4)[1]])
+                ed = np.array([node_dsp[nd1][0],
+                               node_dsp[nd1][1],
+                               node_dsp[nd2][0],
+                               node_dsp[nd2][1],
+                               node_dsp[nd3][0],
+                               node_dsp[nd3][1],
+                               node_dsp[nd4][0],
+                               node_dsp[nd4][1]])
 
             if unDefoFlag:
                 plt.plot(np.append(ex, ex[0]), np.append(ey, ey[0]),
@@ -782,6 +863,12 @@ def _plot_defo_mode_3d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
                        fig_lbrt):
 
     ele_tags = ops.getEleTags()
+    node_crd = _get_node_crds()
+    ele_nodes = _get_ele_nodes()
+    if modeNo:
+        node_eig = _get_node_eigenvectors(modeNo)
+    else:
+        node_dsp = _get_node_disps()
 
     azim, elev = az_el
     fig_wi, fig_he = fig_wi_he
@@ -799,53 +886,53 @@ def _plot_defo_mode_3d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
 
     ax.view_init(azim=azim, elev=elev)
 
-    nen = np.shape(ops.eleNodes(ele_tags[0]))[0]
+    nen = np.shape(ele_nodes[ele_tags[0]])[0]
 
     # plot: truss and beam/frame elements in 3d
     if nen == 2:
 
-        ndf = np.shape(ops.nodeDOFs(ops.eleNodes(ele_tags[0])[0]))[0]
+        ndf = np.shape(ops.nodeDOFs(ele_nodes[ele_tags[0]][0]))[0]
 
         # plot: beam/frame element in 3d
         if ndf == 6:
 
             for i, ele_tag in enumerate(ele_tags):
-                nd1, nd2 = ops.eleNodes(ele_tag)
+                nd1, nd2 = ele_nodes[ele_tag]
 
                 # element x, y coordinates
-                ex = np.array([ops.nodeCoord(nd1)[0],
-                               ops.nodeCoord(nd2)[0]])
-                ey = np.array([ops.nodeCoord(nd1)[1],
-                               ops.nodeCoord(nd2)[1]])
-                ez = np.array([ops.nodeCoord(nd1)[2],
-                               ops.nodeCoord(nd2)[2]])
+                ex = np.array([node_crd[nd1][0],
+                               node_crd[nd2][0]])
+                ey = np.array([node_crd[nd1][1],
+                               node_crd[nd2][1]])
+                ez = np.array([node_crd[nd1][2],
+                               node_crd[nd2][2]])
 
                 if modeNo:
-                    ed = np.array([ops.nodeEigenvector(nd1, modeNo)[0],
-                                   ops.nodeEigenvector(nd1, modeNo)[1],
-                                   ops.nodeEigenvector(nd1, modeNo)[2],
-                                   ops.nodeEigenvector(nd1, modeNo)[3],
-                                   ops.nodeEigenvector(nd1, modeNo)[4],
-                                   ops.nodeEigenvector(nd1, modeNo)[5],
-                                   ops.nodeEigenvector(nd2, modeNo)[0],
-                                   ops.nodeEigenvector(nd2, modeNo)[1],
-                                   ops.nodeEigenvector(nd2, modeNo)[2],
-                                   ops.nodeEigenvector(nd2, modeNo)[3],
-                                   ops.nodeEigenvector(nd2, modeNo)[4],
-                                   ops.nodeEigenvector(nd2, modeNo)[5]])
+                    ed = np.array([node_eig[nd1][0],
+                                   node_eig[nd1][1],
+                                   node_eig[nd1][2],
+                                   node_eig[nd1][3],
+                                   node_eig[nd1][4],
+                                   node_eig[nd1][5],
+                                   node_eig[nd2][0],
+                                   node_eig[nd2][1],
+                                   node_eig[nd2][2],
+                                   node_eig[nd2][3],
+                                   node_eig[nd2][4],
+                                   node_eig[nd2][5]])
                 else:
-                    ed = np.array([ops.nodeDisp(nd1)[0],
-                                   ops.nodeDisp(nd1)[1],
-                                   ops.nodeDisp(nd1)[2],
-                                   ops.nodeDisp(nd1)[3],
-                                   ops.nodeDisp(nd1)[4],
-                                   ops.nodeDisp(nd1)[5],
-                                   ops.nodeDisp(nd2)[0],
-                                   ops.nodeDisp(nd2)[1],
-                                   ops.nodeDisp(nd2)[2],
-                                   ops.nodeDisp(nd2)[3],
-                                   ops.nodeDisp(nd2)[4],
-                                   ops.nodeDisp(nd2)[5]])
+                    ed = np.array([node_dsp[nd1][0],
+                                   node_dsp[nd1][1],
+                                   node_dsp[nd1][2],
+                                   node_dsp[nd1][3],
+                                   node_dsp[nd1][4],
+                                   node_dsp[nd1][5],
+                                   node_dsp[nd2][0],
+                                   node_dsp[nd2][1],
+                                   node_dsp[nd2][2],
+                                   node_dsp[nd2][3],
+                                   node_dsp[nd2][4],
+                                   node_dsp[nd2][5]])
 
                 # eo = Eo[i, :]
                 xloc = ops.eleResponse(ele_tag, 'xlocal')
@@ -889,54 +976,54 @@ def _plot_defo_mode_3d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
     # plot: quad in 3d
     elif nen == 4:
 
-        ndf = np.shape(ops.nodeDOFs(ops.eleNodes(ele_tags[0])[0]))[0]
+        ndf = np.shape(ops.nodeDOFs(ele_nodes[ele_tags[0]][0]))[0]
 
         # plot: shell in 3d
         if ndf == 6:
 
             for i, ele_tag in enumerate(ele_tags):
-                nd1, nd2, nd3, nd4 = ops.eleNodes(ele_tag)
+                nd1, nd2, nd3, nd4 = ele_nodes[ele_tag]
 
                 # element node1-node2, x,  y coordinates
-                ex = np.array([ops.nodeCoord(nd1)[0],
-                               ops.nodeCoord(nd2)[0],
-                               ops.nodeCoord(nd3)[0],
-                               ops.nodeCoord(nd4)[0]])
-                ey = np.array([ops.nodeCoord(nd1)[1],
-                               ops.nodeCoord(nd2)[1],
-                               ops.nodeCoord(nd3)[1],
-                               ops.nodeCoord(nd4)[1]])
-                ez = np.array([ops.nodeCoord(nd1)[2],
-                               ops.nodeCoord(nd2)[2],
-                               ops.nodeCoord(nd3)[2],
-                               ops.nodeCoord(nd4)[2]])
+                ex = np.array([node_crd[nd1][0],
+                               node_crd[nd2][0],
+                               node_crd[nd3][0],
+                               node_crd[nd4][0]])
+                ey = np.array([node_crd[nd1][1],
+                               node_crd[nd2][1],
+                               node_crd[nd3][1],
+                               node_crd[nd4][1]])
+                ez = np.array([node_crd[nd1][2],
+                               node_crd[nd2][2],
+                               node_crd[nd3][2],
+                               node_crd[nd4][2]])
 
                 if modeNo:
-                    ed = np.array([ops.nodeEigenvector(nd1, modeNo)[0],
-                                   ops.nodeEigenvector(nd1, modeNo)[1],
-                                   ops.nodeEigenvector(nd1, modeNo)[2],
-                                   ops.nodeEigenvector(nd2, modeNo)[0],
-                                   ops.nodeEigenvector(nd2, modeNo)[1],
-                                   ops.nodeEigenvector(nd2, modeNo)[2],
-                                   ops.nodeEigenvector(nd3, modeNo)[0],
-                                   ops.nodeEigenvector(nd3, modeNo)[1],
-                                   ops.nodeEigenvector(nd3, modeNo)[2],
-                                   ops.nodeEigenvector(nd4, modeNo)[0],
-                                   ops.nodeEigenvector(nd4, modeNo)[1],
-                                   ops.nodeEigenvector(nd4, modeNo)[2]])
+                    ed = np.array([node_eig[nd1][0],
+                                   node_eig[nd1][1],
+                                   node_eig[nd1][2],
+                                   node_eig[nd2][0],
+                                   node_eig[nd2][1],
+                                   node_eig[nd2][2],
+                                   node_eig[nd3][0],
+                                   node_eig[nd3][1],
+                                   node_eig[nd3][2],
+                                   node_eig[nd4][0],
+                                   node_eig[nd4][1],
+                                   node_eig[nd4][2]])
                 else:
-                    ed = np.array([ops.nodeDisp(nd1)[0],
-                                   ops.nodeDisp(nd1)[1],
-                                   ops.nodeDisp(nd1)[2],
-                                   ops.nodeDisp(nd2)[0],
-                                   ops.nodeDisp(nd2)[1],
-                                   ops.nodeDisp(nd2)[2],
-                                   ops.nodeDisp(nd3)[0],
-                                   ops.nodeDisp(nd3)[1],
-                                   ops.nodeDisp(nd3)[2],
-                                   ops.nodeDisp(nd4)[0],
-                                   ops.nodeDisp(nd4)[1],
-                                   ops.nodeDisp(nd4)[2]])
+                    ed = np.array([node_dsp[nd1][0],
+                                   node_dsp[nd1][1],
+                                   node_dsp[nd1][2],
+                                   node_dsp[nd2][0],
+                                   node_dsp[nd2][1],
+                                   node_dsp[nd2][2],
+                                   node_dsp[nd3][0],
+                                   node_dsp[nd3][1],
+                                   node_dsp[nd3][2],
+                                   node_dsp[nd4][0],
+                                   node_dsp[nd4][1],
+                                   node_dsp[nd4][2]])
 
                 if unDefoFlag:
                     ax.plot(np.append(ex, ex[0]),
@@ -969,84 +1056,84 @@ def _plot_defo_mode_3d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
     elif nen == 8:
 
         for i, ele_tag in enumerate(ele_tags):
-            nd1, nd2, nd3, nd4, nd5, nd6, nd7, nd8 = ops.eleNodes(ele_tag)
+            nd1, nd2, nd3, nd4, nd5, nd6, nd7, nd8 = ele_nodes[ele_tag]
 
             # element node1-node2, x,  y coordinates
-            ex = np.array([ops.nodeCoord(nd1)[0],
-                           ops.nodeCoord(nd2)[0],
-                           ops.nodeCoord(nd3)[0],
-                           ops.nodeCoord(nd4)[0],
-                           ops.nodeCoord(nd5)[0],
-                           ops.nodeCoord(nd6)[0],
-                           ops.nodeCoord(nd7)[0],
-                           ops.nodeCoord(nd8)[0]])
-            ey = np.array([ops.nodeCoord(nd1)[1],
-                           ops.nodeCoord(nd2)[1],
-                           ops.nodeCoord(nd3)[1],
-                           ops.nodeCoord(nd4)[1],
-                           ops.nodeCoord(nd5)[1],
-                           ops.nodeCoord(nd6)[1],
-                           ops.nodeCoord(nd7)[1],
-                           ops.nodeCoord(nd8)[1]])
-            ez = np.array([ops.nodeCoord(nd1)[2],
-                           ops.nodeCoord(nd2)[2],
-                           ops.nodeCoord(nd3)[2],
-                           ops.nodeCoord(nd4)[2],
-                           ops.nodeCoord(nd5)[2],
-                           ops.nodeCoord(nd6)[2],
-                           ops.nodeCoord(nd7)[2],
-                           ops.nodeCoord(nd8)[2]])
+            ex = np.array([node_crd[nd1][0],
+                           node_crd[nd2][0],
+                           node_crd[nd3][0],
+                           node_crd[nd4][0],
+                           node_crd[nd5][0],
+                           node_crd[nd6][0],
+                           node_crd[nd7][0],
+                           node_crd[nd8][0]])
+            ey = np.array([node_crd[nd1][1],
+                           node_crd[nd2][1],
+                           node_crd[nd3][1],
+                           node_crd[nd4][1],
+                           node_crd[nd5][1],
+                           node_crd[nd6][1],
+                           node_crd[nd7][1],
+                           node_crd[nd8][1]])
+            ez = np.array([node_crd[nd1][2],
+                           node_crd[nd2][2],
+                           node_crd[nd3][2],
+                           node_crd[nd4][2],
+                           node_crd[nd5][2],
+                           node_crd[nd6][2],
+                           node_crd[nd7][2],
+                           node_crd[nd8][2]])
 
             if modeNo:
-                ed = np.array([ops.nodeEigenvector(nd1, modeNo)[0],
-                               ops.nodeEigenvector(nd1, modeNo)[1],
-                               ops.nodeEigenvector(nd1, modeNo)[2],
-                               ops.nodeEigenvector(nd2, modeNo)[0],
-                               ops.nodeEigenvector(nd2, modeNo)[1],
-                               ops.nodeEigenvector(nd2, modeNo)[2],
-                               ops.nodeEigenvector(nd3, modeNo)[0],
-                               ops.nodeEigenvector(nd3, modeNo)[1],
-                               ops.nodeEigenvector(nd3, modeNo)[2],
-                               ops.nodeEigenvector(nd4, modeNo)[0],
-                               ops.nodeEigenvector(nd4, modeNo)[1],
-                               ops.nodeEigenvector(nd4, modeNo)[2],
-                               ops.nodeEigenvector(nd5, modeNo)[0],
-                               ops.nodeEigenvector(nd5, modeNo)[1],
-                               ops.nodeEigenvector(nd5, modeNo)[2],
-                               ops.nodeEigenvector(nd6, modeNo)[0],
-                               ops.nodeEigenvector(nd6, modeNo)[1],
-                               ops.nodeEigenvector(nd6, modeNo)[2],
-                               ops.nodeEigenvector(nd7, modeNo)[0],
-                               ops.nodeEigenvector(nd7, modeNo)[1],
-                               ops.nodeEigenvector(nd7, modeNo)[2],
-                               ops.nodeEigenvector(nd8, modeNo)[0],
-                               ops.nodeEigenvector(nd8, modeNo)[1],
-                               ops.nodeEigenvector(nd8, modeNo)[2]])
+                ed = np.array([node_eig[nd1][0],
+                               node_eig[nd1][1],
+                               node_eig[nd1][2],
+                               node_eig[nd2][0],
+                               node_eig[nd2][1],
+                               node_eig[nd2][2],
+                               node_eig[nd3][0],
+                               node_eig[nd3][1],
+                               node_eig[nd3][2],
+                               node_eig[nd4][0],
+                               node_eig[nd4][1],
+                               node_eig[nd4][2],
+                               node_eig[nd5][0],
+                               node_eig[nd5][1],
+                               node_eig[nd5][2],
+                               node_eig[nd6][0],
+                               node_eig[nd6][1],
+                               node_eig[nd6][2],
+                               node_eig[nd7][0],
+                               node_eig[nd7][1],
+                               node_eig[nd7][2],
+                               node_eig[nd8][0],
+                               node_eig[nd8][1],
+                               node_eig[nd8][2]])
             else:
-                ed = np.array([ops.nodeDisp(nd1)[0],
-                               ops.nodeDisp(nd1)[1],
-                               ops.nodeDisp(nd1)[2],
-                               ops.nodeDisp(nd2)[0],
-                               ops.nodeDisp(nd2)[1],
-                               ops.nodeDisp(nd2)[2],
-                               ops.nodeDisp(nd3)[0],
-                               ops.nodeDisp(nd3)[1],
-                               ops.nodeDisp(nd3)[2],
-                               ops.nodeDisp(nd4)[0],
-                               ops.nodeDisp(nd4)[1],
-                               ops.nodeDisp(nd4)[2],
-                               ops.nodeDisp(nd5)[0],
-                               ops.nodeDisp(nd5)[1],
-                               ops.nodeDisp(nd5)[2],
-                               ops.nodeDisp(nd6)[0],
-                               ops.nodeDisp(nd6)[1],
-                               ops.nodeDisp(nd6)[2],
-                               ops.nodeDisp(nd7)[0],
-                               ops.nodeDisp(nd7)[1],
-                               ops.nodeDisp(nd7)[2],
-                               ops.nodeDisp(nd8)[0],
-                               ops.nodeDisp(nd8)[1],
-                               ops.nodeDisp(nd8)[2]])
+                ed = np.array([node_dsp[nd1][0],
+                               node_dsp[nd1][1],
+                               node_dsp[nd1][2],
+                               node_dsp[nd2][0],
+                               node_dsp[nd2][1],
+                               node_dsp[nd2][2],
+                               node_dsp[nd3][0],
+                               node_dsp[nd3][1],
+                               node_dsp[nd3][2],
+                               node_dsp[nd4][0],
+                               node_dsp[nd4][1],
+                               node_dsp[nd4][2],
+                               node_dsp[nd5][0],
+                               node_dsp[nd5][1],
+                               node_dsp[nd5][2],
+                               node_dsp[nd6][0],
+                               node_dsp[nd6][1],
+                               node_dsp[nd6][2],
+                               node_dsp[nd7][0],
+                               node_dsp[nd7][1],
+                               node_dsp[nd7][2],
+                               node_dsp[nd8][0],
+                               node_dsp[nd8][1],
+                               node_dsp[nd8][2]])
 
             if unDefoFlag:
                 ax.plot(np.append(ex[0:4], ex[0]),
@@ -1146,6 +1233,8 @@ def plot_defo(sfac=False, nep=17, unDefoFlag=1, fmt_undefo=fmt_undefo,
     element ends.
     """
     node_tags = ops.getNodeTags()
+    node_crd = _get_node_crds()
+    node_dsp = _get_node_disps()
 
     # calculate sfac
     min_x, min_y, min_z = np.inf, np.inf, np.inf
@@ -1153,15 +1242,15 @@ def plot_defo(sfac=False, nep=17, unDefoFlag=1, fmt_undefo=fmt_undefo,
     max_ux, max_uy, max_uz = -np.inf, -np.inf, -np.inf
     ratio = 0.1
 
-    ndim = np.shape(ops.nodeCoord(node_tags[0]))[0]
+    ndim = np.shape(node_crd[node_tags[0]])[0]
 
     if ndim == 2:
         if not sfac:
             for node_tag in node_tags:
-                x_crd = ops.nodeCoord(node_tag)[0]
-                y_crd = ops.nodeCoord(node_tag)[1]
-                ux = ops.nodeDisp(node_tag)[0]
-                uy = ops.nodeDisp(node_tag)[1]
+                x_crd = node_crd[node_tag][0]
+                y_crd = node_crd[node_tag][1]
+                ux = node_dsp[node_tag][0]
+                uy = node_dsp[node_tag][1]
 
                 min_x = min(min_x, x_crd)
                 min_y = min(min_y, y_crd)
@@ -1186,12 +1275,12 @@ This usually happens when translational DOFs are too small\n\n""")
     elif ndim == 3:
         if not sfac:
             for node_tag in node_tags:
-                x_crd = ops.nodeCoord(node_tag)[0]
-                y_crd = ops.nodeCoord(node_tag)[1]
-                z_crd = ops.nodeCoord(node_tag)[2]
-                ux = ops.nodeDisp(node_tag)[0]
-                uy = ops.nodeDisp(node_tag)[1]
-                uz = ops.nodeDisp(node_tag)[2]
+                x_crd = node_crd[node_tag][0]
+                y_crd = node_crd[node_tag][1]
+                z_crd = node_crd[node_tag][2]
+                ux = node_dsp[node_tag][0]
+                uy = node_dsp[node_tag][1]
+                uz = node_dsp[node_tag][2]
 
                 min_x = min(min_x, x_crd)
                 min_y = min(min_y, y_crd)
@@ -1220,40 +1309,46 @@ This usually happens when translational DOFs are too small\n\n""")
 
 def _anim_mode_2d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
                   endDispFlag, fmt_interp, fmt_nodes, fig_wi_he, xlim, ylim,
-                  lw):
+                  lw, movie, fps):
 
     fig_wi, fig_he = fig_wi_he
     ele_tags = ops.getEleTags()
+    node_crd = _get_node_crds()
+    ele_nodes = _get_ele_nodes()
+    if modeNo:
+        node_eig = _get_node_eigenvectors(modeNo)
+    else:
+        node_dsp = _get_node_disps()
 
-    nen = np.shape(ops.eleNodes(ele_tags[0]))[0]
+    nen = np.shape(ele_nodes[ele_tags[0]])[0]
 
     # truss and beam/frame elements
     if nen == 2:
 
-        ndf = np.shape(ops.nodeDOFs(ops.eleNodes(ele_tags[0])[0]))[0]
+        ndf = np.shape(ops.nodeDOFs(ele_nodes[ele_tags[0]][0]))[0]
 
         # truss element
         if ndf == 2:
 
             for ele_tag in ele_tags:
-                nd1, nd2 = ops.eleNodes(ele_tag)
+                nd1, nd2 = ele_nodes[ele_tag]
 
                 # element x, y coordinates
-                ex = np.array([ops.nodeCoord(nd1)[0],
-                               ops.nodeCoord(nd2)[0]])
-                ey = np.array([ops.nodeCoord(nd1)[1],
-                               ops.nodeCoord(nd2)[1]])
+                ex = np.array([node_crd[nd1][0],
+                               node_crd[nd2][0]])
+                ey = np.array([node_crd[nd1][1],
+                               node_crd[nd2][1]])
 
                 if modeNo:
-                    eux = np.array([ops.nodeEigenvector(nd1, modeNo)[0],
-                                    ops.nodeEigenvector(nd2, modeNo)[0]])
-                    euy = np.array([ops.nodeEigenvector(nd1, modeNo)[1],
-                                    ops.nodeEigenvector(nd2, modeNo)[1]])
+                    eux = np.array([node_eig[nd1][0],
+                                    node_eig[nd2][0]])
+                    euy = np.array([node_eig[nd1][1],
+                                    node_eig[nd2][1]])
                 else:
-                    eux = np.array([ops.nodeDisp(nd1)[0],
-                                    ops.nodeDisp(nd2)[0]])
-                    euy = np.array([ops.nodeDisp(nd1)[1],
-                                    ops.nodeDisp(nd2)[1]])
+                    eux = np.array([node_dsp[nd1][0],
+                                    node_dsp[nd2][0]])
+                    euy = np.array([node_dsp[nd1][1],
+                                    node_dsp[nd2][1]])
 
                 # displaced element coordinates (scaled by sfac factor)
                 edx = np.array([ex[0] + sfac*eux[0], ex[1] + sfac*eux[1]])
@@ -1279,52 +1374,50 @@ def _anim_mode_2d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
             # time vector for one cycle (period)
             n_frames = 32 + 1
             t = np.linspace(0., 2*np.pi, n_frames)
-            lines = []
 
             for i, ele_tag in enumerate(ele_tags):
-                nd1, nd2 = ops.eleNodes(ele_tag)
+                nd1, nd2 = ele_nodes[ele_tag]
 
                 # element x, y coordinates
-                Ex[i, :] = np.array([ops.nodeCoord(nd1)[0],
-                                     ops.nodeCoord(nd2)[0]])
-                Ey[i, :] = np.array([ops.nodeCoord(nd1)[1],
-                                     ops.nodeCoord(nd2)[1]])
-
-                Ed[i, :] = np.array([ops.nodeEigenvector(nd1, modeNo)[0],
-                                     ops.nodeEigenvector(nd1, modeNo)[1],
-                                     ops.nodeEigenvector(nd1, modeNo)[2],
-                                     ops.nodeEigenvector(nd2, modeNo)[0],
-                                     ops.nodeEigenvector(nd2, modeNo)[1],
-                                     ops.nodeEigenvector(nd2, modeNo)[2]])
-
-                lines.append(ax.plot([], [], fmt_nodes, lw=lw)[0])
+                Ex[i, :] = np.array([node_crd[nd1][0],
+                                     node_crd[nd2][0]])
+                Ey[i, :] = np.array([node_crd[nd1][1],
+                                     node_crd[nd2][1]])
+
+                Ed[i, :] = np.array([node_eig[nd1][0],
+                                     node_eig[nd1][1],
+                                     node_eig[nd1][2],
+                                     node_eig[nd2][0],
+                                     node_eig[nd2][1],
+                                     node_eig[nd2][2]])
+
+            # the mode shape is interpolated once and scaled by cos(t) in
+            # each frame; without interpolation only the ends are moved
+            if not interpFlag:
+                nep = 2
+            xy_c, u_xyc = _beam_defo_interp_2d_eles(Ex, Ey, Ed, nep)
+            frame_x, frame_y = _eles_to_line_data(
+                xy_c + sfac * np.cos(t)[:, None, None, None] * u_xyc)
+
+            # all elements are drawn by one line
+            line, = ax.plot([], [], fmt_nodes, lw=lw)
 
             def init():
-                for j, ele_tag in enumerate(ele_tags):
-                    lines[j].set_data([], [])
-                return lines
+                line.set_data([], [])
+                return line,
 
             def animate(i):
-                for j, ele_tag in enumerate(ele_tags):
+                line.set_data(frame_x[i], frame_y[i])
+                return line,
 
-                    if interpFlag:
-                        xcdi, ycdi = beam_defo_interp_2d(Ex[j, :],
-                                                         Ey[j, :],
-                                                         Ed[j, :],
-                                                         sfac*np.cos(t[i]),
-                                                         nep)
-                        lines[j].set_data(xcdi, ycdi)
-                    else:
-                        xdi, ydi = beam_disp_ends(Ex[j, :], Ey[j, :], Ed[j, :],
-                                                  sfac*np.cos(t[i]))
-                        lines[j].set_data(xdi, ydi)
+            anim = FuncAnimation(fig, animate, init_func=init,
+                                 frames=n_frames, interval=1000/fps,
+                                 blit=True)
 
-                    # plt.plot(xcdi, ycdi, fmt_interp)
+            if movie:
+                _save_anim(anim, movie, fps)
 
-                return lines
-
-            FuncAnimation(fig, animate, init_func=init,
-                          frames=n_frames, interval=50, blit=True)
+            return anim
 
         # plt.axis('equal')
         # plt.show()  # call this from main py file for more control
@@ -1339,36 +1432,36 @@ def _anim_mode_2d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
     # 2d quadrilateral (quad) elements
     elif nen == 4:
         for ele_tag in ele_tags:
-            nd1, nd2, nd3, nd4 = ops.eleNodes(ele_tag)
+            nd1, nd2, nd3, nd4 = ele_nodes[ele_tag]
 
             # element x, y coordinates
-            ex = np.array([ops.nodeCoord(nd1)[0],
-                           ops.nodeCoord(nd2)[0],
-                           ops.nodeCoord(nd3)[0],
-                           ops.nodeCoord(nd4)[0]])
-            ey = np.array([ops.nodeCoord(nd1)[1],
-                           ops.nodeCoord(nd2)[1],
-                           ops.nodeCoord(nd3)[1],
-                           ops.nodeCoord(nd4)[1]])
+            ex = np.array([node_crd[nd1][0],
+                           node_crd[nd2][0],
+                           node_crd[nd3][0],
+                           node_crd[nd4][0]])
+            ey = np.array([node_crd[nd1][1],
+                           node_crd[nd2][1],
+                           node_crd[nd3][1],
+                           node_crd[nd4][1]])
 
             if modeNo:
-                ed = np.array([ops.nodeEigenvector(nd1, modeNo)[0],
-                               ops.nodeEigenvector(nd1, modeNo)[1],
-                               ops.nodeEigenvector(nd2, modeNo)[0],
-                               ops.nodeEigenvector(nd2, modeNo)[1],
-                               ops.nodeEigenvector(nd3, modeNo)[0],
-                               ops.nodeEigenvector(nd3, modeNo)[1],
-                               ops.nodeEigenvector(nd4, modeNo)[0],
-                               ops.nodeEigenvector(nd4, modeNo)[1]])
+                ed = np.array([node_eig[nd1][0],
+                               node_eig[nd1][1],
+                               node_eig[nd2][0],
+                               node_eig[nd2][1],
+                               node_eig[nd3][0],
+                               node_eig[nd3][1],
+                               node_eig[nd4][0],
+                               node_eig[nd4][1]])
             else:
-                ed = np.array([ops.nodeDisp(nd1)[0],
-                               ops.nodeDisp(nd1)[1],
-                               ops.nodeDisp(nd2)[0],
-                               ops.nodeDisp(nd2)[1],
-                               ops.nodeDisp(nd3)[0],
-                               ops.nodeDisp(nd3)[1],
-                               ops.nodeDisp(nd4)[0],
-                               ops.nodeDisp(nd4)[1]])
+                ed = np.array([node_dsp[nd1][0],
+                               node_dsp[nd1][1],
+                               node_dsp[nd2][0],
+                               node_dsp[nd2][1],
+                               node_dsp[nd3][0],
+                               node_dsp[nd3][1],
+                               node_dsp[nd4][0],
+                               node_dsp[nd4][1]])
 
             if unDefoFlag:
                 plt.plot(np.append(ex, ex[0]), np.append(ey, ey[0]),
@@ -1406,7 +1499,8 @@ def _anim_mode_2d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
 def anim_mode(modeNo, sfac=False, nep=17, unDefoFlag=1, fmt_undefo=fmt_undefo,
               interpFlag=1, endDispFlag=1, fmt_interp=fmt_interp,
               fmt_nodes='b-', Eo=0, az_el=az_el, fig_wi_he=fig_wi_he,
-              fig_lbrt=fig_lbrt, xlim=[0, 1], ylim=[0, 1], lw=3.):
+              fig_lbrt=fig_lbrt, xlim=[0, 1], ylim=[0, 1], lw=3., movie=False,
+              fps=20):
     """Make animation of a mode shape obtained from eigenvalue solution.
 
     Args:
@@ -1442,6 +1536,15 @@ def anim_mode(modeNo, sfac=False, nep=17, unDefoFlag=1, fmt_undefo=fmt_undefo,
 
         fig_wi_he (tuple): contains width and height of the figure
 
+        movie (str): file name (.gif or .mp4) to save the animation to,
+            False - do not save
+
+        fps (int): frames per second of the animation and the movie
+
+    Returns:
+        anim: the FuncAnimation object. Keep a reference to it, otherwise
+            the animation is garbage collected and stops.
+
     Examples:
 
     Notes:
@@ -1450,6 +1553,8 @@ def anim_mode(modeNo, sfac=False, nep=17, unDefoFlag=1, fmt_undefo=fmt_undefo,
     """
 
     node_tags = ops.getNodeTags()
+    node_crd = _get_node_crds()
+    node_eig = _get_node_eigenvectors(modeNo)
 
     # calculate sfac
     # min_x, min_y, min_z = np.inf, np.inf, np.inf
@@ -1460,15 +1565,15 @@ def anim_mode(modeNo, sfac=False, nep=17, unDefoFlag=1, fmt_undefo=fmt_undefo,
     max_ux, max_uy = -np.inf, -np.inf
     ratio = 0.1
 
-    ndim = np.shape(ops.nodeCoord(node_tags[0]))[0]
+    ndim = np.shape(node_crd[node_tags[0]])[0]
 
     if ndim == 2:
         if not sfac:
             for node_tag in node_tags:
-                x_crd = ops.nodeCoord(node_tag)[0]
-                y_crd = ops.nodeCoord(node_tag)[1]
-                ux = ops.nodeEigenvector(node_tag, modeNo)[0]
-                uy = ops.nodeEigenvector(node_tag, modeNo)[1]
+                x_crd = node_crd[node_tag][0]
+                y_crd = node_crd[node_tag][1]
+                ux = node_eig[node_tag][0]
+                uy = node_eig[node_tag][1]
 
                 min_x = min(min_x, x_crd)
                 min_y = min(min_y, y_crd)
@@ -1483,9 +1588,9 @@ def anim_mode(modeNo, sfac=False, nep=17, unDefoFlag=1, fmt_undefo=fmt_undefo,
             edmax = max(max_ux, max_uy)
             sfac = ratio * dlmax/edmax
 
-        _anim_mode_2d(modeNo, sfac, nep, unDefoFlag, fmt_undefo, interpFlag,
-                      endDispFlag, fmt_interp, fmt_nodes, fig_wi_he, xlim,
-                      ylim, lw)
+        return _anim_mode_2d(modeNo, sfac, nep, unDefoFlag, fmt_undefo,
+                             interpFlag, endDispFlag, fmt_interp, fmt_nodes,
+                             fig_wi_he, xlim, ylim, lw, movie, fps)
 
     # elif ndim == 3:
     #     if not sfac:
@@ -1568,6 +1673,8 @@ def plot_mode_shape(modeNo, sfac=False, nep=17, unDefoFlag=1,
     """
 
     node_tags = ops.getNodeTags()
+    node_crd = _get_node_crds()
+    node_eig = _get_node_eigenvectors(modeNo)
 
     # calculate sfac
     min_x, min_y, min_z = np.inf, np.inf, np.inf
@@ -1575,15 +1682,15 @@ def plot_mode_shape(modeNo, sfac=False, nep=17, unDefoFlag=1,
     max_ux, max_uy, max_uz = -np.inf, -np.inf, -np.inf
     ratio = 0.1
 
-    ndim = np.shape(ops.nodeCoord(node_tags[0]))[0]
+    ndim = np.shape(node_crd[node_tags[0]])[0]
 
     if ndim == 2:
         if not sfac:
             for node_tag in node_tags:
-                x_crd = ops.nodeCoord(node_tag)[0]
-                y_crd = ops.nodeCoord(node_tag)[1]
-                ux = ops.nodeEigenvector(node_tag, modeNo)[0]
-                uy = ops.nodeEigenvector(node_tag, modeNo)[1]
+                x_crd = node_crd[node_tag][0]
+                y_crd = node_crd[node_tag][1]
+                ux = node_eig[node_tag][0]
+                uy = node_eig[node_tag][1]
 
                 min_x = min(min_x, x_crd)
                 min_y = min(min_y, y_crd)
@@ -1604,12 +1711,12 @@ def plot_mode_shape(modeNo, sfac=False, nep=17, unDefoFlag=1,
     elif ndim == 3:
         if not sfac:
             for node_tag in node_tags:
-                x_crd = ops.nodeCoord(node_tag)[0]
-                y_crd = ops.nodeCoord(node_tag)[1]
-                z_crd = ops.nodeCoord(node_tag)[2]
-                ux = ops.nodeEigenvector(node_tag, modeNo)[0]
-                uy = ops.nodeEigenvector(node_tag, modeNo)[1]
-                uz = ops.nodeEigenvector(node_tag, modeNo)[2]
+                x_crd = node_crd[node_tag][0]
+                y_crd = node_crd[node_tag][1]
+                z_crd = node_crd[node_tag][2]
+                ux = node_eig[node_tag][0]
+                uy = node_eig[node_tag][1]
+                uz = node_eig[node_tag][2]
 
                 min_x = min(min_x, x_crd)
                 min_y = min(min_y, y_crd)
@@ -1720,6 +1827,63 @@ def beam_defo_interp_2d(ex, ey, u, sfac, nep=17):
     return crd_xc, crd_yc
 
 
+def _beam_defo_interp_2d_eles(Ex, Ey, Ed, nep=17):
+    """
+    Vectorized beam_defo_interp_2d() for all elements (and frames) at once.
+
+    Parametrs:
+    Ex, Ey : element x, y coordinates, (nel x 2)
+    Ed : element nodal displacements, (... x nel x 6), e.g. one row of
+        elements per animation frame
+    nep : number of evaluation points (including end nodes)
+
+    Returns:
+    xy_c : (nel x nep x 2) undeformed coordinates at the nep points
+    u_xyc : (... x nel x nep x 2) global displacements at the nep points,
+        such that xy_c + sfac * u_xyc is the deformed shape of
+        beam_defo_interp_2d()
+    """
+
+    Lx, Ly = Ex[:, 1] - Ex[:, 0], Ey[:, 1] - Ey[:, 0]
+    L = np.sqrt(Lx**2 + Ly**2)
+    cosa, cosb = (Lx / L)[:, None], (Ly / L)[:, None]
+    L = L[:, None]
+
+    # local displacements at the element ends
+    ua1 = cosa[:, 0] * Ed[..., 0] + cosb[:, 0] * Ed[..., 1]
+    ut1 = -cosb[:, 0] * Ed[..., 0] + cosa[:, 0] * Ed[..., 1]
+    ua2 = cosa[:, 0] * Ed[..., 3] + cosb[:, 0] * Ed[..., 4]
+    ut2 = -cosb[:, 0] * Ed[..., 3] + cosa[:, 0] * Ed[..., 4]
+
+    # shape functions in terms of xl/L
+    s = np.linspace(0., 1., num=nep)
+    u_ac = ua1[..., None] * (1 - s) + ua2[..., None] * s
+    u_tc = (ut1[..., None] * (1 - 3*s**2 + 2*s**3)
+            + Ed[..., 2, None] * L * (s - 2*s**2 + s**3)
+            + ut2[..., None] * (3*s**2 - 2*s**3)
+            + Ed[..., 5, None] * L * (-s**2 + s**3))
+
+    u_xyc = np.stack((cosa * u_ac - cosb * u_tc,
+                      cosb * u_ac + cosa * u_tc), axis=-1)
+    xy_c = np.stack((Ex[:, :1] + Lx[:, None] * s,
+                     Ey[:, :1] + Ly[:, None] * s), axis=-1)
+
+    return xy_c, u_xyc
+
+
+def _eles_to_line_data(xy):
+    """
+    Join the (... x nel x nep x 2) element lines into (... x n) x and y
+    arrays separated by nan, so that all elements are drawn by one Line2D.
+    """
+
+    gap = np.full(xy.shape[:-2] + (1, 2), np.nan)
+    xy = np.concatenate((xy, gap), axis=-2)
+    xy = xy.reshape(xy.shape[:-3] + (-1, 2))
+
+    return xy[..., 0], xy[..., 1]
+
+
 def beam_defo_interp_3d(ex, ey, ez, g, u, sfac, nep=17):
     """
     3d beam version of beam_defo_interp_2d.
@@ -1949,34 +2113,37 @@ def fib_sec_list_to_cmds(fib_sec_list):
 
 def _anim_defo_2d(Eds, timeV, sfac, nep, unDefoFlag, fmt_undefo,
                   interpFlag, endDispFlag, fmt_interp, fmt_nodes, fig_wi_he,
-                  xlim, ylim):
+                  xlim, ylim, movie, fps):
 
     fig_wi, fig_he = fig_wi_he
     ele_tags = ops.getEleTags()
+    node_crd = _get_node_crds()
+    ele_nodes = _get_ele_nodes()
+    node_dsp = _get_node_disps()
 
-    nen = np.shape(ops.eleNodes(ele_tags[0]))[0]
+    nen = np.shape(ele_nodes[ele_tags[0]])[0]
 
     # truss and beam/frame elements
     if nen == 2:
 
-        ndf = np.shape(ops.nodeDOFs(ops.eleNodes(ele_tags[0])[0]))[0]
+        ndf = np.shape(ops.nodeDOFs(ele_nodes[ele_tags[0]][0]))[0]
 
         # truss element
         if ndf == 2:
 
             for ele_tag in ele_tags:
-                nd1, nd2 = ops.eleNodes(ele_tag)
+                nd1, nd2 = ele_nodes[ele_tag]
 
                 # element x, y coordinates
-                ex = np.array([ops.nodeCoord(nd1)[0],
-                               ops.nodeCoord(nd2)[0]])
-                ey = np.array([ops.nodeCoord(nd1)[1],
-                               ops.nodeCoord(nd2)[1]])
+                ex = np.array([node_crd[nd1][0],
+                               node_crd[nd2][0]])
+                ey = np.array([node_crd[nd1][1],
+                               node_crd[nd2][1]])
 
-                eux = np.array([ops.nodeDisp(nd1)[0],
-                                ops.nodeDisp(nd2)[0]])
-                euy = np.array([ops.nodeDisp(nd1)[1],
-                                ops.nodeDisp(nd2)[1]])
+                eux = np.array([node_dsp[nd1][0],
+                                node_dsp[nd2][0]])
+                euy = np.array([node_dsp[nd1][1],
+                                node_dsp[nd2][1]])
 
                 # displaced element coordinates (scaled by sfac factor)
                 edx = np.array([ex[0] + sfac*eux[0], ex[1] + sfac*eux[1]])
@@ -2001,54 +2168,52 @@ def _anim_defo_2d(Eds, timeV, sfac, nep, unDefoFlag, fmt_undefo,
             Ey = np.zeros((nel, 2))
             # no of frames equal to time intervals
             n_frames, _, _ = np.shape(Eds)
-            lines = []
 
             # time_text = ax.set_title('')  # does not work
             time_text = ax.text(.05, .95, '', transform=ax.transAxes)
             for i, ele_tag in enumerate(ele_tags):
-                nd1, nd2 = ops.eleNodes(ele_tag)
+                nd1, nd2 = ele_nodes[ele_tag]
 
                 # element x, y coordinates
-                Ex[i, :] = np.array([ops.nodeCoord(nd1)[0],
-                                     ops.nodeCoord(nd2)[0]])
-                Ey[i, :] = np.array([ops.nodeCoord(nd1)[1],
-                                     ops.nodeCoord(nd2)[1]])
-
-                lines.append(ax.plot([], [], fmt_nodes, lw=3)[0])
+                Ex[i, :] = np.array([node_crd[nd1][0],
+                                     node_crd[nd2][0]])
+                Ey[i, :] = np.array([node_crd[nd1][1],
+                                     node_crd[nd2][1]])
+
+            # the deformed shapes of all frames are interpolated at once;
+            # without interpolation only the ends are moved
+            if not interpFlag:
+                nep = 2
+            xy_c, u_xyc = _beam_defo_interp_2d_eles(Ex, Ey, np.asarray(Eds),
+                                                    nep)
+            frame_x, frame_y = _eles_to_line_data(xy_c + sfac * u_xyc)
+
+            # all elements are drawn by one line
+            line, = ax.plot([], [], fmt_nodes, lw=3)
 
             def init():
-                for j, ele_tag in enumerate(ele_tags):
-                    lines[j].set_data([], [])
-
+                line.set_data([], [])
                 time_text.set_text('')
 
-                return tuple(lines) + (time_text,)
+                return line, time_text
 
             def animate(i):
-                for j, ele_tag in enumerate(ele_tags):
-
-                    if interpFlag:
-                        xcdi, ycdi = beam_defo_interp_2d(Ex[j, :],
-                                                         Ey[j, :],
-                                                         Eds[i, j, :],
-                                                         sfac,
-                                                         nep)
-                        lines[j].set_data(xcdi, ycdi)
-                    else:
-                        xdi, ydi = beam_disp_ends(Ex[j, :], Ey[j, :],
-                                                  Eds[i, j, :], sfac)
-                        lines[j].set_data(xdi, ydi)
-
-                    # plt.plot(xcdi, ycdi, fmt_interp)
+                line.set_data(frame_x[i], frame_y[i])
 
                 # time_text.set_text(f'f')
                 time_text.set_text(f'frame: {i+1}/{n_frames}, \
 time: {timeV[i]:.3f} s')
 
-                return tuple(lines) + (time_text,)
+                return line, time_text
+
+            anim = FuncAnimation(fig, animate, init_func=init,
+                                 frames=n_frames, interval=1000/fps,
+                                 blit=True, repeat=False)
+
+            if movie:
+                _save_anim(anim, movie, fps)
 
-            FuncAnimation(fig, animate, init_func=init, frames=n_frames,
-                          interval=50, blit=True, repeat=False)
+            return anim
 
         # plt.axis('equal')
         # plt.show()  # call this from main py file for more control
@@ -2063,17 +2228,17 @@ time: {timeV[i]:.3f} s')
     # 2d quadrilateral (quad) elements
     elif nen == 4:
         for ele_tag in ele_tags:
-            nd1, nd2, nd3, nd4 = ops.eleNodes(ele_tag)
+            nd1, nd2, nd3, nd4 = ele_nodes[ele_tag]
 
             # element x, y coordinates
-            ex = np.array([ops.nodeCoord(nd1)[0],
-                           ops.nodeCoord(nd2)[0],
-                           ops.nodeCoord(nd3)[0],
-                           ops.nodeCoord(nd4)[0]])
-            ey = np.array([ops.nodeCoord(nd1)[1],
-                           ops.nodeCoord(nd2)[1],
-                           ops.nodeCoord(nd3)[1],
-                           ops.nodeCoord(nd4)[1]])
+            ex = np.array([node_crd[nd1][0],
+                           node_crd[nd2][0],
+                           node_crd[nd3][0],
+                           node_crd[nd4][0]])
+            ey = np.array([node_crd[nd1][1],
+                           node_crd[nd2][1],
+                           node_crd[nd3][1],
+                           node_crd[nd4][1]])
 
             # if modeNo:
             #     ed = np.array([ops.nodeEigenvector(nd1, modeNo)[0],
@@ -2085,14 +2250,14 @@ time: {timeV[i]:.3f} s')
             #                    ops.nodeEigenvector(nd4, modeNo)[0],
             #                    ops.nodeEigenvector(nd4, modeNo)[1]])
             # else:
-            ed = np.array([ops.nodeDisp(nd1)[0],
-                           ops.nodeDisp(nd1)[1],
-                           ops.nodeDisp(nd2)[0],
-                           ops.nodeDisp(nd2)[1],
-                           ops.nodeDisp(nd3)[0],
-                           ops.nodeDisp(nd3)[1],
-                           ops.nodeDisp(nd4)[0],
-                           ops.nodeDisp(nd4)[1]])
+            ed = np.array([node_dsp[nd1][0],
+                           node_dsp[nd1][1],
+                           node_dsp[nd2][0],
+                           node_dsp[nd2][1],
+                           node_dsp[nd3][0],
+                           node_dsp[nd3][1],
+                           node_dsp[nd4][0],
+                           node_dsp[nd4][1]])
 
             if unDefoFlag:
                 plt.plot(np.append(ex, ex[0]), np.append(ey, ey[0]),
@@ -2130,7 +2295,8 @@ time: {timeV[i]:.3f} s')
 def anim_defo(Eds, timeV, sfac, nep=17, unDefoFlag=1, fmt_undefo=fmt_undefo,
               interpFlag=1, endDispFlag=1, fmt_interp=fmt_interp,
               fmt_nodes='b-', az_el=az_el, fig_lbrt=fig_lbrt,
-              fig_wi_he=fig_wi_he, xlim=[0, 1], ylim=[0, 1]):
+              fig_wi_he=fig_wi_he, xlim=[0, 1], ylim=[0, 1], movie=False,
+              fps=20):
     """Make animation of the deformed shape computed by transient analysis
 
     Args:
@@ -2164,6 +2330,15 @@ def anim_defo(Eds, timeV, sfac, nep=17, unDefoFlag=1, fmt_undefo=fmt_undefo,
 
         fig_wi_he (tuple): contains width and height of the figure
 
+        movie (str): file name (.gif or .mp4) to save the animation to,
+            False - do not save
+
+        fps (int): frames per second of the animation and the movie
+
+    Returns:
+        anim: the FuncAnimation object. Keep a reference to it, otherwise
+            the animation is garbage collected and stops.
+
     Examples:
 
     Notes:
@@ -2176,9 +2351,9 @@ def anim_defo(Eds, timeV, sfac, nep=17, unDefoFlag=1, fmt_undefo=fmt_undefo,
     ndim = np.shape(ops.nodeCoord(node_tags[0]))[0]
 
     if ndim == 2:
-        _anim_defo_2d(Eds, timeV, sfac, nep, unDefoFlag, fmt_undefo,
-                      interpFlag, endDispFlag, fmt_interp, fmt_nodes,
-                      fig_wi_he, xlim, ylim)
+        return _anim_defo_2d(Eds, timeV, sfac, nep, unDefoFlag, fmt_undefo,
+                             interpFlag, endDispFlag, fmt_interp, fmt_nodes,
+                             fig_wi_he, xlim, ylim, movie, fps)
 
     else:
         print(f'\nWarning! ndim: {ndim} not supported yet.')
@@ -2353,6 +2528,8 @@ def section_force_diagram_2d(sf_type, Ew, sfac=1., nep=17,
 
     maxVal, minVal = -np.inf, np.inf
     ele_tags = ops.getEleTags()
+    node_crd = _get_node_crds()
+    ele_nodes = _get_ele_nodes()
 
     for ele_tag in ele_tags:
 
@@ -2361,13 +2538,13 @@ def section_force_diagram_2d(sf_type, Ew, sfac=1., nep=17,
         if ele_tag in Ew:
             eload_data = Ew[ele_tag]
 
-        nd1, nd2 = ops.eleNodes(ele_tag)
+        nd1, nd2 = ele_nodes[ele_tag]
 
         # element x, y coordinates
-        ex = np.array([ops.nodeCoord(nd1)[0],
-                       ops.nodeCoord(nd2)[0]])
-        ey = np.array([ops.nodeCoord(nd1)[1],
-                       ops.nodeCoord(nd2)[1]])
+        ex = np.array([node_crd[nd1][0],
+                       node_crd[nd2][0]])
+        ey = np.array([node_crd[nd1][1],
+                       node_crd[nd2][1]])
 
         Lxy = np.array([ex[1]-ex[0], ey[1]-ey[0]])
         L = np.sqrt(Lxy @ Lxy)
@@ -2471,6 +2648,8 @@ def section_force_diagram_3d(sf_type, Ew, sfac=1., nep=17,
 
     maxVal, minVal = -np.inf, np.inf
     ele_tags = ops.getEleTags()
+    node_crd = _get_node_crds()
+    ele_nodes = _get_ele_nodes()
 
     azim, elev = az_el
     fig_wi, fig_he = fig_wi_he
@@ -2495,15 +2674,15 @@ def section_force_diagram_3d(sf_type, Ew, sfac=1., nep=17,
         if ele_tag in Ew:
             eload_data = Ew[ele_tag]
 
-        nd1, nd2 = ops.eleNodes(ele_tag)
+        nd1, nd2 = ele_nodes[ele_tag]
 
         # element x, y coordinates
-        ex = np.array([ops.nodeCoord(nd1)[0],
-                       ops.nodeCoord(nd2)[0]])
-        ey = np.array([ops.nodeCoord(nd1)[1],
-                       ops.nodeCoord(nd2)[1]])
-        ez = np.array([ops.nodeCoord(nd1)[2],
-                       ops.nodeCoord(nd2)[2]])
+        ex = np.array([node_crd[nd1][0],
+                       node_crd[nd2][0]])
+        ey = np.array([node_crd[nd1][1],
+                       node_crd[nd2][1]])
+        ez = np.array([node_crd[nd1][2],
+                       node_crd[nd2][2]])
 
         # eo = Eo[i, :]
         xloc = ops.eleResponse(ele_tag, 'xlocal')
@@ -2603,7 +2782,9 @@ def quad_sig_out_per_node():
        angle: angle of the principal stress s1
     """
     ele_tags = ops.getEleTags()
+    ele_nodes = _get_ele_nodes()
     node_tags = ops.getNodeTags()
+    node_index = _getNodeIndex(node_tags)
     n_nodes = len(node_tags)
 
     # initialize helper arrays
@@ -2613,12 +2794,12 @@ def quad_sig_out_per_node():
     nodes_tag_count[:, 0] = node_tags
 
     for i, ele_tag in enumerate(ele_tags):
-        nd1, nd2, nd3, nd4 = ops.eleNodes(ele_tag)
+        nd1, nd2, nd3, nd4 = ele_nodes[ele_tag]
 
-        ind1 = node_tags.index(nd1)
-        ind2 = node_tags.index(nd2)
-        ind3 = node_tags.index(nd3)
-        ind4 = node_tags.index(nd4)
+        ind1 = node_index[nd1]
+        ind2 = node_index[nd2]
+        ind3 = node_index[nd3]
+        ind4 = node_index[nd4]
         nodes_tag_count[[ind1, ind2, ind3, ind4], 1] += 1
 
         sig_ip_el = ops.eleResponse(ele_tag, 'stress')
@@ -2882,12 +3063,15 @@ def quad_crds_node_to_ip():
     It also returns quad connectivity.
     """
     node_tags, ele_tags = ops.getNodeTags(), ops.getEleTags()
+    node_index = _getNodeIndex(node_tags)
+    node_crd = _get_node_crds()
+    ele_nodes = _get_ele_nodes()
     n_nodes, n_eles = len(node_tags), len(ele_tags)
 
     # idiom coordinates as ordered in node_tags
     nds_crd = np.zeros((n_nodes, 2))
     for i, node_tag in enumerate(node_tags):
-        nds_crd[i] = ops.nodeCoord(node_tag)
+        nds_crd[i] = node_crd[node_tag]
 
     quads_conn = np.zeros((n_eles, 4), dtype=int)
     # quads_conn_ops = np.zeros((n_eles, 4), dtype=int)
@@ -2895,23 +3079,23 @@ def quad_crds_node_to_ip():
     eles_ips_crd = np.zeros((n_eles, 4, 2))
 
     for i, ele_tag in enumerate(ele_tags):
-        nd1, nd2, nd3, nd4 = ops.eleNodes(ele_tag)
+        nd1, nd2, nd3, nd4 = ele_nodes[ele_tag]
 
-        ind1 = node_tags.index(nd1)
-        ind2 = node_tags.index(nd2)
-        ind3 = node_tags.index(nd3)
-        ind4 = node_tags.index(nd4)
+        ind1 = node_index[nd1]
+        ind2 = node_index[nd2]
+        ind3 = node_index[nd3]
+        ind4 = node_index[nd4]
         quads_conn[i] = np.array([ind1, ind2, ind3, ind4])
         # quads_conn_ops[i] = np.array([nd1, nd2, nd3, nd4])
 
-        eles_nds_crd[i] = np.array([[ops.nodeCoord(nd1, 1),
-                                     ops.nodeCoord(nd1, 2)],
-                                    [ops.nodeCoord(nd2, 1),
-                                     ops.nodeCoord(nd2, 2)],
-                                    [ops.nodeCoord(nd3, 1),
-                                     ops.nodeCoord(nd3, 2)],
-                                    [ops.nodeCoord(nd4, 1),
-                                     ops.nodeCoord(nd4, 2)]])
+        eles_nds_crd[i] = np.array([[node_crd[nd1][0],
+                                     node_crd[nd1][1]],
+                                    [node_crd[nd2][0],
+                                     node_crd[nd2][1]],
+                                    [node_crd[nd3][0],
+                                     node_crd[nd3][1]],
+                                    [node_crd[nd4][0],
+                                     node_crd[nd4][1]]])
         eles_ips_crd[i] = quad_interpolate_node_to_ip(eles_nds_crd[i])
 
     return eles_ips_crd, eles_nds_crd, nds_crd, quads_conn
@@ -2934,6 +3118,8 @@ def quad_sig_out_per_ele():
         Used e.g. by plot_mesh_with_ips_2d function
     """
     node_tags, ele_tags = ops.getNodeTags(), ops.getEleTags()
+    node_index = _getNodeIndex(node_tags)
+    ele_nodes = _get_ele_nodes()
     n_nodes, n_eles = len(node_tags), len(ele_tags)
 
     eles_ips_sig_out = np.zeros((n_eles, 4, 4))
@@ -2941,18 +3127,18 @@ def quad_sig_out_per_ele():
 
     # array (n_nodes, 2):
     # node_tags, number of occurrence in quad elements)
-    # correspondence indx and node_tag is in node_tags.index
+    # correspondence indx and node_tag is in node_index
     # (a) data in np.array of integers
     nodes_tag_count = np.zeros((n_nodes, 2), dtype=int)
     nodes_tag_count[:, 0] = node_tags
 
     for i, ele_tag in enumerate(ele_tags):
-        nd1, nd2, nd3, nd4 = ops.eleNodes(ele_tag)
+        nd1, nd2, nd3, nd4 = ele_nodes[ele_tag]
 
-        ind1 = node_tags.index(nd1)
-        ind2 = node_tags.index(nd2)
-        ind3 = node_tags.index(nd3)
-        ind4 = node_tags.index(nd4)
+        ind1 = node_index[nd1]
+        ind2 = node_index[nd2]
+        ind3 = node_index[nd3]
+        ind4 = node_index[nd4]
         nodes_tag_count[[ind1, ind2, ind3, ind4], 1] += 1
 
         sig_ip_el = ops.eleResponse(ele_tag, 'stress')
@@ -3063,13 +3249,16 @@ def plot_stress_2d(nds_val, mesh_outline=1, cmap='jet'):
     """
 
     node_tags, ele_tags = ops.getNodeTags(), ops.getEleTags()
+    node_index = _getNodeIndex(node_tags)
+    node_crd = _get_node_crds()
+    ele_nodes = _get_ele_nodes()
     n_nodes, n_eles = len(node_tags), len(ele_tags)
 
     # idiom coordinates as ordered in node_tags
-    # use node_tags.index(tag) for correspondence
+    # use node_index[tag] for correspondence
     nds_crd = np.zeros((n_nodes, 2))
     for i, node_tag in enumerate(node_tags):
-        nds_crd[i] = ops.nodeCoord(node_tag)
+        nds_crd[i] = node_crd[node_tag]
 
     # from utils / quad_sig_out_per_node
     # fixme: if this can be simplified
@@ -3078,16 +3267,16 @@ def plot_stress_2d(nds_val, mesh_outline=1, cmap='jet'):
     # nodes_tag_count = np.zeros((n_nodes, 2), dtype=int)
     # nodes_tag_count[:, 0] = node_tags
     #
-    # correspondence indx and node_tag is in node_tags.index
+    # correspondence indx and node_tag is in node_index
     # after testing remove the above
     quads_conn = np.zeros((n_eles, 4), dtype=int)
 
     for i, ele_tag in enumerate(ele_tags):
-        nd1, nd2, nd3, nd4 = ops.eleNodes(ele_tag)
-        ind1 = node_tags.index(nd1)
-        ind2 = node_tags.index(nd2)
-        ind3 = node_tags.index(nd3)
-        ind4 = node_tags.index(nd4)
+        nd1, nd2, nd3, nd4 = ele_nodes[ele_tag]
+        ind1 = node_index[nd1]
+        ind2 = node_index[nd2]
+        ind3 = node_index[nd3]
+        ind4 = node_index[nd4]
         quads_conn[i] = np.array([ind1, ind2, ind3, ind4])
 
     tris_conn, nds_c_crd, nds_c_val = \
@@ -3115,13 +3304,16 @@ def plot_stress_2d(nds_val, mesh_outline=1, cmap='jet'):
 def plot_stress_9n_2d(nds_val, cmap='jet'):
 
     node_tags, ele_tags = ops.getNodeTags(), ops.getEleTags()
+    node_index = _getNodeIndex(node_tags)
+    node_crd = _get_node_crds()
+    ele_nodes = _get_ele_nodes()
     n_nodes, n_eles = len(node_tags), len(ele_tags)
 
     # idiom coordinates as ordered in node_tags
-    # use node_tags.index(tag) for correspondence
+    # use node_index[tag] for correspondence
     nds_crd = np.zeros((n_nodes, 2))
     for i, node_tag in enumerate(node_tags):
-        nds_crd[i] = ops.nodeCoord(node_tag)
+        nds_crd[i] = node_crd[node_tag]
 
     # from utils / quad_sig_out_per_node
     # fixme: if this can be simplified
@@ -3130,16 +3322,16 @@ def plot_stress_9n_2d(nds_val, cmap='jet'):
     # nodes_tag_count = np.zeros((n_nodes, 2), dtype=int)
     # nodes_tag_count[:, 0] = node_tags
     #
-    # correspondence indx and node_tag is in node_tags.index
+    # correspondence indx and node_tag is in node_index
     # after testing remove the above
     quads_conn = np.zeros((n_eles, 4), dtype=int)
 
     for i, ele_tag in enumerate(ele_tags):
-        nd1, nd2, nd3, nd4 = ops.eleNodes(ele_tag)
-        ind1 = node_tags.index(nd1)
-        ind2 = node_tags.index(nd2)
-        ind3 = node_tags.index(nd3)
-        ind4 = node_tags.index(nd4)
+        nd1, nd2, nd3, nd4 = ele_nodes[ele_tag]
+        ind1 = node_index[nd1]
+        ind2 = node_index[nd2]
+        ind3 = node_index[nd3]
+        ind4 = node_index[nd4]
         quads_conn[i] = np.array([ind1, ind2, ind3, ind4])
 
     tris_conn, nds_c_crd, nds_c_val = \
@@ -3195,6 +3387,8 @@ def plot_extruded_model_rect_section_3d(b, h, az_el=az_el,
     b2, h2 = b/2, h/2
 
     ele_tags = ops.getEleTags()
+    node_crd = _get_node_crds()
+    ele_nodes = _get_ele_nodes()
 
     azim, elev = az_el
     fig_wi, fig_he = fig_wi_he
@@ -3214,15 +3408,15 @@ def plot_extruded_model_rect_section_3d(b, h, az_el=az_el,
 
     for i, ele_tag in enumerate(ele_tags):
 
-        nd1, nd2 = ops.eleNodes(ele_tag)
+        nd1, nd2 = ele_nodes[ele_tag]
 
         # element x, y coordinates
-        ex = np.array([ops.nodeCoord(nd1)[0],
-                       ops.nodeCoord(nd2)[0]])
-        ey = np.array([ops.nodeCoord(nd1)[1],
-                       ops.nodeCoord(nd2)[1]])
-        ez = np.array([ops.nodeCoord(nd1)[2],
-                       ops.nodeCoord(nd2)[2]])
+        ex = np.array([node_crd[nd1][0],
+                       node_crd[nd2][0]])
+        ey = np.array([node_crd[nd1][1],
+                       node_crd[nd2][1]])
+        ez = np.array([node_crd[nd1][2],
+                       node_crd[nd2][2]])
 
         # eo = Eo[i, :]
         xloc = ops.eleResponse(ele_tag, 'xlocal')
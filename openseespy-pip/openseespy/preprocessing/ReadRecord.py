@@ -0,0 +1,169 @@
+import os
+import re
+import hashlib
+import tempfile
+
+import numpy as np
+import openseespy.opensees as ops
+
+# Reader for ground motion records from the PEER strong motion database.
+#
+# The header of a PEER record ends, e.g., with one of the following lines:
+#  1) new NGA database
+#     3930 0.00500 NPTS, DT
+#  2) old SMD database
+#     NPTS=  3930, DT= .00500 SEC
+#
+# The values after the header are decoded in one pass and cached in a
+# binary .npy sidecar file, so that a record used by many analyses
+# (e.g. in an IDA) is parsed only once. The sidecar stores
+#     [version, dt, size of record file, mtime of record file, values...]
+# and is ignored as soon as the record file changes.
+
+_cacheVersion = 1.0
+_cacheHeader = 4
+
+_headerLength = 8192
+_ngaHeader = re.compile(r'^[ \t]*(\d+)[ \t,]+([-+.\dEe]+)[ \t]+NPTS[ \t]*,[ \t]*DT', re.M | re.I)
+_smdHeader = re.compile(r'NPTS[ \t]*=[ \t]*(\d+)[ \t]*,?[ \t]*DT[ \t]*=[ \t]*([-+.\dEe]+)', re.I)
+_dataEnd = re.compile(r'^[ \t]*[^\s\d.+\-]', re.M)
+
+
+def ParseRecord(text):
+    """Decode the text of a PEER record.
+
+    Args:
+        text: content of a .AT2 (NGA or SMD format) record
+
+    Returns:
+        dt: time step from the header
+        values: numpy array of the record values
+    """
+
+    head = text[:_headerLength]
+    matches = [m for m in (_ngaHeader.search(head), _smdHeader.search(head)) if m is not None]
+    if len(matches) == 0:
+        raise ValueError('ParseRecord: NPTS and DT not found in the record header')
+    m = min(matches, key=lambda x: x.start())
+
+    npts = int(m.group(1))
+    dt = float(m.group(2))
+
+    # data starts on the line after NPTS, DT and stops at the first
+    # line that does not start with a number, e.g. *** End Data ***
+    start = text.find('\n', m.end())
+    if start < 0:
+        return dt, np.zeros(0)
+    data = text[start:]
+    end = _dataEnd.search(data)
+    if end is not None:
+        data = data[:end.start()]
+
+    values = np.array(data.split(), dtype=float)
+    if npts > 0 and len(values) > npts:
+        values = values[:npts]
+
+    return dt, values
+
+
+def _cacheFile(inFilename, cacheDir):
+
+    if cacheDir is None:
+        return inFilename + '.npy'
+
+    key = hashlib.sha1(os.path.abspath(inFilename).encode()).hexdigest()[:12]
+    return os.path.join(cacheDir, os.path.basename(inFilename) + '.' + key + '.npy')
+
+
+def _loadCache(cacheFilename, stat):
+
+    try:
+        cache = np.load(cacheFilename, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+
+    if cache.ndim != 1 or len(cache) < _cacheHeader:
+        return None
+    if cache[0] != _cacheVersion or cache[2] != stat.st_size or cache[3] != stat.st_mtime:
+        return None
+
+    return float(cache[1]), cache[_cacheHeader:]
+
+
+def _saveCache(cacheFilename, stat, dt, values):
+
+    cache = np.empty(_cacheHeader + len(values))
+    cache[:_cacheHeader] = [_cacheVersion, dt, stat.st_size, stat.st_mtime]
+    cache[_cacheHeader:] = values
+
+    # write to a temporary file first so that processes reading the
+    # same record at the same time never see a partial cache
+    cacheDir = os.path.dirname(os.path.abspath(cacheFilename))
+    tmpFilename = None
+    try:
+        os.makedirs(cacheDir, exist_ok=True)
+        fd, tmpFilename = tempfile.mkstemp(suffix='.npy', dir=cacheDir)
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, cache)
+        os.replace(tmpFilename, cacheFilename)
+    except OSError:
+        # a read-only record directory only disables the cache
+        if tmpFilename is not None and os.path.exists(tmpFilename):
+            os.remove(tmpFilename)
+
+
+def ReadRecord(inFilename, cache=True, cacheDir=None):
+    """Read a ground motion record from the PEER strong motion database.
+
+    Args:
+        inFilename: the .AT2 record file
+        cache: reuse/write the decoded values in a binary sidecar file
+        cacheDir: directory of the sidecar files, default is next to the record
+
+    Returns:
+        dt: time step from the record header
+        values: numpy array of the record values, read-only if loaded from the cache
+    """
+
+    stat = os.stat(inFilename)
+
+    if cache:
+        cacheFilename = _cacheFile(inFilename, cacheDir)
+        cached = _loadCache(cacheFilename, stat)
+        if cached is not None:
+            return cached
+
+    with open(inFilename, 'r') as f:
+        dt, values = ParseRecord(f.read())
+
+    if cache:
+        _saveCache(cacheFilename, stat, dt, values)
+
+    return dt, values
+
+
+def PathTimeSeries(tag, inFilename, *args, factor=1.0, share=True, cache=True, cacheDir=None):
+    """Create a Path timeSeries from a PEER record.
+
+    Args:
+        tag: time series tag
+        inFilename: the .AT2 record file
+        args: other options of the Path timeSeries, e.g. '-prependZero'
+        factor: factor of the values, e.g. g
+        share: let the time series use the record values without a copy
+        cache: see ReadRecord
+        cacheDir: see ReadRecord
+
+    Returns:
+        dt: time step from the record header
+        npts: number of values
+    """
+
+    dt, values = ReadRecord(inFilename, cache, cacheDir)
+
+    options = ['-dt', dt, '-values', values, '-factor', factor]
+    if share:
+        options.append('-share')
+    ops.timeSeries('Path', tag, *options, *args)
+
+    return dt, len(values)
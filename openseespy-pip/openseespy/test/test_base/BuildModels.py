@@ -0,0 +1,67 @@
+# BuildModels.py
+# ------------------------------------------------------------------------------------------------------------
+#
+# Small models shared by the tests, which read this file with exec as
+# they do ReadRecord.py
+#
+# buildOscillator -- a unit mass on a unit truss under a harmonic force,
+#                    with a Newton transient analysis
+# buildTruss      -- the three bar truss of test_Truss, with a linear
+#                    static analysis
+
+import openseespy.opensees as ops
+
+
+def buildOscillator():
+
+    ops.model('basic', '-ndm', 1, '-ndf', 1)
+
+    ops.node(1, 0.0)
+    ops.node(2, 1.0, '-mass', 1.0)
+    ops.fix(1, 1)
+
+    ops.uniaxialMaterial('Elastic', 1, 100.0)
+    ops.element('Truss', 1, 1, 2, 1.0, 1)
+
+    ops.timeSeries('Trig', 1, 0.0, 10.0, 1.0, '-factor', 5.0)
+    ops.pattern('Plain', 1, 1)
+    ops.load(2, 1.0)
+
+    ops.system('BandGeneral')
+    ops.numberer('Plain')
+    ops.constraints('Plain')
+    ops.test('NormDispIncr', 1.0e-10, 10)
+    ops.algorithm('Newton')
+    ops.integrator('Newmark', 0.5, 0.25)
+    ops.analysis('Transient')
+
+
+def buildTruss(E, P=1.0):
+
+    ops.model('basic', '-ndm', 2, '-ndf', 2)
+
+    ops.node(1, 0.0, 0.0)
+    ops.node(2, 144.0,  0.0)
+    ops.node(3, 168.0,  0.0)
+    ops.node(4,  72.0, 96.0)
+
+    ops.fix(1, 1, 1)
+    ops.fix(2, 1, 1)
+    ops.fix(3, 1, 1)
+
+    ops.uniaxialMaterial("Elastic", 1, E)
+
+    ops.element("Truss",1,1,4,10.0,1)
+    ops.element("Truss",2,2,4,5.0,1)
+    ops.element("Truss",3,3,4,5.0,1)
+
+    ops.timeSeries("Linear", 1)
+    ops.pattern("Plain", 1, 1)
+    ops.load(4, 100.0*P, -50.0*P)
+
+    ops.system("BandSPD")
+    ops.numberer("Plain")
+    ops.constraints("Plain")
+    ops.integrator("LoadControl", 1.0)
+    ops.algorithm("Linear")
+    ops.analysis("Static")
@@ -0,0 +1,84 @@
+import openseespy.opensees as ops
+
+
+def buildOscillator():
+
+    ops.model('basic', '-ndm', 1, '-ndf', 1)
+
+    ops.node(1, 0.0)
+    ops.node(2, 0.0, '-mass', 1.0)
+    ops.fix(1, 1)
+
+    ops.uniaxialMaterial('Steel01', 1, 10.0, 100.0, 0.02)
+    ops.element('zeroLength', 1, 1, 2, '-mat', 1, '-dir', 1)
+
+    # a harmonic force well past the yield force
+    ops.timeSeries('Trig', 1, 0.0, 10.0, 1.0, '-factor', 30.0)
+    ops.pattern('Plain', 1, 1)
+    ops.load(2, 1.0)
+
+    ops.system('BandGeneral')
+    ops.numberer('Plain')
+    ops.constraints('Plain')
+    ops.integrator('Newmark', 0.5, 0.25)
+    ops.analysis('Transient')
+
+
+def test_AnalyzeAdaptive():
+
+    ops.wipe()
+    buildOscillator()
+
+    # one iteration is enough on a branch of the material,
+    # but not when the material yields or unloads
+    ops.algorithm('Newton')
+    ops.test('NormUnbalance', 1.0e-8, 1)
+
+    ops.fallback('algorithm', 'KrylovNewton')
+    ops.fallback('test', 'NormUnbalance', 1.0e-8, 50)
+
+    numIncr = 200
+    dt = 0.01
+    summary = ops.analyzeAdaptive(numIncr, dt)
+
+    assert len(summary) == 4*numIncr
+    times = summary[0::4]
+    rungs = summary[1::4]
+    numSteps = summary[2::4]
+
+    assert abs(times[-1]-numIncr*dt) < 1e-10
+    assert min(rungs) == 0 and max(rungs) == 1
+    assert min(numSteps) == 1 and max(numSteps) == 1
+
+    disp = ops.nodeDisp(2, 1)
+
+    # the same analysis with the fallback only
+    ops.wipe()
+    buildOscillator()
+    ops.algorithm('KrylovNewton')
+    ops.test('NormUnbalance', 1.0e-8, 50)
+    assert ops.analyze(numIncr, dt) == 0
+
+    assert abs(ops.nodeDisp(2, 1)-disp) < 1e-6
+
+    ops.wipe()
+
+
+def test_AnalyzeAdaptiveFails():
+
+    ops.wipe()
+    buildOscillator()
+
+    ops.algorithm('Newton')
+    ops.test('NormUnbalance', 1.0e-8, 1)
+    ops.fallback('algorithm', 'ModifiedNewton')
+    ops.fallback('test', 'NormUnbalance', 1.0e-8, 1)
+
+    # stops at the first step which fails after all bisections
+    summary = ops.analyzeAdaptive(200, 0.01, '-maxBisections', 2)
+
+    assert len(summary) % 4 == 0 and len(summary) < 4*200
+    assert summary[-3] == -1
+    assert all(rung >= 0 for rung in summary[1:-4:4])
+
+    ops.wipe()
@@ -0,0 +1,53 @@
+import threading
+import openseespy.opensees as ops
+
+
+def test_AnalyzeThreads():
+
+    ops.wipe()
+    ops.model('basic', '-ndm', 2, '-ndf', 2)
+
+    ops.node(1, 0.0, 0.0)
+    ops.node(2, 144.0,  0.0)
+    ops.node(3,  72.0, 96.0)
+    ops.fix(1, 1, 1)
+    ops.fix(2, 1, 1)
+
+    ops.uniaxialMaterial("Elastic", 1, 3000.0)
+    ops.element("Truss",1,1,3,10.0,1)
+    ops.element("Truss",2,2,3,5.0,1)
+
+    ops.timeSeries("Linear", 1)
+    ops.pattern("Plain", 1, 1)
+    ops.load(3, 100.0, -50.0)
+
+    ops.system("BandSPD")
+    ops.numberer("Plain")
+    ops.constraints("Plain")
+    ops.integrator("LoadControl", 0.01)
+    ops.algorithm("Linear")
+    ops.analysis("Static")
+
+    # the commands of another thread run before or after analyze,
+    # never while the GIL is released in it
+    times = []
+    started = threading.Event()
+    stop = threading.Event()
+
+    def monitor():
+        started.set()
+        while not stop.is_set():
+            times.append(ops.getTime())
+
+    thread = threading.Thread(target=monitor)
+    thread.start()
+    started.wait()
+    assert ops.analyze(2000) == 0
+    stop.set()
+    thread.join()
+
+    assert len(times) > 0
+    for t in times:
+        assert abs(t) < 1e-12 or abs(t-20.0) < 1e-8
+
+    ops.wipe()
@@ -0,0 +1,68 @@
+import os.path
+import openseespy.opensees as ops
+
+exec(open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'BuildModels.py'), 'r').read())
+
+
+def test_AnalyzeToTime():
+
+    ops.wipe()
+    buildOscillator()
+
+    # the last step is shortened to land on the time
+    assert ops.analyze(1000, 0.03, '-time', 1.0) == 0
+    assert abs(ops.getTime()-1.0) < 1e-12
+
+    # nothing to do at the time
+    assert ops.analyze(1000, 0.03, '-time', 1.0) == 0
+    assert abs(ops.getTime()-1.0) < 1e-12
+
+    # the number of steps is still a maximum
+    assert ops.analyze(10, 0.01, '-time', 5.0) == 0
+    assert abs(ops.getTime()-1.1) < 1e-12
+
+    ops.wipe()
+
+
+def test_AnalyzeToLimit():
+
+    ops.wipe()
+    buildOscillator()
+    disps = []
+    for i in range(200):
+        assert ops.analyze(1, 0.01) == 0
+        disps.append(ops.nodeDisp(2, 1))
+
+    limit = 0.5*max(abs(u) for u in disps)
+    step = next(i for i, u in enumerate(disps) if abs(u) >= limit)
+
+    # the first limit is far, the second one stops the analysis
+    ops.wipe()
+    buildOscillator()
+    assert ops.analyze(200, 0.01, '-nodeLimit', 2, 1, 1.0e10, 'vel',
+                       '-nodeLimit', 2, 1, limit) == 2
+    assert abs(ops.getTime()-(step+1)*0.01) < 1e-12
+    assert abs(ops.nodeDisp(2, 1)-disps[step]) < 1e-12
+
+    # the same limit as the force of the element
+    ops.wipe()
+    buildOscillator()
+    assert ops.analyze(200, 0.01, '-eleLimit', 1, 100.0*limit, 'axialForce') == 1
+    assert abs(ops.getTime()-(step+1)*0.01) < 1e-12
+
+    # and as the drift between the nodes at a distance of 1
+    ops.wipe()
+    buildOscillator()
+    assert ops.analyze(200, 0.01, '-driftLimit', 1, 2, 1, 1, limit) == 1
+    assert abs(ops.getTime()-(step+1)*0.01) < 1e-12
+
+    # arguments that are neither numbers nor strings are not options
+    ops.wipe()
+    buildOscillator()
+    try:
+        ops.analyze(10, 0.01, None)
+        assert False
+    except ops.OpenSeesError:
+        pass
+
+    ops.wipe()
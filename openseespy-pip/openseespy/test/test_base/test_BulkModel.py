@@ -0,0 +1,116 @@
+import numpy as np
+import openseespy.opensees as ops
+
+
+numX = 4
+numY = 6
+
+
+def meshArrays():
+
+    x, y = np.meshgrid(np.arange(numX+1.0), np.arange(numY+1.0))
+    nodeTags = np.arange(1, x.size+1)
+    crds = np.column_stack((x.ravel(), y.ravel()))
+
+    grid = nodeTags.reshape(numY+1, numX+1)
+    eleNodes = np.column_stack((grid[:-1, :-1].ravel(), grid[:-1, 1:].ravel(),
+                                grid[1:, 1:].ravel(), grid[1:, :-1].ravel()))
+    eleTags = np.arange(1, len(eleNodes)+1)
+
+    return nodeTags, crds, eleTags, eleNodes
+
+
+def analyzeMesh():
+
+    topNode = (numX+1)*(numY+1)
+
+    ops.timeSeries('Linear', 1)
+    ops.pattern('Plain', 1, 1)
+    ops.load(topNode, 1.0, 0.0)
+
+    ops.system('BandGeneral')
+    ops.numberer('RCM')
+    ops.constraints('Plain')
+    ops.test('NormDispIncr', 1.0e-10, 10)
+    ops.algorithm('Newton')
+    ops.integrator('LoadControl', 1.0)
+    ops.analysis('Static')
+    assert ops.analyze(1) == 0
+
+    return ops.nodeDisp(topNode), ops.eigen(2)
+
+
+def test_BulkModel():
+
+    nodeTags, crds, eleTags, eleNodes = meshArrays()
+    baseNodes = nodeTags[:numX+1]
+
+    # one by one
+    ops.wipe()
+    ops.model('basic', '-ndm', 2, '-ndf', 2)
+    ops.nDMaterial('ElasticIsotropic', 1, 1000.0, 0.25)
+    for tag, crd in zip(nodeTags, crds):
+        ops.node(int(tag), *crd)
+        ops.mass(int(tag), 1.0, 2.0)
+    for tag, nodes in zip(eleTags, eleNodes):
+        ops.element('quad', int(tag), *[int(nd) for nd in nodes], 1.0, 'PlaneStress', 1)
+    for tag in baseNodes:
+        ops.fix(int(tag), 1, 1)
+    disp, eigenValues = analyzeMesh()
+
+    # in one call each
+    ops.wipe()
+    ops.model('basic', '-ndm', 2, '-ndf', 2)
+    ops.nDMaterial('ElasticIsotropic', 1, 1000.0, 0.25)
+    ops.nodes(nodeTags, crds)
+    ops.masses(nodeTags, np.tile([1.0, 2.0], (len(nodeTags), 1)))
+    ops.elements('quad', eleTags, eleNodes, 1.0, 'PlaneStress', 1)
+    ops.fixes(baseNodes, np.ones((len(baseNodes), 2), dtype=np.int32))
+
+    assert ops.getNodeTags() == list(nodeTags)
+    assert ops.getEleTags() == list(eleTags)
+    assert ops.eleNodes(int(eleTags[-1])) == list(eleNodes[-1])
+
+    bulkDisp, bulkEigenValues = analyzeMesh()
+    assert np.allclose(bulkDisp, disp, rtol=1e-12)
+    assert np.allclose(bulkEigenValues, eigenValues, rtol=1e-10)
+
+    ops.wipe()
+
+
+def test_BulkTrusses():
+
+    # element args of several types after the nodes, and masses with the nodes
+    ops.wipe()
+    ops.model('basic', '-ndm', 1, '-ndf', 1)
+    ops.uniaxialMaterial('Elastic', 1, 100.0)
+    ops.nodes([1, 2, 3], [0.0, 1.0, 3.0], '-mass', [0.0, 1.0, 1.0])
+    ops.elements('Truss', [1, 2], np.array([[1, 2], [2, 3]]), 2.0, 1)
+    ops.fixes([1], [1])
+
+    assert ops.eleNodes(2) == [2, 3]
+    assert ops.nodeMass(3) == [1.0]
+
+    ops.timeSeries('Constant', 1)
+    ops.pattern('Plain', 1, 1)
+    ops.load(3, 10.0)
+    ops.system('BandGeneral')
+    ops.numberer('Plain')
+    ops.constraints('Plain')
+    ops.integrator('LoadControl', 1.0)
+    ops.algorithm('Linear')
+    ops.analysis('Static')
+    assert ops.analyze(1) == 0
+
+    # springs of stiffness 200 and 100 in series
+    assert abs(ops.nodeDisp(3, 1)-(10.0/200.0+10.0/100.0)) < 1e-12
+
+    # an element with a wrong number of nodes is not created
+    ops.nodes([4], [4.0])
+    try:
+        ops.elements('Truss', [3], [3, 4, 1], 2.0, 1)
+    except ops.OpenSeesError:
+        pass
+    assert 3 not in ops.getEleTags()
+
+    ops.wipe()
@@ -0,0 +1,93 @@
+import numpy as np
+import openseespy.opensees as ops
+
+
+def test_BulkQuery():
+
+    # a cantilever of frame nodes, and a truss node with fewer dofs
+    ops.wipe()
+    ops.model('basic', '-ndm', 2, '-ndf', 3)
+    ops.node(1, 0.0, 0.0)
+    ops.node(2, 0.0, 1.0, '-mass', 1.0, 1.0, 0.01)
+    ops.node(3, 0.0, 2.0, '-mass', 1.0, 1.0, 0.01)
+    ops.fix(1, 1, 1, 1)
+    ops.geomTransf('Linear', 1)
+    ops.element('elasticBeamColumn', 1, 1, 2, 1.0, 100.0, 1.0, 1)
+    ops.element('elasticBeamColumn', 2, 2, 3, 1.0, 100.0, 1.0, 1)
+
+    ops.model('basic', '-ndm', 2, '-ndf', 2)
+    ops.node(4, 1.0, 0.0)
+    ops.fix(4, 1, 1)
+
+    ops.timeSeries('Linear', 1)
+    ops.pattern('Plain', 1, 1)
+    ops.load(3, 1.0, -1.0, 0.5)
+
+    ops.system('BandGeneral')
+    ops.numberer('Plain')
+    ops.constraints('Plain')
+    ops.integrator('LoadControl', 1.0)
+    ops.algorithm('Linear')
+    ops.analysis('Static')
+    assert ops.analyze(1) == 0
+
+    nodeTags = ops.getNodeTags()
+
+    # all nodes have the same number of coordinates
+    crds = np.reshape(ops.nodeCoord('-all'), (len(nodeTags), -1))
+    for i, tag in enumerate(nodeTags):
+        assert np.allclose(crds[i], ops.nodeCoord(tag))
+
+    # but not of dofs
+    try:
+        ops.nodeDisp('-all')
+        assert False
+    except ops.OpenSeesError:
+        pass
+
+    disps = np.reshape(ops.nodeDisp('-all', '-dof', 1, 2), (len(nodeTags), 2))
+    for i, tag in enumerate(nodeTags):
+        assert np.allclose(disps[i], [ops.nodeDisp(tag, 1), ops.nodeDisp(tag, 2)])
+
+    # unless the values of each node are preceded by their number
+    disps = []
+    for tag in nodeTags:
+        disps += [len(ops.nodeDisp(tag))] + ops.nodeDisp(tag)
+    assert np.allclose(ops.nodeDisp('-all', '-sizes'), disps)
+    assert np.allclose(ops.nodeDisp('-node', 4, 3, '-dof', 2, '-sizes'),
+                       [1, ops.nodeDisp(4, 2), 1, ops.nodeDisp(3, 2)])
+
+    # a list of nodes of the same size
+    disps = ops.nodeDisp('-node', 3, 2)
+    assert np.allclose(disps, ops.nodeDisp(3) + ops.nodeDisp(2))
+    assert np.allclose(ops.nodeDisp('-node', 3, '-dof', 3), [ops.nodeDisp(3, 3)])
+    ops.reactions()
+    assert np.allclose(ops.nodeReaction('-node', 1), ops.nodeReaction(1))
+
+    try:
+        ops.nodeDisp('-node', 4, '-dof', 3)
+        assert False
+    except ops.OpenSeesError:
+        pass
+
+    # the eigenvectors are given mode by mode for each node
+    ops.wipeAnalysis()
+    ops.eigen(2)
+    eigs = np.reshape(ops.nodeEigenvector('-all', '-mode', 1, 2, '-dof', 1, 2),
+                      (len(nodeTags), 2, 2))
+    for i, tag in enumerate(nodeTags):
+        for mode in [1, 2]:
+            for dof in [1, 2]:
+                assert abs(eigs[i, mode-1, dof-1]-ops.nodeEigenvector(tag, mode, dof)) < 1e-12
+
+    try:
+        ops.nodeEigenvector('-all', '-dof', 1)
+        assert False
+    except ops.OpenSeesError:
+        pass
+
+    # the number of nodes of each element followed by the nodes
+    assert list(ops.eleNodes('-all')) == [2, 1, 2, 2, 2, 3]
+    assert list(ops.eleNodes('-ele', 2)) == [2, 2, 3]
+
+    ops.wipe()
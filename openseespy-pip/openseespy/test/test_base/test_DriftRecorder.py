@@ -0,0 +1,64 @@
+import numpy as np
+import openseespy.opensees as ops
+
+
+def buildColumn():
+
+    ops.model('basic', '-ndm', 2, '-ndf', 3)
+
+    ops.node(1, 0.0, 0.0)
+    ops.node(2, 0.0, 2.0)
+    ops.fix(1, 1, 1, 1)
+
+    ops.geomTransf('Linear', 1)
+    ops.element('elasticBeamColumn', 1, 1, 2, 1.0, 100.0, 1.0, 1)
+
+    ops.timeSeries('Trig', 1, 0.0, 10.0, 4.0)
+    ops.pattern('Plain', 1, 1)
+    ops.load(2, 1.0, 0.0, 0.0)
+
+    ops.system('BandGeneral')
+    ops.numberer('Plain')
+    ops.constraints('Plain')
+    ops.algorithm('Linear')
+    ops.integrator('LoadControl', 0.1)
+    ops.analysis('Static')
+
+
+def test_DriftRecorder(tmp_path):
+
+    ops.wipe()
+    buildColumn()
+
+    drifts = np.zeros((20, 1))
+    envelopeFile = str(tmp_path / 'envelope.out')
+    ops.recorder('Drift', '-array', drifts, '-iNode', 1, '-jNode', 2, '-dof', 1, '-perpDirn', 2)
+    ops.recorder('EnvelopeDrift', '-file', envelopeFile, '-iNode', 1, '-jNode', 2, '-dof', 1, '-perpDirn', 2)
+
+    disps = []
+    for i in range(20):
+        assert ops.analyze(1) == 0
+        disps.append(ops.nodeDisp(2, 1))
+    disps = np.array(disps)
+
+    assert np.allclose(drifts[:, 0], disps/2.0)
+
+    # min, max and absolute max written when the recorder is removed
+    ops.wipe()
+    envelope = np.loadtxt(envelopeFile)
+    assert np.allclose(envelope, [disps.min()/2.0, disps.max()/2.0, abs(disps).max()/2.0])
+
+
+def test_DriftRecorderOptions():
+
+    ops.wipe()
+    buildColumn()
+
+    # a misspelt option is not taken for the default direction
+    try:
+        ops.recorder('Drift', '-iNode', 1, '-jNode', 2, '-Dof', 2, '-perpDirn', 1)
+        assert False
+    except ops.OpenSeesError:
+        pass
+
+    ops.wipe()
@@ -0,0 +1,91 @@
+import numpy as np
+import openseespy.opensees as ops
+
+
+def hasThirdMode():
+
+    # a solution from the cache keeps all modes solved for,
+    # a new solution of two modes does not
+    try:
+        ops.nodeEigenvector(4, 3, 1)
+        return True
+    except ops.OpenSeesError:
+        return False
+
+
+def test_EigenCache():
+
+    # a chain of three masses and springs
+    ops.wipe()
+    ops.model('basic', '-ndm', 1, '-ndf', 1)
+    ops.node(1, 0.0)
+    for i in range(2, 5):
+        ops.node(i, float(i-1), '-mass', 1.0)
+    ops.fix(1, 1)
+    ops.uniaxialMaterial('Elastic', 1, 100.0)
+    for i in range(1, 4):
+        ops.element('Truss', i, i, i+1, 1.0, 1)
+    ops.parameter(1, 'element', 3, 'A')
+
+    ops.system('BandGeneral')
+    ops.numberer('Plain')
+    ops.constraints('Plain')
+    ops.integrator('Newmark', 0.5, 0.25)
+    ops.algorithm('Linear')
+    ops.analysis('Transient')
+
+    lam1 = ops.eigen(3)
+    assert np.allclose(ops.eigen('-cache', 2), lam1[:2])
+    assert np.allclose(ops.eigen('-cache', 1), lam1[:1])
+    assert hasThirdMode()
+
+    # a change of the mass or stiffness invalidates the solution
+    ops.mass(4, 2.0)
+    lam2 = ops.eigen('-cache', 2)
+    assert not hasThirdMode()
+    assert not np.allclose(lam2, lam1[:2])
+    ops.mass(4, 1.0)
+
+    ops.eigen(3)
+    ops.updateParameter(1, 2.0)
+    assert not np.allclose(ops.eigen('-cache', 2), lam1[:2])
+    assert not hasThirdMode()
+    ops.setParameter('-val', 1.0, '-ele', 3, 'A')
+
+    ops.eigen(3)
+    ops.setNodeCoord(4, 1, 2.0)
+    ops.updateElementDomain()
+    ops.eigen('-cache', 2)
+    assert not hasThirdMode()
+    ops.setNodeCoord(4, 1, 3.0)
+    ops.updateElementDomain()
+
+    # and so do an analysis step and a change of the domain
+    assert np.allclose(ops.eigen(3), lam1)
+    assert ops.analyze(1, 0.01) == 0
+    assert np.allclose(ops.eigen('-cache', 2), lam1[:2])
+    assert not hasThirdMode()
+
+    ops.eigen(3)
+    ops.domainChange()
+    ops.eigen('-cache', 2)
+    assert not hasThirdMode()
+
+    # more modes than solved for
+    ops.eigen(2)
+    assert np.allclose(ops.eigen('-cache', 3), lam1)
+    assert hasThirdMode()
+
+    # the solution of another solver, and any solver is
+    # accepted without a solver given
+    ops.eigen(3)
+    ops.eigen('-cache', '-fullGenLapack', 2)
+    assert not hasThirdMode()
+
+    ops.eigen('-fullGenLapack', 3)
+    assert np.allclose(ops.eigen('-cache', 2), lam1[:2])
+    assert hasThirdMode()
+    ops.eigen('-cache', '-symmBandLapack', 2)
+    assert not hasThirdMode()
+
+    ops.wipe()
@@ -0,0 +1,70 @@
+import os.path
+import openseespy.opensees as ops
+from openseespy.model import Model
+
+exec(open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'BuildModels.py'), 'r').read())
+
+
+def test_MultipleModels():
+
+    ops.wipe()
+
+    # the same tags in two models
+    stiff = Model()
+    soft = Model()
+    with stiff:
+        buildTruss(3000.0)
+    with soft:
+        buildTruss(1500.0)
+
+    assert ops.getActiveModel() == 0
+    assert ops.getModelTags() == [0, stiff.tag, soft.tag]
+
+    stiff.analyze(1)
+    soft.analyze(1)
+    assert soft.isActive()
+
+    ux = stiff.nodeDisp(4,1)
+    uy = stiff.nodeDisp(4,2)
+    assert abs(ux-0.53009277713228375450)<1e-12 and abs(uy+0.17789363846931768864)<1e-12
+
+    ux = soft.nodeDisp(4,1)
+    uy = soft.nodeDisp(4,2)
+    assert abs(ux-2*0.53009277713228375450)<1e-12 and abs(uy+2*0.17789363846931768864)<1e-12
+
+    # the analysis of each model goes on from its own state
+    stiff.analyze(1)
+    assert abs(stiff.nodeDisp(4,1)-2*0.53009277713228375450)<1e-12
+    assert abs(soft.getTime()-1.0)<1e-12
+
+    ops.switchModel(0)
+    stiff.remove()
+    soft.remove()
+    assert ops.getModelTags() == [0]
+    ops.wipe()
+
+
+def test_MultipleModelMeshes():
+
+    ops.wipe()
+
+    # the same mesh tag in two models
+    first = Model()
+    second = Model()
+    for m in [first, second]:
+        with m:
+            ops.model('basic', '-ndm', 2, '-ndf', 2)
+            ops.node(1, 0.0, 0.0)
+            ops.node(2, 1.0, 0.0)
+            ops.mesh('line', 1, 2, 1, 2, 0, 2, 0.25)
+
+    with first:
+        numNodes = len(ops.getNodeTags())
+    with second:
+        assert len(ops.getNodeTags()) == numNodes
+    assert numNodes > 2
+
+    ops.switchModel(0)
+    first.remove()
+    second.remove()
+    ops.wipe()
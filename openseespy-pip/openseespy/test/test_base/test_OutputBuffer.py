@@ -0,0 +1,35 @@
+import numpy as np
+import openseespy.opensees as ops
+
+
+def test_OutputBuffer():
+
+    ops.wipe()
+    ops.model('basic', '-ndm', 2, '-ndf', 2)
+    ops.node(1, 0.0, 0.0)
+    ops.node(2, 1.0, 0.0)
+    ops.node(3, 1.0, 2.0)
+
+    # lists by default
+    assert ops.getNodeTags() == [1, 2, 3]
+
+    # buffers of ints and doubles
+    ops.setOutputBuffer(1)
+    tags = ops.getNodeTags()
+    assert isinstance(tags, memoryview) and tags.format == 'i'
+    assert tags.tolist() == [1, 2, 3]
+
+    crds = ops.nodeCoord('-all')
+    assert isinstance(crds, memoryview) and crds.format == 'd'
+    assert np.allclose(np.asarray(crds), [0.0, 0.0, 1.0, 0.0, 1.0, 2.0])
+    assert len(ops.nodeCoord(3)) == 2 and ops.nodeCoord(3)[1] == 2.0
+
+    # scalars are not changed
+    assert isinstance(ops.nodeDisp(3, 1), float)
+
+    # and lists again
+    ops.setOutputBuffer(0)
+    assert ops.getNodeTags() == [1, 2, 3]
+    assert ops.nodeCoord(3) == [1.0, 2.0]
+
+    ops.wipe()
@@ -0,0 +1,44 @@
+import os.path
+import numpy as np
+import openseespy.opensees as ops
+from openseespy.parametric import runGrid
+
+exec(open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'BuildModels.py'), 'r').read())
+
+
+def buildCase(case):
+
+    buildTruss(case['E'], case['P'])
+
+
+def analyzeCase(case, attempt):
+
+    # the negative load fails at the first attempt
+    if case['P'] < 0 and attempt == 0:
+        return None
+
+    if ops.analyze(1) < 0:
+        return None
+
+    return [ops.nodeDisp(4,1), ops.nodeDisp(4,2)]
+
+
+def test_Parametric():
+
+    grid = {'E': [3000.0, 1500.0, 6000.0], 'P': [1.0, 2.0, -1.0]}
+
+    results, converged = runGrid(buildCase, analyzeCase, grid, processes=2)
+    assert results.shape == (3, 3, 2)
+    assert converged[:, :2].all() and not converged[:, 2].any()
+    assert np.isnan(results[:, 2]).all()
+
+    for i, E in enumerate(grid['E']):
+        for j, P in enumerate(grid['P'][:2]):
+            ux, uy = results[i, j]
+            assert abs(ux-0.53009277713228375450*3000.0/E*P)<1e-12
+            assert abs(uy+0.17789363846931768864*3000.0/E*P)<1e-12
+
+    # the failed cases run again
+    results, converged = runGrid(buildCase, analyzeCase, grid, processes=2, retries=1)
+    assert converged.all()
+    assert abs(results[0, 2, 0]+0.53009277713228375450)<1e-12
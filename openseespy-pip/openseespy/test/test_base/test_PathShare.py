@@ -0,0 +1,99 @@
+import sys
+import numpy as np
+import openseespy.opensees as ops
+from openseespy.model import Model
+
+
+def pathDisps(values, *args):
+
+    # a unit spring, so the displacements are the load factors of the
+    # Path series at the times 0.1, 0.2, ...
+    ops.model('basic', '-ndm', 1, '-ndf', 1)
+    ops.node(1, 0.0)
+    ops.node(2, 1.0)
+    ops.fix(1, 1)
+    ops.uniaxialMaterial('Elastic', 1, 1.0)
+    ops.element('Truss', 1, 1, 2, 1.0, 1)
+    ops.timeSeries('Path', 1, '-dt', 0.1, '-values', values, *args)
+    ops.pattern('Plain', 1, 1)
+    ops.load(2, 1.0)
+
+    ops.system('BandGeneral')
+    ops.numberer('Plain')
+    ops.constraints('Plain')
+    ops.integrator('LoadControl', 0.1)
+    ops.algorithm('Linear')
+    ops.analysis('Static')
+
+    disps = []
+    for i in range(3):
+        assert ops.analyze(1) == 0
+        disps.append(ops.nodeDisp(2, 1))
+
+    return disps
+
+
+def test_PathValues():
+
+    values = [0.0, 1.0, 4.0, 9.0]
+
+    # a list, a tuple and an array give the same values
+    for v in [values, tuple(values), np.array(values)]:
+        ops.wipe()
+        assert np.allclose(pathDisps(v), values[1:])
+
+    # an array that can not be shared is copied
+    ops.wipe()
+    strided = np.array([values, values]).T[:, 0]
+    count = sys.getrefcount(strided)
+    assert np.allclose(pathDisps(strided, '-share'), values[1:])
+    assert sys.getrefcount(strided) == count
+
+    ops.wipe()
+
+
+def test_PathShare():
+
+    values = np.array([0.0, 1.0, 4.0, 9.0])
+    count = sys.getrefcount(values)
+
+    # the shared array is held by the series
+    ops.wipe()
+    ops.model('basic', '-ndm', 1, '-ndf', 1)
+    ops.timeSeries('Path', 1, '-dt', 0.1, '-values', values, '-share')
+    assert sys.getrefcount(values) > count
+
+    # and released on wipe
+    ops.wipe()
+    assert sys.getrefcount(values) == count
+
+    # changes of the array are seen by the series
+    ops.wipe()
+    values[3] = -9.0
+    assert np.allclose(pathDisps(values, '-share'), [1.0, 4.0, -9.0])
+    values[3] = 9.0
+
+    ops.wipe()
+    assert sys.getrefcount(values) == count
+
+
+def test_PathShareModels():
+
+    values = np.array([0.0, 1.0, 4.0, 9.0])
+    count = sys.getrefcount(values)
+
+    ops.wipe()
+    other = Model()
+    with other:
+        ops.model('basic', '-ndm', 1, '-ndf', 1)
+        ops.timeSeries('Path', 1, '-dt', 0.1, '-values', values, '-share')
+
+    # a wipe of another model keeps the array
+    ops.wipe()
+    assert sys.getrefcount(values) > count
+
+    # it goes with its model
+    other.remove()
+    assert sys.getrefcount(values) == count
+
+    ops.wipe()
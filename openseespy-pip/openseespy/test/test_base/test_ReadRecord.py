@@ -0,0 +1,41 @@
+import os
+import os.path
+import numpy as np
+import openseespy.opensees as ops
+from openseespy.preprocessing.ReadRecord import ReadRecord, PathTimeSeries
+
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+
+def readValues(filename):
+    values = []
+    for line in open(filename, 'r'):
+        try:
+            values += [float(word) for word in line.split()]
+        except ValueError:
+            pass
+    return values
+
+
+def test_ReadRecord(tmp_path):
+
+    # elCentro.dat holds the values of elCentro.at2
+    values = readValues('elCentro.dat')
+
+    dt, accel = ReadRecord('elCentro.at2', cacheDir=str(tmp_path))
+    assert dt == 0.02
+    assert np.array_equal(accel, values)
+    assert len(os.listdir(str(tmp_path))) == 1
+
+    # second read comes from the cache
+    dt, accel = ReadRecord('elCentro.at2', cacheDir=str(tmp_path))
+    assert dt == 0.02
+    assert np.array_equal(accel, values)
+
+    ops.wipe()
+    ops.model('basic', '-ndm', 1, '-ndf', 1)
+    dt, nPts = PathTimeSeries(1, 'elCentro.at2', factor=2.0, cacheDir=str(tmp_path))
+    assert nPts == len(values)
+    assert dt == 0.02
+
+    ops.wipe()
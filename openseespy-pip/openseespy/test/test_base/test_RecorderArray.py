@@ -0,0 +1,88 @@
+import os.path
+import numpy as np
+import openseespy.opensees as ops
+
+exec(open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'BuildModels.py'), 'r').read())
+
+
+def test_RecorderArray():
+
+    ops.wipe()
+    buildOscillator()
+
+    nodeData = np.zeros((50, 2))
+    eleData = np.zeros((8, 1))
+    nodeTag = ops.recorder('Node', '-array', nodeData, '-time', '-node', 2, '-dof', 1, 'disp')
+    eleTag = ops.recorder('Element', '-array', eleData, '-ring', '-ele', 1, 'axialForce')
+
+    times = []
+    disps = []
+    for i in range(20):
+        assert ops.analyze(1, 0.01) == 0
+        times.append(ops.getTime())
+        disps.append(ops.nodeDisp(2, 1))
+
+    # written in place while the analysis runs
+    assert ops.recorderRows(nodeTag) == [20, 2]
+    assert np.allclose(nodeData[:20, 0], times)
+    assert np.allclose(nodeData[:20, 1], disps)
+    assert not nodeData[20:].any()
+
+    # the last 8 rows of the ring, the oldest one is row 20 % 8
+    assert ops.recorderRows(eleTag) == [20, 1]
+    forces = np.roll(eleData[:, 0], -(20 % 8))
+    assert np.allclose(forces, 100.0*np.array(disps[-8:]))
+
+    # a read-only array is not written into
+    readOnly = np.zeros((50, 1))
+    readOnly.flags.writeable = False
+    try:
+        ops.recorder('Node', '-array', readOnly, '-node', 2, '-dof', 1, 'disp')
+        assert False
+    except ops.OpenSeesError:
+        pass
+
+    ops.wipe()
+
+
+def test_RecorderReduce():
+
+    ops.wipe()
+    buildOscillator()
+
+    nodeData = np.zeros((6, 1))
+    eleData = np.zeros((6, 1))
+    nodeTag = ops.recorder('Node', '-reduce', nodeData, '-time', '-node', 2, '-dof', 1, 'disp')
+    eleTag = ops.recorder('Element', '-reduce', eleData, '-ele', 1, 'axialForce')
+
+    times = []
+    disps = []
+    for i in range(150):
+        assert ops.analyze(1, 0.01) == 0
+        times.append(ops.getTime())
+        disps.append(ops.nodeDisp(2, 1))
+    disps = np.array(disps)
+
+    # the time is not reduced
+    assert ops.recorderRows(nodeTag) == [150, 1]
+    assert ops.recorderRows(eleTag) == [150, 1]
+
+    # max, min, absolute max, rms, time of the absolute max and last value
+    peak = abs(disps).argmax()
+    assert np.allclose(nodeData[:, 0], [disps.max(), disps.min(), abs(disps).max(),
+                                        np.sqrt((disps**2).mean()), times[peak], disps[-1]])
+
+    # without the time, the number of the step of the absolute max
+    forces = 100.0*disps
+    assert np.allclose(eleData[:, 0], [forces.max(), forces.min(), abs(forces).max(),
+                                       np.sqrt((forces**2).mean()), peak+1, forces[-1]])
+
+    # a read-only array is not written into
+    readOnly = np.frombuffer(bytes(6*8))
+    try:
+        ops.recorder('Element', '-reduce', readOnly, '-ele', 1, 'axialForce')
+        assert False
+    except ops.OpenSeesError:
+        pass
+
+    ops.wipe()
@@ -0,0 +1,40 @@
+import os
+import os.path
+import numpy as np
+import openseespy.opensees as ops
+
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+exec(open('ReadRecord.py','r').read())
+
+
+def test_ResponseSpectrum():
+
+    # the peak displacements (in) of the El Centro record in
+    # Chopra, Section 6.4, as in test_sdofTransient
+    g = 386.4
+    dt, nPts = ReadRecord('elCentro.at2', 'elCentro.dat')
+    accel = np.array(open('elCentro.dat').read().split()[:nPts], dtype=float)
+
+    periods = [0.0, 0.5, 1.0, 2.0]
+    damping = [0.0, 0.02, 0.05]
+    spectra = ops.responseSpectrum('-dt', dt, '-accel', accel, '-periods', periods,
+                                   '-damping', damping, '-factor', g)
+    spectra = np.reshape(spectra, (len(damping), len(periods), 3))
+
+    # the same values given one by one
+    assert np.allclose(ops.responseSpectrum('-dt', dt, '-accel', *accel, '-periods', *periods,
+                                            '-damping', *damping, '-factor', g),
+                       spectra.flatten())
+
+    Sd = spectra[:, :, 0]
+    assert np.allclose([Sd[1, 1], Sd[1, 2], Sd[1, 3]], [2.67, 5.97, 7.47], atol=3.0e-2)
+    assert np.allclose(Sd[:, 3], [9.91, 7.47, 5.37], atol=3.0e-2)
+
+    # the pseudo velocities and accelerations, and the PGA at a period of 0
+    w = 2.0*np.pi/np.array(periods[1:])
+    assert np.allclose(spectra[:, 1:, 1], w*Sd[:, 1:])
+    assert np.allclose(spectra[:, 1:, 2], w*w*Sd[:, 1:])
+    assert np.allclose(spectra[:, 0, 2], g*np.abs(accel).max())
+
+    ops.wipe()
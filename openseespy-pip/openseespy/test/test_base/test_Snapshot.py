@@ -0,0 +1,78 @@
+import pickle
+
+import openseespy.opensees as ops
+
+
+def buildBar():
+
+    ops.model('basic', '-ndm', 2, '-ndf', 2)
+
+    ops.node(1, 0.0, 0.0)
+    ops.node(2, 100.0, 0.0)
+
+    ops.fix(1, 1, 1)
+    ops.fix(2, 0, 1)
+
+    ops.uniaxialMaterial('Steel01', 1, 60.0, 30000.0, 0.02)
+    ops.element('Truss', 1, 1, 2, 1.0, 1)
+
+    ops.timeSeries('Linear', 1)
+    ops.pattern('Plain', 1, 1)
+    ops.sp(2, 1, 0.3)
+
+
+def setAnalysis():
+
+    ops.system('BandGeneral')
+    ops.numberer('Plain')
+    ops.constraints('Transformation')
+    ops.test('NormDispIncr', 1.0e-10, 10)
+    ops.algorithm('Newton')
+    ops.integrator('LoadControl', 0.1)
+    ops.analysis('Static')
+
+
+def cycle():
+
+    # unload past the yield of the other side, the response
+    # depends on the history of the material
+    ops.integrator('LoadControl', -0.2)
+    forces = []
+    for i in range(10):
+        assert ops.analyze(1) == 0
+        forces.append(ops.eleResponse(1, 'axialForce')[0])
+    return forces
+
+
+def test_Snapshot():
+
+    ops.wipe()
+    buildBar()
+    setAnalysis()
+
+    # yield the bar
+    assert ops.analyze(10) == 0
+    time = ops.getTime()
+    disp = ops.nodeDisp(2, 1)
+
+    snapshot = ops.snapshot()
+    assert isinstance(snapshot, bytes)
+
+    forces = cycle()
+
+    # back to the yielded state in the same model
+    ops.restoreSnapshot(snapshot)
+    assert abs(ops.getTime()-time) < 1e-12
+    assert abs(ops.nodeDisp(2, 1)-disp) < 1e-12
+    assert max(abs(a-b) for a, b in zip(cycle(), forces)) < 1e-8
+
+    # in a new model, e.g. in another process
+    ops.wipe()
+    ops.model('basic', '-ndm', 2, '-ndf', 2)
+    ops.restoreSnapshot(pickle.loads(pickle.dumps(snapshot)))
+    setAnalysis()
+    assert abs(ops.getTime()-time) < 1e-12
+    assert abs(ops.nodeDisp(2, 1)-disp) < 1e-12
+    assert max(abs(a-b) for a, b in zip(cycle(), forces)) < 1e-8
+
+    ops.wipe()
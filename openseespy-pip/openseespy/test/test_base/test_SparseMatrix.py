@@ -0,0 +1,74 @@
+import numpy as np
+import openseespy.opensees as ops
+
+
+def dense(data):
+
+    # coordinate format: N, nnz, rows, cols, values
+    data = np.asarray(data)
+    N, nnz = int(data[0]), int(data[1])
+    rows = data[2:2+nnz].astype(int)
+    cols = data[2+nnz:2+2*nnz].astype(int)
+    A = np.zeros((N, N))
+    np.add.at(A, (rows, cols), data[2+2*nnz:])
+
+    return A
+
+
+def printedMatrix(m, c, k):
+
+    ops.integrator('GimmeMCK', m, c, k)
+    assert ops.analyze(1, 0.0) == 0
+    N = ops.systemSize()
+
+    return np.reshape(ops.printA('-ret'), (N, N))
+
+
+def test_SparseMatrix():
+
+    # a two story frame column with Rayleigh damping
+    ops.wipe()
+    ops.model('basic', '-ndm', 2, '-ndf', 3)
+    ops.node(1, 0.0, 0.0)
+    ops.node(2, 0.0, 3.0, '-mass', 2.0, 2.0, 0.1)
+    ops.node(3, 0.0, 6.0, '-mass', 1.0, 1.0, 0.05)
+    ops.fix(1, 1, 1, 1)
+    ops.geomTransf('Linear', 1)
+    ops.element('elasticBeamColumn', 1, 1, 2, 0.1, 200.0e3, 1.0e-3, 1)
+    ops.element('elasticBeamColumn', 2, 2, 3, 0.1, 200.0e3, 1.0e-3, 1)
+    ops.rayleigh(0.1, 0.002, 0.0, 0.0)
+
+    ops.system('FullGeneral')
+    ops.numberer('Plain')
+    ops.constraints('Plain')
+    ops.algorithm('Linear')
+    ops.analysis('Transient')
+
+    K = printedMatrix(0.0, 0.0, 1.0)
+    M = printedMatrix(1.0, 0.0, 0.0)
+    C = printedMatrix(0.0, 1.0, 0.0)
+    assert np.abs(K).max() > 0.0 and np.abs(M).max() > 0.0
+
+    # the same equations as the system
+    assert np.allclose(dense(ops.sparseMatrix('K')), K)
+    assert np.allclose(dense(ops.sparseMatrix('M')), M)
+    assert np.allclose(dense(ops.sparseMatrix('C')), C)
+    assert np.allclose(dense(ops.sparseMatrix('-k', 2.0, '-m', 3.0)), 2.0*K+3.0*M)
+
+    # only the nonzero entries
+    data = ops.sparseMatrix('M')
+    assert int(data[1]) == np.count_nonzero(M)
+
+    # the compressed rows of the same entries
+    coo = np.asarray(ops.sparseMatrix('K'))
+    csr = np.asarray(ops.sparseMatrix('K', '-csr'))
+    N, nnz = int(csr[0]), int(csr[1])
+    assert N == int(coo[0]) and nnz == int(coo[1])
+    rowPtr = csr[2:3+N].astype(int)
+    assert rowPtr[0] == 0 and rowPtr[-1] == nnz
+    rows = np.repeat(np.arange(N), np.diff(rowPtr))
+    A = np.zeros((N, N))
+    np.add.at(A, (rows, csr[3+N:3+N+nnz].astype(int)), csr[3+N+nnz:])
+    assert np.allclose(A, K)
+
+    ops.wipe()
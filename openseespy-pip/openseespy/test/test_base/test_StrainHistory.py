@@ -0,0 +1,44 @@
+import numpy as np
+import openseespy.opensees as ops
+
+
+def test_StrainHistory():
+
+    ops.wipe()
+    ops.model('basic', '-ndm', 1, '-ndf', 1)
+    for tag in [1, 11]:
+        ops.uniaxialMaterial('Steel01', tag, 60.0, 30000.0, 0.02)
+    for tag in [2, 12]:
+        ops.uniaxialMaterial('Steel01', tag, 50.0, 30000.0, 0.05)
+
+    strains = 0.01*np.sin(np.linspace(0.0, 4.0*np.pi, 201))
+
+    # the same as one point at a time on the copies 11 and 12
+    expected = []
+    for tag in [11, 12]:
+        ops.testUniaxialMaterial(tag)
+        stresses = []
+        tangents = []
+        for eps in strains:
+            ops.setStrain(eps)
+            stresses.append(ops.getStress())
+            tangents.append(ops.getTangent())
+        expected.append([stresses, tangents])
+
+    # on copies, the materials stay at zero strain
+    results = np.reshape(ops.setStrainHistory(strains, 1, 2, '-clone'), (2, 2, -1))
+    assert np.allclose(results, expected)
+    ops.testUniaxialMaterial(1)
+    assert ops.getStrain() == 0.0
+
+    # the same history again on the materials themselves
+    results = np.reshape(ops.setStrainHistory(list(strains), 1, 2), (2, 2, -1))
+    assert np.allclose(results, expected)
+    assert ops.getStrain() == strains[-1]
+
+    # the material of testUniaxialMaterial by default
+    ops.uniaxialMaterial('Elastic', 3, 100.0)
+    ops.testUniaxialMaterial(3)
+    assert np.allclose(ops.setStrainHistory([0.1, -0.2]), [10.0, -20.0, 100.0, 100.0])
+
+    ops.wipe()
@@ -0,0 +1,31 @@
+import openseespy.opensees as ops
+
+
+def test_StringArgs():
+
+    ops.wipe()
+    ops.model('basic', '-ndm', 1, '-ndf', 1)
+    ops.node(1, 0.0)
+    ops.node(2, 1.0)
+    ops.fix(1, 1)
+    ops.uniaxialMaterial('Elastic', 1, 100.0)
+    ops.element('Truss', 1, 1, 2, 1.0, 1)
+    ops.timeSeries('Linear', 1)
+    ops.pattern('Plain', 1, 1)
+    ops.load(2, 10.0)
+
+    # the spaces in strings are ignored, the same strings again
+    # give the same types
+    for i in range(2):
+        ops.wipeAnalysis()
+        ops.system('Band General')
+        ops.numberer('Plain')
+        ops.constraints('Plain')
+        ops.integrator('Load Control', 0.5)
+        ops.algorithm(' Newton ')
+        ops.analysis('Static')
+        assert ops.analyze(1) == 0
+
+    assert abs(ops.nodeDisp(2, 1)-0.1) < 1e-12
+
+    ops.wipe()